@@ -0,0 +1,45 @@
+"""Add HedgeFundFlowRunEvent table
+
+Revision ID: 7c3e1f2a9d4b
+Revises: 2f8c5d9e4b1a
+Create Date: 2025-01-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e1f2a9d4b'
+down_revision: Union[str, None] = '2f8c5d9e4b1a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('hedge_fund_flow_run_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('run_id', sa.Integer(), nullable=False),
+    sa.Column('sequence', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('agent', sa.String(length=100), nullable=True),
+    sa.Column('ticker', sa.String(length=20), nullable=True),
+    sa.Column('payload', sa.JSON(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('run_id', 'sequence', name='uq_hedge_fund_flow_run_events_run_sequence')
+    )
+    op.create_index(op.f('ix_hedge_fund_flow_run_events_id'), 'hedge_fund_flow_run_events', ['id'], unique=False)
+    op.create_index(op.f('ix_hedge_fund_flow_run_events_run_id'), 'hedge_fund_flow_run_events', ['run_id'], unique=False)
+    op.create_index('ix_hedge_fund_flow_run_events_run_type_ticker', 'hedge_fund_flow_run_events', ['run_id', 'event_type', 'ticker'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_hedge_fund_flow_run_events_run_type_ticker', table_name='hedge_fund_flow_run_events')
+    op.drop_index(op.f('ix_hedge_fund_flow_run_events_run_id'), table_name='hedge_fund_flow_run_events')
+    op.drop_index(op.f('ix_hedge_fund_flow_run_events_id'), table_name='hedge_fund_flow_run_events')
+    op.drop_table('hedge_fund_flow_run_events')
@@ -0,0 +1,49 @@
+"""Add flow listing and name search indexes
+
+Revision ID: 9a4d2b7e1c3f
+Revises: 7c3e1f2a9d4b
+Create Date: 2025-01-20 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d2b7e1c3f'
+down_revision: Union[str, None] = '7c3e1f2a9d4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_hedge_fund_flows_last_modified',
+        'hedge_fund_flows',
+        [sa.text('coalesce(updated_at, created_at) DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index('ix_hedge_fund_flow_runs_flow_run_number', 'hedge_fund_flow_runs', ['flow_id', sa.text('run_number DESC')], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_hedge_fund_flows_name_trgm',
+            'hedge_fund_flows',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        )
+    else:
+        op.create_index('ix_hedge_fund_flows_name_trgm', 'hedge_fund_flows', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_hedge_fund_flows_name_trgm', table_name='hedge_fund_flows')
+    op.drop_index('ix_hedge_fund_flow_runs_flow_run_number', table_name='hedge_fund_flow_runs')
+    op.drop_index('ix_hedge_fund_flows_last_modified', table_name='hedge_fund_flows')
@@ -1,15 +1,24 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, JSON, Index, UniqueConstraint, DDL, event
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.sql import func
 from .connection import Base
 
+# Timestamps compared by keyset pagination. SQLite keeps server-side CURRENT_TIMESTAMP values as
+# text without fractional seconds, so Python-side values must be written in the same format to
+# compare correctly; other databases use a native timestamp type.
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite",
+)
+
 
 class HedgeFundFlow(Base):
     """Table to store React Flow configurations (nodes, edges, viewport)"""
     __tablename__ = "hedge_fund_flows"
     
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, onupdate=func.now())
     
     # Flow metadata
     name = Column(String(200), nullable=False)
@@ -25,6 +34,28 @@ class HedgeFundFlow(Base):
     is_template = Column(Boolean, default=False)  # Mark as template for reuse
     tags = Column(JSON, nullable=True)  # Store tags for categorization
 
+    @classmethod
+    def last_modified(cls):
+        """Sort key for flow listings; matches ix_hedge_fund_flows_last_modified"""
+        return func.coalesce(cls.updated_at, cls.created_at)
+
+
+# Keyset pagination of flow listings, most recently modified first
+Index("ix_hedge_fund_flows_last_modified", HedgeFundFlow.last_modified().desc(), HedgeFundFlow.id.desc())
+
+# Trigram index so name search (ILIKE '%term%') doesn't scan the table on PostgreSQL
+Index(
+    "ix_hedge_fund_flows_name_trgm",
+    HedgeFundFlow.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
+event.listen(
+    HedgeFundFlow.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
 
 class HedgeFundFlowRun(Base):
     """Table to track individual execution runs of a hedge fund flow"""
@@ -49,4 +80,26 @@ class HedgeFundFlowRun(Base):
     run_number = Column(Integer, nullable=False, default=1)  # Sequential run number for this flow
 
 
- 
\ No newline at end of file
+# Keyset pagination of a flow's runs, newest run first
+Index("ix_hedge_fund_flow_runs_flow_run_number", HedgeFundFlowRun.flow_id, HedgeFundFlowRun.run_number.desc())
+
+
+ 
+
+class HedgeFundFlowRunEvent(Base):
+    """Append-only log of a flow run's progress events and per-ticker signals"""
+    __tablename__ = "hedge_fund_flow_run_events"
+    __table_args__ = (
+        UniqueConstraint("run_id", "sequence", name="uq_hedge_fund_flow_run_events_run_sequence"),
+        Index("ix_hedge_fund_flow_run_events_run_type_ticker", "run_id", "event_type", "ticker"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, nullable=False, index=True)  # Foreign key to hedge_fund_flow_runs
+    sequence = Column(Integer, nullable=False)  # Per-run event number, used as the SSE event id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    event_type = Column(String(50), nullable=False)  # progress, signal, complete, error
+    agent = Column(String(100), nullable=True)
+    ticker = Column(String(20), nullable=True)
+    payload = Column(JSON, nullable=True)  # Event body (status, analysis, signal, decisions, ...)
@@ -2,15 +2,20 @@ from typing import Dict, Optional, Any, Literal
 from pydantic import BaseModel
 
 
+def format_sse(event_type: str, data: str, event_id: Optional[int] = None) -> str:
+    """Format a Server-Sent Event; the id lets clients resume with Last-Event-ID"""
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"event: {event_type.lower()}\n{id_line}data: {data}\n\n"
+
+
 class BaseEvent(BaseModel):
     """Base class for all Server-Sent Event events"""
 
     type: str
 
-    def to_sse(self) -> str:
+    def to_sse(self, event_id: Optional[int] = None) -> str:
         """Convert to Server-Sent Event format"""
-        event_type = self.type.lower()
-        return f"event: {event_type}\ndata: {self.model_dump_json()}\n\n"
+        return format_sse(self.type, self.model_dump_json(), event_id)
 
 
 class StartEvent(BaseEvent):
@@ -19,6 +24,13 @@ class StartEvent(BaseEvent):
     type: Literal["start"] = "start"
     timestamp: Optional[str] = None
 
+class QueuePositionEvent(BaseEvent):
+    """Event reporting a run's position in the run queue (0 once it starts running)"""
+
+    type: Literal["queued"] = "queued"
+    position: int
+    timestamp: Optional[str] = None
+
 class ProgressUpdateEvent(BaseEvent):
     """Event containing an agent's progress update"""
 
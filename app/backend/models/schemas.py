@@ -55,6 +55,7 @@ class HedgeFundRequest(BaseModel):
     model_provider: ModelProvider = ModelProvider.OPENAI
     initial_cash: float = 100000.0
     margin_requirement: float = 0.0
+    flow_run_id: Optional[int] = None  # Persist this run's events (resumable via the flow run events stream)
 
     def get_start_date(self) -> str:
         """Calculate start date if not provided"""
@@ -138,6 +139,12 @@ class FlowSummaryResponse(BaseModel):
         from_attributes = True
 
 
+class FlowSummaryPage(BaseModel):
+    """A page of flow summaries; pass next_cursor back as `cursor` for the next page"""
+    items: List[FlowSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
 # Flow Run schemas
 class FlowRunCreateRequest(BaseModel):
     """Request to create a new flow run"""
@@ -182,3 +189,22 @@ class FlowRunSummaryResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class FlowRunSummaryPage(BaseModel):
+    """A page of flow run summaries; pass next_cursor back as `cursor` for the next page"""
+    items: List[FlowRunSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
+class FlowRunEventResponse(BaseModel):
+    """A persisted flow run event (progress update, per-ticker signal or final result)"""
+    sequence: int
+    event_type: str
+    agent: Optional[str]
+    ticker: Optional[str]
+    payload: Optional[Dict[str, Any]]
+    created_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
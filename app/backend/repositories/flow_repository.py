@@ -1,15 +1,29 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import Row, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.backend.database.models import HedgeFundFlow
+from app.backend.services.graph_cache import get_compiled_graph_cache
+
+# Columns needed by list views; leaves out the nodes/edges/viewport/data JSON blobs
+FLOW_SUMMARY_COLUMNS = (
+    HedgeFundFlow.id,
+    HedgeFundFlow.name,
+    HedgeFundFlow.description,
+    HedgeFundFlow.is_template,
+    HedgeFundFlow.tags,
+    HedgeFundFlow.created_at,
+    HedgeFundFlow.updated_at,
+)
 
 
 class FlowRepository:
     """Repository for HedgeFundFlow CRUD operations"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create_flow(self, name: str, nodes: dict, edges: dict, description: str = None, 
+    async def create_flow(self, name: str, nodes: dict, edges: dict, description: str = None, 
                    viewport: dict = None, data: dict = None, is_template: bool = False, tags: List[str] = None) -> HedgeFundFlow:
         """Create a new hedge fund flow"""
         flow = HedgeFundFlow(
@@ -23,35 +37,68 @@ class FlowRepository:
             tags=tags or []
         )
         self.db.add(flow)
-        self.db.commit()
-        self.db.refresh(flow)
+        await self.db.commit()
+        await self.db.refresh(flow)
         return flow
     
-    def get_flow_by_id(self, flow_id: int) -> Optional[HedgeFundFlow]:
+    async def get_flow_by_id(self, flow_id: int) -> Optional[HedgeFundFlow]:
         """Get a flow by its ID"""
-        return self.db.query(HedgeFundFlow).filter(HedgeFundFlow.id == flow_id).first()
+        return await self.db.get(HedgeFundFlow, flow_id)
     
-    def get_all_flows(self, include_templates: bool = True) -> List[HedgeFundFlow]:
+    async def get_all_flows(self, include_templates: bool = True) -> List[HedgeFundFlow]:
         """Get all flows, optionally excluding templates"""
-        query = self.db.query(HedgeFundFlow)
+        query = select(HedgeFundFlow)
         if not include_templates:
-            query = query.filter(HedgeFundFlow.is_template == False)
-        return query.order_by(HedgeFundFlow.updated_at.desc()).all()
+            query = query.where(HedgeFundFlow.is_template == False)
+        result = await self.db.scalars(query.order_by(HedgeFundFlow.updated_at.desc()))
+        return list(result)
     
-    def get_flows_by_name(self, name: str) -> List[HedgeFundFlow]:
+    async def get_flows_by_name(self, name: str) -> List[HedgeFundFlow]:
         """Search flows by name (case-insensitive partial match)"""
-        return self.db.query(HedgeFundFlow).filter(
-            HedgeFundFlow.name.ilike(f"%{name}%")
-        ).order_by(HedgeFundFlow.updated_at.desc()).all()
+        result = await self.db.scalars(
+            select(HedgeFundFlow)
+            .where(HedgeFundFlow.name.ilike(f"%{name}%"))
+            .order_by(HedgeFundFlow.updated_at.desc())
+        )
+        return list(result)
     
-    def update_flow(self, flow_id: int, name: str = None, description: str = None,
+    async def get_flow_summaries(self, include_templates: bool = True, name: Optional[str] = None,
+                                 limit: Optional[int] = None,
+                                 after: Optional[Tuple[datetime, int]] = None) -> List[Row]:
+        """
+        Get summary rows (FLOW_SUMMARY_COLUMNS plus last_modified), most recently modified first.
+
+        `name` filters by case-insensitive partial match (served by the trigram index on PostgreSQL).
+        `after` is the (last_modified, id) of the previous page's last row, for keyset pagination.
+        """
+        last_modified = HedgeFundFlow.last_modified()
+        query = select(*FLOW_SUMMARY_COLUMNS, last_modified.label("last_modified"))
+        if not include_templates:
+            query = query.where(HedgeFundFlow.is_template == False)
+        if name:
+            query = query.where(HedgeFundFlow.name.ilike(f"%{name}%"))
+        if after is not None:
+            after_modified, after_id = after
+            # Bind with the column's type so the value is stored-format compatible (see Timestamp)
+            query = query.where(
+                tuple_(last_modified, HedgeFundFlow.id) < tuple_(literal(after_modified, last_modified.type), after_id)
+            )
+        query = query.order_by(last_modified.desc(), HedgeFundFlow.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.db.execute(query)
+        return list(result)
+    
+    async def update_flow(self, flow_id: int, name: str = None, description: str = None,
                    nodes: dict = None, edges: dict = None, viewport: dict = None, data: dict = None,
                    is_template: bool = None, tags: List[str] = None) -> Optional[HedgeFundFlow]:
         """Update an existing flow"""
-        flow = self.get_flow_by_id(flow_id)
+        flow = await self.get_flow_by_id(flow_id)
         if not flow:
             return None
         
+        previous_nodes, previous_edges = flow.nodes, flow.edges
+        
         if name is not None:
             flow.name = name
         if description is not None:
@@ -69,29 +116,34 @@ class FlowRepository:
         if tags is not None:
             flow.tags = tags
         
-        self.db.commit()
-        self.db.refresh(flow)
+        await self.db.commit()
+        await self.db.refresh(flow)
+        
+        # Drop the compiled graph for the flow's old structure
+        if nodes is not None or edges is not None:
+            get_compiled_graph_cache().invalidate(previous_nodes, previous_edges)
         return flow
     
-    def delete_flow(self, flow_id: int) -> bool:
+    async def delete_flow(self, flow_id: int) -> bool:
         """Delete a flow by ID"""
-        flow = self.get_flow_by_id(flow_id)
+        flow = await self.get_flow_by_id(flow_id)
         if not flow:
             return False
         
-        self.db.delete(flow)
-        self.db.commit()
+        get_compiled_graph_cache().invalidate(flow.nodes, flow.edges)
+        await self.db.delete(flow)
+        await self.db.commit()
         return True
     
-    def duplicate_flow(self, flow_id: int, new_name: str = None) -> Optional[HedgeFundFlow]:
+    async def duplicate_flow(self, flow_id: int, new_name: str = None) -> Optional[HedgeFundFlow]:
         """Create a copy of an existing flow"""
-        original = self.get_flow_by_id(flow_id)
+        original = await self.get_flow_by_id(flow_id)
         if not original:
             return None
         
         copy_name = new_name or f"{original.name} (Copy)"
         
-        return self.create_flow(
+        return await self.create_flow(
             name=copy_name,
             description=original.description,
             nodes=original.nodes,
@@ -0,0 +1,87 @@
+from typing import List, Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select
+from app.backend.database.models import HedgeFundFlowRunEvent
+
+
+class FlowRunEventRepository:
+    """Repository for the append-only HedgeFundFlowRunEvent log"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def append_events(self, run_id: int, events: List[Dict[str, Any]]) -> int:
+        """
+        Insert a batch of events for a run in one statement.
+
+        Each event is a dict with sequence, event_type and optionally agent, ticker, payload.
+        Returns the number of inserted events.
+        """
+        if not events:
+            return 0
+
+        await self.db.execute(
+            insert(HedgeFundFlowRunEvent),
+            [
+                {
+                    "run_id": run_id,
+                    "sequence": event["sequence"],
+                    "event_type": event["event_type"],
+                    "agent": event.get("agent"),
+                    "ticker": event.get("ticker"),
+                    "payload": event.get("payload"),
+                }
+                for event in events
+            ],
+        )
+        await self.db.commit()
+        return len(events)
+
+    async def get_events(self, run_id: int, after_sequence: int = 0, limit: int = 100,
+                         event_type: Optional[str] = None,
+                         exclude_types: Optional[List[str]] = None) -> List[HedgeFundFlowRunEvent]:
+        """Get a page of a run's events with sequence > after_sequence, oldest first"""
+        query = select(HedgeFundFlowRunEvent).where(
+            HedgeFundFlowRunEvent.run_id == run_id,
+            HedgeFundFlowRunEvent.sequence > after_sequence
+        )
+        if event_type is not None:
+            query = query.where(HedgeFundFlowRunEvent.event_type == event_type)
+        if exclude_types:
+            query = query.where(HedgeFundFlowRunEvent.event_type.notin_(exclude_types))
+        result = await self.db.scalars(query.order_by(HedgeFundFlowRunEvent.sequence).limit(limit))
+        return list(result)
+
+    async def get_signals(self, run_id: int, ticker: Optional[str] = None, agent: Optional[str] = None,
+                          limit: int = 100, offset: int = 0) -> List[HedgeFundFlowRunEvent]:
+        """Get a page of a run's per-ticker analyst signals"""
+        query = select(HedgeFundFlowRunEvent).where(
+            HedgeFundFlowRunEvent.run_id == run_id,
+            HedgeFundFlowRunEvent.event_type == "signal"
+        )
+        if ticker is not None:
+            query = query.where(HedgeFundFlowRunEvent.ticker == ticker)
+        if agent is not None:
+            query = query.where(HedgeFundFlowRunEvent.agent == agent)
+        result = await self.db.scalars(
+            query.order_by(HedgeFundFlowRunEvent.ticker, HedgeFundFlowRunEvent.agent)
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(result)
+
+    async def get_last_sequence(self, run_id: int) -> int:
+        """Get the highest event sequence recorded for a run (0 if none)"""
+        last_sequence = await self.db.scalar(
+            select(func.max(HedgeFundFlowRunEvent.sequence))
+            .where(HedgeFundFlowRunEvent.run_id == run_id)
+        )
+        return last_sequence or 0
+
+    async def delete_events_by_run_id(self, run_id: int) -> int:
+        """Delete all events for a run. Returns count of deleted events."""
+        result = await self.db.execute(
+            delete(HedgeFundFlowRunEvent).where(HedgeFundFlowRunEvent.run_id == run_id)
+        )
+        await self.db.commit()
+        return result.rowcount
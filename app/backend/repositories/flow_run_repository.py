@@ -1,22 +1,34 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from app.backend.database.models import HedgeFundFlowRun
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, delete, desc, func, select
+from app.backend.database.models import HedgeFundFlowRun, HedgeFundFlowRunEvent
 from app.backend.models.schemas import FlowRunStatus
 
+# Columns needed by list views; leaves out the request_data/results JSON blobs
+FLOW_RUN_SUMMARY_COLUMNS = (
+    HedgeFundFlowRun.id,
+    HedgeFundFlowRun.flow_id,
+    HedgeFundFlowRun.status,
+    HedgeFundFlowRun.run_number,
+    HedgeFundFlowRun.created_at,
+    HedgeFundFlowRun.started_at,
+    HedgeFundFlowRun.completed_at,
+    HedgeFundFlowRun.error_message,
+)
+
 
 class FlowRunRepository:
     """Repository for HedgeFundFlowRun CRUD operations"""
-    
-    def __init__(self, db: Session):
+
+    def __init__(self, db: AsyncSession):
         self.db = db
-    
-    def create_flow_run(self, flow_id: int, request_data: Dict[str, Any] = None) -> HedgeFundFlowRun:
+
+    async def create_flow_run(self, flow_id: int, request_data: Dict[str, Any] = None) -> HedgeFundFlowRun:
         """Create a new flow run"""
         # Get the next run number for this flow
-        run_number = self._get_next_run_number(flow_id)
-        
+        run_number = await self._get_next_run_number(flow_id)
+
         flow_run = HedgeFundFlowRun(
             flow_id=flow_id,
             request_data=request_data,
@@ -24,46 +36,61 @@ class FlowRunRepository:
             status=FlowRunStatus.IDLE.value
         )
         self.db.add(flow_run)
-        self.db.commit()
-        self.db.refresh(flow_run)
+        await self.db.commit()
+        await self.db.refresh(flow_run)
         return flow_run
-    
-    def get_flow_run_by_id(self, run_id: int) -> Optional[HedgeFundFlowRun]:
+
+    async def get_flow_run_by_id(self, run_id: int) -> Optional[HedgeFundFlowRun]:
         """Get a flow run by its ID"""
-        return self.db.query(HedgeFundFlowRun).filter(HedgeFundFlowRun.id == run_id).first()
-    
-    def get_flow_runs_by_flow_id(self, flow_id: int, limit: int = 50, offset: int = 0) -> List[HedgeFundFlowRun]:
+        return await self.db.get(HedgeFundFlowRun, run_id)
+
+    async def get_flow_runs_by_flow_id(self, flow_id: int, limit: int = 50, offset: int = 0) -> List[HedgeFundFlowRun]:
         """Get all runs for a specific flow, ordered by most recent first"""
-        return (
-            self.db.query(HedgeFundFlowRun)
-            .filter(HedgeFundFlowRun.flow_id == flow_id)
+        result = await self.db.scalars(
+            select(HedgeFundFlowRun)
+            .where(HedgeFundFlowRun.flow_id == flow_id)
             .order_by(desc(HedgeFundFlowRun.created_at))
             .limit(limit)
             .offset(offset)
-            .all()
         )
-    
-    def get_active_flow_run(self, flow_id: int) -> Optional[HedgeFundFlowRun]:
+        return list(result)
+
+    async def get_flow_run_summaries(self, flow_id: int, limit: int = 50, offset: int = 0,
+                                     before_run_number: Optional[int] = None) -> List[Row]:
+        """
+        Get summary rows (FLOW_RUN_SUMMARY_COLUMNS) for a flow's runs, newest first.
+
+        Pass the previous page's last run_number as `before_run_number` for keyset pagination.
+        """
+        query = select(*FLOW_RUN_SUMMARY_COLUMNS).where(HedgeFundFlowRun.flow_id == flow_id)
+        if before_run_number is not None:
+            query = query.where(HedgeFundFlowRun.run_number < before_run_number)
+        result = await self.db.execute(
+            query.order_by(desc(HedgeFundFlowRun.run_number)).limit(limit).offset(offset)
+        )
+        return list(result)
+
+    async def get_active_flow_run(self, flow_id: int) -> Optional[HedgeFundFlowRun]:
         """Get the current active (IN_PROGRESS) run for a flow"""
-        return (
-            self.db.query(HedgeFundFlowRun)
-            .filter(
+        return await self.db.scalar(
+            select(HedgeFundFlowRun)
+            .where(
                 HedgeFundFlowRun.flow_id == flow_id,
                 HedgeFundFlowRun.status == FlowRunStatus.IN_PROGRESS.value
             )
-            .first()
+            .limit(1)
         )
-    
-    def get_latest_flow_run(self, flow_id: int) -> Optional[HedgeFundFlowRun]:
+
+    async def get_latest_flow_run(self, flow_id: int) -> Optional[HedgeFundFlowRun]:
         """Get the most recent run for a flow"""
-        return (
-            self.db.query(HedgeFundFlowRun)
-            .filter(HedgeFundFlowRun.flow_id == flow_id)
+        return await self.db.scalar(
+            select(HedgeFundFlowRun)
+            .where(HedgeFundFlowRun.flow_id == flow_id)
             .order_by(desc(HedgeFundFlowRun.created_at))
-            .first()
+            .limit(1)
         )
-    
-    def update_flow_run(
+
+    async def update_flow_run(
         self,
         run_id: int,
         status: Optional[FlowRunStatus] = None,
@@ -71,63 +98,69 @@ class FlowRunRepository:
         error_message: Optional[str] = None
     ) -> Optional[HedgeFundFlowRun]:
         """Update an existing flow run"""
-        flow_run = self.get_flow_run_by_id(run_id)
+        flow_run = await self.get_flow_run_by_id(run_id)
         if not flow_run:
             return None
-        
+
         # Update status and timing
         if status is not None:
             flow_run.status = status.value
-            
+
             # Update timing based on status
             if status == FlowRunStatus.IN_PROGRESS and not flow_run.started_at:
                 flow_run.started_at = datetime.utcnow()
             elif status in [FlowRunStatus.COMPLETE, FlowRunStatus.ERROR] and not flow_run.completed_at:
                 flow_run.completed_at = datetime.utcnow()
-        
+
         # Update results and error message
         if results is not None:
             flow_run.results = results
         if error_message is not None:
             flow_run.error_message = error_message
-        
-        self.db.commit()
-        self.db.refresh(flow_run)
+
+        await self.db.commit()
+        await self.db.refresh(flow_run)
         return flow_run
-    
-    def delete_flow_run(self, run_id: int) -> bool:
+
+    async def delete_flow_run(self, run_id: int) -> bool:
         """Delete a flow run by ID"""
-        flow_run = self.get_flow_run_by_id(run_id)
+        flow_run = await self.get_flow_run_by_id(run_id)
         if not flow_run:
             return False
-        
-        self.db.delete(flow_run)
-        self.db.commit()
+
+        await self.db.execute(delete(HedgeFundFlowRunEvent).where(HedgeFundFlowRunEvent.run_id == run_id))
+        await self.db.delete(flow_run)
+        await self.db.commit()
         return True
-    
-    def delete_flow_runs_by_flow_id(self, flow_id: int) -> int:
+
+    async def delete_flow_runs_by_flow_id(self, flow_id: int) -> int:
         """Delete all runs for a specific flow. Returns count of deleted runs."""
-        deleted_count = (
-            self.db.query(HedgeFundFlowRun)
-            .filter(HedgeFundFlowRun.flow_id == flow_id)
-            .delete()
+        run_ids = select(HedgeFundFlowRun.id).where(HedgeFundFlowRun.flow_id == flow_id)
+        await self.db.execute(
+            delete(HedgeFundFlowRunEvent)
+            .where(HedgeFundFlowRunEvent.run_id.in_(run_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(
+            delete(HedgeFundFlowRun)
+            .where(HedgeFundFlowRun.flow_id == flow_id)
+            .execution_options(synchronize_session=False)
         )
-        self.db.commit()
-        return deleted_count
-    
-    def get_flow_run_count(self, flow_id: int) -> int:
+        await self.db.commit()
+        return result.rowcount
+
+    async def get_flow_run_count(self, flow_id: int) -> int:
         """Get total count of runs for a flow"""
-        return (
-            self.db.query(HedgeFundFlowRun)
-            .filter(HedgeFundFlowRun.flow_id == flow_id)
-            .count()
+        return await self.db.scalar(
+            select(func.count())
+            .select_from(HedgeFundFlowRun)
+            .where(HedgeFundFlowRun.flow_id == flow_id)
         )
-    
-    def _get_next_run_number(self, flow_id: int) -> int:
+
+    async def _get_next_run_number(self, flow_id: int) -> int:
         """Get the next run number for a flow"""
-        max_run_number = (
-            self.db.query(func.max(HedgeFundFlowRun.run_number))
-            .filter(HedgeFundFlowRun.flow_id == flow_id)
-            .scalar()
+        max_run_number = await self.db.scalar(
+            select(func.max(HedgeFundFlowRun.run_number))
+            .where(HedgeFundFlowRun.flow_id == flow_id)
         )
-        return (max_run_number or 0) + 1 
\ No newline at end of file
+        return (max_run_number or 0) + 1
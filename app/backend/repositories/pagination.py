@@ -0,0 +1,23 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque keyset cursor"""
+    encoded = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(encoded).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str], *types: type) -> Optional[List[Any]]:
+    """Decode a cursor from `encode_cursor`, converting each value to the given type; raises ValueError if malformed"""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeEncodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+    return [datetime.fromisoformat(value) if kind is datetime else kind(value) for value, kind in zip(values, types)]
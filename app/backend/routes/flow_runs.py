@@ -1,21 +1,47 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+import asyncio
+import json
 
-from app.backend.database import get_db
+from app.backend.database import get_async_db, AsyncSessionLocal
+from app.backend.models.events import format_sse
+from app.backend.repositories.flow_run_event_repository import FlowRunEventRepository
 from app.backend.repositories.flow_run_repository import FlowRunRepository
 from app.backend.repositories.flow_repository import FlowRepository
+from app.backend.repositories.pagination import decode_cursor, encode_cursor
 from app.backend.models.schemas import (
     FlowRunCreateRequest,
     FlowRunUpdateRequest,
     FlowRunResponse,
     FlowRunSummaryResponse,
+    FlowRunSummaryPage,
     FlowRunStatus,
+    FlowRunEventResponse,
     ErrorResponse
 )
 
 router = APIRouter(prefix="/flows/{flow_id}/runs", tags=["flow-runs"])
 
+# Seconds between polls of the events table while replaying a run that is still in progress
+EVENT_STREAM_POLL_INTERVAL = 0.5
+# Close the stream after this many seconds without new events, so a run left IN_PROGRESS
+# (e.g. by a server restart) does not keep a client polling forever; clients resume via Last-Event-ID
+EVENT_STREAM_IDLE_TIMEOUT = 300.0
+
+
+async def _get_flow_run_or_404(db: AsyncSession, flow_id: int, run_id: int):
+    """Verify the flow exists and the run belongs to it"""
+    flow = await FlowRepository(db).get_flow_by_id(flow_id)
+    if not flow:
+        raise HTTPException(status_code=404, detail="Flow not found")
+
+    flow_run = await FlowRunRepository(db).get_flow_run_by_id(run_id)
+    if not flow_run or flow_run.flow_id != flow_id:
+        raise HTTPException(status_code=404, detail="Flow run not found")
+    return flow_run
+
 
 @router.post(
     "/",
@@ -28,19 +54,19 @@ router = APIRouter(prefix="/flows/{flow_id}/runs", tags=["flow-runs"])
 async def create_flow_run(
     flow_id: int, 
     request: FlowRunCreateRequest, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new flow run for the specified flow"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Create the flow run
         run_repo = FlowRunRepository(db)
-        flow_run = run_repo.create_flow_run(
+        flow_run = await run_repo.create_flow_run(
             flow_id=flow_id,
             request_data=request.request_data
         )
@@ -63,19 +89,19 @@ async def get_flow_runs(
     flow_id: int,
     limit: int = Query(50, ge=1, le=100, description="Maximum number of runs to return"),
     offset: int = Query(0, ge=0, description="Number of runs to skip"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all runs for the specified flow"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get flow runs
         run_repo = FlowRunRepository(db)
-        flow_runs = run_repo.get_flow_runs_by_flow_id(flow_id, limit=limit, offset=offset)
+        flow_runs = await run_repo.get_flow_run_summaries(flow_id, limit=limit, offset=offset)
         return [FlowRunSummaryResponse.from_orm(run) for run in flow_runs]
     except HTTPException:
         raise
@@ -83,6 +109,50 @@ async def get_flow_runs(
         raise HTTPException(status_code=500, detail=f"Failed to retrieve flow runs: {str(e)}")
 
 
+@router.get(
+    "/summaries",
+    response_model=FlowRunSummaryPage,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid cursor"},
+        404: {"model": ErrorResponse, "description": "Flow not found"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+)
+async def get_flow_run_summaries(
+    flow_id: int,
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of runs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of run summaries for the specified flow, newest first"""
+    try:
+        after = decode_cursor(cursor, int)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        # Verify flow exists
+        flow_repo = FlowRepository(db)
+        flow = await flow_repo.get_flow_by_id(flow_id)
+        if not flow:
+            raise HTTPException(status_code=404, detail="Flow not found")
+
+        # Fetch one extra row to know whether there is a next page
+        run_repo = FlowRunRepository(db)
+        flow_runs = await run_repo.get_flow_run_summaries(
+            flow_id, limit=limit + 1, before_run_number=after[0] if after else None
+        )
+        next_cursor = None
+        if len(flow_runs) > limit:
+            flow_runs = flow_runs[:limit]
+            next_cursor = encode_cursor(flow_runs[-1].run_number)
+        return FlowRunSummaryPage(items=[FlowRunSummaryResponse.from_orm(run) for run in flow_runs], next_cursor=next_cursor)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve flow runs: {str(e)}")
+
+
 @router.get(
     "/active",
     response_model=Optional[FlowRunResponse],
@@ -91,18 +161,18 @@ async def get_flow_runs(
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_active_flow_run(flow_id: int, db: Session = Depends(get_db)):
+async def get_active_flow_run(flow_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get the current active (IN_PROGRESS) run for the specified flow"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get active flow run
         run_repo = FlowRunRepository(db)
-        active_run = run_repo.get_active_flow_run(flow_id)
+        active_run = await run_repo.get_active_flow_run(flow_id)
         return FlowRunResponse.from_orm(active_run) if active_run else None
     except HTTPException:
         raise
@@ -118,18 +188,18 @@ async def get_active_flow_run(flow_id: int, db: Session = Depends(get_db)):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_latest_flow_run(flow_id: int, db: Session = Depends(get_db)):
+async def get_latest_flow_run(flow_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get the most recent run for the specified flow"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get latest flow run
         run_repo = FlowRunRepository(db)
-        latest_run = run_repo.get_latest_flow_run(flow_id)
+        latest_run = await run_repo.get_latest_flow_run(flow_id)
         return FlowRunResponse.from_orm(latest_run) if latest_run else None
     except HTTPException:
         raise
@@ -145,18 +215,18 @@ async def get_latest_flow_run(flow_id: int, db: Session = Depends(get_db)):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_flow_run(flow_id: int, run_id: int, db: Session = Depends(get_db)):
+async def get_flow_run(flow_id: int, run_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific flow run by ID"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get flow run
         run_repo = FlowRunRepository(db)
-        flow_run = run_repo.get_flow_run_by_id(run_id)
+        flow_run = await run_repo.get_flow_run_by_id(run_id)
         if not flow_run or flow_run.flow_id != flow_id:
             raise HTTPException(status_code=404, detail="Flow run not found")
         
@@ -167,6 +237,114 @@ async def get_flow_run(flow_id: int, run_id: int, db: Session = Depends(get_db))
         raise HTTPException(status_code=500, detail=f"Failed to retrieve flow run: {str(e)}")
 
 
+@router.get(
+    "/{run_id}/events",
+    response_model=List[FlowRunEventResponse],
+    responses={
+        404: {"model": ErrorResponse, "description": "Flow or run not found"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+)
+async def get_flow_run_events(
+    flow_id: int,
+    run_id: int,
+    after: int = Query(0, ge=0, description="Return events with a sequence greater than this"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
+    event_type: Optional[str] = Query(None, description="Only return events of this type"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of a run's persisted events, oldest first (pass the last sequence as `after` for the next page)"""
+    try:
+        await _get_flow_run_or_404(db, flow_id, run_id)
+        events = await FlowRunEventRepository(db).get_events(run_id, after_sequence=after, limit=limit, event_type=event_type)
+        return [FlowRunEventResponse.from_orm(event) for event in events]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve flow run events: {str(e)}")
+
+
+@router.get(
+    "/{run_id}/signals",
+    response_model=List[FlowRunEventResponse],
+    responses={
+        404: {"model": ErrorResponse, "description": "Flow or run not found"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+)
+async def get_flow_run_signals(
+    flow_id: int,
+    run_id: int,
+    ticker: Optional[str] = Query(None, description="Only return signals for this ticker"),
+    agent: Optional[str] = Query(None, description="Only return signals from this agent"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of signals to return"),
+    offset: int = Query(0, ge=0, description="Number of signals to skip"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of a run's per-ticker analyst signals"""
+    try:
+        await _get_flow_run_or_404(db, flow_id, run_id)
+        signals = await FlowRunEventRepository(db).get_signals(run_id, ticker=ticker, agent=agent, limit=limit, offset=offset)
+        return [FlowRunEventResponse.from_orm(signal) for signal in signals]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve flow run signals: {str(e)}")
+
+
+@router.get(
+    "/{run_id}/events/stream",
+    responses={
+        200: {"description": "Replay of the run's events, followed by live updates until it finishes"},
+        404: {"model": ErrorResponse, "description": "Flow or run not found"},
+    },
+)
+async def stream_flow_run_events(
+    flow_id: int,
+    run_id: int,
+    request: Request,
+    last_event_id: Optional[int] = Query(None, ge=0, description="Resume after this event id (the Last-Event-ID header takes precedence)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Resume a run's event stream: replay persisted events after the last seen id, then follow the run until it finishes"""
+    await _get_flow_run_or_404(db, flow_id, run_id)
+
+    header = request.headers.get("last-event-id")
+    after = int(header) if header and header.isdigit() else (last_event_id or 0)
+
+    async def load_events(after_sequence: int):
+        # Own session per poll; the request's session is closed once streaming starts
+        async with AsyncSessionLocal() as session:
+            # Check the status first: a finished run has already flushed all of its events
+            flow_run = await FlowRunRepository(session).get_flow_run_by_id(run_id)
+            finished = flow_run is None or flow_run.status in (FlowRunStatus.COMPLETE.value, FlowRunStatus.ERROR.value)
+            # Signals are only served by the signals endpoint; the stream mirrors the live run stream
+            events = await FlowRunEventRepository(session).get_events(run_id, after_sequence=after_sequence, exclude_types=["signal"])
+            return [(event.sequence, event.event_type, event.payload) for event in events], finished
+
+    async def event_generator():
+        sequence = after
+        loop = asyncio.get_running_loop()
+        last_activity = loop.time()
+        while True:
+            events, finished = await load_events(sequence)
+            for sequence, event_type, payload in events:
+                yield format_sse(event_type, json.dumps(payload), sequence)
+
+            if not events and finished:
+                return
+            if await request.is_disconnected():
+                return
+            if events:
+                last_activity = loop.time()
+            elif loop.time() - last_activity >= EVENT_STREAM_IDLE_TIMEOUT:
+                return
+            else:
+                await asyncio.sleep(EVENT_STREAM_POLL_INTERVAL)
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
 @router.put(
     "/{run_id}",
     response_model=FlowRunResponse,
@@ -179,24 +357,24 @@ async def update_flow_run(
     flow_id: int, 
     run_id: int, 
     request: FlowRunUpdateRequest, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an existing flow run"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Update flow run
         run_repo = FlowRunRepository(db)
         # First verify the run exists and belongs to this flow
-        existing_run = run_repo.get_flow_run_by_id(run_id)
+        existing_run = await run_repo.get_flow_run_by_id(run_id)
         if not existing_run or existing_run.flow_id != flow_id:
             raise HTTPException(status_code=404, detail="Flow run not found")
         
-        flow_run = run_repo.update_flow_run(
+        flow_run = await run_repo.update_flow_run(
             run_id=run_id,
             status=request.status,
             results=request.results,
@@ -221,22 +399,22 @@ async def update_flow_run(
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def delete_flow_run(flow_id: int, run_id: int, db: Session = Depends(get_db)):
+async def delete_flow_run(flow_id: int, run_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete a flow run"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Verify run exists and belongs to this flow
         run_repo = FlowRunRepository(db)
-        existing_run = run_repo.get_flow_run_by_id(run_id)
+        existing_run = await run_repo.get_flow_run_by_id(run_id)
         if not existing_run or existing_run.flow_id != flow_id:
             raise HTTPException(status_code=404, detail="Flow run not found")
         
-        success = run_repo.delete_flow_run(run_id)
+        success = await run_repo.delete_flow_run(run_id)
         if not success:
             raise HTTPException(status_code=404, detail="Flow run not found")
         
@@ -255,18 +433,18 @@ async def delete_flow_run(flow_id: int, run_id: int, db: Session = Depends(get_d
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def delete_all_flow_runs(flow_id: int, db: Session = Depends(get_db)):
+async def delete_all_flow_runs(flow_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete all runs for the specified flow"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Delete all flow runs
         run_repo = FlowRunRepository(db)
-        deleted_count = run_repo.delete_flow_runs_by_flow_id(flow_id)
+        deleted_count = await run_repo.delete_flow_runs_by_flow_id(flow_id)
         
         return {"message": f"Deleted {deleted_count} flow runs successfully"}
     except HTTPException:
@@ -283,18 +461,18 @@ async def delete_all_flow_runs(flow_id: int, db: Session = Depends(get_db)):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_flow_run_count(flow_id: int, db: Session = Depends(get_db)):
+async def get_flow_run_count(flow_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get the total count of runs for the specified flow"""
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
+        flow = await flow_repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get run count
         run_repo = FlowRunRepository(db)
-        count = run_repo.get_flow_run_count(flow_id)
+        count = await run_repo.get_flow_run_count(flow_id)
         
         return {"flow_id": flow_id, "total_runs": count}
     except HTTPException:
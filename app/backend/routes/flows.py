@@ -1,14 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional
 
-from app.backend.database import get_db
+from app.backend.database import get_async_db
 from app.backend.repositories.flow_repository import FlowRepository
+from app.backend.repositories.pagination import decode_cursor, encode_cursor
 from app.backend.models.schemas import (
     FlowCreateRequest, 
     FlowUpdateRequest, 
     FlowResponse, 
     FlowSummaryResponse,
+    FlowSummaryPage,
     ErrorResponse
 )
 
@@ -23,11 +26,11 @@ router = APIRouter(prefix="/flows", tags=["flows"])
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def create_flow(request: FlowCreateRequest, db: Session = Depends(get_db)):
+async def create_flow(request: FlowCreateRequest, db: AsyncSession = Depends(get_async_db)):
     """Create a new hedge fund flow"""
     try:
         repo = FlowRepository(db)
-        flow = repo.create_flow(
+        flow = await repo.create_flow(
             name=request.name,
             description=request.description,
             nodes=request.nodes,
@@ -49,16 +52,50 @@ async def create_flow(request: FlowCreateRequest, db: Session = Depends(get_db))
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_flows(include_templates: bool = True, db: Session = Depends(get_db)):
+async def get_flows(include_templates: bool = True, db: AsyncSession = Depends(get_async_db)):
     """Get all flows (summary view)"""
     try:
         repo = FlowRepository(db)
-        flows = repo.get_all_flows(include_templates=include_templates)
+        flows = await repo.get_flow_summaries(include_templates=include_templates)
         return [FlowSummaryResponse.from_orm(flow) for flow in flows]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve flows: {str(e)}")
 
 
+@router.get(
+    "/summaries",
+    response_model=FlowSummaryPage,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid cursor"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+)
+async def get_flow_summaries(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of flows to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_templates: bool = True,
+    name: Optional[str] = Query(None, min_length=1, description="Case-insensitive partial name match"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of flow summaries, most recently modified first"""
+    try:
+        after = decode_cursor(cursor, datetime, int)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        repo = FlowRepository(db)
+        # Fetch one extra row to know whether there is a next page
+        flows = await repo.get_flow_summaries(include_templates=include_templates, name=name, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(flows) > limit:
+            flows = flows[:limit]
+            next_cursor = encode_cursor(flows[-1].last_modified, flows[-1].id)
+        return FlowSummaryPage(items=[FlowSummaryResponse.from_orm(flow) for flow in flows], next_cursor=next_cursor)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve flows: {str(e)}")
+
+
 @router.get(
     "/{flow_id}",
     response_model=FlowResponse,
@@ -67,11 +104,11 @@ async def get_flows(include_templates: bool = True, db: Session = Depends(get_db
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_flow(flow_id: int, db: Session = Depends(get_db)):
+async def get_flow(flow_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific flow by ID"""
     try:
         repo = FlowRepository(db)
-        flow = repo.get_flow_by_id(flow_id)
+        flow = await repo.get_flow_by_id(flow_id)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         return FlowResponse.from_orm(flow)
@@ -89,11 +126,11 @@ async def get_flow(flow_id: int, db: Session = Depends(get_db)):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def update_flow(flow_id: int, request: FlowUpdateRequest, db: Session = Depends(get_db)):
+async def update_flow(flow_id: int, request: FlowUpdateRequest, db: AsyncSession = Depends(get_async_db)):
     """Update an existing flow"""
     try:
         repo = FlowRepository(db)
-        flow = repo.update_flow(
+        flow = await repo.update_flow(
             flow_id=flow_id,
             name=request.name,
             description=request.description,
@@ -121,11 +158,11 @@ async def update_flow(flow_id: int, request: FlowUpdateRequest, db: Session = De
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def delete_flow(flow_id: int, db: Session = Depends(get_db)):
+async def delete_flow(flow_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete a flow"""
     try:
         repo = FlowRepository(db)
-        success = repo.delete_flow(flow_id)
+        success = await repo.delete_flow(flow_id)
         if not success:
             raise HTTPException(status_code=404, detail="Flow not found")
         return {"message": "Flow deleted successfully"}
@@ -143,11 +180,11 @@ async def delete_flow(flow_id: int, db: Session = Depends(get_db)):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def duplicate_flow(flow_id: int, new_name: str = None, db: Session = Depends(get_db)):
+async def duplicate_flow(flow_id: int, new_name: str = None, db: AsyncSession = Depends(get_async_db)):
     """Create a copy of an existing flow"""
     try:
         repo = FlowRepository(db)
-        flow = repo.duplicate_flow(flow_id, new_name)
+        flow = await repo.duplicate_flow(flow_id, new_name)
         if not flow:
             raise HTTPException(status_code=404, detail="Flow not found")
         return FlowResponse.from_orm(flow)
@@ -164,11 +201,11 @@ async def duplicate_flow(flow_id: int, new_name: str = None, db: Session = Depen
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def search_flows(name: str, db: Session = Depends(get_db)):
+async def search_flows(name: str, db: AsyncSession = Depends(get_async_db)):
     """Search flows by name"""
     try:
         repo = FlowRepository(db)
-        flows = repo.get_flows_by_name(name)
+        flows = await repo.get_flow_summaries(name=name)
         return [FlowSummaryResponse.from_orm(flow) for flow in flows]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to search flows: {str(e)}") 
\ No newline at end of file
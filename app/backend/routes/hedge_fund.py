@@ -3,19 +3,27 @@ from fastapi.responses import StreamingResponse
 import asyncio
 
 from app.backend.models.schemas import ErrorResponse, HedgeFundRequest
-from app.backend.models.events import StartEvent, ProgressUpdateEvent, ErrorEvent, CompleteEvent
-from app.backend.services.graph import create_graph, parse_hedge_fund_response, run_graph_async
+from app.backend.models.events import StartEvent, ProgressUpdateEvent, QueuePositionEvent, ErrorEvent, CompleteEvent
+from app.backend.services.graph import get_compiled_graph, parse_hedge_fund_response, run_graph
 from app.backend.services.portfolio import create_portfolio
+from app.backend.services.run_events import RunEventRecorder
+from app.backend.services.run_scheduler import RunQueueFullError, get_run_scheduler
+from src.utils.cancellation import RunCancelledError
 from src.utils.progress import progress
 from src.utils.analysts import get_agents_list
 
 router = APIRouter(prefix="/hedge-fund")
 
+# Keep references to run finalizers so they are not garbage collected mid-run
+_background_tasks = set()
+
 @router.post(
     path="/run",
     responses={
         200: {"description": "Successful response with streaming updates"},
         400: {"model": ErrorResponse, "description": "Invalid request parameters"},
+        404: {"model": ErrorResponse, "description": "Flow run not found"},
+        429: {"model": ErrorResponse, "description": "Run queue full or per-user run limit reached"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
@@ -24,21 +32,101 @@ async def run_hedge_fund(request_data: HedgeFundRequest, request: Request):
         # Create the portfolio
         portfolio = create_portfolio(request_data.initial_cash, request_data.margin_requirement, request_data.tickers)
 
-        # Construct agent graph using the React Flow graph structure
-        graph = create_graph(
+        # Construct agent graph using the React Flow graph structure (compiled graphs are cached by structure)
+        graph = get_compiled_graph(
             graph_nodes=request_data.graph_nodes,
             graph_edges=request_data.graph_edges
         )
-        graph = graph.compile()
 
-        # Log a test progress update for debugging
-        progress.update_status("system", None, "Preparing hedge fund run")
+        # Progress updates for this run only, so concurrent runs don't see each other's events
+        progress_channel = progress.create_channel()
+        progress_channel.update_status("system", None, "Preparing hedge fund run")
 
         # Convert model_provider to string if it's an enum
         model_provider = request_data.model_provider
         if hasattr(model_provider, "value"):
             model_provider = model_provider.value
 
+        # Persist this run's events when it is tied to a flow run, so clients can resume the stream
+        recorder = None
+        if request_data.flow_run_id is not None:
+            recorder = await RunEventRecorder.open(request_data.flow_run_id)
+            if recorder is None:
+                raise HTTPException(status_code=404, detail="Flow run not found")
+
+        # Queue for progress and queue-position updates, filled before the stream starts
+        progress_queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        # Handler runs on graph worker threads; hand events to the event loop thread-safely
+        def progress_handler(agent_name, ticker, status, analysis, timestamp):
+            event = ProgressUpdateEvent(agent=agent_name, ticker=ticker, status=status, timestamp=timestamp, analysis=analysis)
+            event_id = recorder.record(event, agent=agent_name, ticker=ticker) if recorder else None
+            loop.call_soon_threadsafe(progress_queue.put_nowait, (event, event_id))
+
+        # Register our handler with this run's progress channel
+        progress_channel.register_handler(progress_handler)
+
+        # Admit the run into the bounded run queue (429 if the queue or the user's quota is full)
+        scheduler = get_run_scheduler()
+        user_id = request.headers.get("X-User-Id") or (request.client.host if request.client else "anonymous")
+        try:
+            ticket = scheduler.submit(
+                user_id,
+                run_graph,
+                graph=graph,
+                portfolio=portfolio,
+                tickers=request_data.tickers,
+                start_date=request_data.start_date,
+                end_date=request_data.end_date,
+                model_name=request_data.model_name,
+                model_provider=model_provider,
+                request=request_data,  # Pass the full request for agent-specific model access
+                progress_channel=progress_channel,
+                on_position=lambda position: progress_queue.put_nowait((QueuePositionEvent(position=position), None)),
+            )
+        except RunQueueFullError as e:
+            progress_channel.unregister_handler(progress_handler)
+            if recorder:
+                await recorder.finish(ErrorEvent(message=str(e)))
+            raise HTTPException(status_code=429, detail=str(e))
+
+        # Build (and persist) the final event once the run finishes, independently of the client stream
+        async def finalize_run():
+            try:
+                try:
+                    result = await ticket.result
+                except (asyncio.CancelledError, RunCancelledError):
+                    print("Task was cancelled")
+                    if recorder:
+                        await recorder.finish(ErrorEvent(message="Run was cancelled"))
+                    return None
+                except Exception as e:
+                    result, error = None, str(e)
+                else:
+                    error = "Failed to generate hedge fund decisions"
+
+                analyst_signals = None
+                if not result or not result.get("messages"):
+                    final_event = ErrorEvent(message=error)
+                else:
+                    analyst_signals = result.get("data", {}).get("analyst_signals", {})
+                    final_event = CompleteEvent(
+                        data={
+                            "decisions": parse_hedge_fund_response(result.get("messages", [])[-1].content),
+                            "analyst_signals": analyst_signals,
+                        }
+                    )
+
+                event_id = await recorder.finish(final_event, analyst_signals) if recorder else None
+                return final_event, event_id
+            finally:
+                progress_channel.unregister_handler(progress_handler)
+
+        finalize_task = asyncio.create_task(finalize_run())
+        _background_tasks.add(finalize_task)
+        finalize_task.add_done_callback(_background_tasks.discard)
+
         # Function to detect client disconnection
         async def wait_for_disconnect():
             """Wait for client disconnect and return True when it happens"""
@@ -52,92 +140,48 @@ async def run_hedge_fund(request_data: HedgeFundRequest, request: Request):
 
         # Set up streaming response
         async def event_generator():
-            # Queue for progress updates
-            progress_queue = asyncio.Queue()
-            run_task = None
             disconnect_task = None
 
-            # Simple handler to add updates to the queue
-            def progress_handler(agent_name, ticker, status, analysis, timestamp):
-                event = ProgressUpdateEvent(agent=agent_name, ticker=ticker, status=status, timestamp=timestamp, analysis=analysis)
-                progress_queue.put_nowait(event)
-
-            # Register our handler with the progress tracker
-            progress.register_handler(progress_handler)
-
             try:
-                # Start the graph execution in a background task
-                run_task = asyncio.create_task(
-                    run_graph_async(
-                        graph=graph,
-                        portfolio=portfolio,
-                        tickers=request_data.tickers,
-                        start_date=request_data.start_date,
-                        end_date=request_data.end_date,
-                        model_name=request_data.model_name,
-                        model_provider=model_provider,
-                        request=request_data,  # Pass the full request for agent-specific model access
-                    )
-                )
-                
                 # Start the disconnect detection task
                 disconnect_task = asyncio.create_task(wait_for_disconnect())
                 
                 # Send initial message
                 yield StartEvent().to_sse()
 
-                # Stream progress updates until run_task completes or client disconnects
-                while not run_task.done():
+                # Stream queue position and progress updates until the run completes or client disconnects
+                while not finalize_task.done() or not progress_queue.empty():
                     # Check if client disconnected
                     if disconnect_task.done():
-                        print("Client disconnected, cancelling hedge fund execution")
-                        run_task.cancel()
-                        try:
-                            await run_task
-                        except asyncio.CancelledError:
-                            pass
+                        if recorder:
+                            print("Client disconnected, hedge fund run continues in the background")
+                        else:
+                            print("Client disconnected, cancelling hedge fund execution")
+                            scheduler.cancel(ticket)
                         return
 
-                    # Either get a progress update or wait a bit
+                    # Either get an update or wait a bit
                     try:
-                        event = await asyncio.wait_for(progress_queue.get(), timeout=1.0)
-                        yield event.to_sse()
+                        event, event_id = await asyncio.wait_for(progress_queue.get(), timeout=1.0)
+                        yield event.to_sse(event_id)
                     except asyncio.TimeoutError:
                         # Just continue the loop
                         pass
 
-                # Get the final result
-                try:
-                    result = await run_task
-                except asyncio.CancelledError:
-                    print("Task was cancelled")
-                    return
-
-                if not result or not result.get("messages"):
-                    yield ErrorEvent(message="Failed to generate hedge fund decisions").to_sse()
-                    return
-
                 # Send the final result
-                final_data = CompleteEvent(
-                    data={
-                        "decisions": parse_hedge_fund_response(result.get("messages", [])[-1].content),
-                        "analyst_signals": result.get("data", {}).get("analyst_signals", {}),
-                    }
-                )
-                yield final_data.to_sse()
+                final = await finalize_task
+                if final is None:
+                    return
+                final_event, event_id = final
+                yield final_event.to_sse(event_id)
 
             except asyncio.CancelledError:
                 print("Event generator cancelled")
                 return
             finally:
-                # Clean up
-                progress.unregister_handler(progress_handler)
-                if run_task and not run_task.done():
-                    run_task.cancel()
-                    try:
-                        await run_task
-                    except asyncio.CancelledError:
-                        pass
+                # Clean up; persisted runs keep running so the client can resume from the events stream
+                if not recorder:
+                    scheduler.cancel(ticket)
                 if disconnect_task and not disconnect_task.done():
                     disconnect_task.cancel()
 
@@ -2,14 +2,11 @@ from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Any
 
 from app.backend.models.schemas import ErrorResponse
-from app.backend.services.ollama_service import OllamaService
+from app.backend.services.ollama_service import ollama_service
 from src.llm.models import get_models_list
 
 router = APIRouter(prefix="/language-models")
 
-# Initialize Ollama service
-ollama_service = OllamaService()
-
 @router.get(
     path="/",
     responses={
@@ -216,6 +216,33 @@ async def get_download_progress(model_name: str):
         logger.error(f"Error getting download progress for {model_name}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get download progress: {str(e)}")
 
+@router.get(
+    "/models/download/progress/{model_name}/stream",
+    responses={
+        404: {"model": ErrorResponse, "description": "Model download not found"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+)
+async def stream_download_progress(model_name: str):
+    """Follow an in-progress model download via Server-Sent Events."""
+    try:
+        if not ollama_service.is_download_active(model_name):
+            raise HTTPException(status_code=404, detail=f"No active download found for model: {model_name}")
+        
+        return StreamingResponse(
+            ollama_service.stream_download_progress(model_name),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming download progress for {model_name}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to stream download progress: {str(e)}")
+
 @router.get(
     "/models/downloads/active",
     response_model=Dict[str, ProgressResponse],
@@ -5,11 +5,13 @@ from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
 
 from app.backend.services.agent_service import create_agent_function
+from app.backend.services.graph_cache import get_compiled_graph_cache
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
 from src.main import start
 from src.utils.analysts import ANALYST_CONFIG
 from src.graph.state import AgentState
+from src.utils.progress import ProgressChannel, progress
 
 
 def extract_base_agent_key(unique_id: str) -> str:
@@ -129,13 +131,20 @@ def create_graph(graph_nodes: list, graph_edges: list) -> StateGraph:
     return graph
 
 
-async def run_graph_async(graph, portfolio, tickers, start_date, end_date, model_name, model_provider, request=None):
+def get_compiled_graph(graph_nodes: list, graph_edges: list):
+    """Return the compiled graph for this React Flow structure, reusing a cached compile when possible."""
+    return get_compiled_graph_cache().get_or_compile(
+        graph_nodes,
+        graph_edges,
+        lambda: create_graph(graph_nodes=graph_nodes, graph_edges=graph_edges).compile(),
+    )
+
+
+async def run_graph_async(graph, portfolio, tickers, start_date, end_date, model_name, model_provider, request=None, progress_channel=None):
     """Async wrapper for run_graph to work with asyncio."""
-    # Use run_in_executor to run the synchronous function in a separate thread
-    # so it doesn't block the event loop
-    loop = asyncio.get_running_loop()
-    result = await loop.run_in_executor(None, lambda: run_graph(graph, portfolio, tickers, start_date, end_date, model_name, model_provider, request))  # Use default executor
-    return result
+    # Run the synchronous graph in a worker thread so it doesn't block the event loop;
+    # to_thread copies the current context, so the run's progress channel follows it
+    return await asyncio.to_thread(run_graph, graph, portfolio, tickers, start_date, end_date, model_name, model_provider, request, progress_channel)
 
 
 def run_graph(
@@ -147,34 +156,37 @@ def run_graph(
     model_name: str,
     model_provider: str,
     request=None,
+    progress_channel: ProgressChannel | None = None,
 ) -> dict:
     """
     Run the graph with the given portfolio, tickers,
     start date, end date, show reasoning, model name,
-    and model provider.
+    and model provider. Agent progress is reported to
+    progress_channel (the default channel if omitted).
     """
-    return graph.invoke(
-        {
-            "messages": [
-                HumanMessage(
-                    content="Make trading decisions based on the provided data.",
-                )
-            ],
-            "data": {
-                "tickers": tickers,
-                "portfolio": portfolio,
-                "start_date": start_date,
-                "end_date": end_date,
-                "analyst_signals": {},
+    with progress.use_channel(progress_channel or progress.default_channel):
+        return graph.invoke(
+            {
+                "messages": [
+                    HumanMessage(
+                        content="Make trading decisions based on the provided data.",
+                    )
+                ],
+                "data": {
+                    "tickers": tickers,
+                    "portfolio": portfolio,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "analyst_signals": {},
+                },
+                "metadata": {
+                    "show_reasoning": False,
+                    "model_name": model_name,
+                    "model_provider": model_provider,
+                    "request": request,  # Pass the request for agent-specific model access
+                },
             },
-            "metadata": {
-                "show_reasoning": False,
-                "model_name": model_name,
-                "model_provider": model_provider,
-                "request": request,  # Pass the request for agent-specific model access
-            },
-        },
-    )
+        )
 
 
 def parse_hedge_fund_response(response):
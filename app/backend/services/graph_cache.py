@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+def _field(item: Any, name: str) -> Any:
+    """Read a field from a pydantic GraphNode/GraphEdge or a raw React Flow dict."""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def graph_structure_key(graph_nodes: list, graph_edges: list) -> str:
+    """
+    Hash the parts of a React Flow graph that determine the compiled agent graph:
+    the node IDs and the edges between them. Positions, labels and other UI data
+    are ignored, so moving a node around does not change the key.
+    """
+    node_ids = sorted(str(_field(node, "id")) for node in graph_nodes)
+    node_id_set = set(node_ids)
+    edges = sorted(
+        (str(_field(edge, "source")), str(_field(edge, "target")))
+        for edge in graph_edges
+        if _field(edge, "source") in node_id_set and _field(edge, "target") in node_id_set
+    )
+    encoded = json.dumps([node_ids, edges]).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CompiledGraphCache:
+    """LRU cache of compiled LangGraph graphs keyed by graph structure."""
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self._graphs: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(self, graph_nodes: list, graph_edges: list, compile_fn: Callable[[], Any]) -> Any:
+        """Return the compiled graph for this structure, compiling it with compile_fn on a miss."""
+        key = graph_structure_key(graph_nodes, graph_edges)
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                self.hits += 1
+                return graph
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss for the same key just compiles twice
+        graph = compile_fn()
+        with self._lock:
+            self._graphs[key] = graph
+            self._graphs.move_to_end(key)
+            while len(self._graphs) > self.max_size:
+                self._graphs.popitem(last=False)
+        return graph
+
+    def invalidate(self, graph_nodes: Optional[list], graph_edges: Optional[list]) -> bool:
+        """Drop the compiled graph for this structure, if cached."""
+        if graph_nodes is None or graph_edges is None:
+            return False
+        key = graph_structure_key(graph_nodes, graph_edges)
+        with self._lock:
+            return self._graphs.pop(key, None) is not None
+
+    def clear(self):
+        """Drop all compiled graphs."""
+        with self._lock:
+            self._graphs.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._graphs), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+# Global compiled graph cache instance
+_compiled_graph_cache: Optional[CompiledGraphCache] = None
+
+
+def get_compiled_graph_cache() -> CompiledGraphCache:
+    """Get the global compiled graph cache (bounded by GRAPH_CACHE_SIZE, default 32)."""
+    global _compiled_graph_cache
+    if _compiled_graph_cache is None:
+        _compiled_graph_cache = CompiledGraphCache(max_size=int(os.getenv("GRAPH_CACHE_SIZE", "32")))
+    return _compiled_graph_cache
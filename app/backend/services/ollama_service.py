@@ -11,7 +11,9 @@ import threading
 from pathlib import Path
 from typing import Dict, List, Optional, AsyncGenerator
 import logging
+import shutil
 import signal
+import httpx
 import ollama
 
 logger = logging.getLogger(__name__)
@@ -22,12 +24,19 @@ class OllamaService:
     def __init__(self):
         self._status_cache = {}
         self._last_check = 0
-        self._cache_duration = 10
+        self._cache_duration = float(os.getenv("OLLAMA_STATUS_CACHE_SECONDS", "10"))
+        self._probe_timeout = float(os.getenv("OLLAMA_PROBE_TIMEOUT", "2"))
+        self._status_lock = asyncio.Lock()
+        self._installed: Optional[bool] = None
         self._download_progress = {}
-        self._download_processes = {}
+        self._download_watchers: Dict[str, asyncio.Task] = {}
+        self._download_subscribers: Dict[str, List[asyncio.Queue]] = {}
         
-        # Initialize async client
-        self._async_client = ollama.AsyncClient()
+        # One pooled keep-alive HTTP client shared by every Ollama API call on the event loop
+        self._async_client = ollama.AsyncClient(
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30)
+        )
+        # Used only from worker threads while starting/stopping the server
         self._sync_client = ollama.Client()
     
     # =============================================================================
@@ -39,10 +48,17 @@ class OllamaService:
         if self._should_use_cached_status():
             return self._status_cache
         
+        # Concurrent requests share one probe instead of each hitting the server
+        async with self._status_lock:
+            if self._should_use_cached_status():
+                return self._status_cache
+            return await self._refresh_status()
+    
+    async def _refresh_status(self) -> Dict[str, any]:
+        """Probe installation and server state and update the status cache."""
         try:
             is_installed = await self._check_installation()
-            is_running = await self._check_server_running()
-            models, server_url = await self._get_server_info(is_running)
+            is_running, models, server_url = await self._probe_server()
             
             status = {
                 "installed": is_installed,
@@ -94,7 +110,6 @@ class OllamaService:
         try:
             self._clear_status_cache()
             success = await self._execute_model_download(model_name)
-            self._clear_status_cache()
             
             message = f"Model {model_name} downloaded successfully" if success else f"Failed to download model {model_name}"
             return {"success": success, "message": message}
@@ -108,6 +123,34 @@ class OllamaService:
         async for progress_data in self._stream_model_download(model_name):
             yield progress_data
     
+    async def stream_download_progress(self, model_name: str) -> AsyncGenerator[str, None]:
+        """
+        Stream progress of a model download as Server-Sent Events.
+        
+        Every subscriber is fed by the download's single watcher task; the latest known
+        progress is sent first, and the stream ends when the download finishes.
+        """
+        latest = self._download_progress.get(model_name)
+        if model_name not in self._download_watchers:
+            if latest:
+                yield self._format_progress_event(latest)
+            return
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        self._download_subscribers.setdefault(model_name, []).append(queue)
+        try:
+            if latest:
+                yield self._format_progress_event(latest)
+            while True:
+                progress_data = await queue.get()
+                if progress_data is None:
+                    return
+                yield self._format_progress_event(progress_data)
+        finally:
+            subscribers = self._download_subscribers.get(model_name, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+    
     async def delete_model(self, model_name: str) -> Dict[str, any]:
         """Delete an Ollama model."""
         try:
@@ -172,9 +215,17 @@ class OllamaService:
         """Get current download progress for all models."""
         return self._download_progress.copy()
     
+    def is_download_active(self, model_name: str) -> bool:
+        """Check whether a model download is in progress."""
+        return model_name in self._download_watchers
+    
     def cancel_download(self, model_name: str) -> bool:
         """Cancel an active download."""
-        logger.warning(f"Download cancellation not directly supported by ollama client for model: {model_name}")
+        watcher = self._download_watchers.get(model_name)
+        if watcher is not None:
+            # Closing the pull stream stops the download; the watcher reports the cancellation
+            watcher.cancel()
+            return True
         
         if model_name in self._download_progress:
             self._download_progress[model_name] = {
@@ -191,9 +242,13 @@ class OllamaService:
     # =============================================================================
     
     def _should_use_cached_status(self) -> bool:
-        """Check if we should use cached status."""
-        current_time = time.time()
-        return (current_time - self._last_check) < self._cache_duration and self._status_cache
+        """Check if we should use cached status (shared by all requests for OLLAMA_STATUS_CACHE_SECONDS)."""
+        if not self._status_cache:
+            return False
+        # Installed models change while a download runs; don't serve a model list from before it finished
+        if self._download_watchers:
+            return False
+        return (time.time() - self._last_check) < self._cache_duration
     
     def _update_status_cache(self, status: Dict[str, any]) -> None:
         """Update the status cache."""
@@ -217,56 +272,39 @@ class OllamaService:
         }
     
     async def _check_installation(self) -> bool:
-        """Check if Ollama CLI is installed."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._is_ollama_installed)
+        """Check if Ollama CLI is installed (only a positive result is cached)."""
+        if not self._installed:
+            self._installed = self._is_ollama_installed()
+        return self._installed
     
     def _is_ollama_installed(self) -> bool:
         """Check if Ollama is installed on the system."""
-        system = platform.system().lower()
-        command = ["which", "ollama"] if system in ["darwin", "linux"] else ["where", "ollama"]
-        shell = system == "windows"
-        
-        try:
-            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=shell)
-            return result.returncode == 0
-        except Exception:
-            return False
+        return shutil.which("ollama") is not None
     
     async def _check_server_running(self) -> bool:
         """Check if the Ollama server is running using the ollama client."""
+        is_running, _, _ = await self._probe_server()
+        return is_running
+    
+    async def _probe_server(self) -> tuple[bool, List[str], str]:
+        """Check the server and list its models with a single request: (running, models, server_url)."""
         try:
-            await self._async_client.list()
-            logger.debug("Ollama server confirmed running via client")
-            return True
+            response = await asyncio.wait_for(self._async_client.list(), timeout=self._probe_timeout)
         except Exception as e:
             logger.debug(f"Ollama server not reachable: {e}")
-            return False
-    
-    async def _get_server_info(self, is_running: bool) -> tuple[List[str], str]:
-        """Get server information (models and URL) if server is running."""
-        if not is_running:
-            return [], ""
+            return False, [], ""
         
-        try:
-            response = await self._async_client.list()
-            models = [model.model for model in response.models]
-            server_url = getattr(self._async_client, 'host', 'http://localhost:11434')
-            logger.debug(f"Found {len(models)} locally available models")
-            return models, server_url
-        except Exception as e:
-            logger.debug(f"Failed to get server info: {e}")
-            return [], ""
+        models = [model.model for model in response.models]
+        server_url = getattr(self._async_client, 'host', 'http://localhost:11434')
+        logger.debug(f"Ollama server running with {len(models)} locally available models")
+        return True, models, server_url
     
     async def _execute_server_start(self) -> bool:
         """Execute server start operation."""
         # Check if already running
-        try:
-            self._sync_client.list()
+        if await self._check_server_running():
             logger.info("Ollama server is already running")
             return True
-        except Exception:
-            pass  # Server not running, continue to start it
         
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self._start_ollama_process)
@@ -306,9 +344,7 @@ class OllamaService:
     async def _execute_server_stop(self) -> bool:
         """Execute server stop operation."""
         # Check if already stopped
-        try:
-            self._sync_client.list()
-        except Exception:
+        if not await self._check_server_running():
             logger.info("Ollama server is already stopped")
             return True
         
@@ -402,19 +438,13 @@ class OllamaService:
         return False
     
     async def _execute_model_download(self, model_name: str) -> bool:
-        """Execute model download operation."""
+        """Execute model download operation (joins an in-progress download of the same model)."""
         if not await self._check_server_running():
             logger.error(f"Cannot download model {model_name}: Ollama server is not running")
             return False
         
-        try:
-            logger.info(f"Starting download of model: {model_name}")
-            await self._async_client.pull(model_name)
-            logger.info(f"Successfully downloaded model: {model_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Error downloading model {model_name}: {e}")
-            return False
+        watcher = self._ensure_download_watcher(model_name)
+        return await asyncio.shield(watcher)
     
     async def _execute_model_deletion(self, model_name: str) -> bool:
         """Execute model deletion operation."""
@@ -432,39 +462,79 @@ class OllamaService:
             return False
     
     async def _stream_model_download(self, model_name: str) -> AsyncGenerator[str, None]:
-        """Stream model download with progress updates."""
-        try:
-            if not await self._check_server_running():
-                yield f"data: {json.dumps({'status': 'error', 'error': 'Ollama server is not running'})}\n\n"
-                return
-            
+        """Start (or join) a model download and stream its progress updates."""
+        if not await self._check_server_running():
+            yield self._format_progress_event({'status': 'error', 'error': 'Ollama server is not running'})
+            return
+        
+        self._ensure_download_watcher(model_name)
+        async for progress_data in self.stream_download_progress(model_name):
+            yield progress_data
+    
+    def _ensure_download_watcher(self, model_name: str) -> asyncio.Task:
+        """Get the task pulling this model, starting one if no download is in progress."""
+        watcher = self._download_watchers.get(model_name)
+        if watcher is None:
             logger.info(f"Starting download of model: {model_name}")
-            self._download_progress[model_name] = {"status": "starting", "percentage": 0}
-            
-            yield f"data: {json.dumps({'status': 'starting', 'percentage': 0, 'message': f'Starting download of {model_name}...'})}\n\n"
-            
+            self._download_progress[model_name] = {
+                "status": "starting",
+                "percentage": 0,
+                "message": f"Starting download of {model_name}..."
+            }
+            watcher = asyncio.create_task(self._watch_download(model_name))
+            self._download_watchers[model_name] = watcher
+        return watcher
+    
+    async def _watch_download(self, model_name: str) -> bool:
+        """Pull a model once and publish each progress update to all subscribers."""
+        success = False
+        try:
             async for progress in self._async_client.pull(model_name, stream=True):
                 progress_data = self._process_download_progress(progress, model_name)
                 if progress_data:
-                    yield f"data: {json.dumps(progress_data)}\n\n"
+                    self._publish_download_progress(model_name, progress_data)
                     
                     if progress_data.get("status") == "completed":
                         logger.info(f"Successfully downloaded model: {model_name}")
+                        success = True
                         break
-                        
+        except asyncio.CancelledError:
+            logger.info(f"Download of model {model_name} was cancelled")
+            self._publish_download_progress(model_name, {
+                "status": "cancelled",
+                "message": f"Download of {model_name} was cancelled",
+                "error": "Download cancelled by user"
+            })
         except Exception as e:
-            error_data = {
+            logger.error(f"Error downloading model {model_name}: {e}")
+            self._publish_download_progress(model_name, {
                 "status": "error",
                 "message": f"Error downloading model {model_name}",
                 "error": str(e)
-            }
-            self._download_progress[model_name] = error_data
-            yield f"data: {json.dumps(error_data)}\n\n"
-            logger.error(f"Error downloading model {model_name}: {e}")
+            })
         finally:
-            await asyncio.sleep(1)
-            if model_name in self._download_progress:
-                del self._download_progress[model_name]
+            self._download_watchers.pop(model_name, None)
+            self._clear_status_cache()
+            for queue in self._download_subscribers.pop(model_name, []):
+                queue.put_nowait(None)
+            # Keep the final state briefly for late pollers
+            asyncio.get_running_loop().call_later(1, self._clear_download_progress, model_name)
+        return success
+    
+    def _publish_download_progress(self, model_name: str, progress_data: Dict[str, any]) -> None:
+        """Record a download's latest progress and push it to every subscriber."""
+        self._download_progress[model_name] = progress_data
+        for queue in self._download_subscribers.get(model_name, []):
+            queue.put_nowait(progress_data)
+    
+    def _clear_download_progress(self, model_name: str) -> None:
+        """Forget a finished download's progress unless a new download has started."""
+        if model_name not in self._download_watchers:
+            self._download_progress.pop(model_name, None)
+    
+    def _format_progress_event(self, progress_data: Dict[str, any]) -> str:
+        """Format a progress update as a Server-Sent Event."""
+        return f"data: {json.dumps(progress_data)}\n\n"
     
     def _process_download_progress(self, progress, model_name: str) -> Optional[Dict[str, any]]:
         """Process download progress from ollama client."""
@@ -477,8 +547,11 @@ class OllamaService:
             "raw_output": progress.status
         }
         
+        completed = getattr(progress, 'completed', None)
+        total = getattr(progress, 'total', None)
+        
         # Add completed/total info if available
-        if hasattr(progress, 'completed') and hasattr(progress, 'total') and progress.total > 0:
+        if completed is not None and total:
             percentage = (progress.completed / progress.total) * 100
             progress_data.update({
                 "percentage": percentage,
@@ -487,23 +560,16 @@ class OllamaService:
             })
         
         # Add digest info if available
-        if hasattr(progress, 'digest'):
+        if getattr(progress, 'digest', None):
             progress_data["digest"] = progress.digest
         
-        # Store in cache
-        self._download_progress[model_name] = progress_data
-        
-        # Check if download is complete
-        if (progress.status == "success" or 
-            (hasattr(progress, 'completed') and hasattr(progress, 'total') and 
-             progress.completed == progress.total)):
-            final_data = {
+        # Check if download is complete (individual layers also report completed == total)
+        if progress.status == "success":
+            return {
                 "status": "completed",
                 "percentage": 100,
                 "message": f"Model {model_name} downloaded successfully!"
             }
-            self._download_progress[model_name] = final_data
-            return final_data
         
         return progress_data
     
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.backend.database import AsyncSessionLocal
+from app.backend.models.events import BaseEvent
+from app.backend.models.schemas import FlowRunStatus
+from app.backend.repositories.flow_run_event_repository import FlowRunEventRepository
+from app.backend.repositories.flow_run_repository import FlowRunRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RunEventRecorder:
+    """
+    Records a flow run's events into the append-only run-events table.
+
+    `record` is cheap and thread-safe (it is called from graph worker threads): it assigns
+    the event's sequence number and buffers it. A task on the event loop writes the buffer in
+    batches every `flush_interval` seconds, or as soon as `batch_size` events are pending.
+    Create recorders with `open` from the event loop.
+    """
+
+    def __init__(self, run_id: int, last_sequence: int = 0,
+                 session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+                 batch_size: int = 50, flush_interval: float = 1.0):
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self._sequence = last_sequence
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    @classmethod
+    async def open(cls, run_id: int, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal, **kwargs) -> Optional["RunEventRecorder"]:
+        """Mark the flow run as in progress and start recording its events (None if the run does not exist)."""
+        async with session_factory() as db:
+            if await FlowRunRepository(db).update_flow_run(run_id, status=FlowRunStatus.IN_PROGRESS) is None:
+                return None
+            last_sequence = await FlowRunEventRepository(db).get_last_sequence(run_id)
+        return cls(run_id, last_sequence, session_factory=session_factory, **kwargs)
+
+    def record(self, event: BaseEvent, agent: Optional[str] = None, ticker: Optional[str] = None) -> int:
+        """Buffer an event and return its sequence number (the SSE event id)."""
+        return self._append(event.type, event.model_dump(), agent, ticker)
+
+    async def finish(self, final_event: BaseEvent, analyst_signals: Optional[Dict[str, Dict[str, Any]]] = None) -> int:
+        """
+        Record the run's per-ticker signals and its final (complete or error) event, flush
+        everything, and mark the flow run as finished. Returns the final event's sequence.
+
+        The flow run's `results` keep the decisions and a signal count; the signals themselves
+        are served from the events table.
+        """
+        signal_count = 0
+        for agent, signals in (analyst_signals or {}).items():
+            for ticker, signal in (signals or {}).items():
+                self._append("signal", {"type": "signal", "agent": agent, "ticker": ticker, "signal": signal}, agent, ticker)
+                signal_count += 1
+        sequence = self.record(final_event)
+        await self.close()
+
+        is_complete = final_event.type == "complete"
+        results = None
+        if is_complete:
+            results = {key: value for key, value in (getattr(final_event, "data", None) or {}).items() if key != "analyst_signals"}
+            results["signal_count"] = signal_count
+        async with self._session_factory() as db:
+            await FlowRunRepository(db).update_flow_run(
+                self.run_id,
+                status=FlowRunStatus.COMPLETE if is_complete else FlowRunStatus.ERROR,
+                results=results,
+                error_message=None if is_complete else getattr(final_event, "message", None),
+            )
+        return sequence
+
+    async def flush(self):
+        """Write all buffered events in one batch. A failed batch stays buffered for the next flush."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        try:
+            async with self._session_factory() as db:
+                await FlowRunEventRepository(db).append_events(self.run_id, batch)
+        except Exception as e:
+            logger.error(f"Failed to persist {len(batch)} events for flow run {self.run_id}, will retry: {e}")
+            with self._lock:
+                # Events recorded meanwhile have higher sequences, so the batch goes back in front
+                self._buffer[:0] = batch
+
+    async def close(self):
+        """Stop the background writer and flush what is left."""
+        self._closed = True
+        self._wakeup.set()
+        await self._flush_task
+        await self.flush()
+
+    def _append(self, event_type: str, payload: Dict[str, Any], agent: Optional[str], ticker: Optional[str]) -> int:
+        with self._lock:
+            self._sequence += 1
+            self._buffer.append({
+                "sequence": self._sequence,
+                "event_type": event_type,
+                "agent": agent,
+                "ticker": ticker,
+                "payload": payload,
+            })
+            sequence, full = self._sequence, len(self._buffer) >= self.batch_size
+        if full:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        return sequence
+
+    async def _flush_loop(self):
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
@@ -0,0 +1,146 @@
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.utils.cancellation import RunCancelledError, cancellation_scope
+
+logger = logging.getLogger(__name__)
+
+
+class RunQueueFullError(Exception):
+    """Raised when a run cannot be admitted (queue full or per-user limit reached)."""
+
+
+class RunTicket:
+    """A submitted hedge fund run: its queue position, cancellation signal and result."""
+
+    def __init__(self, user_id: str, fn: Callable[[], Any], on_position: Optional[Callable[[int], None]] = None):
+        self.run_id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.fn = fn
+        self.on_position = on_position
+        self.position: Optional[int] = None  # 1-based while queued, 0 once running
+        self.cancel_event = threading.Event()
+        self.result: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.context = contextvars.copy_context()
+
+    def done(self) -> bool:
+        return self.result.done()
+
+    def _set_position(self, position: int):
+        if position != self.position:
+            self.position = position
+            if self.on_position:
+                self.on_position(position)
+
+
+class RunScheduler:
+    """
+    Admission control for graph runs: a dedicated, bounded worker pool fed from a FIFO
+    queue, with a cap on queued runs and on active (queued or running) runs per user.
+
+    All bookkeeping happens on the event loop thread; only the run itself executes on
+    the pool. Cancelling a running run sets its cancellation event, which stops the
+    run at its next LLM/data-call checkpoint (see src.utils.cancellation).
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int, max_runs_per_user: int):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.max_runs_per_user = max_runs_per_user
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge-fund-run")
+        self._queue: deque[RunTicket] = deque()
+        self._running: Dict[str, RunTicket] = {}
+
+    def submit(self, user_id: str, fn: Callable, *args, on_position: Optional[Callable[[int], None]] = None, **kwargs) -> RunTicket:
+        """Queue fn(*args, **kwargs) for execution; must be called from the event loop."""
+        user_runs = sum(1 for ticket in self._all_tickets() if ticket.user_id == user_id)
+        if user_runs >= self.max_runs_per_user:
+            raise RunQueueFullError(f"User already has {user_runs} active run(s); the limit is {self.max_runs_per_user}")
+        if len(self._queue) >= self.max_queue_size:
+            raise RunQueueFullError(f"Run queue is full ({self.max_queue_size} runs waiting)")
+
+        ticket = RunTicket(user_id, lambda: fn(*args, **kwargs), on_position)
+        self._queue.append(ticket)
+        self._dispatch()
+        return ticket
+
+    def cancel(self, ticket: RunTicket):
+        """Cancel a queued or running run."""
+        if ticket.done():
+            return
+        ticket.cancel_event.set()
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            ticket.result.set_exception(RunCancelledError("Run was cancelled before it started"))
+            ticket.result.exception()  # Mark retrieved; nobody may be awaiting a cancelled run
+            self._dispatch()
+
+    def get_status(self) -> Dict[str, int]:
+        """Current pool utilisation."""
+        return {
+            "max_workers": self.max_workers,
+            "running": len(self._running),
+            "queued": len(self._queue),
+            "max_queue_size": self.max_queue_size,
+            "max_runs_per_user": self.max_runs_per_user,
+        }
+
+    def _all_tickets(self):
+        yield from self._running.values()
+        yield from self._queue
+
+    def _dispatch(self):
+        """Start queued runs while workers are free, then report queue positions."""
+        while len(self._running) < self.max_workers and self._queue:
+            self._start(self._queue.popleft())
+
+        for position, ticket in enumerate(self._queue, start=1):
+            ticket._set_position(position)
+
+    def _start(self, ticket: RunTicket):
+        self._running[ticket.run_id] = ticket
+        ticket._set_position(0)
+
+        def run():
+            with cancellation_scope(ticket.cancel_event):
+                return ticket.fn()
+
+        future = asyncio.get_running_loop().run_in_executor(self._executor, ticket.context.run, run)
+        future.add_done_callback(lambda completed: self._finish(ticket, completed))
+
+    def _finish(self, ticket: RunTicket, completed: asyncio.Future):
+        self._running.pop(ticket.run_id, None)
+        if not ticket.result.done():
+            if completed.cancelled():
+                ticket.result.cancel()
+            elif completed.exception() is not None:
+                ticket.result.set_exception(completed.exception())
+            else:
+                ticket.result.set_result(completed.result())
+        if ticket.cancel_event.is_set() and not ticket.result.cancelled():
+            ticket.result.exception()  # Cancelled runs are usually abandoned by their client
+        self._dispatch()
+
+
+# Global scheduler instance, created on first use from the running event loop
+_run_scheduler: Optional[RunScheduler] = None
+
+
+def get_run_scheduler() -> RunScheduler:
+    """Get the global run scheduler (sized via HEDGE_FUND_MAX_CONCURRENT_RUNS, HEDGE_FUND_MAX_QUEUED_RUNS, HEDGE_FUND_MAX_RUNS_PER_USER)."""
+    global _run_scheduler
+    if _run_scheduler is None:
+        _run_scheduler = RunScheduler(
+            max_workers=int(os.getenv("HEDGE_FUND_MAX_CONCURRENT_RUNS", str(min(4, os.cpu_count() or 1)))),
+            max_queue_size=int(os.getenv("HEDGE_FUND_MAX_QUEUED_RUNS", "32")),
+            max_runs_per_user=int(os.getenv("HEDGE_FUND_MAX_RUNS_PER_USER", "2")),
+        )
+        logger.info(f"Run scheduler: {_run_scheduler.max_workers} workers, queue of {_run_scheduler.max_queue_size}, {_run_scheduler.max_runs_per_user} runs per user")
+    return _run_scheduler
@@ -3,7 +3,7 @@ import { Button } from '@/components/ui/button';
 import { Dialog, DialogContent, DialogDescription, DialogFooter, DialogHeader, DialogTitle } from '@/components/ui/dialog';
 import { cn } from '@/lib/utils';
 import { AlertTriangle, Brain, CheckCircle, Download, Play, RefreshCw, Server, Square, Trash2, X } from 'lucide-react';
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 
 interface OllamaStatus {
   installed: boolean;
@@ -41,7 +41,7 @@ export function OllamaSettings() {
   const [error, setError] = useState<string | null>(null);
   const [downloadProgress, setDownloadProgress] = useState<Record<string, DownloadProgress>>({});
   const [activeDownloads, setActiveDownloads] = useState<Set<string>>(new Set());
-  const [pollIntervals, setPollIntervals] = useState<Set<NodeJS.Timeout>>(new Set());
+  const streamControllers = useRef<Set<AbortController>>(new Set());
   const [deleteConfirmation, setDeleteConfirmation] = useState<{
     isOpen: boolean;
     modelName: string;
@@ -133,6 +133,79 @@ export function OllamaSettings() {
     setActionLoading(null);
   };
 
+  // Apply progress events from a download's SSE stream until it completes, fails or is cancelled
+  const readProgressStream = async (modelName: string, response: Response) => {
+    const reader = response.body?.getReader();
+    const decoder = new TextDecoder();
+    if (!reader) return;
+
+    let buffer = '';
+    try {
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop() ?? '';
+
+        for (const line of lines) {
+          if (!line.startsWith('data: ')) continue;
+          try {
+            const jsonData = line.slice(6).trim();
+            if (!jsonData) continue;
+            const data = JSON.parse(jsonData);
+
+            setDownloadProgress(prev => ({
+              ...prev,
+              [modelName]: data
+            }));
+
+            // Check if download is complete or failed
+            if (data.status === 'completed') {
+              setActiveDownloads(prev => {
+                const newSet = new Set(prev);
+                newSet.delete(modelName);
+                return newSet;
+              });
+              // Immediately clean up progress display for completed downloads
+              setDownloadProgress(prev => {
+                const newProgress = { ...prev };
+                delete newProgress[modelName];
+                return newProgress;
+              });
+              // Refresh status to show the new model
+              setTimeout(() => fetchOllamaStatus(), 1000);
+              return;
+            } else if (data.status === 'error' || data.status === 'cancelled') {
+              setActiveDownloads(prev => {
+                const newSet = new Set(prev);
+                newSet.delete(modelName);
+                return newSet;
+              });
+              if (data.status === 'error') {
+                setError(`Download failed for ${modelName}: ${data.message || data.error}`);
+              }
+              // Clean up progress display after 3 seconds for errors/cancellations
+              setTimeout(() => {
+                setDownloadProgress(prev => {
+                  const newProgress = { ...prev };
+                  delete newProgress[modelName];
+                  return newProgress;
+                });
+              }, 3000);
+              return;
+            }
+          } catch (e) {
+            console.error('Error parsing progress data:', e, 'Line:', line);
+          }
+        }
+      }
+    } finally {
+      reader.releaseLock();
+    }
+  };
+
   const downloadModelWithProgress = async (modelName: string) => {
     setError(null);
     setActiveDownloads(prev => new Set(prev).add(modelName));
@@ -162,77 +235,7 @@ export function OllamaSettings() {
         return;
       }
 
-      // Read the streaming response
-      const reader = response.body?.getReader();
-      const decoder = new TextDecoder();
-
-      if (reader) {
-        try {
-          while (true) {
-            const { done, value } = await reader.read();
-            if (done) break;
-
-            const chunk = decoder.decode(value, { stream: true });
-            const lines = chunk.split('\n');
-
-            for (const line of lines) {
-              if (line.startsWith('data: ')) {
-                try {
-                  const jsonData = line.slice(6).trim();
-                  if (jsonData) {
-                    const data = JSON.parse(jsonData);
-                    
-                    setDownloadProgress(prev => ({
-                      ...prev,
-                      [modelName]: data
-                    }));
-
-                    // Check if download is complete or failed
-                    if (data.status === 'completed') {
-                      setActiveDownloads(prev => {
-                        const newSet = new Set(prev);
-                        newSet.delete(modelName);
-                        return newSet;
-                      });
-                      // Immediately clean up progress display for completed downloads
-                      setDownloadProgress(prev => {
-                        const newProgress = { ...prev };
-                        delete newProgress[modelName];
-                        return newProgress;
-                      });
-                      // Refresh status to show the new model
-                      setTimeout(() => fetchOllamaStatus(), 1000);
-                      return; // Exit the function
-                    } else if (data.status === 'error' || data.status === 'cancelled') {
-                      setActiveDownloads(prev => {
-                        const newSet = new Set(prev);
-                        newSet.delete(modelName);
-                        return newSet;
-                      });
-                      if (data.status === 'error') {
-                        setError(`Download failed for ${modelName}: ${data.message || data.error}`);
-                      }
-                      // Clean up progress display after 3 seconds for errors/cancellations
-                      setTimeout(() => {
-                        setDownloadProgress(prev => {
-                          const newProgress = { ...prev };
-                          delete newProgress[modelName];
-                          return newProgress;
-                        });
-                      }, 3000);
-                      return; // Exit the function
-                    }
-                  }
-                } catch (e) {
-                  console.error('Error parsing progress data:', e, 'Line:', line);
-                }
-              }
-            }
-          }
-        } finally {
-          reader.releaseLock();
-        }
-      }
+      await readProgressStream(modelName, response);
     } catch (error) {
       console.error('Failed to download model with progress:', error);
       setError(`Failed to download ${modelName}: ${error instanceof Error ? error.message : 'Unknown error'}`);
@@ -383,104 +386,31 @@ export function OllamaSettings() {
     }
 
     console.log(`Monitoring existing download for ${modelName}`);
-    
-    // Poll for progress updates instead of starting a new stream
-    const pollProgress = async () => {
-      try {
-        // Check all active downloads instead of individual model
-        const response = await fetch('http://localhost:8000/ollama/models/downloads/active');
-        if (response.ok) {
-          const activeDownloads = await response.json();
-          const progress = activeDownloads[modelName];
-          
-          if (progress) {
-            setDownloadProgress(prev => ({
-              ...prev,
-              [modelName]: progress
-            }));
 
-            // Check if download is complete or failed
-            if (progress.status === 'completed') {
-              setActiveDownloads(prev => {
-                const newSet = new Set(prev);
-                newSet.delete(modelName);
-                return newSet;
-              });
-              // Immediately clean up progress display for completed downloads
-              setDownloadProgress(prev => {
-                const newProgress = { ...prev };
-                delete newProgress[modelName];
-                return newProgress;
-              });
-              // Refresh status to show the new model
-              setTimeout(() => fetchOllamaStatus(), 1000);
-              return false; // Stop polling
-            } else if (progress.status === 'error' || progress.status === 'cancelled') {
-              setActiveDownloads(prev => {
-                const newSet = new Set(prev);
-                newSet.delete(modelName);
-                return newSet;
-              });
-              if (progress.status === 'error') {
-                setError(`Download failed for ${modelName}: ${progress.message || progress.error}`);
-              }
-              // Clean up progress display after 3 seconds for errors/cancellations
-              setTimeout(() => {
-                setDownloadProgress(prev => {
-                  const newProgress = { ...prev };
-                  delete newProgress[modelName];
-                  return newProgress;
-                });
-              }, 3000);
-              return false; // Stop polling
-            }
-            
-            return true; // Continue polling
-          } else {
-            // Model not in active downloads, remove from tracking
-            setActiveDownloads(prev => {
-              const newSet = new Set(prev);
-              newSet.delete(modelName);
-              return newSet;
-            });
-            return false; // Stop polling
-          }
-        } else {
-          // Error getting active downloads, stop polling
-          console.error(`Error getting active downloads: ${response.status}`);
-          return false; // Stop polling
-        }
-      } catch (error) {
-        console.error(`Error polling progress for ${modelName}:`, error);
-        return false; // Stop polling on error
-      }
-    };
-
-    // Start polling every 2 seconds
-    const pollInterval = setInterval(async () => {
-      const shouldContinue = await pollProgress();
-      if (!shouldContinue) {
-        clearInterval(pollInterval);
-        setPollIntervals(prev => {
+    // Follow the server's progress stream for this download instead of polling
+    const controller = new AbortController();
+    streamControllers.current.add(controller);
+    try {
+      const response = await fetch(
+        `http://localhost:8000/ollama/models/download/progress/${encodeURIComponent(modelName)}/stream`,
+        { signal: controller.signal }
+      );
+      if (!response.ok) {
+        // Download already finished, remove from tracking
+        setActiveDownloads(prev => {
           const newSet = new Set(prev);
-          newSet.delete(pollInterval);
+          newSet.delete(modelName);
           return newSet;
         });
+        return;
       }
-    }, 2000);
-
-    // Track the interval for cleanup
-    setPollIntervals(prev => new Set(prev).add(pollInterval));
-
-    // Do an initial poll
-    const shouldContinue = await pollProgress();
-    if (!shouldContinue) {
-      clearInterval(pollInterval);
-      setPollIntervals(prev => {
-        const newSet = new Set(prev);
-        newSet.delete(pollInterval);
-        return newSet;
-      });
+      await readProgressStream(modelName, response);
+    } catch (error) {
+      if (!controller.signal.aborted) {
+        console.error(`Error following progress for ${modelName}:`, error);
+      }
+    } finally {
+      streamControllers.current.delete(controller);
     }
   };
 
@@ -495,12 +425,13 @@ export function OllamaSettings() {
     }
   }, [ollamaStatus?.running, recommendedModels.length]); // Only depend on running status and whether we have models
 
-  // Cleanup polling intervals on unmount
+  // Close progress streams on unmount
   useEffect(() => {
+    const controllers = streamControllers.current;
     return () => {
-      pollIntervals.forEach(interval => clearInterval(interval));
+      controllers.forEach(controller => controller.abort());
     };
-  }, [pollIntervals]);
+  }, []);
 
   const getStatusIcon = () => {
     if (!ollamaStatus) return <RefreshCw className="h-4 w-4 animate-spin text-muted-foreground" />;
@@ -198,6 +198,15 @@ export const api = {
                       // Reset all nodes at the start of a new run
                       nodeContext.resetAllNodes(flowId);
                       break;
+                    case 'queued':
+                      // Run is waiting for a free worker (position 0 means it has started)
+                      if (eventData.position > 0) {
+                        nodeContext.updateAgentNode(flowId, 'output', {
+                          status: 'IN_PROGRESS',
+                          message: `Queued (position ${eventData.position})`
+                        });
+                      }
+                      break;
                     case 'progress':
                       if (eventData.agent) {
                         // Map the progress to a node status
@@ -10,7 +10,8 @@ CRITICAL: This is asset-level analysis, completely independent from macro regime
 import time
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import date as date_type, datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from collections import defaultdict
 
@@ -43,6 +44,15 @@ def get_simple_event_writer():
     return SimpleEventWriter()
 
 
+def _as_date(value) -> date_type:
+    """Normalize datetime/date/ISO-string values from the database to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date_type):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
 class EnhancedAssetScanner:
     """
     Multi-timeframe asset market condition scanner with fallback technical analysis
@@ -60,7 +70,8 @@ class EnhancedAssetScanner:
                  timeframes: List[str] = None,
                  fallback_enabled: bool = True,
                  confidence_weights: Dict[str, float] = None,
-                 min_confidence_threshold: float = 0.6):
+                 min_confidence_threshold: float = 0.6,
+                 lookback_days: int = 30):
         """
         Initialize Enhanced Asset Scanner
         
@@ -70,6 +81,7 @@ class EnhancedAssetScanner:
             fallback_enabled: Enable technical analysis fallback
             confidence_weights: Weights for timeframe confidence calculation
             min_confidence_threshold: Minimum confidence for results
+            lookback_days: How far back a scanner row may be and still count as current
         """
         self.enable_database = enable_database
         # For now, only daily data is available from Yahoo Finance
@@ -77,6 +89,7 @@ class EnhancedAssetScanner:
         self.timeframes = ['1d']  # timeframes or ['1d', '4h', '1h']
         self.fallback_enabled = fallback_enabled
         self.min_confidence_threshold = min_confidence_threshold
+        self.lookback_days = lookback_days
         
         # Timeframe confidence weights (must sum to 1.0)
         # For now, only daily data available
@@ -98,6 +111,10 @@ class EnhancedAssetScanner:
         self.cache = {}
         self.cache_ttl = 300  # 5 minutes
         
+        # Backtest mode: scanner rows for a whole window, indexed for as-of lookups
+        self._preloaded_window = None  # (start_date, end_date, tickers)
+        self._as_of_index = {}  # (ticker, timeframe) -> (sorted dates, rows)
+        
         # Initialize without database warning
         if not self.is_database_available and self.enable_database:
             print("Warning: Database not available for asset scanner. Using technical analysis fallback.")
@@ -212,21 +229,8 @@ class EnhancedAssetScanner:
                 # Filter for requested tickers
                 return {t: ac for t, ac in cache_entry['data'].items() if t in tickers}
         
-        # Query database
-        date_str = date.strftime('%Y-%m-%d')
-        
-        scanner_data = execute_query("""
-            SELECT ticker, market, confidence, timeframe, date
-            FROM scanner_historical
-            WHERE ticker = ANY(:tickers)
-            AND confidence >= :min_confidence
-            AND date <= :date
-            ORDER BY ticker, timeframe, confidence DESC, date DESC
-        """, {
-            "tickers": tickers,
-            "date": date_str,
-            "min_confidence": min_confidence
-        })
+        # Latest row per (ticker, timeframe) within the lookback window
+        scanner_data = self._get_latest_scanner_rows(tickers, date, min_confidence)
         
         if not scanner_data:
             return {}
@@ -250,6 +254,121 @@ class EnhancedAssetScanner:
         
         return asset_conditions
     
+    def _get_latest_scanner_rows(self, 
+                                 tickers: List[str], 
+                                 date: datetime, 
+                                 min_confidence: float) -> Optional[List[Dict]]:
+        """
+        Get the most recent scanner row per (ticker, timeframe) as of date
+        
+        Served from the preloaded as-of index when the date and tickers are covered,
+        otherwise from a window-bounded DISTINCT ON query.
+        """
+        if self._is_preloaded(tickers, date):
+            return self._lookup_preloaded_rows(tickers, date, min_confidence)
+        
+        start_date = date - timedelta(days=self.lookback_days)
+        
+        return execute_query("""
+            SELECT ticker, market, confidence, timeframe, date
+            FROM (
+                SELECT DISTINCT ON (ticker, timeframe)
+                       ticker, market, confidence, timeframe, date
+                FROM scanner_historical
+                WHERE ticker = ANY(:tickers)
+                AND date > :start_date
+                AND date <= :date
+                ORDER BY ticker, timeframe, date DESC
+            ) latest
+            WHERE confidence >= :min_confidence
+            ORDER BY ticker, timeframe
+        """, {
+            "tickers": tickers,
+            "start_date": start_date.strftime('%Y-%m-%d'),
+            "date": date.strftime('%Y-%m-%d'),
+            "min_confidence": min_confidence
+        })
+    
+    def preload_window(self, 
+                       tickers: List[str], 
+                       start_date: datetime, 
+                       end_date: datetime) -> int:
+        """
+        Bulk-load scanner rows for a backtest window into an as-of lookup index
+        
+        One query replaces a query per scan; later scans for dates in
+        [start_date, end_date] are answered from memory.
+        
+        Args:
+            tickers: Tickers the backtest will scan
+            start_date: First backtest date
+            end_date: Last backtest date
+            
+        Returns:
+            Number of rows loaded
+        """
+        self.clear_preload()
+        if not self.is_database_available:
+            return 0
+        
+        rows = execute_query("""
+            SELECT ticker, market, confidence, timeframe, date
+            FROM scanner_historical
+            WHERE ticker = ANY(:tickers)
+            AND date > :start_date
+            AND date <= :end_date
+            ORDER BY ticker, timeframe, date
+        """, {
+            "tickers": tickers,
+            "start_date": (start_date - timedelta(days=self.lookback_days)).strftime('%Y-%m-%d'),
+            "end_date": end_date.strftime('%Y-%m-%d')
+        })
+        if rows is None:
+            return 0
+        
+        index = defaultdict(lambda: ([], []))
+        for row in sorted(rows, key=lambda r: (r['ticker'], r['timeframe'], _as_date(r['date']))):
+            dates, series = index[(row['ticker'], row['timeframe'])]
+            dates.append(_as_date(row['date']))
+            series.append(row)
+        
+        self._as_of_index = dict(index)
+        self._preloaded_window = (_as_date(start_date), _as_date(end_date), frozenset(tickers))
+        self.cache.clear()
+        return len(rows)
+    
+    def clear_preload(self):
+        """Drop the preloaded backtest window"""
+        self._preloaded_window = None
+        self._as_of_index = {}
+    
+    def _is_preloaded(self, tickers: List[str], date: datetime) -> bool:
+        if self._preloaded_window is None:
+            return False
+        start_date, end_date, preloaded_tickers = self._preloaded_window
+        return start_date <= _as_date(date) <= end_date and preloaded_tickers.issuperset(tickers)
+    
+    def _lookup_preloaded_rows(self, 
+                               tickers: List[str], 
+                               date: datetime, 
+                               min_confidence: float) -> List[Dict]:
+        """As-of lookup against the preloaded index (same semantics as the database query)"""
+        as_of = _as_date(date)
+        window_start = as_of - timedelta(days=self.lookback_days)
+        wanted = set(tickers)
+        
+        rows = []
+        for (ticker, _timeframe), (dates, series) in self._as_of_index.items():
+            if ticker not in wanted:
+                continue
+            position = bisect_right(dates, as_of)
+            if position == 0:
+                continue
+            row = series[position - 1]
+            if dates[position - 1] > window_start and row['confidence'] >= min_confidence:
+                rows.append(row)
+        return rows
+    
     def _process_database_ticker_data(self, 
                                      ticker: str, 
                                      rows: List[Dict], 
@@ -705,7 +824,12 @@ class EnhancedAssetScanner:
             'confidence_weights': self.confidence_weights,
             'min_confidence_threshold': self.min_confidence_threshold,
             'cache_entries': len(self.cache),
-            'cache_ttl_seconds': self.cache_ttl
+            'cache_ttl_seconds': self.cache_ttl,
+            'lookback_days': self.lookback_days,
+            'preloaded_window': (
+                (self._preloaded_window[0].isoformat(), self._preloaded_window[1].isoformat())
+                if self._preloaded_window else None
+            )
         }
 
 
@@ -133,4 +133,14 @@ class AssetBucketManager:
                 'etf_count': len(self.filter_assets_by_type(assets, 'etf')),
                 'stock_count': len(self.filter_assets_by_type(assets, 'stock'))
             }
-        return stats
\ No newline at end of file
+        return stats
+
+
+def get_asset_type(ticker: str, provider=None) -> str:
+    """Classify a ticker as 'crypto' or 'stock', preferring the provider's own crypto check"""
+    is_crypto_symbol = getattr(provider, '_is_crypto_symbol', None)
+    if callable(is_crypto_symbol):
+        return 'crypto' if is_crypto_symbol(ticker) is True else 'stock'
+    
+    crypto_assets = AssetBucketManager().filter_assets_by_type([ticker.upper()], 'crypto')
+    return 'crypto' if crypto_assets else 'stock'
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from .providers.registry import ProviderRegistry
 from .providers.yahoo_finance.provider import YahooFinanceProvider
 from .providers.alpha_vantage.provider import AlphaVantageProvider
+from .providers.replay.provider import ReplayProvider
 from .timeframe_manager import TimeframeManager
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,13 @@ class DataManager:
         except ValueError as e:
             logger.warning(f"Alpha Vantage provider not available: {e}")
         
+        # Register the recorded-response provider if an archive is configured
+        if os.getenv('DATA_REPLAY_DIR'):
+            try:
+                self.registry.register('replay', ReplayProvider.from_env())
+            except ValueError as e:
+                logger.warning(f"Replay provider not available: {e}")
+        
         # Set active provider from parameter, environment, or default
         provider = provider_name or os.getenv('DATA_PROVIDER', 'yahoo')
         
@@ -203,6 +211,117 @@ class DataManager:
             print(f"Error downloading data for {ticker}: {e}")
             return None
     
+    def download_multiple_data(self, tickers: list, start_date: datetime, end_date: datetime,
+                               use_cache: bool = True, interval: str = '1d') -> Dict[str, pd.DataFrame]:
+        """
+        Download many tickers, batching cache misses into the provider's multi-symbol fetch
+        
+        Returns:
+            Dict mapping ticker -> DataFrame (tickers without data are omitted)
+        """
+        results = {}
+        to_fetch = []
+        for ticker in dict.fromkeys(tickers):
+            cached_data = self._load_from_cache(ticker, start_date, end_date, interval) if use_cache else None
+            if cached_data is not None:
+                results[ticker] = cached_data
+            else:
+                to_fetch.append(ticker)
+        
+        if not to_fetch:
+            return results
+        
+        provider = self.registry.get_active()
+        if interval not in provider.get_supported_timeframes():
+            logger.warning(
+                f"Provider {provider.name} doesn't support {interval}. "
+                f"Available: {provider.get_supported_timeframes()}. Using daily data."
+            )
+            interval = '1d'
+        
+        print(f"Downloading {len(to_fetch)} tickers from {start_date.date()} to {end_date.date()} "
+              f"using {provider.name} provider (timeframe: {interval})")
+        try:
+            fetched = provider.fetch_multiple(to_fetch, interval, start_date, end_date + timedelta(days=1))
+        except Exception as e:
+            logger.error(f"Error downloading data for {len(to_fetch)} tickers: {e}")
+            return results
+        
+        for ticker, data in fetched.items():
+            data = data.dropna()
+            if data.empty:
+                continue
+            if use_cache:
+                self._save_to_cache(ticker, start_date, end_date, data, interval)
+            results[ticker] = data
+        
+        missing = [ticker for ticker in to_fetch if ticker not in results]
+        if missing:
+            print(f"No data found for {', '.join(missing)}")
+        return results
+    
+    def append_latest_bars(self, tickers: list) -> Dict[str, pd.DataFrame]:
+        """
+        Append the latest daily bar to each ticker's newest daily cache file
+        
+        The bars come from the provider's bulk path, so refreshing a whole universe
+        costs a handful of requests instead of one per ticker. The extended frame
+        replaces the old file, renamed to the new end date.
+        
+        Returns:
+            Dict mapping ticker -> updated cached DataFrame (tickers without a daily
+            cache or a latest bar are omitted)
+        """
+        provider_name = self.registry.get_active_name()
+        cache_files = {}
+        for ticker in dict.fromkeys(tickers):
+            cache_dir = self.cache_dir / provider_name / ticker / '1d'
+            candidates = []
+            for cache_file in cache_dir.glob(f"{ticker}_1d_*.pkl"):
+                parts = cache_file.stem.split('_')
+                try:
+                    candidates.append((datetime.strptime(parts[-1], '%Y%m%d'),
+                                       datetime.strptime(parts[-2], '%Y%m%d'), cache_file))
+                except (ValueError, IndexError):
+                    continue
+            if candidates:
+                cache_files[ticker] = max(candidates)
+            else:
+                logger.warning(f"No daily cache for {ticker}; download its history before appending")
+        
+        if not cache_files:
+            return {}
+        
+        latest_bars = self.registry.get_active().fetch_latest_bars(list(cache_files))
+        
+        updated = {}
+        for ticker, bar in latest_bars.items():
+            cached_end, cached_start, cache_file = cache_files[ticker]
+            try:
+                with open(cache_file, 'rb') as f:
+                    data = pickle.load(f)
+                
+                # Match the cached index's timezone handling before combining
+                if data.index.tz is not None and bar.index.tz is None:
+                    bar = bar.tz_localize(data.index.tz)
+                elif data.index.tz is None and bar.index.tz is not None:
+                    bar = bar.tz_localize(None)
+                
+                combined = pd.concat([data, bar[[col for col in data.columns if col in bar.columns]]])
+                combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+                combined.attrs = dict(data.attrs)
+                
+                new_end = max(cached_end, combined.index[-1].to_pydatetime().replace(tzinfo=None))
+                self._save_to_cache(ticker, cached_start, new_end, combined, '1d')
+                if self._get_cache_filename(ticker, cached_start, new_end, '1d') != cache_file:
+                    cache_file.unlink()
+                updated[ticker] = combined
+            except Exception as e:
+                logger.error(f"Error appending latest bar for {ticker}: {e}")
+        
+        print(f"Appended latest bars for {len(updated)}/{len(tickers)} tickers")
+        return updated
+    
     def get_data(self, ticker: str, start_date: datetime, end_date: datetime, 
                 use_cache: bool = True) -> Optional[bt.feeds.PandasData]:
         
@@ -254,6 +373,14 @@ class DataManager:
         
         data_feeds = {}
         
+        # Fetch uncached tickers in one batch where the provider supports it; the
+        # per-ticker loop below then loads them from the cache
+        batch_attempted = set()
+        batch_results = {}
+        if len(uncached_tickers) > 1:
+            batch_results = self.download_multiple_data(uncached_tickers, start_date, end_date, use_cache)
+            batch_attempted = set(uncached_tickers)
+        
         # Process cached tickers fast (no provider overhead)
         for ticker in cached_tickers:
             data = self.get_data(ticker, start_date, end_date, use_cache)
@@ -264,6 +391,10 @@ class DataManager:
         
         # Process uncached tickers with provider
         for ticker in uncached_tickers:
+            # The batch already tried (and fell back per symbol for) these tickers
+            if ticker in batch_attempted and ticker not in batch_results:
+                print(f"Failed to download data for {ticker}")
+                continue
             data = self.get_data(ticker, start_date, end_date, use_cache)
             if data is not None:
                 data_feeds[ticker] = data
@@ -1,16 +1,25 @@
 import sys
 import os
+import re
+from bisect import bisect_right
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 from .database_manager import get_database_manager, execute_query
 
 
+SENTIMENT_INDICATORS = {
+    'positive': ['bullish', 'optimistic', 'growth', 'expansion', 'strong', 'positive'],
+    'negative': ['bearish', 'pessimistic', 'recession', 'contraction', 'weak', 'negative', 'decline']
+}
+
+
 class DatabaseIntegration:
     def __init__(self):
         self.db_manager = get_database_manager()
         self.database_available = self.db_manager.is_connected
         self.cache = {}
+        self.preloaded = None
         
         if not self.database_available:
             print("Warning: Database connection not available. Using mock data.")
@@ -29,15 +38,18 @@ class DatabaseIntegration:
         if cache_key in self.cache:
             return self.cache[cache_key]
         
-        research_data = execute_query("""
-            SELECT title, regime, buckets, created_at
-            FROM research 
-            WHERE created_at <= :end_date
-            AND regime IS NOT NULL
-            ORDER BY created_at DESC 
-            LIMIT 1
-        """, {"end_date": end_date})
-            
+        if self._is_preloaded(end_date):
+            research_data = self._preloaded_macro_rows(end_date)
+        else:
+            research_data = execute_query("""
+                SELECT title, regime, buckets, created_at
+                FROM research 
+                WHERE created_at <= :end_date
+                AND regime IS NOT NULL
+                ORDER BY created_at DESC 
+                LIMIT 1
+            """, {"end_date": end_date})
+        
         if research_data:
             regime = research_data[0].get('regime')
             buckets = research_data[0].get('buckets', [])
@@ -67,15 +79,18 @@ class DatabaseIntegration:
         if cache_key in self.cache:
             return self.cache[cache_key]
         
-        trending_data = execute_query("""
-            SELECT * FROM scanner_historical
-            WHERE ticker = ANY(:tickers)
-            AND confidence >= :min_confidence
-            AND market = 'trending'
-            AND date <= :end_date
-            ORDER BY confidence DESC, date DESC
-            LIMIT :limit
-        """, {"tickers": tickers, "end_date": end_date, "limit": limit, "min_confidence": min_confidence})
+        if self._is_preloaded(end_date, tickers):
+            trending_data = self._preloaded_trending_rows(tickers, end_date, limit, min_confidence)
+        else:
+            trending_data = execute_query("""
+                SELECT * FROM scanner_historical
+                WHERE ticker = ANY(:tickers)
+                AND confidence >= :min_confidence
+                AND market = 'trending'
+                AND date <= :end_date
+                ORDER BY confidence DESC, date DESC
+                LIMIT :limit
+            """, {"tickers": tickers, "end_date": end_date, "limit": limit, "min_confidence": min_confidence})
         
         if trending_data:
             trending_tickers = [item['ticker'] for item in trending_data]
@@ -99,13 +114,16 @@ class DatabaseIntegration:
         if cache_key in self.cache:
             return self.cache[cache_key]
         
-        research_entries = execute_query("""
-            SELECT plain_text, created_at
-            FROM research 
-            WHERE created_at <= :date
-            ORDER BY created_at DESC 
-            LIMIT 3
-        """, {"date": date})
+        if self._is_preloaded(date):
+            research_entries = self._preloaded_sentiment_rows(date)
+        else:
+            research_entries = execute_query("""
+                SELECT plain_text, created_at
+                FROM research 
+                WHERE created_at <= :date
+                ORDER BY created_at DESC 
+                LIMIT 3
+            """, {"date": date})
         
         if research_entries:
             sentiment_score = self._analyze_sentiment_from_research(research_entries)
@@ -124,6 +142,121 @@ class DatabaseIntegration:
         self.cache[cache_key] = result_data
         return result_data
     
+    def preload_range(self, start_date: str, end_date: str, tickers: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Load the research (and optionally trending scanner) rows a backtest window needs in
+        one query each, parse every research row once, and serve per-date lookups in
+        [start_date, end_date] from memory.
+        """
+        self.clear_preload()
+        if not self.database_available:
+            return {'research_rows': 0, 'trending_rows': 0}
+        
+        # Rows inside the window, plus the rows an as-of lookup on start_date can still see:
+        # the latest regime row and the three latest research rows at or before start_date
+        research_rows = execute_query("""
+            (SELECT title, regime, buckets, plain_text, created_at
+             FROM research
+             WHERE created_at > :start_date AND created_at <= :end_date)
+            UNION
+            (SELECT title, regime, buckets, plain_text, created_at
+             FROM research
+             WHERE created_at <= :start_date AND regime IS NOT NULL
+             ORDER BY created_at DESC
+             LIMIT 1)
+            UNION
+            (SELECT title, regime, buckets, plain_text, created_at
+             FROM research
+             WHERE created_at <= :start_date
+             ORDER BY created_at DESC
+             LIMIT 3)
+        """, {"start_date": start_date, "end_date": end_date})
+        if research_rows is None:
+            return {'research_rows': 0, 'trending_rows': 0}
+        
+        trending_rows = []
+        if tickers:
+            trending_rows = execute_query("""
+                SELECT * FROM scanner_historical
+                WHERE ticker = ANY(:tickers)
+                AND market = 'trending'
+                AND date <= :end_date
+            """, {"tickers": tickers, "end_date": end_date}) or []
+        
+        research_rows = sorted(research_rows, key=lambda row: pd.Timestamp(row['created_at']))
+        for row in research_rows:
+            row['top_markets'] = self._extract_top_markets(row.get('plain_text'))
+            row['sentiment_score'] = self._score_research_text(row.get('plain_text'))
+        
+        regime_rows = [row for row in research_rows if row.get('regime') is not None]
+        self.preloaded = {
+            'start_date': pd.Timestamp(start_date),
+            'end_date': pd.Timestamp(end_date),
+            'tickers': set(tickers or []),
+            'research_rows': research_rows,
+            'research_dates': [pd.Timestamp(row['created_at']) for row in research_rows],
+            'regime_rows': regime_rows,
+            'regime_dates': [pd.Timestamp(row['created_at']) for row in regime_rows],
+            'trending_rows': sorted(
+                trending_rows,
+                key=lambda row: (-float(row['confidence']), -pd.Timestamp(row['date']).value)
+            ),
+        }
+        self.cache.clear()
+        return {'research_rows': len(research_rows), 'trending_rows': len(trending_rows)}
+    
+    def clear_preload(self):
+        self.preloaded = None
+    
+    def get_top_markets(self, date: str) -> List[str]:
+        """Top markets parsed from the latest research text as of date."""
+        if self._is_preloaded(date):
+            rows = self._preloaded_sentiment_rows(date)[:1]
+            return list(rows[0]['top_markets']) if rows else []
+        
+        if not self.database_available:
+            return []
+        
+        rows = execute_query("""
+            SELECT plain_text
+            FROM research
+            WHERE created_at <= :date
+            ORDER BY created_at DESC
+            LIMIT 1
+        """, {"date": date})
+        return self._extract_top_markets(rows[0].get('plain_text')) if rows else []
+    
+    def _is_preloaded(self, date: str, tickers: Optional[List[str]] = None) -> bool:
+        if self.preloaded is None:
+            return False
+        if not self.preloaded['start_date'] <= pd.Timestamp(date) <= self.preloaded['end_date']:
+            return False
+        return tickers is None or self.preloaded['tickers'].issuperset(tickers)
+    
+    def _preloaded_macro_rows(self, end_date: str) -> List[Dict]:
+        position = bisect_right(self.preloaded['regime_dates'], pd.Timestamp(end_date))
+        if not position:
+            return []
+        row = self.preloaded['regime_rows'][position - 1]
+        return [{key: row.get(key) for key in ('title', 'regime', 'buckets', 'created_at')}]
+    
+    def _preloaded_sentiment_rows(self, date: str) -> List[Dict]:
+        position = bisect_right(self.preloaded['research_dates'], pd.Timestamp(date))
+        return self.preloaded['research_rows'][max(0, position - 3):position][::-1]
+    
+    def _preloaded_trending_rows(self, tickers: List[str], end_date: str, limit: int, min_confidence: float) -> List[Dict]:
+        as_of = pd.Timestamp(end_date)
+        wanted = set(tickers)
+        matches = []
+        for row in self.preloaded['trending_rows']:
+            if float(row['confidence']) < min_confidence:
+                break
+            if row['ticker'] in wanted and pd.Timestamp(row['date']) <= as_of:
+                matches.append(row)
+                if len(matches) == limit:
+                    break
+        return matches
+    
     def get_regime_change_history(self, start_date: str, end_date: str) -> pd.DataFrame:
         dates = pd.date_range(start_date, end_date, freq='W')  # Weekly sampling
         regime_history = []
@@ -142,8 +275,6 @@ class DatabaseIntegration:
         return pd.DataFrame(regime_history)
     
     def _extract_top_markets(self, text: str) -> List[str]:
-        import re
-        
         if not text:
             return []
         
@@ -172,29 +303,30 @@ class DatabaseIntegration:
         if not research_entries:
             return 0.5  # Neutral
         
-        sentiment_indicators = {
-            'positive': ['bullish', 'optimistic', 'growth', 'expansion', 'strong', 'positive'],
-            'negative': ['bearish', 'pessimistic', 'recession', 'contraction', 'weak', 'negative', 'decline']
-        }
-        
         total_score = 0
         total_entries = 0
         
         for entry in research_entries:
-            if not entry.get('plain_text'):
-                continue
-            
-            text_lower = entry['plain_text'].lower()
-            positive_count = sum(1 for indicator in sentiment_indicators['positive'] if indicator in text_lower)
-            negative_count = sum(1 for indicator in sentiment_indicators['negative'] if indicator in text_lower)
-            
-            if positive_count + negative_count > 0:
-                entry_score = positive_count / (positive_count + negative_count)
+            # Preloaded rows carry their score already
+            entry_score = entry['sentiment_score'] if 'sentiment_score' in entry else self._score_research_text(entry.get('plain_text'))
+            if entry_score is not None:
                 total_score += entry_score
                 total_entries += 1
         
         return total_score / total_entries if total_entries > 0 else 0.5
     
+    def _score_research_text(self, text: Optional[str]) -> Optional[float]:
+        if not text:
+            return None
+        
+        text_lower = text.lower()
+        positive_count = sum(1 for indicator in SENTIMENT_INDICATORS['positive'] if indicator in text_lower)
+        negative_count = sum(1 for indicator in SENTIMENT_INDICATORS['negative'] if indicator in text_lower)
+        
+        if positive_count + negative_count == 0:
+            return None
+        return positive_count / (positive_count + negative_count)
+    
     def _determine_regime_from_macro(self, top_markets: List[str]) -> str:
         if not top_markets:
             return 'Risk On'  # Default
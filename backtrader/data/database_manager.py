@@ -10,7 +10,11 @@ Provides connection management, configuration, and session handling for:
 
 import os
 import sys
-from typing import Optional, Dict, Any
+import time
+import threading
+from typing import Optional, Dict, Any, Iterator, Union
+import numpy as np
+import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -27,6 +31,11 @@ except ImportError:
     print("Warning: python-dotenv not installed. .env file support disabled.")
 
 
+# Streaming defaults (overridable via environment)
+DEFAULT_FETCH_SIZE = int(os.getenv('DB_FETCH_SIZE', '2000'))
+SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', '500'))
+
+
 class DatabaseManager:
     """
     Centralized PostgreSQL database manager with connection pooling,
@@ -39,6 +48,9 @@ class DatabaseManager:
         self.is_connected = False
         self._setup_logging()
         
+        self._query_stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+        
         self.database_url = database_url or self._get_database_url_from_env()
         
         if self.database_url:
@@ -173,9 +185,11 @@ class DatabaseManager:
         if not session:
             return None
         
+        start = time.perf_counter()
         try:
             result = session.execute(text(query), params or {})
             rows = [dict(row._mapping) for row in result]
+            self._record_query(query, len(rows), start)
             return rows
         except SQLAlchemyError as e:
             self.logger.error(f"Query execution failed: {e}")
@@ -183,6 +197,112 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def stream_query(self, 
+                     query: str, 
+                     params: Optional[Dict[str, Any]] = None, 
+                     fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a query through a server-side cursor and yield rows one at a time.
+        
+        Only fetch_size rows are held in memory at once. Errors are logged and
+        end the stream early, matching execute_query's graceful degradation.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            fetch_size: Rows fetched from the server per round trip
+            
+        Yields:
+            Result rows as dictionaries
+        """
+        for chunk in self._stream_partitions(query, params, fetch_size):
+            for row in chunk['rows']:
+                yield dict(row._mapping)
+    
+    def stream_query_chunks(self, 
+                            query: str, 
+                            params: Optional[Dict[str, Any]] = None, 
+                            chunk_size: int = DEFAULT_FETCH_SIZE, 
+                            as_frame: bool = True) -> Iterator[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
+        """
+        Execute a query through a server-side cursor and yield column-oriented chunks.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            chunk_size: Rows per chunk (also the server fetch size)
+            as_frame: Yield pandas DataFrames if True, else dicts of NumPy column arrays
+            
+        Yields:
+            One DataFrame (or column dict) per chunk of at most chunk_size rows
+        """
+        for chunk in self._stream_partitions(query, params, chunk_size):
+            columns = list(zip(*chunk['rows'])) if chunk['rows'] else [()] * len(chunk['keys'])
+            arrays = {key: np.asarray(values) for key, values in zip(chunk['keys'], columns)}
+            yield pd.DataFrame(arrays, columns=chunk['keys']) if as_frame else arrays
+    
+    def _stream_partitions(self, 
+                           query: str, 
+                           params: Optional[Dict[str, Any]], 
+                           fetch_size: int) -> Iterator[Dict[str, Any]]:
+        """Yield {'keys', 'rows'} partitions from a streaming (server-side cursor) result"""
+        if not self.is_connected:
+            self.logger.warning("Database not connected - cannot execute query")
+            return
+        
+        start = time.perf_counter()
+        row_count = 0
+        try:
+            with self.engine.connect() as conn:
+                result = conn.execution_options(
+                    stream_results=True, 
+                    max_row_buffer=fetch_size
+                ).execute(text(query), params or {})
+                keys = list(result.keys())
+                for rows in result.partitions(fetch_size):
+                    row_count += len(rows)
+                    yield {'keys': keys, 'rows': rows}
+        except SQLAlchemyError as e:
+            self.logger.error(f"Streaming query failed: {e}")
+        finally:
+            self._record_query(query, row_count, start)
+    
+    def _record_query(self, query: str, row_count: int, start: float):
+        """Accumulate per-query timing and row-count statistics"""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        label = ' '.join(query.split())[:120]
+        
+        with self._stats_lock:
+            stats = self._query_stats.setdefault(label, {
+                'calls': 0, 'rows': 0, 'total_ms': 0.0, 'max_ms': 0.0
+            })
+            stats['calls'] += 1
+            stats['rows'] += row_count
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+        
+        if elapsed_ms >= SLOW_QUERY_MS:
+            self.logger.warning(f"Slow query ({elapsed_ms:.0f} ms, {row_count} rows): {label}")
+    
+    def get_query_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-query instrumentation.
+        
+        Returns:
+            Dictionary keyed by normalized query text with calls, rows,
+            total_ms, avg_ms and max_ms
+        """
+        with self._stats_lock:
+            return {
+                label: {**stats, 'avg_ms': stats['total_ms'] / stats['calls'] if stats['calls'] else 0.0}
+                for label, stats in self._query_stats.items()
+            }
+    
+    def reset_query_stats(self):
+        """Clear per-query instrumentation"""
+        with self._stats_lock:
+            self._query_stats.clear()
+    
     def get_connection_info(self) -> Dict[str, Any]:
         """
         Get database connection information.
@@ -255,6 +375,42 @@ def execute_query(query: str, params: Optional[Dict[str, Any]] = None) -> Option
     return get_database_manager().execute_query(query, params)
 
 
+def stream_query(query: str, 
+                 params: Optional[Dict[str, Any]] = None, 
+                 fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Stream query rows from a server-side cursor using the global manager.
+    
+    Args:
+        query: SQL query string
+        params: Query parameters
+        fetch_size: Rows fetched from the server per round trip
+        
+    Yields:
+        Result rows as dictionaries
+    """
+    return get_database_manager().stream_query(query, params, fetch_size)
+
+
+def stream_query_chunks(query: str, 
+                        params: Optional[Dict[str, Any]] = None, 
+                        chunk_size: int = DEFAULT_FETCH_SIZE, 
+                        as_frame: bool = True) -> Iterator[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
+    """
+    Stream column-oriented query chunks using the global manager.
+    
+    Args:
+        query: SQL query string
+        params: Query parameters
+        chunk_size: Rows per chunk
+        as_frame: Yield DataFrames if True, else dicts of NumPy arrays
+        
+    Yields:
+        DataFrame or column dict per chunk
+    """
+    return get_database_manager().stream_query_chunks(query, params, chunk_size, as_frame)
+
+
 # Database configuration validation
 def validate_database_config() -> Dict[str, Any]:
     """
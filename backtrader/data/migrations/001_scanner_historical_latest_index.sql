@@ -0,0 +1,16 @@
+-- Module 12: latest-per-(ticker, timeframe) scanner lookups
+--
+-- EnhancedAssetScanner fetches the most recent row per (ticker, timeframe)
+-- inside a bounded date window (SELECT DISTINCT ON (ticker, timeframe) ...
+-- ORDER BY ticker, timeframe, date DESC). This index matches that ordering,
+-- so each group is resolved with a short index range scan, and it covers
+-- market/confidence so the heap is not visited.
+--
+-- CONCURRENTLY avoids locking writes on a live table; it cannot run inside
+-- a transaction block, so apply with:
+--   psql "$DATABASE_URL" -f data/migrations/001_scanner_historical_latest_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scanner_ticker_timeframe_date
+    ON scanner_historical (ticker, timeframe, date DESC)
+    INCLUDE (market, confidence);
+
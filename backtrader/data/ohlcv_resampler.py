@@ -0,0 +1,151 @@
+"""
+Vectorized OHLCV aggregation for deriving coarser timeframes from native bars
+
+Bars are assigned to bins with integer arithmetic on the nanosecond timestamps and
+aggregated with numpy reductions over contiguous runs, so no pandas groupby or
+resample machinery is involved.
+
+Binning rules:
+- Equities: intraday bins are anchored at the 09:30 US market open of each trading
+  day (exchange wall time), so 4h bars are 09:30-13:30, 13:30-17:30, ... Pre-market
+  bars fall into bins counted back from the open, clipped to the start of their day,
+  so no bin ever spans two trading days.
+- Crypto: markets trade 24/7, so bins are floored from the epoch (midnight UTC).
+- Daily and longer bins start at midnight; weekly bins start on Mondays.
+"""
+
+import logging
+import re
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+MARKET_OPEN = pd.Timedelta(hours=9, minutes=30)
+ONE_DAY = pd.Timedelta(days=1)
+WEEK = pd.Timedelta(days=7)
+WEEK_ORIGIN = pd.Timedelta(days=4)
+
+_TIMEFRAME_UNITS = {
+    'min': 'min', 't': 'min',
+    'h': 'h',
+    'd': 'D',
+    'w': 'W'
+}
+
+
+def timeframe_to_timedelta(timeframe: str) -> pd.Timedelta:
+    """
+    Convert a timeframe string to a fixed bar width
+
+    Accepts our format ('15min', '4h', '1d', '1w') and pandas-style rules ('4H', '15T')
+
+    Raises:
+        ValueError: If the timeframe cannot be parsed
+    """
+    match = re.fullmatch(r'(\d+)\s*(min|t|h|d|w)', timeframe.strip().lower())
+    if not match:
+        raise ValueError(f"Unsupported timeframe format: {timeframe}")
+
+    amount, unit = int(match.group(1)), _TIMEFRAME_UNITS[match.group(2)]
+    if amount <= 0:
+        raise ValueError(f"Unsupported timeframe format: {timeframe}")
+    if unit == 'W':
+        return WEEK * amount
+    return pd.Timedelta(amount, unit=unit)
+
+
+def bin_starts(index: pd.DatetimeIndex, bar_width: pd.Timedelta, asset_type: str = 'stock') -> np.ndarray:
+    """
+    Compute the bin start of every timestamp as int64 nanoseconds of wall time
+
+    Args:
+        index: Sorted timestamps (naive timestamps are taken as exchange time for
+            equities and UTC for crypto)
+        bar_width: Target bar width
+        asset_type: 'crypto' for 24/7 epoch-aligned bins, anything else for
+            session-anchored equity bins
+
+    Returns:
+        Array of bin starts aligned with index
+    """
+    if index.tz is not None:
+        if asset_type == 'crypto':
+            index = index.tz_convert('UTC')
+        index = index.tz_localize(None)
+
+    ns = index.as_unit('ns').asi8
+    step = bar_width.value
+
+    if asset_type == 'crypto' or bar_width >= ONE_DAY:
+        # The epoch is a Thursday; weekly bins start on Mondays
+        origin = WEEK_ORIGIN.value if step % WEEK.value == 0 else 0
+        return ns - np.mod(ns - origin, step)
+
+    day = ns - np.mod(ns, ONE_DAY.value)
+    anchor = day + MARKET_OPEN.value
+    starts = anchor + np.floor_divide(ns - anchor, step) * step
+    return np.maximum(starts, day)
+
+
+def resample_ohlcv(df: pd.DataFrame, target_timeframe: str, asset_type: str = 'stock') -> pd.DataFrame:
+    """
+    Aggregate OHLCV bars into a coarser timeframe
+
+    Args:
+        df: DataFrame with a DatetimeIndex and OHLCV columns
+        target_timeframe: Target timeframe (e.g., '2h', '4h', '30min', '1w')
+        asset_type: 'stock' (09:30 session anchored) or 'crypto' (24/7)
+
+    Returns:
+        Resampled DataFrame with the same OHLCV columns, index timezone and index
+        name; bins without any complete bar are omitted
+    """
+    if df.empty:
+        return df
+
+    bar_width = timeframe_to_timedelta(target_timeframe)
+    columns = [column for column in OHLCV_COLUMNS if column in df.columns]
+    price_columns = [column for column in columns if column != 'Volume']
+
+    data = df[columns]
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+    data = data.dropna(subset=price_columns)
+    if data.empty:
+        return data
+
+    index = pd.DatetimeIndex(data.index)
+    bins = bin_starts(index, bar_width, asset_type)
+
+    # Bin starts are non-decreasing over sorted input, so each bin is a contiguous run
+    run_starts = np.flatnonzero(np.concatenate(([True], bins[1:] != bins[:-1])))
+    run_ends = np.append(run_starts[1:], len(bins)) - 1
+
+    aggregated = {}
+    for column in columns:
+        values = data[column].to_numpy()
+        if column == 'Open':
+            aggregated[column] = values[run_starts]
+        elif column == 'Close':
+            aggregated[column] = values[run_ends]
+        elif column == 'High':
+            aggregated[column] = np.maximum.reduceat(values, run_starts)
+        elif column == 'Low':
+            aggregated[column] = np.minimum.reduceat(values, run_starts)
+        else:
+            aggregated[column] = np.add.reduceat(np.nan_to_num(values), run_starts)
+
+    result_index = pd.DatetimeIndex(bins[run_starts].view('datetime64[ns]'), name=index.name)
+    if index.tz is not None:
+        if asset_type == 'crypto':
+            result_index = result_index.tz_localize('UTC').tz_convert(index.tz)
+        else:
+            result_index = result_index.tz_localize(index.tz, ambiguous=True, nonexistent='shift_forward')
+
+    resampled = pd.DataFrame(aggregated, index=result_index)
+    logger.debug(f"Resampled {len(df)} records to {len(resampled)} {target_timeframe} records ({asset_type})")
+    return resampled
@@ -0,0 +1,483 @@
+"""
+Quota-aware preload planning
+
+Turns a preload request (tickers x timeframes x date range) into the smallest set of
+provider fetches that completes the cache, orders them by priority and spreads them
+over days within a daily API call budget. The plan is persisted as JSON, so repeated
+invocations with the same request continue where the previous one stopped.
+
+Minimal request set:
+- Only native timeframes are fetched; derived ones (e.g. 4h from 1h) are aggregated
+  locally once their source is complete
+- Ranges already covered by cache files are skipped
+- Daily and crypto series come back whole from one call, so each needs at most one
+- Alpha Vantage equity intraday history is fetched month by month, and closed months
+  already in the intraday month cache cost nothing
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Ranges ending within this window use the provider's 'recent' intraday endpoint
+RECENT_WINDOW = timedelta(days=30)
+MAX_ATTEMPTS = 3
+
+
+@dataclass
+class PreloadUnit:
+    """One provider fetch in a preload plan"""
+    ticker: str
+    timeframe: str   # Native timeframe fetched
+    start_date: str  # ISO date
+    end_date: str    # ISO date
+    calls: int       # Estimated API calls
+    priority: int
+    status: str = 'pending'  # pending, completed, failed
+    attempts: int = 0
+    calls_used: int = 0
+    error: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+@dataclass
+class PreloadPlan:
+    """A persisted, resumable preload schedule"""
+    plan_id: str
+    provider: str
+    tickers: List[str]
+    timeframes: List[str]
+    start_date: str  # ISO date
+    end_date: str    # ISO date
+    daily_quota: int
+    priority_tickers: List[str]
+    units: List[PreloadUnit]
+    usage: Dict[str, int] = field(default_factory=dict)  # ISO date -> API calls spent
+    assembled: List[str] = field(default_factory=list)   # Tickers whose timeframes are complete
+    created_at: str = ''
+    last_updated: str = ''
+    
+    @property
+    def pending_units(self) -> List[PreloadUnit]:
+        return [unit for unit in self.units if unit.status == 'pending']
+    
+    @property
+    def is_complete(self) -> bool:
+        return not self.pending_units
+
+
+class PreloadPlanner:
+    """
+    Builds, schedules and executes quota-limited preload plans
+    
+    Works on top of DataManager: fetches go through download_data (so results land in
+    the provider cache exactly as in normal downloads) and derived timeframes through
+    the TimeframeManager.
+    """
+    
+    def __init__(self, data_manager, daily_quota: int, plan_dir: str = "data/preload_plans"):
+        """
+        Args:
+            data_manager: DataManager whose active provider and cache are planned for
+            daily_quota: API calls that may be spent per calendar day
+            plan_dir: Directory for persisted plans
+        """
+        if daily_quota <= 0:
+            raise ValueError(f"daily_quota must be positive, got {daily_quota}")
+        
+        self.data_manager = data_manager
+        self.timeframe_manager = data_manager.timeframe_manager
+        self.daily_quota = daily_quota
+        self.plan_dir = Path(plan_dir)
+        self.plan_dir.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def provider_name(self) -> str:
+        return self.data_manager.registry.get_active_name()
+    
+    # ------------------------------------------------------------------
+    # Plan persistence
+    # ------------------------------------------------------------------
+    
+    def plan_id_for(self, tickers: List[str], timeframes: List[str], start_date: date, end_date: date) -> str:
+        """Deterministic plan ID, so the same request always maps to the same plan"""
+        signature = json.dumps([self.provider_name, sorted(set(tickers)), sorted(set(timeframes)),
+                                start_date.isoformat(), end_date.isoformat()])
+        digest = hashlib.sha1(signature.encode()).hexdigest()[:10]
+        return f"PRELOAD_{start_date:%Y%m%d}_{end_date:%Y%m%d}_{digest}"
+    
+    def load_or_create(self, tickers: List[str], timeframes: List[str],
+                       start_date: datetime, end_date: datetime,
+                       priority_tickers: Optional[List[str]] = None, force: bool = False) -> PreloadPlan:
+        """
+        Continue the persisted plan for this request, or build a new one
+        
+        Args:
+            tickers: Tickers to preload
+            timeframes: Timeframes to preload (native or derivable)
+            start_date: Start of the requested range
+            end_date: End of the requested range
+            priority_tickers: Tickers to fetch first, in order (e.g. the next backtest's universe)
+            force: Ignore existing cache coverage and rebuild the plan
+            
+        Returns:
+            PreloadPlan (already saved)
+        """
+        start, end = _as_date(start_date), _as_date(end_date)
+        plan_id = self.plan_id_for(tickers, timeframes, start, end)
+        
+        plan = None if force else self.load_plan(plan_id)
+        if plan is not None:
+            plan.daily_quota = self.daily_quota
+            if priority_tickers is not None and priority_tickers != plan.priority_tickers:
+                self._reprioritize(plan, priority_tickers)
+            logger.info(f"Continuing preload plan {plan_id}: {len(plan.pending_units)} units pending")
+        else:
+            plan = self.build_plan(plan_id, tickers, timeframes, start, end, priority_tickers or [], force)
+        
+        self.save_plan(plan)
+        return plan
+    
+    def load_plan(self, plan_id: str) -> Optional[PreloadPlan]:
+        """Load a persisted plan, or None if it does not exist"""
+        path = self.plan_dir / f"{plan_id}.json"
+        if not path.exists():
+            return None
+        
+        with open(path, 'r') as f:
+            data = json.load(f)
+        data['units'] = [PreloadUnit(**unit) for unit in data['units']]
+        return PreloadPlan(**data)
+    
+    def save_plan(self, plan: PreloadPlan):
+        """Atomically persist a plan"""
+        plan.last_updated = datetime.now().isoformat()
+        path = self.plan_dir / f"{plan.plan_id}.json"
+        temp_path = path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(asdict(plan), f, indent=2)
+        temp_path.replace(path)
+    
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+    
+    def build_plan(self, plan_id: str, tickers: List[str], timeframes: List[str],
+                   start_date: date, end_date: date, priority_tickers: List[str],
+                   force: bool = False) -> PreloadPlan:
+        """Diff the requested coverage against the cache and build the minimal fetch set"""
+        tickers = list(dict.fromkeys(tickers))
+        natives = list(dict.fromkeys(self.native_timeframe(tf) for tf in timeframes))
+        ranks = self._priority_ranks(tickers, priority_tickers)
+        
+        units = []
+        for ticker in tickers:
+            for native in natives:
+                gaps = [(start_date, end_date)] if force else self.missing_ranges(ticker, native, start_date, end_date)
+                units.extend(self._units_for_gaps(ticker, native, gaps, ranks[ticker]))
+        
+        units.sort(key=_unit_order)
+        now = datetime.now().isoformat()
+        plan = PreloadPlan(
+            plan_id=plan_id,
+            provider=self.provider_name,
+            tickers=tickers,
+            timeframes=list(timeframes),
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+            daily_quota=self.daily_quota,
+            priority_tickers=list(priority_tickers),
+            units=units,
+            created_at=now,
+            last_updated=now
+        )
+        logger.info(f"Built preload plan {plan_id}: {len(units)} units, "
+                    f"{sum(unit.calls for unit in units)} estimated calls")
+        return plan
+    
+    def native_timeframe(self, timeframe: str) -> str:
+        """The timeframe actually fetched for a requested timeframe"""
+        return self.timeframe_manager.resolve_derivation(timeframe) or timeframe
+    
+    def missing_ranges(self, ticker: str, timeframe: str,
+                       start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """Date ranges in [start_date, end_date] not covered by any cache file"""
+        gaps = []
+        cursor = start_date
+        for cached_start, cached_end in _merge_ranges(r for r, _ in self._cached_files(ticker, timeframe)):
+            if cached_end < cursor:
+                continue
+            if cached_start > end_date:
+                break
+            if cached_start > cursor:
+                gaps.append((cursor, cached_start - timedelta(days=1)))
+            cursor = max(cursor, cached_end + timedelta(days=1))
+            if cursor > end_date:
+                break
+        
+        if cursor <= end_date:
+            gaps.append((cursor, end_date))
+        return gaps
+    
+    def _cached_files(self, ticker: str, timeframe: str) -> List[Tuple[Tuple[date, date], Path]]:
+        """Cache files of a ticker/timeframe with the date range encoded in their names"""
+        cache_dir = Path(self.data_manager.cache_dir) / self.provider_name / ticker / timeframe
+        files = []
+        if not cache_dir.exists():
+            return files
+        
+        for path in cache_dir.glob(f"{ticker}_{timeframe}_*.pkl"):
+            parts = path.stem.split('_')
+            try:
+                files.append(((datetime.strptime(parts[-2], '%Y%m%d').date(),
+                               datetime.strptime(parts[-1], '%Y%m%d').date()), path))
+            except (ValueError, IndexError):
+                continue
+        return sorted(files)
+    
+    def _units_for_gaps(self, ticker: str, timeframe: str, gaps: List[Tuple[date, date]],
+                        priority: int) -> List[PreloadUnit]:
+        """Split uncovered ranges into fetches matching how the provider requests them"""
+        if not gaps:
+            return []
+        
+        def unit(start: date, end: date, calls: int) -> PreloadUnit:
+            return PreloadUnit(ticker=ticker, timeframe=timeframe, start_date=start.isoformat(),
+                               end_date=end.isoformat(), calls=calls, priority=priority)
+        
+        provider = self.data_manager.registry.get_active()
+        month_by_month = (timeframe != '1d' and self.provider_name == 'alpha_vantage'
+                          and self.timeframe_manager._get_asset_type(ticker) != 'crypto')
+        if not month_by_month:
+            # One request returns the whole series
+            return [unit(gaps[0][0], gaps[-1][1], 1)]
+        
+        units = []
+        recent_cutoff = date.today() - RECENT_WINDOW
+        recent_gaps = []
+        month_cache = provider.get_month_cache()
+        api_symbol = provider._sanitize_symbol_for_api(ticker)
+        interval = provider._resolve_native_timeframe(timeframe)['native']
+        
+        for gap_start, gap_end in gaps:
+            if gap_end > recent_cutoff:
+                recent_gaps.append((max(gap_start, recent_cutoff + timedelta(days=1)), gap_end))
+                gap_end = recent_cutoff
+            
+            month_start = gap_start.replace(day=1)
+            while month_start <= gap_end:
+                next_month = (month_start + timedelta(days=32)).replace(day=1)
+                start, end = max(gap_start, month_start), min(gap_end, next_month - timedelta(days=1))
+                cached = month_cache.contains(api_symbol, interval, month_start.strftime('%Y-%m'))
+                units.append(unit(start, end, 0 if cached else 1))
+                month_start = next_month
+        
+        if recent_gaps:
+            # The recent endpoint returns the last 30 days in one request
+            units.append(unit(recent_gaps[0][0], recent_gaps[-1][1], 1))
+        return units
+    
+    def _priority_ranks(self, tickers: List[str], priority_tickers: List[str]) -> Dict[str, int]:
+        """Priority tickers first (in the given order), then the rest alphabetically"""
+        ranks = {ticker: i for i, ticker in enumerate(t for t in priority_tickers if t in tickers)}
+        for ticker in sorted(t for t in tickers if t not in ranks):
+            ranks[ticker] = len(ranks)
+        return ranks
+    
+    def _reprioritize(self, plan: PreloadPlan, priority_tickers: List[str]):
+        ranks = self._priority_ranks(plan.tickers, priority_tickers)
+        for unit in plan.units:
+            unit.priority = ranks.get(unit.ticker, len(ranks))
+        plan.units.sort(key=_unit_order)
+        plan.priority_tickers = list(priority_tickers)
+    
+    def schedule(self, plan: PreloadPlan, today: Optional[date] = None) -> List[Dict]:
+        """
+        Assign pending units to days within the daily quota
+        
+        Returns:
+            List of {'date', 'calls', 'units', 'tickers'} per day, starting today
+            (with today's remaining quota)
+        """
+        day = today or date.today()
+        remaining = plan.daily_quota - plan.usage.get(day.isoformat(), 0)
+        days = [{'date': day.isoformat(), 'calls': 0, 'units': 0, 'tickers': []}]
+        
+        for unit in plan.pending_units:
+            if unit.calls > remaining:
+                day += timedelta(days=1)
+                remaining = plan.daily_quota
+                days.append({'date': day.isoformat(), 'calls': 0, 'units': 0, 'tickers': []})
+            current = days[-1]
+            current['calls'] += unit.calls
+            current['units'] += 1
+            if unit.ticker not in current['tickers']:
+                current['tickers'].append(unit.ticker)
+            remaining -= unit.calls
+        
+        return [d for d in days if d['units'] > 0]
+    
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+    
+    def execute(self, plan: PreloadPlan, today: Optional[date] = None) -> Dict:
+        """
+        Run as much of the plan as today's remaining quota allows
+        
+        Units are taken in priority order; a unit that does not fit is skipped for a
+        later, cheaper one so the day's budget is used up. The plan is saved after every
+        unit, so an interrupted run loses nothing.
+        
+        Returns:
+            Dict with completed/failed/remaining unit counts and calls spent today
+        """
+        day = (today or date.today()).isoformat()
+        completed = failed = 0
+        
+        for unit in plan.pending_units:
+            remaining = plan.daily_quota - plan.usage.get(day, 0)
+            if unit.calls > remaining:
+                continue
+            
+            requests_before = self._request_count()
+            success = self._fetch_unit(unit)
+            requests_after = self._request_count()
+            
+            used = unit.calls if requests_before is None or requests_after is None else requests_after - requests_before
+            unit.calls_used += used
+            plan.usage[day] = plan.usage.get(day, 0) + used
+            
+            if success:
+                completed += 1
+            elif unit.status == 'failed':
+                failed += 1
+            self.save_plan(plan)
+        
+        assembled = self.assemble(plan)
+        self.save_plan(plan)
+        
+        return {
+            'plan_id': plan.plan_id,
+            'completed_units': completed,
+            'failed_units': failed,
+            'pending_units': len(plan.pending_units),
+            'calls_today': plan.usage.get(day, 0),
+            'assembled_tickers': assembled,
+            'complete': plan.is_complete
+        }
+    
+    def _fetch_unit(self, unit: PreloadUnit) -> bool:
+        unit.attempts += 1
+        start = datetime.combine(date.fromisoformat(unit.start_date), time())
+        end = datetime.combine(date.fromisoformat(unit.end_date), time())
+        try:
+            data = self.data_manager.download_data(unit.ticker, start, end, use_cache=True, interval=unit.timeframe)
+            if data is not None and not data.empty:
+                unit.status = 'completed'
+                unit.error = None
+                unit.completed_at = datetime.now().isoformat()
+                return True
+            unit.error = 'No data returned'
+        except Exception as e:
+            unit.error = str(e)
+        
+        logger.warning(f"Preload unit {unit.ticker} {unit.timeframe} {unit.start_date}..{unit.end_date} "
+                       f"failed (attempt {unit.attempts}): {unit.error}")
+        if unit.attempts >= MAX_ATTEMPTS:
+            unit.status = 'failed'
+        return False
+    
+    def _request_count(self) -> Optional[int]:
+        """Requests sent by the active provider's pooled session, if it has one"""
+        from .providers.http_transport import PooledHTTPAdapter, get_latency_stats
+        
+        session = getattr(self.data_manager.registry.get_active(), 'session', None)
+        adapters = getattr(session, 'adapters', None)
+        if not adapters or not any(isinstance(a, PooledHTTPAdapter) for a in adapters.values()):
+            return None
+        return sum(stats['count'] for stats in get_latency_stats(session).values())
+    
+    def assemble(self, plan: PreloadPlan) -> List[str]:
+        """
+        Finish tickers whose units have all completed
+        
+        Cache pieces of each native timeframe are merged into one file covering the
+        requested range, then every requested timeframe is loaded through the
+        TimeframeManager, which derives and caches the non-native ones. No API calls
+        are made: all native data is in the cache at this point.
+        
+        Returns:
+            Tickers assembled in this call
+        """
+        start = datetime.combine(date.fromisoformat(plan.start_date), time())
+        end = datetime.combine(date.fromisoformat(plan.end_date), time())
+        natives = list(dict.fromkeys(self.native_timeframe(tf) for tf in plan.timeframes))
+        
+        assembled = []
+        for ticker in plan.tickers:
+            if ticker in plan.assembled:
+                continue
+            units = [unit for unit in plan.units if unit.ticker == ticker]
+            if any(unit.status != 'completed' for unit in units):
+                continue
+            
+            try:
+                for native in natives:
+                    self._merge_cached_pieces(ticker, native, start, end)
+                self.timeframe_manager.get_multi_timeframe_data(ticker, plan.timeframes, start, end)
+                plan.assembled.append(ticker)
+                assembled.append(ticker)
+            except Exception as e:
+                logger.error(f"Could not assemble preloaded data for {ticker}: {e}")
+        
+        return assembled
+    
+    def _merge_cached_pieces(self, ticker: str, timeframe: str, start: datetime, end: datetime):
+        """Write one cache file for [start, end] from the pieces covering it"""
+        if any(s <= start.date() and e >= end.date() for (s, e), _ in self._cached_files(ticker, timeframe)):
+            return
+        
+        frames = []
+        for (piece_start, piece_end), path in self._cached_files(ticker, timeframe):
+            if piece_end < start.date() or piece_start > end.date():
+                continue
+            with open(path, 'rb') as f:
+                frames.append(pickle.load(f))
+        if not frames:
+            return
+        
+        combined = pd.concat(frames).sort_index()
+        combined = combined[~combined.index.duplicated(keep='last')]
+        attrs = dict(frames[-1].attrs)
+        combined.attrs = attrs
+        self.data_manager._save_to_cache(ticker, start, end, combined, timeframe)
+        logger.info(f"Merged {len(frames)} cached pieces of {ticker} {timeframe} into one range")
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _unit_order(unit: PreloadUnit):
+    return (unit.priority, unit.calls, unit.timeframe, unit.start_date)
+
+
+def _merge_ranges(ranges) -> List[Tuple[date, date]]:
+    """Union of inclusive date ranges, with adjacent ranges joined"""
+    merged: List[List[date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
@@ -0,0 +1,77 @@
+"""
+Compact on-disk storage for OHLCV DataFrames
+
+Frames are stored as a compressed .npz file with one array per column plus the
+index (timezone and name preserved). No pickled objects are written, and files
+are written atomically so readers never see a partial file.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
+
+
+def write_frame(path: Union[str, Path], df: pd.DataFrame) -> str:
+    """
+    Atomically write a DataFrame to an .npz file
+
+    Returns:
+        SHA-256 checksum of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez_compressed(tmp_path, **_frame_to_arrays(df))
+    checksum = file_checksum(tmp_path)
+    os.replace(tmp_path, path)
+    return checksum
+
+
+def read_frame(path: Union[str, Path]) -> pd.DataFrame:
+    """Read a DataFrame written by write_frame"""
+    with np.load(path, allow_pickle=False) as arrays:
+        return _arrays_to_frame(arrays)
+
+
+def file_checksum(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _frame_to_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Split a DataFrame into plain arrays: one per column plus the index"""
+    index = pd.DatetimeIndex(df.index)
+    arrays = {
+        '__index__': index.asi8,
+        '__tz__': np.array(str(index.tz) if index.tz is not None else ''),
+        '__index_name__': np.array(df.index.name or ''),
+        '__columns__': np.array([str(column) for column in df.columns])
+    }
+    for i, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        arrays[f"col_{i}"] = values.astype(str) if values.dtype == object else values
+    return arrays
+
+
+def _arrays_to_frame(arrays) -> pd.DataFrame:
+    """Rebuild a DataFrame from the arrays written by _frame_to_arrays"""
+    index = pd.DatetimeIndex(arrays['__index__'].view('datetime64[ns]'))
+    tz = str(arrays['__tz__'])
+    if tz:
+        index = index.tz_localize('UTC').tz_convert(tz)
+    index.name = str(arrays['__index_name__']) or None
+
+    columns = [str(column) for column in arrays['__columns__']]
+    return pd.DataFrame(
+        {column: arrays[f"col_{i}"] for i, column in enumerate(columns)},
+        index=index
+    )
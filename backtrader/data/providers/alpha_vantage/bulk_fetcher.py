@@ -1,5 +1,6 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Callable, Tuple, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -7,6 +8,8 @@ import pandas as pd
 
 from .client import AlphaVantageClient
 from .checkpoint_manager import CheckpointManager
+from .data_validator import DataValidator, StreamingValidation
+from ...asset_buckets import get_asset_type
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,8 @@ class DownloadChunk:
     error: Optional[str] = None
     attempt: int = 0
     max_attempts: int = 3
+    data_file: Optional[str] = None  # Spilled data file name, relative to the checkpoint's chunk dir
+    checksum: Optional[str] = None   # SHA-256 of the spilled data file
 
 
 @dataclass
@@ -73,6 +78,7 @@ class BulkDataFetcher:
         # Initialize error handler
         from .error_handler import ErrorRecoveryStrategy
         self.error_handler = ErrorRecoveryStrategy(max_retries=3)
+        self._validator = None
         
     def create_download_plan(
         self,
@@ -142,83 +148,139 @@ class BulkDataFetcher:
         progress_callback: Optional[Callable[[str, int, Dict], None]] = None,
         max_parallel: int = 3,
         enable_checkpoints: bool = True,
-        checkpoint_interval: int = 5
+        checkpoint_interval: int = 5,
+        plan_id: Optional[str] = None
     ) -> pd.DataFrame:
         """
         Execute a download plan with progress tracking and checkpointing
         
         Args:
             plan: DownloadPlan to execute
-            progress_callback: Optional callback(status, progress_percent, stats)
-            max_parallel: Maximum parallel downloads
+            progress_callback: Optional callback(status, progress_percent, stats); stats include
+                chunks_per_minute, records_per_second and eta_seconds
+            max_parallel: Maximum chunks downloading at once
             enable_checkpoints: Enable checkpoint saving for resumable downloads
             checkpoint_interval: Save checkpoint every N completed chunks
+            plan_id: Existing checkpoint identifier when resuming (a new one is generated otherwise)
             
         Returns:
             Combined DataFrame with all data
         """
-        plan_id = f"{plan.ticker}_{plan.timeframe}_{int(time.time())}"
+        resuming = plan_id is not None
+        plan_id = plan_id or f"{plan.ticker}_{plan.timeframe}_{int(time.time())}"
         self.active_downloads[plan_id] = plan
         
         logger.info(f"Executing download plan {plan_id}: {plan.total_chunks} chunks")
         
         # Save initial checkpoint if enabled
         if enable_checkpoints:
-            self.checkpoint_manager.save_checkpoint(plan, plan_id)
-            logger.info(f"Initial checkpoint saved for {plan_id}")
+            if resuming:
+                self.checkpoint_manager.update_checkpoint(plan, plan_id)
+            else:
+                self.checkpoint_manager.save_checkpoint(plan, plan_id, chunk_spill=True)
+                logger.info(f"Initial checkpoint saved for {plan_id}")
         
         try:
-            # Process chunks with rate limiting
-            completed_data = []
+            # Chunks finished in an earlier (resumed) run keep their place in the assembly order
+            chunk_results = {
+                i: chunk.data for i, chunk in enumerate(plan.chunks)
+                if chunk.status == 'completed' and chunk.data is not None
+            }
+            pending = [i for i, chunk in enumerate(plan.chunks) if chunk.status != 'completed']
+            if len(pending) < plan.total_chunks:
+                logger.debug(f"Skipping {plan.total_chunks - len(pending)} already completed chunks")
             
-            for i, chunk in enumerate(plan.chunks):
-                # Skip chunks that are already completed (for resumed downloads)
-                if chunk.status == 'completed':
-                    logger.debug(f"Skipping already completed chunk {i+1}/{plan.total_chunks}")
-                    continue
-                    
-                if progress_callback:
-                    progress_stats = {
-                        'completed_chunks': plan.completed_chunks,
-                        'total_chunks': plan.total_chunks,
-                        'failed_chunks': plan.failed_chunks,
-                        'current_chunk': i + 1,
-                        'plan_id': plan_id
-                    }
-                    progress_callback(
-                        f"Downloading chunk {i+1}/{plan.total_chunks} for {plan.ticker}",
-                        int((plan.completed_chunks / plan.total_chunks) * 100),
-                        progress_stats
-                    )
-                
-                chunk_data = self._download_chunk(chunk)
+            # Chunks are validated as soon as every earlier chunk has settled, so validation
+            # overlaps the download instead of re-scanning the combined frame at the end
+            validation = self._start_validation(plan)
+            settled = set(range(plan.total_chunks)) - set(pending)
+            next_to_validate = 0
+            
+            def validate_settled_chunks():
+                nonlocal validation, next_to_validate
+                while validation is not None and next_to_validate in settled:
+                    if next_to_validate in chunk_results:
+                        try:
+                            validation.add_chunk(chunk_results[next_to_validate])
+                        except Exception as e:
+                            logger.warning(f"Streaming validation stopped for {plan.ticker}: {e}")
+                            validation = None
+                    next_to_validate += 1
+            
+            validate_settled_chunks()
+            
+            workers = max(1, min(max_parallel, len(pending)))
+            if progress_callback and pending:
+                progress_callback(
+                    f"Downloading {len(pending)} chunks for {plan.ticker} ({workers} parallel)",
+                    int((plan.completed_chunks / plan.total_chunks) * 100),
+                    self._progress_stats(plan, plan_id, 0, len(pending), 0, time.time())
+                )
+            
+            # Chunks run concurrently (sharing the client's rate limiter) and may finish out of order;
+            # results are keyed by chunk index so assembly below stays in plan order
+            started = time.time()
+            finished = 0
+            records = 0
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"bulk-{plan.ticker}")
+            try:
+                futures = {executor.submit(self._download_chunk, plan.chunks[i]): i for i in pending}
                 
-                if chunk_data is not None and not chunk_data.empty:
-                    completed_data.append(chunk_data)
-                    plan.completed_chunks += 1
-                    chunk.status = 'completed'
-                    logger.info(f"Completed chunk {i+1}/{plan.total_chunks}: {len(chunk_data)} records")
+                for future in as_completed(futures):
+                    i = futures[future]
+                    chunk_data = future.result()
+                    finished += 1
                     
-                    # Save checkpoint periodically
-                    if enable_checkpoints and plan.completed_chunks % checkpoint_interval == 0:
-                        self.checkpoint_manager.update_checkpoint(plan, plan_id)
-                        logger.debug(f"Checkpoint updated at {plan.completed_chunks}/{plan.total_chunks} chunks")
+                    if chunk_data is not None and not chunk_data.empty:
+                        chunk_results[i] = chunk_data
+                        records += len(chunk_data)
+                        plan.completed_chunks += 1
+                        logger.info(f"Completed chunk {i+1}/{plan.total_chunks}: {len(chunk_data)} records")
+                        
+                        # Spill the chunk so a resumed download can reassemble it without re-fetching
+                        if enable_checkpoints:
+                            self.checkpoint_manager.save_chunk_data(plan_id, i, plan.chunks[i])
                         
-                else:
-                    plan.failed_chunks += 1
-                    chunk.status = 'failed'
-                    logger.warning(f"Failed chunk {i+1}/{plan.total_chunks}")
+                        # Save checkpoint periodically
+                        if enable_checkpoints and plan.completed_chunks % checkpoint_interval == 0:
+                            self.checkpoint_manager.update_checkpoint(plan, plan_id)
+                            logger.debug(f"Checkpoint updated at {plan.completed_chunks}/{plan.total_chunks} chunks")
+                    else:
+                        plan.failed_chunks += 1
+                        logger.warning(f"Failed chunk {i+1}/{plan.total_chunks}")
+                        
+                        # Update checkpoint after failures too
+                        if enable_checkpoints:
+                            self.checkpoint_manager.update_checkpoint(plan, plan_id)
+                    
+                    settled.add(i)
+                    validate_settled_chunks()
                     
-                    # Update checkpoint after failures too
-                    if enable_checkpoints:
-                        self.checkpoint_manager.update_checkpoint(plan, plan_id)
+                    if progress_callback:
+                        progress_stats = self._progress_stats(plan, plan_id, finished, len(pending), records, started)
+                        progress_stats['current_chunk'] = i + 1
+                        progress_callback(
+                            f"Finished chunk {i+1}/{plan.total_chunks} for {plan.ticker}",
+                            int((plan.completed_chunks / plan.total_chunks) * 100),
+                            progress_stats
+                        )
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            
+            completed_data = [chunk_results[i] for i in sorted(chunk_results)]
             
             # Combine all data
             if completed_data:
                 combined_df = pd.concat(completed_data, ignore_index=False)
+                rows_streamed = len(combined_df)
+                in_order = combined_df.index.is_monotonic_increasing
                 combined_df = combined_df.sort_index()
                 combined_df = combined_df.drop_duplicates()
                 
+                # The streamed issue mask only lines up if assembly neither reordered nor dropped rows
+                if validation is not None and not (in_order and len(combined_df) == rows_streamed == validation.rows):
+                    validation = None
+                
                 # Add metadata
                 combined_df.attrs['provider_source'] = 'alpha_vantage'
                 combined_df.attrs['timeframe'] = plan.timeframe
@@ -229,17 +291,14 @@ class BulkDataFetcher:
                 
                 # Validate combined data
                 try:
-                    from .data_validator import DataValidator
-                    validator = DataValidator()
-                    
-                    # Determine asset type
-                    from ..alpha_vantage.provider import AlphaVantageProvider
-                    provider = AlphaVantageProvider()
-                    asset_type = 'crypto' if provider._is_crypto_symbol(plan.ticker) else 'stock'
+                    validator = self.get_validator()
                     
-                    validation_result = validator.validate_dataframe(
-                        combined_df, plan.ticker, plan.timeframe, asset_type
-                    )
+                    if validation is not None:
+                        validation_result = validation.finish()
+                    else:
+                        validation_result = validator.validate_dataframe(
+                            combined_df, plan.ticker, plan.timeframe, self._get_asset_type(plan.ticker)
+                        )
                     
                     # Add validation metadata
                     combined_df.attrs['validation_passed'] = validation_result.is_valid
@@ -291,9 +350,29 @@ class BulkDataFetcher:
             if plan_id in self.active_downloads:
                 del self.active_downloads[plan_id]
     
+    def get_validator(self) -> DataValidator:
+        """Get the shared data validator (lazy initialization)"""
+        if self._validator is None:
+            self._validator = DataValidator()
+        return self._validator
+    
+    def _get_asset_type(self, ticker: str) -> str:
+        """Classify a ticker with the client's provider instead of constructing a new one"""
+        return get_asset_type(ticker, getattr(self.client, 'provider', None))
+    
+    def _start_validation(self, plan: DownloadPlan) -> Optional[StreamingValidation]:
+        """Start streaming validation for a plan, or None if it cannot be set up"""
+        try:
+            return self.get_validator().start_stream(plan.ticker, plan.timeframe, self._get_asset_type(plan.ticker))
+        except Exception as e:
+            logger.warning(f"Could not start streaming validation for {plan.ticker}: {e}")
+            return None
+    
     def _download_chunk(self, chunk: DownloadChunk) -> Optional[pd.DataFrame]:
         """
-        Download a single chunk with retry logic
+        Download a single chunk, retrying as the shared ErrorRecoveryStrategy advises
+        
+        Runs on a worker thread of execute_download_plan.
         
         Args:
             chunk: DownloadChunk to process
@@ -321,25 +400,46 @@ class BulkDataFetcher:
                 if data is not None and not data.empty:
                     chunk.data = data
                     chunk.status = 'completed'
+                    self.error_handler.record_success()
                     return data
-                else:
-                    logger.warning(f"No data returned for chunk {chunk.ticker} {chunk.timeframe}")
-                    
-            except Exception as e:
-                chunk.error = str(e)
-                logger.warning(f"Chunk download attempt {chunk.attempt} failed: {e}")
                 
-                if chunk.attempt < chunk.max_attempts:
-                    # Exponential backoff
-                    wait_time = 2 ** chunk.attempt
-                    logger.info(f"Retrying chunk in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                error = ValueError(f"No data returned for chunk {chunk.ticker} {chunk.timeframe} "
+                                   f"{chunk.start_date.date()} to {chunk.end_date.date()}")
+            except Exception as e:
+                error = e
+            
+            chunk.error = str(error)
+            logger.warning(f"Chunk download attempt {chunk.attempt} failed: {error}")
+            
+            recovery = self.error_handler.handle_error(error, chunk.ticker, chunk.timeframe, chunk.attempt - 1)
+            if not recovery['should_retry'] or chunk.attempt >= chunk.max_attempts:
+                break
+            
+            logger.info(f"Retrying chunk in {recovery['retry_delay']:.1f} seconds...")
+            time.sleep(recovery['retry_delay'])
         
         # All attempts failed
         chunk.status = 'failed'
-        logger.error(f"Chunk download failed after {chunk.max_attempts} attempts: {chunk.error}")
+        logger.error(f"Chunk download failed after {chunk.attempt} attempts: {chunk.error}")
         return None
     
+    def _progress_stats(self, plan: DownloadPlan, plan_id: str, finished: int, pending: int,
+                        records: int, started: float) -> Dict[str, Any]:
+        """Progress counters plus throughput and ETA for the chunks downloaded in this run"""
+        elapsed = max(time.time() - started, 1e-6)
+        remaining = pending - finished
+        chunks_per_second = finished / elapsed
+        
+        return {
+            'completed_chunks': plan.completed_chunks,
+            'total_chunks': plan.total_chunks,
+            'failed_chunks': plan.failed_chunks,
+            'plan_id': plan_id,
+            'chunks_per_minute': chunks_per_second * 60,
+            'records_per_second': records / elapsed,
+            'eta_seconds': remaining / chunks_per_second if chunks_per_second > 0 else None
+        }
+    
     def _convert_timeframe(self, timeframe: str) -> str:
         """Convert our timeframe format to Alpha Vantage format"""
         mapping = {
@@ -421,11 +521,12 @@ class BulkDataFetcher:
         
         logger.info(f"Resuming {plan_id}: {plan.completed_chunks}/{plan.total_chunks} chunks completed")
         
-        # Execute remaining chunks
+        # Execute remaining chunks; completed chunks are reassembled from their spilled data
         return self.execute_download_plan(
             plan=plan,
             progress_callback=progress_callback,
-            enable_checkpoints=True
+            enable_checkpoints=True,
+            plan_id=plan_id
         )
     
     def list_resumable_downloads(self, ticker: str = None, timeframe: str = None) -> List[Dict[str, Any]]:
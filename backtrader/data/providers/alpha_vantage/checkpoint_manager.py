@@ -1,10 +1,14 @@
 import json
 import logging
 import os
+import shutil
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, asdict
+import pandas as pd
+
+from .array_store import file_checksum, read_frame, write_frame
 
 # Import types will be handled at runtime to avoid circular imports
 
@@ -25,6 +29,7 @@ class CheckpointData:
     chunk_states: List[Dict[str, Any]]  # Serialized chunk data
     created_at: str
     last_updated: str
+    chunk_spill: bool = False  # Completed chunks have their data spilled alongside the checkpoint
     
     
 class CheckpointManager:
@@ -33,6 +38,7 @@ class CheckpointManager:
     
     Features:
     - Save/load download progress across sessions
+    - Spill completed chunk data to checksummed columnar files
     - Resume partially completed downloads
     - Cleanup completed/expired checkpoints
     - Progress validation and recovery
@@ -50,32 +56,21 @@ class CheckpointManager:
         
         logger.info(f"CheckpointManager initialized with directory: {self.checkpoint_dir}")
     
-    def save_checkpoint(self, plan, plan_id: str) -> bool:
+    def save_checkpoint(self, plan, plan_id: str, chunk_spill: bool = False) -> bool:
         """
         Save current download plan as checkpoint
         
         Args:
             plan: DownloadPlan to checkpoint
             plan_id: Unique identifier for the plan
+            chunk_spill: Completed chunks will be spilled with save_chunk_data, so only
+                chunks with a spilled file are recorded as completed
             
         Returns:
             True if checkpoint saved successfully
         """
         try:
-            # Serialize chunk data
-            chunk_states = []
-            for chunk in plan.chunks:
-                chunk_data = {
-                    'start_date': chunk.start_date.isoformat(),
-                    'end_date': chunk.end_date.isoformat(),
-                    'timeframe': chunk.timeframe,
-                    'ticker': chunk.ticker,
-                    'status': chunk.status,
-                    'error': chunk.error,
-                    'attempt': chunk.attempt,
-                    'max_attempts': chunk.max_attempts
-                }
-                chunk_states.append(chunk_data)
+            chunk_states = self._serialize_chunks(plan, chunk_spill)
             
             checkpoint = CheckpointData(
                 plan_id=plan_id,
@@ -88,7 +83,8 @@ class CheckpointManager:
                 failed_chunks=plan.failed_chunks,
                 chunk_states=chunk_states,
                 created_at=datetime.now().isoformat(),
-                last_updated=datetime.now().isoformat()
+                last_updated=datetime.now().isoformat(),
+                chunk_spill=chunk_spill
             )
             
             checkpoint_file = self.active_dir / f"{plan_id}.json"
@@ -102,12 +98,17 @@ class CheckpointManager:
             logger.error(f"Failed to save checkpoint for {plan_id}: {e}")
             return False
     
-    def load_checkpoint(self, plan_id: str):
+    def load_checkpoint(self, plan_id: str, load_data: bool = True):
         """
         Load checkpoint and reconstruct DownloadPlan
         
+        Completed chunks get their spilled data back; a chunk whose file is missing or
+        fails its checksum is reset to pending so a resume downloads it again. Checkpoints
+        saved without chunk_spill keep completed chunks as-is (their data is not on disk).
+        
         Args:
             plan_id: Checkpoint identifier to load
+            load_data: Read spilled chunk data (False only restores chunk metadata)
             
         Returns:
             Reconstructed DownloadPlan or None if not found
@@ -137,10 +138,23 @@ class CheckpointManager:
                     status=chunk_data['status'],
                     error=chunk_data.get('error'),
                     attempt=chunk_data['attempt'],
-                    max_attempts=chunk_data['max_attempts']
+                    max_attempts=chunk_data['max_attempts'],
+                    data_file=chunk_data.get('data_file'),
+                    checksum=chunk_data.get('checksum')
                 )
                 chunks.append(chunk)
             
+            if load_data:
+                for chunk in chunks:
+                    if chunk.status != 'completed' or not (checkpoint.chunk_spill or chunk.data_file):
+                        continue
+                    chunk.data = self.load_chunk_data(plan_id, chunk)
+                    if chunk.data is None:
+                        chunk.status = 'pending'
+                        chunk.attempt = 0
+            
+            completed_chunks = len([c for c in chunks if c.status == 'completed']) if load_data else checkpoint.completed_chunks
+            
             # Reconstruct DownloadPlan
             plan = DownloadPlan(
                 ticker=checkpoint.ticker,
@@ -149,7 +163,7 @@ class CheckpointManager:
                 end_date=datetime.fromisoformat(checkpoint.end_date),
                 chunks=chunks,
                 total_chunks=checkpoint.total_chunks,
-                completed_chunks=checkpoint.completed_chunks,
+                completed_chunks=completed_chunks,
                 failed_chunks=checkpoint.failed_chunks
             )
             
@@ -182,19 +196,7 @@ class CheckpointManager:
                 existing_data = json.load(f)
             
             # Update with current plan state
-            chunk_states = []
-            for chunk in plan.chunks:
-                chunk_data = {
-                    'start_date': chunk.start_date.isoformat(),
-                    'end_date': chunk.end_date.isoformat(),
-                    'timeframe': chunk.timeframe,
-                    'ticker': chunk.ticker,
-                    'status': chunk.status,
-                    'error': chunk.error,
-                    'attempt': chunk.attempt,
-                    'max_attempts': chunk.max_attempts
-                }
-                chunk_states.append(chunk_data)
+            chunk_states = self._serialize_chunks(plan, existing_data.get('chunk_spill', False))
             
             existing_data.update({
                 'completed_chunks': plan.completed_chunks,
@@ -213,6 +215,94 @@ class CheckpointManager:
             logger.error(f"Failed to update checkpoint {plan_id}: {e}")
             return False
     
+    def save_chunk_data(self, plan_id: str, chunk_index: int, chunk) -> bool:
+        """
+        Spill a completed chunk's data to disk and record its file and checksum on the chunk
+        
+        Data is stored column by column in a compressed .npz file (see array_store) and
+        written atomically, so a crash never leaves a partial file behind the checkpoint.
+        
+        Args:
+            plan_id: Checkpoint identifier
+            chunk_index: Position of the chunk in its plan
+            chunk: Completed DownloadChunk holding its data
+            
+        Returns:
+            True if the chunk was spilled successfully
+        """
+        try:
+            data_file = self._chunk_dir(plan_id) / f"chunk_{chunk_index:04d}.npz"
+            chunk.checksum = write_frame(data_file, chunk.data)
+            chunk.data_file = data_file.name
+            logger.debug(f"Spilled chunk {chunk_index} of {plan_id}: {len(chunk.data)} records")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to spill chunk {chunk_index} of {plan_id}: {e}")
+            return False
+    
+    def load_chunk_data(self, plan_id: str, chunk) -> Optional[pd.DataFrame]:
+        """
+        Load a chunk's spilled data after verifying its checksum
+        
+        Args:
+            plan_id: Checkpoint identifier
+            chunk: DownloadChunk restored from the checkpoint
+            
+        Returns:
+            The chunk's DataFrame, or None if the file is missing or corrupt
+        """
+        if not self.verify_chunk_file(plan_id, chunk):
+            logger.warning(f"Spilled data for {plan_id} chunk {chunk.data_file} is missing or corrupt")
+            return None
+        
+        try:
+            return read_frame(self._chunk_dir(plan_id) / chunk.data_file)
+        except Exception as e:
+            logger.error(f"Failed to read spilled chunk {chunk.data_file} of {plan_id}: {e}")
+            return None
+    
+    def verify_chunk_file(self, plan_id: str, chunk) -> bool:
+        """Check that a chunk's spilled file exists and matches its recorded checksum"""
+        if not chunk.data_file or not chunk.checksum:
+            return False
+        
+        data_file = self._chunk_dir(plan_id) / chunk.data_file
+        return data_file.exists() and file_checksum(data_file) == chunk.checksum
+    
+    def _chunk_dir(self, plan_id: str) -> Path:
+        """Directory holding a checkpoint's spilled chunk files"""
+        return self.active_dir / plan_id
+    
+    def _serialize_chunks(self, plan, chunk_spill: bool) -> List[Dict[str, Any]]:
+        """
+        Serialize chunk states (without their data) for the checkpoint file
+        
+        With chunk_spill a chunk only counts as completed once its data is spilled;
+        downloaded-but-unspilled and in-flight chunks are recorded as pending so a resume
+        fetches them again.
+        """
+        def status(chunk) -> str:
+            if chunk_spill and chunk.status in ('completed', 'downloading') and not chunk.data_file:
+                return 'pending'
+            return chunk.status
+        
+        return [
+            {
+                'start_date': chunk.start_date.isoformat(),
+                'end_date': chunk.end_date.isoformat(),
+                'timeframe': chunk.timeframe,
+                'ticker': chunk.ticker,
+                'status': status(chunk),
+                'error': chunk.error,
+                'attempt': chunk.attempt,
+                'max_attempts': chunk.max_attempts,
+                'data_file': chunk.data_file,
+                'checksum': chunk.checksum
+            }
+            for chunk in plan.chunks
+        ]
+    
     def complete_checkpoint(self, plan_id: str) -> bool:
         """
         Mark checkpoint as completed and move to completed directory
@@ -229,9 +319,10 @@ class CheckpointManager:
                 logger.warning(f"Cannot complete non-existent checkpoint: {plan_id}")
                 return False
             
-            # Move to completed directory
+            # Move to completed directory; the assembled result no longer needs the spilled chunks
             completed_file = self.completed_dir / f"{plan_id}.json"
             active_file.rename(completed_file)
+            shutil.rmtree(self._chunk_dir(plan_id), ignore_errors=True)
             
             logger.info(f"Checkpoint completed and archived: {plan_id}")
             return True
@@ -257,6 +348,7 @@ class CheckpointManager:
             
             if checkpoint_file.exists():
                 checkpoint_file.unlink()
+                shutil.rmtree(self._chunk_dir(plan_id), ignore_errors=True)
                 logger.info(f"Checkpoint deleted: {plan_id}")
                 return True
             else:
@@ -360,12 +452,15 @@ class CheckpointManager:
             active_checkpoints = list(self.active_dir.glob("*.json"))
             completed_checkpoints = list(self.completed_dir.glob("*.json"))
             
+            chunk_files = list(self.active_dir.glob("*/chunk_*.npz"))
+            
             # Calculate total disk usage
-            total_size = sum(f.stat().st_size for f in active_checkpoints + completed_checkpoints)
+            total_size = sum(f.stat().st_size for f in active_checkpoints + completed_checkpoints + chunk_files)
             
             stats = {
                 'active_checkpoints': len(active_checkpoints),
                 'completed_checkpoints': len(completed_checkpoints),
+                'spilled_chunks': len(chunk_files),
                 'total_disk_usage_bytes': total_size,
                 'total_disk_usage_mb': round(total_size / (1024 * 1024), 2),
                 'checkpoint_directory': str(self.checkpoint_dir)
@@ -388,10 +483,13 @@ class CheckpointManager:
             Validation results and suggestions
         """
         try:
-            plan = self.load_checkpoint(plan_id)
+            plan = self.load_checkpoint(plan_id, load_data=False)
             if not plan:
                 return {'valid': False, 'error': 'Checkpoint not found'}
             
+            with open(self.active_dir / f"{plan_id}.json", 'r') as f:
+                data = json.load(f)
+            
             # Basic validation
             issues = []
             suggestions = []
@@ -403,16 +501,22 @@ class CheckpointManager:
                 suggestions.append("Consider retrying failed chunks")
             
             # Check for inconsistent counts
-            actual_completed = len([c for c in plan.chunks if c.status == 'completed'])
-            if actual_completed != plan.completed_chunks:
+            completed = [c for c in plan.chunks if c.status == 'completed']
+            if len(completed) != plan.completed_chunks:
                 issues.append("Inconsistent completed chunk count")
                 suggestions.append("Checkpoint may need repair")
             
+            # Verify spilled chunk files against their checksums
+            corrupt_chunks = [
+                plan.chunks.index(c) for c in completed
+                if (c.data_file or data.get('chunk_spill')) and not self.verify_chunk_file(plan_id, c)
+            ]
+            if corrupt_chunks:
+                issues.append(f"{len(corrupt_chunks)} completed chunks have missing or corrupt data files")
+                suggestions.append("Resume will download those chunks again")
+            
             # Check for old checkpoint
             try:
-                checkpoint_file = self.active_dir / f"{plan_id}.json"
-                with open(checkpoint_file, 'r') as f:
-                    data = json.load(f)
                 last_updated = datetime.fromisoformat(data['last_updated'])
                 age_hours = (datetime.now() - last_updated).total_seconds() / 3600
                 
@@ -429,7 +533,8 @@ class CheckpointManager:
                 'total_chunks': plan.total_chunks,
                 'completed_chunks': plan.completed_chunks,
                 'failed_chunks': plan.failed_chunks,
-                'can_resume': plan.completed_chunks < plan.total_chunks
+                'corrupt_chunks': corrupt_chunks,
+                'can_resume': plan.completed_chunks - len(corrupt_chunks) < plan.total_chunks
             }
             
         except Exception as e:
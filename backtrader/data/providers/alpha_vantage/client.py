@@ -14,8 +14,8 @@ class AlphaVantageClient:
     Provides a consistent interface for both provider and bulk fetcher
     """
     
-    def __init__(self):
-        self.provider = AlphaVantageProvider()
+    def __init__(self, provider: Optional[AlphaVantageProvider] = None):
+        self.provider = provider or AlphaVantageProvider()
         logger.info("AlphaVantageClient initialized")
     
     def fetch_data(self, ticker: str, timeframe: str, 
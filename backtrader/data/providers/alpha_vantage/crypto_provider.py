@@ -5,12 +5,17 @@ Handles cryptocurrency-specific data fetching with proper error handling
 
 import logging
 import os
+import threading
 import time
 from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
 import pandas as pd
 import requests
 
+from ...ohlcv_resampler import resample_ohlcv
+from ..http_transport import get_shared_session
+from .response_parser import decode_response, find_time_series_key, time_series_to_frame
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,23 +39,21 @@ class AlphaVantageCryptoProvider:
         'VET', 'XLM', 'XMR', 'XRP', 'ZEC'
     }
     
-    def __init__(self):
-        self.api_key = os.getenv('ALPHA_VANTAGE_API_KEY')
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
+        self.api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
         if not self.api_key:
             raise ValueError("ALPHA_VANTAGE_API_KEY environment variable is required")
         
         self.base_url = "https://www.alphavantage.co/query"
         self.crypto_list_url = "https://www.alphavantage.co/digital_currency_list/"
         
-        # Session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BacktraderHedgeFund/1.0'
-        })
+        # Shared pooled session, so crypto and equity requests reuse the same connections
+        self.session = session or get_shared_session()
         
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 60 / 75  # 75 requests per minute
+        self._rate_limit_lock = threading.Lock()
         
         # Cache supported cryptos
         self._supported_cryptos: Optional[Set[str]] = None
@@ -59,13 +62,16 @@ class AlphaVantageCryptoProvider:
         logger.info("AlphaVantageCryptoProvider initialized")
     
     def _rate_limit(self):
-        """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
+        """Enforce rate limiting (thread-safe: concurrent callers get successive request slots)"""
+        with self._rate_limit_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + self.min_request_interval)
+            self.last_request_time = slot
+        
+        sleep_time = slot - now
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
-        self.last_request_time = time.time()
     
     def get_supported_cryptos(self, force_refresh: bool = False) -> Set[str]:
         """
@@ -180,7 +186,7 @@ class AlphaVantageCryptoProvider:
             response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = decode_response(response)
             
             # Check for API errors
             if 'Error Message' in data:
@@ -193,35 +199,18 @@ class AlphaVantageCryptoProvider:
                 return pd.DataFrame()
             
             # Find time series key
-            time_series_key = None
-            for key in data.keys():
-                if 'time series' in key.lower():
-                    time_series_key = key
-                    break
+            time_series_key = find_time_series_key(data)
             
             if not time_series_key:
                 logger.error(f"No time series data found for {symbol}. Keys: {list(data.keys())}")
                 return pd.DataFrame()
             
-            # Parse time series data
-            time_series = data[time_series_key]
-            df = pd.DataFrame.from_dict(time_series, orient='index')
+            # Parse time series data straight into sorted OHLCV columns
+            df = time_series_to_frame(data[time_series_key])
             
             if df.empty:
                 return pd.DataFrame()
             
-            # Standardize column names
-            df.columns = [col.split('. ')[-1].title() for col in df.columns]
-            
-            # Ensure we have standard OHLCV columns
-            expected_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-            df = df[[col for col in expected_cols if col in df.columns]]
-            
-            # Convert to numeric and datetime index
-            df = df.astype(float)
-            df.index = pd.to_datetime(df.index)
-            df = df.sort_index()
-            
             # Filter by date range
             mask = (df.index >= pd.Timestamp(start_date)) & (df.index <= pd.Timestamp(end_date))
             df = df[mask]
@@ -275,7 +264,7 @@ class AlphaVantageCryptoProvider:
             response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = decode_response(response)
             
             # Check for API errors
             if 'Error Message' in data:
@@ -292,26 +281,11 @@ class AlphaVantageCryptoProvider:
                 logger.error(f"No daily data found for {symbol}")
                 return pd.DataFrame()
             
-            # Parse time series data
-            time_series = data[time_series_key]
-            rows = []
-            
-            for date_str, values in time_series.items():
-                # Extract values - Alpha Vantage uses simple numeric keys for crypto daily
-                row = {
-                    'Date': date_str,
-                    'Open': float(values.get('1. open', values.get('1a. open (USD)', 0))),
-                    'High': float(values.get('2. high', values.get('2a. high (USD)', 0))),
-                    'Low': float(values.get('3. low', values.get('3a. low (USD)', 0))),
-                    'Close': float(values.get('4. close', values.get('4a. close (USD)', 0))),
-                    'Volume': float(values.get('5. volume', 0))
-                }
-                rows.append(row)
-            
-            df = pd.DataFrame(rows)
-            df['Date'] = pd.to_datetime(df['Date'])
-            df.set_index('Date', inplace=True)
-            df = df.sort_index()
+            # Parse time series data - accepts both '1. open' and legacy '1a. open (USD)' keys
+            df = time_series_to_frame(data[time_series_key])
+            df.index.name = 'Date'
+            if 'Volume' not in df.columns:
+                df['Volume'] = 0.0
             
             # Filter by date range
             mask = (df.index >= pd.Timestamp(start_date)) & (df.index <= pd.Timestamp(end_date))
@@ -331,6 +305,45 @@ class AlphaVantageCryptoProvider:
             traceback.print_exc()
             return pd.DataFrame()
     
+    def fetch_crypto_daily_batch(self, symbols: List[str], start_date: datetime,
+                                 end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch daily data for many crypto symbols
+        
+        Alpha Vantage has no multi-symbol crypto endpoint, so this keeps the per-symbol
+        cost down instead: the supported list is loaded once, unsupported symbols are
+        dropped without a request, and aliases of one pair ('BTC', 'BTCUSD') share a
+        single DIGITAL_CURRENCY_DAILY call.
+        
+        Args:
+            symbols: Crypto symbols (e.g., ['BTC', 'ETHUSD'])
+            start_date: Start date for data
+            end_date: End date for data
+            
+        Returns:
+            Dict mapping each requested symbol -> DataFrame (symbols without data are omitted)
+        """
+        supported_cryptos = self.get_supported_cryptos()
+        by_base: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            base = symbol.upper()[:-3] if symbol.upper().endswith('USD') else symbol.upper()
+            if base in supported_cryptos:
+                by_base.setdefault(base, []).append(symbol)
+            else:
+                logger.warning(f"Cryptocurrency {symbol} is not supported by Alpha Vantage")
+        
+        results = {}
+        for base, aliases in by_base.items():
+            df = self.fetch_crypto_daily(base, start_date, end_date)
+            if df.empty:
+                continue
+            for symbol in aliases:
+                results[symbol] = df
+        
+        logger.info(f"Fetched daily data for {len(results)}/{len(symbols)} crypto symbols "
+                    f"with {len(by_base)} requests")
+        return results
+    
     def resample_to_timeframe(self, df: pd.DataFrame, target_timeframe: str) -> pd.DataFrame:
         """
         Universal resampling to any target timeframe
@@ -352,14 +365,8 @@ class AlphaVantageCryptoProvider:
             return df
         
         try:
-            # Resample OHLCV data
-            resampled = df.resample(rule).agg({
-                'Open': 'first',
-                'High': 'max',
-                'Low': 'min',
-                'Close': 'last',
-                'Volume': 'sum'
-            }).dropna()
+            # Crypto trades 24/7, so bins are aligned to the epoch rather than a session open
+            resampled = resample_ohlcv(df, rule, asset_type='crypto')
             
             # Preserve metadata
             resampled.attrs = df.attrs.copy()
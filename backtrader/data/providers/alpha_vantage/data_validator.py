@@ -1,11 +1,44 @@
 import logging
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from enum import IntFlag
 
 logger = logging.getLogger(__name__)
 
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+# Window of the rolling volume median used for spike detection
+VOLUME_SPIKE_WINDOW = 10
+
+
+class RowIssue(IntFlag):
+    """Per-row validation issues, packed into a uint16 issue mask"""
+    NULL_VALUE = 1 << 0
+    HIGH_VIOLATION = 1 << 1       # High < Open/Close/Low
+    LOW_VIOLATION = 1 << 2        # Low > Open/Close/High
+    FLAT_OHLC = 1 << 3
+    NON_POSITIVE_PRICE = 1 << 4
+    PRICE_ABOVE_MAX = 1 << 5
+    PRICE_BELOW_MIN = 1 << 6
+    EXTREME_CHANGE = 1 << 7       # Close moved more than max_daily_change since the previous row
+    NEGATIVE_VOLUME = 1 << 8
+    VOLUME_ABOVE_MAX = 1 << 9
+    VOLUME_SPIKE = 1 << 10
+    ZERO_VOLUME = 1 << 11
+    DUPLICATE_TIMESTAMP = 1 << 12  # Superseded by a later row with the same timestamp
+    OUT_OF_ORDER = 1 << 13
+    IRREGULAR_INTERVAL = 1 << 14
+    GAP_BEFORE = 1 << 15
+
+
+# Rows repair_data drops: duplicates, non-positive prices, negative volume and missing values
+DROPPED_ISSUES = (RowIssue.DUPLICATE_TIMESTAMP | RowIssue.NON_POSITIVE_PRICE |
+                  RowIssue.NEGATIVE_VOLUME | RowIssue.NULL_VALUE)
+
 
 @dataclass
 class ValidationResult:
@@ -15,6 +48,7 @@ class ValidationResult:
     warnings: List[str]
     metadata: Dict[str, Any]
     corrected_data: Optional[pd.DataFrame] = None
+    issue_mask: Optional[np.ndarray] = None  # uint16 RowIssue flags, one per validated row
 
 
 class DataValidator:
@@ -28,6 +62,10 @@ class DataValidator:
     - Volume validation
     - Gap detection and analysis
     - Data completeness assessment
+    
+    All row checks run in a single fused scan over the OHLCV arrays, which can be fed
+    chunk by chunk (see start_stream) and produces a per-row issue mask that
+    repair_data applies without re-scanning the data.
     """
     
     def __init__(self):
@@ -74,84 +112,41 @@ class DataValidator:
             asset_type: 'stock' or 'crypto'
             
         Returns:
-            ValidationResult with validation details
+            ValidationResult with validation details and a per-row issue mask
         """
-        errors = []
-        warnings = []
-        metadata = {
-            'ticker': ticker,
-            'timeframe': timeframe,
-            'asset_type': asset_type,
-            'original_rows': len(df),
-            'validation_timestamp': datetime.now().isoformat()
-        }
-        
-        if df.empty:
-            errors.append("DataFrame is empty")
-            return ValidationResult(False, errors, warnings, metadata)
-        
-        # 1. Schema validation
-        schema_errors = self._validate_schema(df)
-        errors.extend(schema_errors)
-        
-        # 2. OHLC relationship validation
-        ohlc_errors, ohlc_warnings = self._validate_ohlc_relationships(df)
-        errors.extend(ohlc_errors)
-        warnings.extend(ohlc_warnings)
-        
-        # 3. Price reasonableness
-        price_errors, price_warnings = self._validate_prices(df, ticker)
-        errors.extend(price_errors)
-        warnings.extend(price_warnings)
-        
-        # 4. Volume validation
-        volume_errors, volume_warnings = self._validate_volume(df)
-        errors.extend(volume_errors)
-        warnings.extend(volume_warnings)
-        
-        # 5. Time series validation
-        time_errors, time_warnings = self._validate_time_series(df, timeframe, asset_type)
-        errors.extend(time_errors)
-        warnings.extend(time_warnings)
-        
-        # 6. Gap detection
-        gap_warnings = self._detect_gaps(df, timeframe, asset_type)
-        warnings.extend(gap_warnings)
-        
-        # 7. Data completeness
-        completeness_warnings = self._validate_completeness(df, timeframe)
-        warnings.extend(completeness_warnings)
-        
-        # Update metadata with validation stats
-        metadata.update({
-            'total_errors': len(errors),
-            'total_warnings': len(warnings),
-            'date_range': f"{df.index.min()} to {df.index.max()}",
-            'trading_days': len(df),
-            'has_nulls': df.isnull().any().any(),
-            'null_count': df.isnull().sum().sum()
-        })
-        
-        is_valid = len(errors) == 0
+        stream = self.start_stream(ticker, timeframe, asset_type)
+        stream.add_chunk(df)
+        return stream.finish()
+    
+    def start_stream(self, ticker: str, timeframe: str, asset_type: str = 'stock') -> 'StreamingValidation':
+        """
+        Start validating data that arrives in consecutive chunks
         
-        logger.info(f"Validation complete for {ticker} {timeframe}: "
-                   f"{'PASSED' if is_valid else 'FAILED'} "
-                   f"({len(errors)} errors, {len(warnings)} warnings)")
+        Chunks must be added in chronological order; checks that span rows (price
+        changes, intervals, gaps, rolling volume median, duplicates) carry over chunk
+        boundaries, so the result equals validating the concatenated frame.
         
-        return ValidationResult(is_valid, errors, warnings, metadata)
+        Args:
+            ticker: Symbol being validated
+            timeframe: Data timeframe
+            asset_type: 'stock' or 'crypto'
+            
+        Returns:
+            StreamingValidation accepting chunks via add_chunk() and finished with finish()
+        """
+        return StreamingValidation(self, ticker, timeframe, asset_type)
     
     def _validate_schema(self, df: pd.DataFrame) -> List[str]:
         """Validate DataFrame schema"""
         errors = []
         
-        expected_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        missing_columns = [col for col in expected_columns if col not in df.columns]
+        missing_columns = [col for col in OHLCV_COLUMNS if col not in df.columns]
         
         if missing_columns:
             errors.append(f"Missing required columns: {missing_columns}")
         
         # Check data types
-        for col in expected_columns:
+        for col in OHLCV_COLUMNS:
             if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
                 errors.append(f"Column {col} is not numeric")
         
@@ -161,232 +156,23 @@ class DataValidator:
         
         return errors
     
-    def _validate_ohlc_relationships(self, df: pd.DataFrame) -> Tuple[List[str], List[str]]:
-        """Validate OHLC price relationships"""
-        errors = []
-        warnings = []
-        
-        if not all(col in df.columns for col in ['Open', 'High', 'Low', 'Close']):
-            return errors, warnings
-        
-        # High should be >= Open, Close, Low
-        high_violations = (
-            (df['High'] < df['Open']) |
-            (df['High'] < df['Close']) |
-            (df['High'] < df['Low'])
-        ).sum()
-        
-        if high_violations > 0:
-            errors.append(f"{high_violations} rows have High < Open/Close/Low")
-        
-        # Low should be <= Open, Close, High
-        low_violations = (
-            (df['Low'] > df['Open']) |
-            (df['Low'] > df['Close']) |
-            (df['Low'] > df['High'])
-        ).sum()
-        
-        if low_violations > 0:
-            errors.append(f"{low_violations} rows have Low > Open/Close/High")
-        
-        # Warn about unusual OHLC patterns
-        equal_ohlc = (
-            (df['Open'] == df['High']) &
-            (df['High'] == df['Low']) &
-            (df['Low'] == df['Close'])
-        ).sum()
-        
-        if equal_ohlc > len(df) * 0.1:  # More than 10% of data
-            warnings.append(f"{equal_ohlc} rows have identical OHLC (possible data issue)")
-        
-        return errors, warnings
-    
-    def _validate_prices(self, df: pd.DataFrame, ticker: str) -> Tuple[List[str], List[str]]:
-        """Validate price reasonableness"""
-        errors = []
-        warnings = []
-        
-        price_columns = ['Open', 'High', 'Low', 'Close']
-        available_columns = [col for col in price_columns if col in df.columns]
-        
-        if not available_columns:
-            return errors, warnings
-        
-        # Check for negative or zero prices
-        for col in available_columns:
-            negative_prices = (df[col] <= 0).sum()
-            if negative_prices > 0:
-                errors.append(f"{negative_prices} rows have non-positive {col} prices")
-        
-        # Check for unreasonably high prices
-        for col in available_columns:
-            high_prices = (df[col] > self.price_limits['max_price']).sum()
-            if high_prices > 0:
-                warnings.append(f"{high_prices} rows have {col} > ${self.price_limits['max_price']}")
-        
-        # Check for unreasonably low prices  
-        for col in available_columns:
-            low_prices = (df[col] < self.price_limits['min_price']).sum()
-            if low_prices > 0:
-                warnings.append(f"{low_prices} rows have {col} < ${self.price_limits['min_price']}")
-        
-        # Check for extreme daily changes
-        if 'Close' in df.columns and len(df) > 1:
-            daily_returns = df['Close'].pct_change().abs()
-            extreme_changes = (daily_returns > self.price_limits['max_daily_change']).sum()
-            
-            if extreme_changes > 0:
-                max_change = daily_returns.max()
-                warnings.append(f"{extreme_changes} periods have >50% price changes (max: {max_change:.1%})")
-        
-        return errors, warnings
-    
-    def _validate_volume(self, df: pd.DataFrame) -> Tuple[List[str], List[str]]:
-        """Validate volume data"""
-        errors = []
-        warnings = []
-        
-        if 'Volume' not in df.columns:
-            return errors, warnings
-        
-        # Check for negative volume
-        negative_volume = (df['Volume'] < 0).sum()
-        if negative_volume > 0:
-            errors.append(f"{negative_volume} rows have negative volume")
-        
-        # Check for unreasonably high volume
-        high_volume = (df['Volume'] > self.volume_limits['max_volume']).sum()
-        if high_volume > 0:
-            warnings.append(f"{high_volume} rows have volume > {self.volume_limits['max_volume']:,}")
-        
-        # Check for volume spikes
-        if len(df) > 10:
-            volume_median = df['Volume'].rolling(10).median()
-            volume_spikes = (df['Volume'] > volume_median * self.volume_limits['max_volume_spike']).sum()
-            
-            if volume_spikes > 0:
-                warnings.append(f"{volume_spikes} rows have volume spikes >10x median")
-        
-        # Check for too many zero volume periods
-        zero_volume = (df['Volume'] == 0).sum()
-        if zero_volume > len(df) * 0.2:  # More than 20%
-            warnings.append(f"{zero_volume} rows have zero volume ({zero_volume/len(df):.1%} of data)")
-        
-        return errors, warnings
-    
-    def _validate_time_series(self, df: pd.DataFrame, timeframe: str, 
-                             asset_type: str) -> Tuple[List[str], List[str]]:
-        """Validate time series properties"""
-        errors = []
-        warnings = []
-        
-        if len(df) < 2:
-            return errors, warnings
-        
-        # Check for duplicate timestamps
-        duplicates = df.index.duplicated().sum()
-        if duplicates > 0:
-            errors.append(f"{duplicates} duplicate timestamps found")
-        
-        # Check for proper sorting
-        if not df.index.is_monotonic_increasing:
-            warnings.append("Index is not sorted chronologically")
-        
-        # Check for reasonable time intervals
-        time_diffs = df.index.to_series().diff().dropna()
-        
+    def _interval_rules(self, timeframe: str) -> Tuple[Optional[timedelta], Optional[timedelta], timedelta]:
+        """Expected bar interval, its tolerance and the gap threshold for a timeframe"""
         if timeframe == '1h':
-            expected_diff = timedelta(hours=1)
-            tolerance = timedelta(minutes=10)
+            return timedelta(hours=1), timedelta(minutes=10), timedelta(hours=6)
         elif timeframe == '4h':
-            expected_diff = timedelta(hours=4)
-            tolerance = timedelta(minutes=30)
+            return timedelta(hours=4), timedelta(minutes=30), timedelta(days=1)
         elif timeframe == '1d':
-            expected_diff = timedelta(days=1)
-            tolerance = timedelta(hours=6)
-        else:
-            expected_diff = None
-            tolerance = None
-        
-        if expected_diff and tolerance:
-            irregular_intervals = (
-                (time_diffs < expected_diff - tolerance) |
-                (time_diffs > expected_diff + tolerance)
-            ).sum()
-            
-            if irregular_intervals > len(df) * 0.1:  # More than 10%
-                warnings.append(f"{irregular_intervals} irregular time intervals for {timeframe} data")
-        
-        return errors, warnings
-    
-    def _detect_gaps(self, df: pd.DataFrame, timeframe: str, asset_type: str) -> List[str]:
-        """Detect significant data gaps"""
-        warnings = []
-        
-        if len(df) < 2:
-            return warnings
-        
-        time_diffs = df.index.to_series().diff().dropna()
-        
-        # Define what constitutes a gap based on timeframe
-        if timeframe == '1h':
-            gap_threshold = timedelta(hours=6)  # Missing 6+ hours
-        elif timeframe == '4h':
-            gap_threshold = timedelta(days=1)   # Missing 1+ day
-        elif timeframe == '1d':
-            gap_threshold = timedelta(days=7)   # Missing 1+ week
-        else:
-            gap_threshold = timedelta(days=1)
-        
-        gaps = time_diffs[time_diffs > gap_threshold]
-        
-        if len(gaps) > 0:
-            max_gap = gaps.max()
-            gap_dates = [str(date.date()) for date in gaps.index[:5]]  # Show first 5
-            warnings.append(f"{len(gaps)} data gaps detected (max: {max_gap}, dates: {gap_dates})")
-        
-        return warnings
-    
-    def _validate_completeness(self, df: pd.DataFrame, timeframe: str) -> List[str]:
-        """Validate data completeness"""
-        warnings = []
-        
-        # Check for null values
-        null_counts = df.isnull().sum()
-        total_nulls = null_counts.sum()
-        
-        if total_nulls > 0:
-            null_cols = null_counts[null_counts > 0].to_dict()
-            warnings.append(f"{total_nulls} null values found: {null_cols}")
-        
-        # Check expected data density based on timeframe
-        if len(df) > 0:
-            date_range = df.index.max() - df.index.min()
-            
-            if timeframe == '1h':
-                # Expect ~6.5 hours/day trading * 5 days/week = 32.5 hours/week
-                expected_points = (date_range.days / 7) * 32.5
-            elif timeframe == '4h':
-                # Expect ~1.6 periods/day * 5 days/week = 8 periods/week
-                expected_points = (date_range.days / 7) * 8
-            elif timeframe == '1d':
-                # Expect ~5 trading days/week
-                expected_points = (date_range.days / 7) * 5
-            else:
-                expected_points = None
-            
-            if expected_points:
-                completeness = len(df) / expected_points
-                if completeness < 0.8:  # Less than 80% complete
-                    warnings.append(f"Data completeness: {completeness:.1%} "
-                                  f"({len(df)} of ~{expected_points:.0f} expected points)")
-        
-        return warnings
+            return timedelta(days=1), timedelta(hours=6), timedelta(days=7)
+        return None, None, timedelta(days=1)
     
     def repair_data(self, df: pd.DataFrame, validation_result: ValidationResult) -> pd.DataFrame:
         """
         Attempt to repair common data issues
         
+        Uses the validation issue mask, so the data is not scanned again. Results
+        without a mask matching df (e.g. built by hand) are re-validated first.
+        
         Args:
             df: Original DataFrame
             validation_result: Validation results
@@ -397,47 +183,45 @@ class DataValidator:
         if validation_result.is_valid:
             return df.copy()
         
-        repaired_df = df.copy()
-        repairs_made = []
+        mask = validation_result.issue_mask
+        if mask is None or len(mask) != len(df):
+            metadata = validation_result.metadata
+            mask = self.validate_dataframe(
+                df, metadata.get('ticker', 'unknown'), metadata.get('timeframe', 'unknown'),
+                metadata.get('asset_type', 'stock')
+            ).issue_mask
         
-        # 1. Remove duplicate timestamps
-        if repaired_df.index.duplicated().any():
-            repaired_df = repaired_df[~repaired_df.index.duplicated(keep='last')]
-            repairs_made.append("Removed duplicate timestamps")
+        repairs_made = []
         
-        # 2. Sort by timestamp
-        if not repaired_df.index.is_monotonic_increasing:
+        # 1. Drop duplicate timestamps (keeping the last), non-positive prices, negative volume and nulls
+        dropped = (mask & DROPPED_ISSUES) != 0
+        for issue, description in [
+            (RowIssue.DUPLICATE_TIMESTAMP, "duplicate timestamps"),
+            (RowIssue.NON_POSITIVE_PRICE, "non-positive prices"),
+            (RowIssue.NEGATIVE_VOLUME, "negative volume"),
+            (RowIssue.NULL_VALUE, "missing values")
+        ]:
+            count = int(np.count_nonzero(mask & issue))
+            if count:
+                repairs_made.append(f"Removed {count} rows with {description}")
+        
+        repaired_df = df[~dropped] if dropped.any() else df.copy()
+        kept_mask = mask[~dropped]
+        
+        # 2. Cap extreme prices
+        if np.any(kept_mask & RowIssue.PRICE_ABOVE_MAX):
+            max_price = self.price_limits['max_price']
+            for col in [col for col in PRICE_COLUMNS if col in repaired_df.columns]:
+                extreme_high = repaired_df[col].to_numpy() > max_price
+                if extreme_high.any():
+                    repaired_df.loc[extreme_high, col] = max_price
+                    repairs_made.append(f"Capped {int(extreme_high.sum())} extreme high {col} values")
+        
+        # 3. Sort by timestamp
+        if np.any(kept_mask & RowIssue.OUT_OF_ORDER):
             repaired_df = repaired_df.sort_index()
             repairs_made.append("Sorted by timestamp")
         
-        # 3. Remove rows with negative/zero prices
-        price_cols = ['Open', 'High', 'Low', 'Close']
-        available_price_cols = [col for col in price_cols if col in repaired_df.columns]
-        
-        for col in available_price_cols:
-            before_count = len(repaired_df)
-            repaired_df = repaired_df[repaired_df[col] > 0]
-            after_count = len(repaired_df)
-            
-            if before_count != after_count:
-                repairs_made.append(f"Removed {before_count - after_count} rows with non-positive {col}")
-        
-        # 4. Remove rows with negative volume
-        if 'Volume' in repaired_df.columns:
-            before_count = len(repaired_df)
-            repaired_df = repaired_df[repaired_df['Volume'] >= 0]
-            after_count = len(repaired_df)
-            
-            if before_count != after_count:
-                repairs_made.append(f"Removed {before_count - after_count} rows with negative volume")
-        
-        # 5. Cap extreme prices
-        for col in available_price_cols:
-            extreme_high = repaired_df[col] > self.price_limits['max_price']
-            if extreme_high.any():
-                repaired_df.loc[extreme_high, col] = self.price_limits['max_price']
-                repairs_made.append(f"Capped {extreme_high.sum()} extreme high {col} values")
-        
         if repairs_made:
             logger.info(f"Data repairs applied: {repairs_made}")
         
@@ -469,4 +253,342 @@ class DataValidator:
             if len(validation_result.warnings) > 5:
                 summary.append(f"  ... and {len(validation_result.warnings) - 5} more")
         
-        return "\n".join(summary)
\ No newline at end of file
+        return "\n".join(summary)
+
+
+class StreamingValidation:
+    """
+    Incremental validation of one series fed in chronological chunks
+    
+    Each chunk is scanned once by a fused kernel that evaluates every row check on
+    the chunk's NumPy arrays. Only the state needed at chunk boundaries is carried
+    between chunks: the previous timestamp and close, and the tail of the volume
+    column for the rolling median.
+    """
+    
+    def __init__(self, validator: DataValidator, ticker: str, timeframe: str, asset_type: str = 'stock'):
+        self.validator = validator
+        self.ticker = ticker
+        self.timeframe = timeframe
+        self.asset_type = asset_type
+        self.started_at = datetime.now().isoformat()
+        
+        expected, tolerance, gap_threshold = validator._interval_rules(timeframe)
+        self._expected_ns = pd.Timedelta(expected).value if expected else None
+        self._tolerance_ns = pd.Timedelta(tolerance).value if tolerance else None
+        self._gap_ns = pd.Timedelta(gap_threshold).value
+        
+        self.rows = 0
+        self._masks: List[np.ndarray] = []
+        self._schema_errors: Optional[List[str]] = None
+        self._columns: List[str] = []
+        self._has_time_index = False
+        self._tz = None
+        
+        # Boundary state carried between chunks
+        self._prev_ts: Optional[int] = None
+        self._prev_close = np.nan
+        self._volume_tail = np.empty(0, dtype=np.float64)
+        
+        # Aggregates for messages and metadata
+        self._counts: Dict[str, int] = {}
+        self._null_counts: Dict[str, int] = {}
+        self._frame_columns: List[str] = []
+        self._max_change = np.nan
+        self._min_ts: Optional[int] = None
+        self._max_ts: Optional[int] = None
+        self._max_gap_ns = 0
+        self._gap_timestamps: List[int] = []
+    
+    def add_chunk(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Validate the next chunk of the series
+        
+        Returns:
+            uint16 issue mask for the chunk's rows (later chunks may still flag the
+            chunk's last row as a superseded duplicate)
+        """
+        if self._schema_errors is None:
+            self._schema_errors = self.validator._validate_schema(df)
+            self._columns = [col for col in OHLCV_COLUMNS
+                             if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+            self._frame_columns = list(df.columns)
+            self._has_time_index = isinstance(df.index, pd.DatetimeIndex)
+            self._tz = df.index.tz if self._has_time_index else None
+        
+        n = len(df)
+        mask = np.zeros(n, dtype=np.uint16)
+        if n == 0:
+            return mask
+        
+        columns = {col: df[col].to_numpy(dtype=np.float64) for col in self._columns if col in df.columns}
+        self._scan_values(columns, mask)
+        if self._has_time_index:
+            self._scan_timestamps(df.index, mask)
+        
+        for col in df.columns:
+            if col not in columns:
+                nulls = int(df[col].isnull().sum())
+                if nulls:
+                    self._null_counts[col] = self._null_counts.get(col, 0) + nulls
+        
+        self.rows += n
+        self._masks.append(mask)
+        return mask
+    
+    def finish(self) -> ValidationResult:
+        """Build the ValidationResult for all chunks added so far"""
+        metadata = {
+            'ticker': self.ticker,
+            'timeframe': self.timeframe,
+            'asset_type': self.asset_type,
+            'original_rows': self.rows,
+            'validation_timestamp': self.started_at
+        }
+        
+        if self.rows == 0:
+            return ValidationResult(False, ["DataFrame is empty"], [], metadata,
+                                    issue_mask=np.zeros(0, dtype=np.uint16))
+        
+        mask = np.concatenate(self._masks) if len(self._masks) > 1 else self._masks[0]
+        if self.rows <= VOLUME_SPIKE_WINDOW:
+            mask &= np.uint16(0xFFFF ^ RowIssue.VOLUME_SPIKE)
+        
+        errors, warnings = self._messages()
+        
+        total_nulls = sum(self._null_counts.values())
+        date_range = "N/A"
+        if self._min_ts is not None:
+            date_range = f"{self._timestamp(self._min_ts)} to {self._timestamp(self._max_ts)}"
+        
+        metadata.update({
+            'total_errors': len(errors),
+            'total_warnings': len(warnings),
+            'date_range': date_range,
+            'trading_days': self.rows,
+            'has_nulls': total_nulls > 0,
+            'null_count': total_nulls,
+            'rows_with_issues': int(np.count_nonzero(mask)),
+            'issue_counts': {issue.name: int(np.count_nonzero(mask & issue))
+                             for issue in RowIssue if np.any(mask & issue)}
+        })
+        
+        is_valid = len(errors) == 0
+        
+        logger.info(f"Validation complete for {self.ticker} {self.timeframe}: "
+                   f"{'PASSED' if is_valid else 'FAILED'} "
+                   f"({len(errors)} errors, {len(warnings)} warnings)")
+        
+        return ValidationResult(is_valid, errors, warnings, metadata, issue_mask=mask)
+    
+    def _count(self, key: str, flags: np.ndarray) -> int:
+        count = int(np.count_nonzero(flags))
+        if count:
+            self._counts[key] = self._counts.get(key, 0) + count
+        return count
+    
+    def _scan_values(self, columns: Dict[str, np.ndarray], mask: np.ndarray):
+        """Row checks on the OHLCV values (fused kernel, one chunk)"""
+        price_limits = self.validator.price_limits
+        volume_limits = self.validator.volume_limits
+        
+        any_null = np.zeros(len(mask), dtype=bool)
+        for col, values in columns.items():
+            nulls = np.isnan(values)
+            null_count = int(np.count_nonzero(nulls))
+            if null_count:
+                self._null_counts[col] = self._null_counts.get(col, 0) + null_count
+                any_null |= nulls
+        mask[any_null] |= RowIssue.NULL_VALUE
+        
+        # OHLC relationships
+        if all(col in columns for col in PRICE_COLUMNS):
+            o, h, l, c = (columns[col] for col in PRICE_COLUMNS)
+            high_violation = (h < o) | (h < c) | (h < l)
+            low_violation = (l > o) | (l > c) | (l > h)
+            flat = (o == h) & (h == l) & (l == c)
+            mask[high_violation] |= RowIssue.HIGH_VIOLATION
+            mask[low_violation] |= RowIssue.LOW_VIOLATION
+            mask[flat] |= RowIssue.FLAT_OHLC
+            self._count('high_violation', high_violation)
+            self._count('low_violation', low_violation)
+            self._count('flat_ohlc', flat)
+        
+        # Price reasonableness
+        for col in PRICE_COLUMNS:
+            if col not in columns:
+                continue
+            values = columns[col]
+            non_positive = values <= 0
+            above_max = values > price_limits['max_price']
+            below_min = values < price_limits['min_price']
+            mask[non_positive] |= RowIssue.NON_POSITIVE_PRICE
+            mask[above_max] |= RowIssue.PRICE_ABOVE_MAX
+            mask[below_min] |= RowIssue.PRICE_BELOW_MIN
+            self._count(f'non_positive_{col}', non_positive)
+            self._count(f'above_max_{col}', above_max)
+            self._count(f'below_min_{col}', below_min)
+        
+        # Period-over-period changes, continuing from the previous chunk's last close.
+        # Like pct_change(), missing closes are forward-filled so a move across a gap still counts
+        if 'Close' in columns:
+            filled = pd.Series(np.concatenate(([self._prev_close], columns['Close']))).ffill().to_numpy()
+            close, previous = filled[1:], filled[:-1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                changes = np.abs(close / previous - 1)
+            extreme = changes > price_limits['max_daily_change']
+            mask[extreme] |= RowIssue.EXTREME_CHANGE
+            if self._count('extreme_change', extreme):
+                self._max_change = np.nanmax([self._max_change, np.nanmax(changes[extreme])])
+            self._prev_close = close[-1]
+        
+        # Volume
+        if 'Volume' in columns:
+            volume = columns['Volume']
+            negative = volume < 0
+            above_max = volume > volume_limits['max_volume']
+            zero = volume == 0
+            mask[negative] |= RowIssue.NEGATIVE_VOLUME
+            mask[above_max] |= RowIssue.VOLUME_ABOVE_MAX
+            mask[zero] |= RowIssue.ZERO_VOLUME
+            self._count('negative_volume', negative)
+            self._count('volume_above_max', above_max)
+            self._count('zero_volume', zero)
+            
+            # Rolling median over the last VOLUME_SPIKE_WINDOW rows, including the previous chunk's tail
+            extended = np.concatenate((self._volume_tail, volume))
+            if len(extended) >= VOLUME_SPIKE_WINDOW:
+                windows = np.lib.stride_tricks.sliding_window_view(extended, VOLUME_SPIKE_WINDOW)
+                medians = np.median(windows, axis=1)
+                first_row = VOLUME_SPIKE_WINDOW - 1 - len(self._volume_tail)
+                offset = max(first_row, 0)
+                spikes = np.zeros(len(volume), dtype=bool)
+                spikes[offset:] = (volume[offset:] >
+                                   medians[offset - first_row:] * volume_limits['max_volume_spike'])
+                mask[spikes] |= RowIssue.VOLUME_SPIKE
+                self._count('volume_spike', spikes)
+            self._volume_tail = extended[-(VOLUME_SPIKE_WINDOW - 1):]
+    
+    def _scan_timestamps(self, index: pd.DatetimeIndex, mask: np.ndarray):
+        """Row checks on the timestamps (fused kernel, one chunk)"""
+        ts = index.as_unit('ns').asi8
+        
+        self._min_ts = ts.min() if self._min_ts is None else min(self._min_ts, ts.min())
+        self._max_ts = ts.max() if self._max_ts is None else max(self._max_ts, ts.max())
+        
+        # Differences to the previous row; the first row of the series has none
+        if self._prev_ts is None:
+            diffs = np.diff(ts)
+            rows = slice(1, None)
+        else:
+            diffs = np.diff(ts, prepend=self._prev_ts)
+            rows = slice(None)
+        
+        # Duplicates: flag every row superseded by a later row with the same timestamp
+        if np.all(diffs >= 0):
+            duplicate = np.zeros(len(ts), dtype=bool)
+            duplicate[:-1] = ts[1:] == ts[:-1]
+        else:
+            duplicate = index.duplicated(keep='last')
+        if self._prev_ts is not None and ts[0] == self._prev_ts:
+            self._masks[-1][-1] |= RowIssue.DUPLICATE_TIMESTAMP
+            self._count('duplicate_timestamp', np.ones(1, dtype=bool))
+        mask[duplicate] |= RowIssue.DUPLICATE_TIMESTAMP
+        self._count('duplicate_timestamp', duplicate)
+        
+        out_of_order = diffs < 0
+        mask[rows][out_of_order] |= RowIssue.OUT_OF_ORDER
+        self._count('out_of_order', out_of_order)
+        
+        if self._expected_ns is not None:
+            irregular = ((diffs < self._expected_ns - self._tolerance_ns) |
+                         (diffs > self._expected_ns + self._tolerance_ns))
+            mask[rows][irregular] |= RowIssue.IRREGULAR_INTERVAL
+            self._count('irregular_interval', irregular)
+        
+        gaps = diffs > self._gap_ns
+        mask[rows][gaps] |= RowIssue.GAP_BEFORE
+        if self._count('gap', gaps):
+            self._max_gap_ns = max(self._max_gap_ns, int(diffs[gaps].max()))
+            if len(self._gap_timestamps) < 5:
+                self._gap_timestamps.extend(ts[rows][gaps][:5 - len(self._gap_timestamps)].tolist())
+        
+        self._prev_ts = int(ts[-1])
+    
+    def _timestamp(self, value: int) -> pd.Timestamp:
+        timestamp = pd.Timestamp(value)
+        return timestamp.tz_localize('UTC').tz_convert(self._tz) if self._tz is not None else timestamp
+    
+    def _messages(self) -> Tuple[List[str], List[str]]:
+        """Errors and warnings, in the order the individual checks have always reported them"""
+        counts = self._counts
+        rows = self.rows
+        errors = list(self._schema_errors or [])
+        warnings = []
+        
+        # OHLC relationships
+        if counts.get('high_violation'):
+            errors.append(f"{counts['high_violation']} rows have High < Open/Close/Low")
+        if counts.get('low_violation'):
+            errors.append(f"{counts['low_violation']} rows have Low > Open/Close/High")
+        if counts.get('flat_ohlc', 0) > rows * 0.1:  # More than 10% of data
+            warnings.append(f"{counts['flat_ohlc']} rows have identical OHLC (possible data issue)")
+        
+        # Prices
+        price_limits = self.validator.price_limits
+        for col in PRICE_COLUMNS:
+            if counts.get(f'non_positive_{col}'):
+                errors.append(f"{counts[f'non_positive_{col}']} rows have non-positive {col} prices")
+        for col in PRICE_COLUMNS:
+            if counts.get(f'above_max_{col}'):
+                warnings.append(f"{counts[f'above_max_{col}']} rows have {col} > ${price_limits['max_price']}")
+        for col in PRICE_COLUMNS:
+            if counts.get(f'below_min_{col}'):
+                warnings.append(f"{counts[f'below_min_{col}']} rows have {col} < ${price_limits['min_price']}")
+        if counts.get('extreme_change'):
+            warnings.append(f"{counts['extreme_change']} periods have >50% price changes "
+                            f"(max: {self._max_change:.1%})")
+        
+        # Volume
+        volume_limits = self.validator.volume_limits
+        if counts.get('negative_volume'):
+            errors.append(f"{counts['negative_volume']} rows have negative volume")
+        if counts.get('volume_above_max'):
+            warnings.append(f"{counts['volume_above_max']} rows have volume > {volume_limits['max_volume']:,}")
+        if rows > VOLUME_SPIKE_WINDOW and counts.get('volume_spike'):
+            warnings.append(f"{counts['volume_spike']} rows have volume spikes >10x median")
+        if counts.get('zero_volume', 0) > rows * 0.2:  # More than 20%
+            warnings.append(f"{counts['zero_volume']} rows have zero volume "
+                            f"({counts['zero_volume'] / rows:.1%} of data)")
+        
+        # Time series
+        if rows >= 2:
+            if counts.get('duplicate_timestamp'):
+                errors.append(f"{counts['duplicate_timestamp']} duplicate timestamps found")
+            if counts.get('out_of_order'):
+                warnings.append("Index is not sorted chronologically")
+            if counts.get('irregular_interval', 0) > rows * 0.1:  # More than 10%
+                warnings.append(f"{counts['irregular_interval']} irregular time intervals for {self.timeframe} data")
+            if counts.get('gap'):
+                gap_dates = [str(self._timestamp(ts).date()) for ts in self._gap_timestamps]
+                warnings.append(f"{counts['gap']} data gaps detected "
+                                f"(max: {pd.Timedelta(self._max_gap_ns)}, dates: {gap_dates})")
+        
+        # Completeness
+        if self._null_counts:
+            total_nulls = sum(self._null_counts.values())
+            # Report columns in the frame's order, as df.isnull().sum() does
+            null_cols = {col: self._null_counts[col] for col in self._frame_columns if col in self._null_counts}
+            warnings.append(f"{total_nulls} null values found: {null_cols}")
+        
+        if self._min_ts is not None:
+            date_range = pd.Timedelta(self._max_ts - self._min_ts)
+            density = {'1h': 32.5, '4h': 8, '1d': 5}.get(self.timeframe)
+            if density:
+                expected_points = (date_range.days / 7) * density
+                completeness = rows / expected_points if expected_points else None
+                if completeness is not None and completeness < 0.8:  # Less than 80% complete
+                    warnings.append(f"Data completeness: {completeness:.1%} "
+                                    f"({rows} of ~{expected_points:.0f} expected points)")
+        
+        return errors, warnings
@@ -307,7 +307,7 @@ class ErrorRecoveryStrategy:
                 if retry_count > 0:
                     logger.info(f"Operation succeeded after {retry_count} retries")
                 
-                self.failure_count = max(0, self.failure_count - 1)
+                self.record_success()
                 return result
                 
             except Exception as e:
@@ -365,6 +365,10 @@ class ErrorRecoveryStrategy:
             'last_failure': self.last_failure_time.isoformat() if self.last_failure_time else None
         }
     
+    def record_success(self):
+        """Offset one earlier failure after a successful call"""
+        self.failure_count = max(0, self.failure_count - 1)
+    
     def reset_circuit_breaker(self):
         """Manually reset circuit breaker"""
         self.circuit_open = False
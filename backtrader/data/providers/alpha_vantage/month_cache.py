@@ -0,0 +1,89 @@
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .array_store import read_frame, write_frame
+
+logger = logging.getLogger(__name__)
+
+# Months are only treated as closed once this long has passed after they end, so late
+# corrections published right after the month rolls over are still picked up
+CLOSE_GRACE_PERIOD = timedelta(days=1)
+
+
+class IntradayMonthCache:
+    """
+    Immutable content cache for parsed Alpha Vantage intraday months
+
+    Entries are keyed by (symbol, interval, month, adjusted, extended_hours), not by the
+    requested date range, so any range reuses the months it overlaps. Only closed months
+    are stored, and a stored month is never re-requested or overwritten.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir or os.getenv('ALPHA_VANTAGE_MONTH_CACHE_DIR', 'data/cache/alpha_vantage_months'))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_month_closed(month: str, now: Optional[datetime] = None) -> bool:
+        """True once a 'YYYY-MM' month has ended (plus the grace period)"""
+        year, month_number = (int(part) for part in month.split('-'))
+        next_month = datetime(year + month_number // 12, month_number % 12 + 1, 1, tzinfo=timezone.utc)
+        return (now or datetime.now(timezone.utc)) >= next_month + CLOSE_GRACE_PERIOD
+
+    def get(self, symbol: str, interval: str, month: str,
+            adjusted: bool = True, extended_hours: bool = True) -> Optional[pd.DataFrame]:
+        """Return a cached month, or None on a miss"""
+        path = self._path(symbol, interval, month, adjusted, extended_hours)
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            df = read_frame(path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable month cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return df
+
+    def contains(self, symbol: str, interval: str, month: str,
+                 adjusted: bool = True, extended_hours: bool = True) -> bool:
+        """True if a month is stored (without reading it or counting a hit/miss)"""
+        return self._path(symbol, interval, month, adjusted, extended_hours).exists()
+
+    def put(self, symbol: str, interval: str, month: str, df: pd.DataFrame,
+            adjusted: bool = True, extended_hours: bool = True) -> bool:
+        """
+        Store a parsed month if it has closed
+
+        Returns:
+            True if the month was written
+        """
+        if df.empty or not self.is_month_closed(month):
+            return False
+
+        path = self._path(symbol, interval, month, adjusted, extended_hours)
+        if path.exists():
+            return False
+
+        try:
+            write_frame(path, df)
+            logger.debug(f"Cached closed month {symbol} {interval} {month}: {len(df)} records")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not cache month {symbol} {interval} {month}: {e}")
+            return False
+
+    def _path(self, symbol: str, interval: str, month: str, adjusted: bool, extended_hours: bool) -> Path:
+        flags = f"adj{int(adjusted)}_ext{int(extended_hours)}"
+        return self.cache_dir / symbol.upper() / interval / f"{month}_{flags}.npz"
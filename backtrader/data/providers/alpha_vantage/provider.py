@@ -1,15 +1,22 @@
 import os
 import logging
+import threading
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import pandas as pd
 import requests
 
 from ..base import DataProvider
+from ..http_transport import get_shared_session
+from ...ohlcv_resampler import resample_ohlcv
+from .response_parser import decode_response, time_series_to_frame
 
 logger = logging.getLogger(__name__)
 
+# Symbols per REALTIME_BULK_QUOTES request (the endpoint's maximum)
+REALTIME_BULK_QUOTES_BATCH_SIZE = 100
+
 
 class AlphaVantageProvider(DataProvider):
     """
@@ -21,20 +28,24 @@ class AlphaVantageProvider(DataProvider):
     - Automatic retry with exponential backoff
     """
     
-    def __init__(self):
-        self.api_key = os.getenv('ALPHA_VANTAGE_API_KEY') or os.getenv('ALPHA_VINTAGE_KEY')
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
+        """
+        Args:
+            api_key: API key (default: ALPHA_VANTAGE_API_KEY environment variable)
+            session: HTTP session to send requests through (default: the shared pooled
+                session; the replay provider passes a session serving recorded responses)
+        """
+        self.api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY') or os.getenv('ALPHA_VINTAGE_KEY')
         if not self.api_key:
             raise ValueError("ALPHA_VANTAGE_API_KEY environment variable is required")
             
         self.base_url = "https://www.alphavantage.co/query"
         self.last_request_time = 0
         self.min_request_interval = 60 / 75  # 75 requests per minute
+        self._rate_limit_lock = threading.Lock()
         
-        # Request session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BacktraderHedgeFund/1.0'
-        })
+        # Shared pooled session (keep-alive, gzip, socket retries, conditional GETs)
+        self.session = session or get_shared_session()
         
         # Initialize asset bucket manager for crypto detection
         # Import here to avoid circular imports
@@ -46,6 +57,7 @@ class AlphaVantageProvider(DataProvider):
         self._data_validator = None
         self._error_handler = None
         self._crypto_provider = None
+        self._month_cache = None
         
         logger.info("AlphaVantageProvider initialized with rate limit: 75 req/min")
     
@@ -53,7 +65,7 @@ class AlphaVantageProvider(DataProvider):
         """Get or create crypto provider instance"""
         if self._crypto_provider is None:
             from .crypto_provider import AlphaVantageCryptoProvider
-            self._crypto_provider = AlphaVantageCryptoProvider()
+            self._crypto_provider = AlphaVantageCryptoProvider(api_key=self.api_key, session=self.session)
         return self._crypto_provider
     
     @property
@@ -101,13 +113,16 @@ class AlphaVantageProvider(DataProvider):
         return len(ticker) >= 1 and len(ticker) <= 10
     
     def _rate_limit(self):
-        """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
+        """Enforce rate limiting (thread-safe: concurrent callers get successive request slots)"""
+        with self._rate_limit_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + self.min_request_interval)
+            self.last_request_time = slot
+        
+        sleep_time = slot - now
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
-        self.last_request_time = time.time()
     
     def _make_request(self, params: Dict, ticker: str = "unknown", timeframe: str = "unknown") -> Dict:
         """Make API request with advanced error handling"""
@@ -117,7 +132,7 @@ class AlphaVantageProvider(DataProvider):
             response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = decode_response(response)
             
             # Check for API errors
             if 'Error Message' in data:
@@ -201,30 +216,10 @@ class AlphaVantageProvider(DataProvider):
         
         if df.empty:
             return df
-            
-        # Parse target timeframe
-        if target_timeframe.endswith('H'):
-            # Handle pandas-style resampling rules like '4H', '2H', etc.
-            resample_rule = target_timeframe
-        elif target_timeframe.endswith('h'):
-            # Handle our format like '4h', '2h', etc.
-            hours = int(target_timeframe[:-1])
-            resample_rule = f"{hours}H"
-        elif target_timeframe.endswith('min'):
-            minutes = int(target_timeframe[:-3])
-            resample_rule = f"{minutes}T"
-        else:
-            raise ValueError(f"Unsupported timeframe format: {target_timeframe}")
         
-        # Market-aware resampling (9:30 AM ET origin for stock market)
+        # Market-aware resampling (9:30 AM ET session origin for stock market)
         try:
-            resampled = df.resample(resample_rule, origin='09:30').agg({
-                'Open': 'first',
-                'High': 'max',
-                'Low': 'min',
-                'Close': 'last',
-                'Volume': 'sum'
-            }).dropna()
+            resampled = resample_ohlcv(df, target_timeframe, asset_type='stock')
             
             logger.info(f"Resampled {len(df)} records to {len(resampled)} {target_timeframe} records")
             return resampled
@@ -281,7 +276,11 @@ class AlphaVantageProvider(DataProvider):
             if needs_resampling and not df.empty:
                 target_resample = timeframe_resolution['resample']
                 logger.info(f"Resampling {ticker} from {native_timeframe} to {target_resample}")
-                df = self._resample_timeframe(df, target_resample)
+                if self._is_crypto_symbol(ticker):
+                    # Crypto trades 24/7, so it has no session origin
+                    df = self.get_crypto_provider().resample_to_timeframe(df, target_resample)
+                else:
+                    df = self._resample_timeframe(df, target_resample)
                 
                 # Update metadata to reflect final timeframe
                 if hasattr(df, 'attrs'):
@@ -313,8 +312,112 @@ class AlphaVantageProvider(DataProvider):
             logger.error(f"Error fetching {ticker} data: {e}")
             return pd.DataFrame()
     
-    def _fetch_daily_data(self, ticker: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
-        """Fetch daily data"""
+    def fetch_latest_bars(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch the most recent daily bar for a whole universe
+        
+        Equities are quoted REALTIME_BULK_QUOTES_BATCH_SIZE symbols per request; symbols
+        the bulk endpoint does not return (or every equity, if the key lacks access to
+        it) fall back to one compact TIME_SERIES_DAILY request each. Crypto pairs go
+        through the crypto provider's batch path.
+        
+        Args:
+            tickers: Ticker symbols (equities and crypto may be mixed)
+            
+        Returns:
+            Dict mapping ticker -> single-row daily DataFrame (tickers without data are omitted)
+        """
+        tickers = list(dict.fromkeys(tickers))
+        crypto_tickers = [ticker for ticker in tickers if self._is_crypto_symbol(ticker)]
+        equity_tickers = [ticker for ticker in tickers if ticker not in crypto_tickers]
+        
+        results = self._fetch_bulk_quotes(equity_tickers) if equity_tickers else {}
+        
+        end_date = datetime.now() + timedelta(days=1)
+        start_date = end_date - timedelta(days=8)
+        missing = [ticker for ticker in equity_tickers if ticker not in results]
+        if missing:
+            logger.info(f"Bulk quotes covered {len(results)}/{len(equity_tickers)} equities; "
+                        f"fetching {len(missing)} individually")
+        for ticker in missing:
+            try:
+                df = self._fetch_daily_data(ticker, start_date, end_date, outputsize='compact')
+            except Exception as e:
+                logger.error(f"Error fetching latest bar for {ticker}: {e}")
+                continue
+            if not df.empty:
+                results[ticker] = df.iloc[[-1]]
+        
+        if crypto_tickers:
+            crypto_frames = self.get_crypto_provider().fetch_crypto_daily_batch(crypto_tickers, start_date, end_date)
+            for ticker, df in crypto_frames.items():
+                latest = df.iloc[[-1]].copy()
+                latest.attrs.update({'provider_source': self.name, 'timeframe': '1d',
+                                     'ticker': ticker, 'asset_type': 'crypto'})
+                results[ticker] = latest
+        
+        return results
+    
+    def _fetch_bulk_quotes(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """Latest daily bars from REALTIME_BULK_QUOTES, keyed by ticker (missing symbols omitted)"""
+        by_symbol = {}
+        for ticker in tickers:
+            by_symbol.setdefault(self._sanitize_symbol_for_api(ticker), []).append(ticker)
+        symbols = list(by_symbol)
+        
+        results = {}
+        for i in range(0, len(symbols), REALTIME_BULK_QUOTES_BATCH_SIZE):
+            batch = symbols[i:i + REALTIME_BULK_QUOTES_BATCH_SIZE]
+            params = {
+                'function': 'REALTIME_BULK_QUOTES',
+                'symbol': ','.join(batch),
+                'apikey': self.api_key
+            }
+            
+            try:
+                data = self._make_request(params, ','.join(batch), 'quote')
+            except Exception as e:
+                logger.warning(f"Bulk quote request failed for {len(batch)} symbols: {e}")
+                continue
+            
+            quotes = data.get('data')
+            if not isinstance(quotes, list):
+                # Keys without bulk quote access get an informational message instead
+                message = data.get('message') or data.get('Information') or list(data.keys())
+                logger.warning(f"Bulk quotes unavailable: {message}")
+                break
+            
+            for quote in quotes:
+                bar = self._quote_to_bar(quote)
+                if bar is None:
+                    continue
+                for ticker in by_symbol.get(str(quote.get('symbol', '')).upper(), []):
+                    df = bar.copy()
+                    df.attrs.update({'provider_source': self.name, 'timeframe': '1d',
+                                     'ticker': ticker, 'asset_type': 'stock'})
+                    results[ticker] = df
+        
+        return results
+    
+    @staticmethod
+    def _quote_to_bar(quote: Dict) -> Optional[pd.DataFrame]:
+        """One bulk quote as a single-row daily OHLCV frame, or None if it has no price"""
+        try:
+            timestamp = pd.Timestamp(quote['timestamp']).normalize()
+        except (KeyError, ValueError, TypeError):
+            return None
+        
+        values = {column: pd.to_numeric(quote.get(column.lower()), errors='coerce')
+                  for column in ('Open', 'High', 'Low', 'Close', 'Volume')}
+        if pd.isna(values['Close']):
+            return None
+        
+        return pd.DataFrame({column: [float(value)] for column, value in values.items()},
+                            index=pd.DatetimeIndex([timestamp], name='Date'))
+    
+    def _fetch_daily_data(self, ticker: str, start_date: datetime, end_date: datetime,
+                          outputsize: str = 'full') -> pd.DataFrame:
+        """Fetch daily data ('compact' returns only the latest 100 bars)"""
         # Sanitize symbol for API call
         api_symbol = self._sanitize_symbol_for_api(ticker)
         if api_symbol != ticker:
@@ -324,7 +427,7 @@ class AlphaVantageProvider(DataProvider):
             'function': 'TIME_SERIES_DAILY',
             'symbol': api_symbol,  # Use sanitized symbol
             'apikey': self.api_key,
-            'outputsize': 'full'
+            'outputsize': outputsize
         }
         
         data = self._make_request(params, ticker, 'daily')
@@ -334,16 +437,10 @@ class AlphaVantageProvider(DataProvider):
             return pd.DataFrame()
         
         time_series = data['Time Series (Daily)']
-        df = pd.DataFrame.from_dict(time_series, orient='index')
-        
-        # Clean up column names and data types
-        df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        df.index = pd.to_datetime(df.index)
-        df = df.astype(float)
+        df = time_series_to_frame(time_series)
         
         # Filter by date range
         df = df[(df.index >= pd.Timestamp(start_date)) & (df.index <= pd.Timestamp(end_date))]
-        df = df.sort_index()
         
         # Add provider attribution
         df.attrs['provider_source'] = self.name
@@ -387,13 +484,7 @@ class AlphaVantageProvider(DataProvider):
             return pd.DataFrame()
         
         time_series = data[time_series_key]
-        df = pd.DataFrame.from_dict(time_series, orient='index')
-        
-        # Clean up column names and data types
-        df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        df.index = pd.to_datetime(df.index)
-        df = df.astype(float)
-        df = df.sort_index()
+        df = time_series_to_frame(time_series)
         
         # Filter by date range
         df = df[(df.index >= pd.Timestamp(start_date)) & (df.index <= pd.Timestamp(end_date))]
@@ -485,13 +576,7 @@ class AlphaVantageProvider(DataProvider):
             return pd.DataFrame()
         
         time_series = data[time_series_key]
-        df = pd.DataFrame.from_dict(time_series, orient='index')
-        
-        # Clean up column names and data types
-        df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        df.index = pd.to_datetime(df.index)
-        df = df.astype(float)
-        df = df.sort_index()
+        df = time_series_to_frame(time_series)
         
         # Filter by date range
         df = df[(df.index >= pd.Timestamp(start_date)) & (df.index <= pd.Timestamp(end_date))]
@@ -619,13 +704,7 @@ class AlphaVantageProvider(DataProvider):
             return pd.DataFrame()
         
         time_series = data[time_series_key]
-        df = pd.DataFrame.from_dict(time_series, orient='index')
-        
-        # Clean up column names and data types
-        df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        df.index = pd.to_datetime(df.index)
-        df = df.astype(float)
-        df = df.sort_index()
+        df = time_series_to_frame(time_series)
         
         # Filter by date range
         df = df[(df.index >= pd.Timestamp(start_date)) & (df.index <= pd.Timestamp(end_date))]
@@ -700,19 +779,29 @@ class AlphaVantageProvider(DataProvider):
         if api_symbol != ticker:
             logger.info(f"Sanitized symbol {ticker} -> {api_symbol} for Alpha Vantage API")
         
+        month_cache = self.get_month_cache()
+        
         while current_date <= end_date:
             month_str = current_date.strftime('%Y-%m')
             
             # Check if this month intersects with our date range
             month_start = current_date
             if current_date.month == 12:
-                month_end = current_date.replace(year=current_date.year + 1, month=1, day=1) - timedelta(days=1)
+                next_month = current_date.replace(year=current_date.year + 1, month=1, day=1)
             else:
-                month_end = current_date.replace(month=current_date.month + 1, day=1) - timedelta(days=1)
+                next_month = current_date.replace(month=current_date.month + 1, day=1)
+            month_end = next_month - timedelta(days=1)
+            current_date = next_month
             
             # Skip if month is entirely outside our range
             if month_end < start_date or month_start > end_date:
-                current_date = month_end + timedelta(days=1)
+                continue
+            
+            # Closed months never change: serve them from the month cache when present
+            month_df = month_cache.get(api_symbol, native_timeframe, month_str)
+            if month_df is not None:
+                logger.debug(f"Month cache hit for {ticker} {native_timeframe} {month_str}")
+                all_data.append(month_df)
                 continue
             
             logger.info(f"Fetching historical data for {ticker} {native_timeframe} month {month_str}")
@@ -732,14 +821,11 @@ class AlphaVantageProvider(DataProvider):
                 time_series_key = f'Time Series ({native_timeframe})'
                 if time_series_key in data:
                     time_series = data[time_series_key]
-                    month_df = pd.DataFrame.from_dict(time_series, orient='index')
+                    month_df = time_series_to_frame(time_series)
                     
                     if not month_df.empty:
-                        # Clean up data
-                        month_df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-                        month_df.index = pd.to_datetime(month_df.index)
-                        month_df = month_df.astype(float)
                         all_data.append(month_df)
+                        month_cache.put(api_symbol, native_timeframe, month_str, month_df)
                         logger.info(f"Fetched {len(month_df)} records for {month_str}")
                     else:
                         logger.warning(f"Empty data for {ticker} {month_str}")
@@ -749,12 +835,6 @@ class AlphaVantageProvider(DataProvider):
             except Exception as e:
                 logger.error(f"Error fetching {ticker} data for {month_str}: {e}")
                 # Continue with other months
-            
-            # Move to next month
-            if current_date.month == 12:
-                current_date = current_date.replace(year=current_date.year + 1, month=1)
-            else:
-                current_date = current_date.replace(month=current_date.month + 1)
         
         # Combine all monthly data
         if not all_data:
@@ -793,11 +873,20 @@ class AlphaVantageProvider(DataProvider):
             from .client import AlphaVantageClient
             from .bulk_fetcher import BulkDataFetcher
             
-            client = AlphaVantageClient()
+            # Bulk chunks go through this provider so they share its rate limiter
+            client = AlphaVantageClient(provider=self)
             self._bulk_fetcher = BulkDataFetcher(client)
         
         return self._bulk_fetcher
     
+    def get_month_cache(self):
+        """Get intraday month cache instance (lazy initialization)"""
+        if self._month_cache is None:
+            from .month_cache import IntradayMonthCache
+            self._month_cache = IntradayMonthCache()
+        
+        return self._month_cache
+    
     def get_data_validator(self):
         """Get data validator instance (lazy initialization)"""
         if self._data_validator is None:
@@ -0,0 +1,137 @@
+"""
+Fast parsing of Alpha Vantage time-series responses
+
+Time-series payloads map timestamp strings to dicts of numeric strings. Instead of
+building an object DataFrame with from_dict and converting it column by column, the
+keys and values are streamed once into preallocated datetime64/float64 arrays.
+
+orjson is used to decode response bodies when it is installed, unless
+ALPHA_VANTAGE_JSON_DECODER=json. It decodes roughly twice as fast but has a higher
+transient memory peak than the standard library decoder.
+"""
+
+import json
+import os
+from itertools import chain
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def decode_json(content: bytes) -> Dict[str, Any]:
+    """Decode a JSON response body, preferring orjson when available"""
+    if orjson is not None and os.getenv('ALPHA_VANTAGE_JSON_DECODER', 'auto').lower() != 'json':
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def decode_response(response) -> Dict[str, Any]:
+    """
+    Decode a requests response body
+
+    Falls back to response.json() when the body is not raw bytes (e.g. mocked responses)
+    """
+    content = getattr(response, 'content', None)
+    if isinstance(content, (bytes, bytearray)):
+        return decode_json(content)
+    return response.json()
+
+
+def find_time_series_key(data: Dict[str, Any]) -> Optional[str]:
+    """Return the first 'Time Series ...' key of a response, if any"""
+    for key in data:
+        if 'time series' in key.lower():
+            return key
+    return None
+
+
+def parse_time_series(time_series: Dict[str, Dict[str, str]]) -> Dict[str, np.ndarray]:
+    """
+    Decode a time-series mapping into sorted NumPy arrays
+
+    Args:
+        time_series: Mapping of timestamp string -> {'1. open': '...', ...}
+
+    Returns:
+        Dict with 'timestamps' (datetime64[ns]) and a float64 array for each of
+        'Open', 'High', 'Low', 'Close' and 'Volume' present in the rows, in
+        ascending timestamp order
+    """
+    n = len(time_series)
+    if n == 0:
+        arrays = {'timestamps': np.empty(0, dtype='datetime64[ns]')}
+        arrays.update({column: np.empty(0, dtype=np.float64) for column in OHLCV_COLUMNS})
+        return arrays
+
+    fields = list(next(iter(time_series.values())))
+    positions = _field_positions(fields)
+    width = len(fields)
+
+    timestamps = np.fromiter(time_series.keys(), dtype='datetime64[ns]', count=n)
+
+    rows = time_series.values()
+    if all(len(row) == width for row in rows):
+        # Uniform rows: convert every value straight into one preallocated (n, width) block
+        values = np.fromiter(map(float, chain.from_iterable(row.values() for row in rows)),
+                             dtype=np.float64, count=n * width).reshape(n, width)
+    else:
+        # Rows with missing or extra fields are aligned to the first row's field names
+        values = np.array([[float(row.get(field, 'nan')) for field in fields] for row in rows],
+                          dtype=np.float64).reshape(n, width)
+
+    arrays = {'timestamps': timestamps}
+    for column, position in zip(OHLCV_COLUMNS, positions):
+        if position is not None:
+            arrays[column] = np.ascontiguousarray(values[:, position])
+
+    # Responses are newest-first; reverse when strictly descending, otherwise sort
+    if n > 1:
+        deltas = np.diff(timestamps.view(np.int64))
+        if np.all(deltas < 0):
+            order = slice(None, None, -1)
+        elif np.all(deltas > 0):
+            order = None
+        else:
+            order = np.argsort(timestamps, kind='stable')
+        if order is not None:
+            arrays = {key: array[order] for key, array in arrays.items()}
+
+    return arrays
+
+
+def time_series_to_frame(time_series: Dict[str, Dict[str, str]]) -> pd.DataFrame:
+    """
+    Parse a time-series mapping into a sorted OHLCV DataFrame
+
+    Equivalent to from_dict + rename + to_datetime + astype(float) + sort_index.
+    """
+    arrays = parse_time_series(time_series)
+    index = pd.DatetimeIndex(arrays.pop('timestamps'))
+    return pd.DataFrame(arrays, index=index, copy=False)
+
+
+def _field_positions(fields: List[str]) -> List[Optional[int]]:
+    """
+    Locate the OHLCV fields in a row's key order
+
+    Keys look like '1. open', '5. volume' or '1a. open (USD)'; the first match wins.
+    Rows without recognizable names are assumed to be in OHLCV order.
+    """
+    names = [field.split('. ', 1)[-1].lower() for field in fields]
+    positions = []
+    for column in OHLCV_COLUMNS:
+        match = next((i for i, name in enumerate(names) if name.startswith(column.lower())), None)
+        positions.append(match)
+
+    if all(position is None for position in positions):
+        positions = [i if i < len(fields) else None for i in range(len(OHLCV_COLUMNS))]
+    return positions
+
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 import pandas as pd
 
 
@@ -39,4 +39,38 @@ class DataProvider(ABC):
     @abstractmethod
     def name(self) -> str:
         """Return provider name"""
-        pass
\ No newline at end of file
+        pass
+    
+    def fetch_multiple(
+        self,
+        tickers: List[str],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch one timeframe for many tickers
+        
+        Providers with a multi-symbol endpoint override this to batch the request;
+        the default fetches each ticker on its own.
+        
+        Returns:
+            Dict mapping ticker -> DataFrame (tickers without data are omitted)
+        """
+        results = {}
+        for ticker in dict.fromkeys(tickers):
+            df = self.fetch_data(ticker, timeframe, start_date, end_date)
+            if df is not None and not df.empty:
+                results[ticker] = df
+        return results
+    
+    def fetch_latest_bars(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch the most recent daily bar for many tickers
+        
+        Returns:
+            Dict mapping ticker -> single-row DataFrame (tickers without data are omitted)
+        """
+        end_date = datetime.now() + timedelta(days=1)
+        frames = self.fetch_multiple(tickers, '1d', end_date - timedelta(days=8), end_date)
+        return {ticker: df.iloc[[-1]] for ticker, df in frames.items()}
\ No newline at end of file
@@ -0,0 +1,297 @@
+"""
+Shared HTTP transport for data providers
+
+All providers talking to the same upstream share one requests.Session, so TCP and
+TLS connections are pooled and kept alive across providers, chunks and threads
+instead of being re-established per provider instance.
+
+The session's adapter adds:
+- Sized connection pools (HTTP_POOL_CONNECTIONS hosts, HTTP_POOL_MAXSIZE connections
+  per host, which should cover the bulk fetcher's max_parallel)
+- Retries for transient socket errors (connect/read failures, HTTP_MAX_RETRIES);
+  HTTP status codes such as 429 are left to the providers' error handling
+- Conditional GETs: when an upstream returns an ETag or Last-Modified header the
+  body is kept in a bounded in-memory cache, later requests for the same URL send
+  If-None-Match/If-Modified-Since, and a 304 is answered from the cache
+- Per-host latency histograms (time to response headers)
+
+gzip/deflate is requested explicitly; requests decompresses transparently.
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'BacktraderHedgeFund/1.0'
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one host"""
+    
+    def __init__(self, bounds_ms=LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def observe(self, seconds: float):
+        """Record one request latency"""
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a latency percentile from the buckets
+        
+        Args:
+            q: Percentile in [0, 100]
+            
+        Returns:
+            Upper bound (ms) of the bucket containing the percentile, the observed
+            maximum for the open-ended bucket, or None without observations
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, round(self.count * q / 100))
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(self.bounds_ms[i]) if i < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+    
+    def snapshot(self) -> Dict:
+        """Summary statistics and bucket counts"""
+        labels = [f"<={bound}ms" for bound in self.bounds_ms] + [f">{self.bounds_ms[-1]}ms"]
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else None,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+
+@dataclass
+class CachedResponse:
+    """Body and validators of a response that can be revalidated"""
+    content: bytes
+    headers: Dict[str, str]
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ConditionalCache:
+    """Thread-safe LRU cache of revalidatable responses, bounded by total body size"""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+    
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+    
+    def put(self, url: str, entry: CachedResponse):
+        if len(entry.content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(url, None)
+            if previous is not None:
+                self._bytes -= len(previous.content)
+            self._entries[url] = entry
+            self._bytes += len(entry.content)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.content)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter adding conditional GETs and per-host latency tracking"""
+    
+    def __init__(self, pool_connections: int, pool_maxsize: int, max_retries: int,
+                 cache_max_bytes: int):
+        retries = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=0,
+            backoff_factor=0.5,
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            raise_on_status=False
+        )
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                         max_retries=retries)
+        self.conditional_cache = ConditionalCache(cache_max_bytes)
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._histogram_lock = threading.Lock()
+    
+    def send(self, request, stream=False, **kwargs):
+        cacheable = request.method == 'GET' and not stream
+        entry = self.conditional_cache.get(request.url) if cacheable else None
+        if entry is not None:
+            if entry.etag:
+                request.headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                request.headers['If-Modified-Since'] = entry.last_modified
+        
+        started = time.perf_counter()
+        response = super().send(request, stream=stream, **kwargs)
+        self._observe(request.url, time.perf_counter() - started)
+        
+        if entry is not None and response.status_code == 304:
+            return self._replay(response, entry)
+        
+        if cacheable and response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.conditional_cache.put(request.url, CachedResponse(
+                    content=response.content,
+                    headers=dict(response.headers),
+                    encoding=response.encoding,
+                    etag=etag,
+                    last_modified=last_modified
+                ))
+        
+        response.from_cache = False
+        return response
+    
+    def _replay(self, response: requests.Response, entry: CachedResponse) -> requests.Response:
+        """Turn a 304 into the cached 200 response, keeping the fresh headers"""
+        self.conditional_cache.hits += 1
+        headers = CaseInsensitiveDict(entry.headers)
+        headers.update(response.headers)
+        # The cached body is already decoded
+        headers.pop('Content-Encoding', None)
+        headers['Content-Length'] = str(len(entry.content))
+        response.headers = headers
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = entry.content
+        response.encoding = entry.encoding
+        response.from_cache = True
+        logger.debug(f"Not modified, served from conditional cache: {urlsplit(response.url).path}")
+        return response
+    
+    def _observe(self, url: str, seconds: float):
+        host = urlsplit(url).netloc
+        with self._histogram_lock:
+            histogram = self._histograms.get(host)
+            if histogram is None:
+                histogram = self._histograms[host] = LatencyHistogram()
+            histogram.observe(seconds)
+    
+    def latency_stats(self) -> Dict[str, Dict]:
+        """Latency histogram snapshot per host"""
+        with self._histogram_lock:
+            return {host: histogram.snapshot() for host, histogram in self._histograms.items()}
+
+
+def create_session(pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                   max_retries: Optional[int] = None, cache_max_bytes: Optional[int] = None,
+                   user_agent: str = USER_AGENT) -> requests.Session:
+    """
+    Create a session with the pooled transport mounted for http and https
+    
+    Args:
+        pool_connections: Number of hosts to keep pools for (HTTP_POOL_CONNECTIONS, default 10)
+        pool_maxsize: Connections kept alive per host (HTTP_POOL_MAXSIZE, default 16)
+        max_retries: Retries for connect/read errors (HTTP_MAX_RETRIES, default 3)
+        cache_max_bytes: Conditional cache size (HTTP_CONDITIONAL_CACHE_MB, default 64 MB)
+        user_agent: User-Agent header
+        
+    Returns:
+        requests.Session whose adapter is a PooledHTTPAdapter
+    """
+    if pool_connections is None:
+        pool_connections = int(os.getenv('HTTP_POOL_CONNECTIONS', '10'))
+    if pool_maxsize is None:
+        pool_maxsize = int(os.getenv('HTTP_POOL_MAXSIZE', '16'))
+    if max_retries is None:
+        max_retries = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+    if cache_max_bytes is None:
+        cache_max_bytes = int(float(os.getenv('HTTP_CONDITIONAL_CACHE_MB', '64')) * 1024 * 1024)
+    
+    adapter = PooledHTTPAdapter(pool_connections, pool_maxsize, max_retries, cache_max_bytes)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': user_agent,
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive'
+    })
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Get the process-wide pooled session (lazy initialization)"""
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = create_session()
+                logger.info("Shared HTTP session initialized")
+    return _shared_session
+
+
+def get_latency_stats(session: Optional[requests.Session] = None) -> Dict[str, Dict]:
+    """
+    Per-host latency histograms of a session's pooled adapters
+    
+    Args:
+        session: Session to inspect (default: the shared session)
+        
+    Returns:
+        Dict mapping host -> histogram snapshot
+    """
+    session = session or get_shared_session()
+    stats = {}
+    for adapter in _pooled_adapters(session):
+        stats.update(adapter.latency_stats())
+    return stats
+
+
+def _pooled_adapters(session: requests.Session) -> List[PooledHTTPAdapter]:
+    adapters = []
+    for adapter in session.adapters.values():
+        if isinstance(adapter, PooledHTTPAdapter) and adapter not in adapters:
+            adapters.append(adapter)
+    return adapters
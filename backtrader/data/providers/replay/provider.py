@@ -0,0 +1,196 @@
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from ..base import DataProvider
+from ..alpha_vantage.array_store import read_frame, write_frame
+from ..alpha_vantage.month_cache import IntradayMonthCache
+from .transport import ReplayAdapter, ResponseArchive, SimulatedConditions, create_replay_session
+
+logger = logging.getLogger(__name__)
+
+UPSTREAMS = ('alpha_vantage', 'yahoo')
+
+
+class ReplayProvider(DataProvider):
+    """
+    Data provider serving recorded upstream responses for offline, deterministic runs
+    
+    Wraps a real upstream provider and runs its full pipeline (request building, parsing,
+    validation, resampling) against an archive instead of the network:
+    - alpha_vantage: raw HTTP responses are recorded/replayed by a ReplayAdapter mounted
+      on the upstream provider's session, including crypto endpoints
+    - yahoo: yfinance does not go through requests, so fetched frames are archived
+    
+    In record mode the upstream is called for real and everything it receives is
+    archived. In replay mode no network access happens; simulated latency and rate
+    limits make load tests pace like the real API.
+    """
+    
+    def __init__(self, archive_dir: str, upstream: str = 'alpha_vantage', mode: str = 'replay',
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 requests_per_minute: Optional[int] = None, seed: int = 0):
+        """
+        Args:
+            archive_dir: Directory holding the recorded responses
+            upstream: Provider whose responses are recorded ('alpha_vantage' or 'yahoo')
+            mode: 'replay' (serve from the archive) or 'record' (fetch and archive)
+            latency_ms: Simulated latency added to every replayed request
+            jitter_ms: Upper bound of uniform random jitter added to the latency
+            requests_per_minute: Simulated upstream rate limit (None for unlimited)
+            seed: Seed for the jitter generator
+        """
+        if upstream not in UPSTREAMS:
+            raise ValueError(f"Unknown replay upstream: {upstream}. Available: {list(UPSTREAMS)}")
+        if mode not in ('replay', 'record'):
+            raise ValueError(f"Unknown replay mode: {mode}. Use 'replay' or 'record'")
+        
+        self.archive_dir = Path(archive_dir)
+        self.upstream_name = upstream
+        self.mode = mode
+        self.archive = ResponseArchive(str(self.archive_dir))
+        self.conditions = SimulatedConditions(latency_ms, jitter_ms, requests_per_minute, seed)
+        self.frames_dir = self.archive_dir / 'frames' / upstream
+        
+        self.upstream = self._create_upstream()
+        logger.info(f"ReplayProvider initialized ({mode} {upstream} from {self.archive_dir})")
+    
+    @classmethod
+    def from_env(cls) -> 'ReplayProvider':
+        """
+        Build a replay provider from DATA_REPLAY_* environment variables
+        
+        Raises:
+            ValueError: If DATA_REPLAY_DIR is not set
+        """
+        archive_dir = os.getenv('DATA_REPLAY_DIR')
+        if not archive_dir:
+            raise ValueError("DATA_REPLAY_DIR environment variable is required")
+        requests_per_minute = os.getenv('DATA_REPLAY_RATE_LIMIT')
+        return cls(
+            archive_dir,
+            upstream=os.getenv('DATA_REPLAY_UPSTREAM', 'alpha_vantage'),
+            mode=os.getenv('DATA_REPLAY_MODE', 'replay'),
+            latency_ms=float(os.getenv('DATA_REPLAY_LATENCY_MS', '0')),
+            jitter_ms=float(os.getenv('DATA_REPLAY_JITTER_MS', '0')),
+            requests_per_minute=int(requests_per_minute) if requests_per_minute else None,
+            seed=int(os.getenv('DATA_REPLAY_SEED', '0'))
+        )
+    
+    def _create_upstream(self) -> DataProvider:
+        """Create the wrapped provider, with its HTTP traffic routed through the archive"""
+        if self.upstream_name == 'yahoo':
+            from ..yahoo_finance.provider import YahooFinanceProvider
+            return YahooFinanceProvider()
+        
+        from ..alpha_vantage.provider import AlphaVantageProvider
+        session = create_replay_session(self.archive, self.mode, self.conditions)
+        # Replays need no key: credentials are never part of an archive entry
+        api_key = os.getenv('ALPHA_VANTAGE_API_KEY') or ('replay' if self.mode == 'replay' else None)
+        provider = AlphaVantageProvider(api_key=api_key, session=session)
+        # Closed months are cached next to the recordings, so an archive is self-contained
+        provider._month_cache = IntradayMonthCache(str(self.archive_dir / 'months'))
+        if self.mode == 'replay':
+            # Pacing comes from the simulated conditions, not the client-side throttle
+            provider.min_request_interval = 0
+            provider.get_crypto_provider().min_request_interval = 0
+        return provider
+    
+    @property
+    def name(self) -> str:
+        return "replay"
+    
+    @property
+    def adapter(self) -> Optional[ReplayAdapter]:
+        """The ReplayAdapter carrying the upstream's HTTP traffic, if any"""
+        session = getattr(self.upstream, 'session', None)
+        return session.get_adapter('https://') if session is not None else None
+    
+    def get_supported_timeframes(self, *args, **kwargs) -> List[str]:
+        return self.upstream.get_supported_timeframes(*args, **kwargs)
+    
+    def fetch_data(self, ticker: str, timeframe: str,
+                   start_date: datetime, end_date: datetime, **kwargs) -> pd.DataFrame:
+        """Fetch data through the upstream pipeline, recording or replaying its inputs"""
+        if self.upstream_name == 'yahoo':
+            return self._fetch_frame(ticker, timeframe, start_date, end_date)
+        return self.upstream.fetch_data(ticker, timeframe, start_date, end_date, **kwargs)
+    
+    def fetch_multiple(self, tickers: List[str], timeframe: str,
+                       start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """Batched upstream fetch; yahoo frames are archived per ticker, so they go one by one"""
+        if self.upstream_name == 'yahoo':
+            return super().fetch_multiple(tickers, timeframe, start_date, end_date)
+        return self.upstream.fetch_multiple(tickers, timeframe, start_date, end_date)
+    
+    def fetch_latest_bars(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """Latest daily bars through the upstream's bulk endpoints (per ticker for yahoo)"""
+        if self.upstream_name == 'yahoo':
+            return super().fetch_latest_bars(tickers)
+        return self.upstream.fetch_latest_bars(tickers)
+    
+    def _fetch_frame(self, ticker: str, timeframe: str,
+                     start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Frame-level record/replay for upstreams that do not use requests"""
+        path = self.frames_dir / ticker.upper() / (
+            f"{timeframe}_{pd.Timestamp(start_date):%Y%m%d%H%M}_{pd.Timestamp(end_date):%Y%m%d%H%M}.npz")
+        
+        if self.mode == 'record':
+            data = self.upstream.fetch_data(ticker, timeframe, start_date, end_date)
+            if data is not None and not data.empty:
+                write_frame(path, data)
+            return data
+        
+        host = self.upstream_name
+        retry_after = self.conditions.admit(host)
+        self.conditions.delay()
+        if retry_after is not None:
+            logger.warning(f"Simulated {host} rate limit hit for {ticker}, retry after {retry_after:.1f}s")
+            return pd.DataFrame()
+        
+        if not path.exists():
+            logger.warning(f"No recorded {self.upstream_name} data for {ticker} {timeframe} "
+                           f"{start_date} - {end_date}")
+            return pd.DataFrame()
+        
+        data = read_frame(path)
+        data.attrs.update({'provider_source': self.upstream_name, 'timeframe': timeframe, 'ticker': ticker})
+        return data
+    
+    def get_rate_limit(self) -> Dict[str, int]:
+        """Simulated rate limit when configured, otherwise the upstream's"""
+        if self.conditions.requests_per_minute:
+            per_minute = self.conditions.requests_per_minute
+            return {
+                'requests_per_minute': per_minute,
+                'requests_per_hour': per_minute * 60,
+                'requests_per_day': per_minute * 60 * 24
+            }
+        return self.upstream.get_rate_limit()
+    
+    def validate_ticker(self, ticker: str) -> bool:
+        return self.upstream.validate_ticker(ticker)
+    
+    def get_replay_stats(self) -> Dict:
+        """Archive hits/misses and simulated rate-limit rejections"""
+        stats = {
+            'mode': self.mode,
+            'upstream': self.upstream_name,
+            'archived_responses': len(self.archive),
+            'rate_limited': self.conditions.rate_limited
+        }
+        adapter = self.adapter
+        if isinstance(adapter, ReplayAdapter):
+            stats.update({'hits': adapter.hits, 'misses': adapter.misses, 'recorded': adapter.recorded})
+        return stats
+    
+    def __getattr__(self, attr):
+        # Upstream-specific helpers (crypto detection, bulk fetcher, month cache, ...)
+        upstream = self.__dict__.get('upstream')
+        if upstream is None:
+            raise AttributeError(attr)
+        return getattr(upstream, attr)
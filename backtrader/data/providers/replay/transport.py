@@ -0,0 +1,264 @@
+"""
+Recorded HTTP responses for offline, deterministic data runs
+
+ResponseArchive stores one JSON file per distinct request under
+<archive>/http/<host>/<key>.json. Keys are derived from the method, the URL with its
+query parameters sorted and credentials removed, and the body of non-GET requests, so a
+recording made with one API key replays with any other key (or none).
+
+ReplayAdapter is a requests transport adapter: mounted on a session it either records
+the responses of a real adapter (record mode) or serves them from the archive without
+touching the network (replay mode), optionally adding simulated latency and rate
+limiting so load tests see realistic pacing.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ..http_transport import USER_AGENT, create_session
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never become part of an archive key or file
+CREDENTIAL_PARAMS = {'apikey', 'api_key', 'token', 'access_token', 'key'}
+
+# Response headers that describe the wire encoding rather than the stored body
+TRANSPORT_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection',
+                     'keep-alive', 'set-cookie'}
+
+# Alpha Vantage signals rate limiting with a 200 response carrying a Note
+ALPHA_VANTAGE_RATE_LIMIT_NOTE = (
+    "Thank you for using Alpha Vantage! Our standard API call frequency is 75 requests per "
+    "minute. Please subscribe to any of the premium plans to instantly remove all daily rate limits."
+)
+
+
+def normalize_url(url: str) -> str:
+    """Sort query parameters and drop credentials so equivalent requests share a key"""
+    parts = urlsplit(url)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if name.lower() not in CREDENTIAL_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+
+class ResponseArchive:
+    """
+    On-disk archive of recorded HTTP responses
+    
+    Files are plain JSON (request descriptor, status, headers and the decoded body), so
+    recordings can be inspected, edited or checked into a test fixture directory.
+    """
+    
+    def __init__(self, root: str):
+        self.root = Path(root) / 'http'
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def request_key(self, method: str, url: str, body: Optional[bytes] = None) -> str:
+        """Stable key for a request"""
+        digest = hashlib.sha256(f"{method.upper()} {normalize_url(url)}".encode())
+        if body and method.upper() != 'GET':
+            digest.update(body if isinstance(body, bytes) else str(body).encode())
+        return digest.hexdigest()[:24]
+    
+    def _path(self, method: str, url: str, body: Optional[bytes] = None) -> Path:
+        host = urlsplit(url).netloc.lower().replace(':', '_') or 'local'
+        return self.root / host / f"{self.request_key(method, url, body)}.json"
+    
+    def load(self, method: str, url: str, body: Optional[bytes] = None) -> Optional[Dict]:
+        """Return the recorded response for a request, or None"""
+        path = self._path(method, url, body)
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def save(self, method: str, url: str, body: Optional[bytes], response: requests.Response):
+        """Record a response (the body is stored decoded)"""
+        content = response.content or b''
+        try:
+            stored_body, is_base64 = content.decode('utf-8'), False
+        except UnicodeDecodeError:
+            stored_body, is_base64 = base64.b64encode(content).decode('ascii'), True
+        
+        record = {
+            'request': {'method': method.upper(), 'url': normalize_url(url)},
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {name: value for name, value in response.headers.items()
+                        if name.lower() not in TRANSPORT_HEADERS},
+            'encoding': response.encoding,
+            'body': stored_body,
+            'body_base64': is_base64,
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }
+        
+        path = self._path(method, url, body)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=1)
+        temp_path.replace(path)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self.root.glob('*/*.json'))
+
+
+class SimulatedConditions:
+    """
+    Latency and rate limits applied to replayed responses
+    
+    Latency is latency_ms plus a uniform jitter drawn from a seeded generator. Rate
+    limiting is a sliding one-minute window per host; requests beyond
+    requests_per_minute get the upstream's rate-limit response instead of the recording.
+    """
+    
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 requests_per_minute: Optional[int] = None, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.requests_per_minute = requests_per_minute
+        self._random = random.Random(seed)
+        self._windows: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self.rate_limited = 0
+    
+    def delay(self):
+        """Sleep for the simulated network latency"""
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms > 0 else 0.0
+        time.sleep((self.latency_ms + jitter) / 1000)
+    
+    def admit(self, host: str) -> Optional[float]:
+        """
+        Count a request against the host's window
+        
+        Returns:
+            None if admitted, otherwise seconds until the window has room again
+        """
+        if not self.requests_per_minute:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(host, deque())
+            while window and now - window[0] >= 60:
+                window.popleft()
+            if len(window) >= self.requests_per_minute:
+                self.rate_limited += 1
+                return 60 - (now - window[0])
+            window.append(now)
+            return None
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter that records or replays HTTP responses
+    
+    In replay mode unrecorded requests get a 404 'Not Recorded' response (never the
+    network). In record mode requests go through the wrapped adapter and every
+    response is archived.
+    """
+    
+    def __init__(self, archive: ResponseArchive, mode: str = 'replay',
+                 conditions: Optional[SimulatedConditions] = None,
+                 upstream_adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        if mode not in ('replay', 'record'):
+            raise ValueError(f"Unknown replay mode: {mode}. Use 'replay' or 'record'")
+        self.archive = archive
+        self.mode = mode
+        self.conditions = conditions or SimulatedConditions()
+        self.upstream_adapter = upstream_adapter
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.mode == 'record':
+            if self.upstream_adapter is None:
+                raise RuntimeError("Record mode requires an upstream adapter")
+            response = self.upstream_adapter.send(request, stream=False, timeout=timeout,
+                                                  verify=verify, cert=cert, proxies=proxies)
+            if response.status_code < 500:
+                self.archive.save(request.method, request.url, request.body, response)
+                self.recorded += 1
+            return response
+        
+        host = urlsplit(request.url).netloc.lower()
+        retry_after = self.conditions.admit(host)
+        self.conditions.delay()
+        if retry_after is not None:
+            return self._rate_limited_response(request, host, retry_after)
+        
+        record = self.archive.load(request.method, request.url, request.body)
+        if record is None:
+            self.misses += 1
+            logger.warning(f"No recorded response for {request.method} {normalize_url(request.url)}")
+            return self._build_response(request, 404, 'Not Recorded', {'Content-Type': 'text/plain'},
+                                        b'No recorded response for this request', 'utf-8')
+        
+        self.hits += 1
+        body = record['body']
+        content = base64.b64decode(body) if record.get('body_base64') else body.encode('utf-8')
+        return self._build_response(request, record['status'], record.get('reason') or '',
+                                    record.get('headers', {}), content, record.get('encoding'))
+    
+    def close(self):
+        if self.upstream_adapter is not None:
+            self.upstream_adapter.close()
+    
+    def _rate_limited_response(self, request, host: str, retry_after: float) -> requests.Response:
+        """The upstream's own way of rejecting a request over the rate limit"""
+        if host.endswith('alphavantage.co'):
+            body = json.dumps({'Note': ALPHA_VANTAGE_RATE_LIMIT_NOTE}).encode()
+            return self._build_response(request, 200, 'OK', {'Content-Type': 'application/json'}, body, 'utf-8')
+        headers = {'Content-Type': 'application/json', 'Retry-After': str(max(1, int(retry_after + 0.5)))}
+        body = json.dumps({'error': 'Too Many Requests'}).encode()
+        return self._build_response(request, 429, 'Too Many Requests', headers, body, 'utf-8')
+    
+    def _build_response(self, request, status: int, reason: str, headers: Dict[str, str],
+                        content: bytes, encoding: Optional[str]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        response.encoding = encoding
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def create_replay_session(archive: ResponseArchive, mode: str = 'replay',
+                          conditions: Optional[SimulatedConditions] = None) -> requests.Session:
+    """
+    Create a session whose http and https traffic goes through a ReplayAdapter
+    
+    Record mode wraps the pooled transport from http_transport, so recordings are made
+    with the same retries and connection reuse as normal runs.
+    """
+    upstream_adapter = None
+    if mode == 'record':
+        upstream_adapter = create_session().get_adapter('https://')
+    
+    adapter = ReplayAdapter(archive, mode=mode, conditions=conditions, upstream_adapter=upstream_adapter)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
@@ -69,6 +69,54 @@ class YahooFinanceProvider(DataProvider):
             logger.error(f"Error fetching data for {ticker}: {str(e)}")
             return pd.DataFrame()
     
+    def fetch_multiple(self, tickers: List[str], timeframe: str,
+                       start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch many tickers with one multi-ticker yfinance download
+        
+        Tickers missing from the batch result are retried one by one through fetch_data.
+        
+        Returns:
+            Dict mapping ticker -> DataFrame (tickers without data are omitted)
+        """
+        if timeframe != '1d':
+            logger.warning(f"YahooFinance doesn't support {timeframe} for historical data. Using daily.")
+            timeframe = '1d'
+        
+        tickers = list(dict.fromkeys(tickers))
+        results = {}
+        try:
+            # Same adjustment and corporate-action columns as Ticker.history, exchange timezones kept
+            data = yf.download(tickers, start=start_date, end=end_date, interval=timeframe,
+                               group_by='ticker', auto_adjust=True, actions=True, ignore_tz=False,
+                               threads=True, progress=False)
+        except Exception as e:
+            logger.error(f"Batch download failed for {len(tickers)} tickers: {e}")
+            data = None
+        
+        if data is not None and not data.empty and isinstance(data.columns, pd.MultiIndex):
+            batch_tickers = set(data.columns.get_level_values(0))
+            for ticker in tickers:
+                if ticker not in batch_tickers:
+                    continue
+                df = data[ticker].dropna(how='all')
+                if df.empty:
+                    continue
+                df.columns = [col.title() for col in df.columns]
+                df.columns.name = None
+                df.attrs['provider_source'] = self.name
+                df.attrs['timeframe'] = timeframe
+                df.attrs['ticker'] = ticker
+                results[ticker] = df
+        
+        missing = [ticker for ticker in tickers if ticker not in results]
+        if missing:
+            logger.info(f"Batch download returned {len(results)}/{len(tickers)} tickers; "
+                        f"fetching {len(missing)} individually")
+            results.update(super().fetch_multiple(missing, timeframe, start_date, end_date))
+        
+        return results
+    
     def get_rate_limit(self) -> Dict[str, int]:
         """Return rate limit configuration for Yahoo Finance"""
         return {
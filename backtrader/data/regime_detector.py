@@ -2,6 +2,7 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from .database_manager import get_database_manager, execute_query
+from .database_integration import DatabaseIntegration
 
 # Import the enhanced asset scanner from Module 12
 try:
@@ -35,6 +36,9 @@ class RegimeDetector:
         if not self.db_manager.is_connected and use_database:
             print("Warning: Database connection not available. Using mock regime data.")
         
+        # Research lookups, bulk-preloaded for the active backtest window
+        self.research = DatabaseIntegration() if self.use_database else None
+        
         # Updated regime mappings based on your 4 regime system
         self.regime_mappings = {
             'Goldilocks': ['Risk Assets', 'Growth', 'Large Caps', 'High Beta'],
@@ -43,6 +47,39 @@ class RegimeDetector:
             'Reflation': ['Cyclicals', 'Value', 'International', 'SMID Caps']
         }
     
+    def preload_backtest_window(self, start_date: datetime, end_date: datetime, tickers: List[str]) -> Dict[str, int]:
+        """
+        Switch to backtest mode: bulk-load the window's research and scanner rows
+        
+        Regime lookups and scanner scans for dates in [start_date, end_date] are then
+        answered from in-memory as-of indexes instead of one query per bar.
+        
+        Args:
+            start_date: First backtest date
+            end_date: Last backtest date
+            tickers: Asset universe the strategy scans
+            
+        Returns:
+            Dict with the number of rows loaded per source
+        """
+        loaded = {'research_rows': 0, 'trending_rows': 0, 'scanner_rows': 0}
+        if not self.use_database:
+            return loaded
+        
+        loaded.update(self.research.preload_range(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), tickers))
+        if hasattr(self.asset_scanner, 'preload_window'):
+            loaded['scanner_rows'] = self.asset_scanner.preload_window(tickers, start_date, end_date)
+        self.cache.clear()
+        return loaded
+    
+    def clear_backtest_window(self):
+        """Leave backtest mode and drop the preloaded rows"""
+        if self.research is not None:
+            self.research.clear_preload()
+        if hasattr(self.asset_scanner, 'clear_preload'):
+            self.asset_scanner.clear_preload()
+        self.cache.clear()
+    
     def get_market_regime(self, date: datetime) -> Tuple[str, float]:
         if self.use_database:
             return self._get_regime_from_database(date)
@@ -56,13 +93,17 @@ class RegimeDetector:
         if date_str in self.cache:
             return self.cache[date_str]
         
-        research_data = execute_query("""
-            SELECT regime, buckets, created_at FROM research 
-            WHERE created_at <= :date
-            AND regime IS NOT NULL
-            ORDER BY created_at DESC 
-            LIMIT 1
-        """, {"date": date_str})
+        if self.research is not None and self.research.preloaded is not None:
+            # Same as-of row as the query below; served from the window preload when it covers date
+            research_data = self.research.get_macro_research_data(date_str)['research_data']
+        else:
+            research_data = execute_query("""
+                SELECT regime, buckets, created_at FROM research 
+                WHERE created_at <= :date
+                AND regime IS NOT NULL
+                ORDER BY created_at DESC 
+                LIMIT 1
+            """, {"date": date_str})
         
         if research_data and research_data[0].get('regime'):
             regime = research_data[0]['regime']
@@ -4,10 +4,17 @@ from typing import Dict, List, Optional, Callable
 from datetime import datetime
 import pandas as pd
 
+from .ohlcv_resampler import timeframe_to_timedelta, resample_ohlcv
+from .asset_buckets import get_asset_type
+
 # Import at runtime to avoid circular imports
 
 logger = logging.getLogger(__name__)
 
+# Resolutions fetched from providers as-is; any other timeframe is derived locally
+# from the coarsest of these that evenly divides it
+NATIVE_TIMEFRAMES = ['1min', '5min', '15min', '30min', '1h', '1d']
+
 
 class TimeframeManager:
     """
@@ -57,6 +64,8 @@ class TimeframeManager:
                 'rate_limits': active_provider.get_rate_limit()
             }
         
+        self._asset_types: Dict[str, str] = {}
+        
         logger.info(f"TimeframeManager initialized with {self.provider_name} provider")
         logger.info(f"Supported timeframes: {self.supported_timeframes}")
     
@@ -83,12 +92,13 @@ class TimeframeManager:
         """
         logger.info(f"Fetching multi-timeframe data for {ticker}: {timeframes}")
         
-        # Validate timeframes
-        unsupported = [tf for tf in timeframes if tf not in self.supported_timeframes]
+        # Validate timeframes (derivable timeframes only need their native source)
+        unsupported = [tf for tf in timeframes
+                       if tf not in self.supported_timeframes and self.resolve_derivation(tf) is None]
         if unsupported:
             logger.warning(f"Unsupported timeframes for {self.provider_name}: {unsupported}")
             logger.warning(f"Will skip: {unsupported}")
-            timeframes = [tf for tf in timeframes if tf in self.supported_timeframes]
+            timeframes = [tf for tf in timeframes if tf not in unsupported]
         
         if not timeframes:
             logger.error("No supported timeframes to fetch")
@@ -96,6 +106,13 @@ class TimeframeManager:
         
         results = {}
         total_timeframes = len(timeframes)
+        native_data: Dict[str, Optional[pd.DataFrame]] = {}
+        
+        def get_native(timeframe: str) -> Optional[pd.DataFrame]:
+            # Each native resolution is fetched at most once per call
+            if timeframe not in native_data:
+                native_data[timeframe] = self._fetch_timeframe(ticker, timeframe, start_date, end_date)
+            return native_data[timeframe]
         
         for i, timeframe in enumerate(timeframes):
             try:
@@ -103,24 +120,13 @@ class TimeframeManager:
                     progress_callback(f"Fetching {ticker} {timeframe}", 
                                     int((i / total_timeframes) * 100))
                 
-                logger.info(f"Fetching {ticker} data for timeframe: {timeframe}")
-                if self.data_manager:
-                    data = self.data_manager.download_data(
-                        ticker=ticker,
-                        start_date=start_date, 
-                        end_date=end_date,
-                        interval=timeframe,
-                        use_cache=True
+                source_timeframe = self.resolve_derivation(timeframe)
+                if source_timeframe:
+                    data = self._get_derived_timeframe(
+                        ticker, timeframe, source_timeframe, start_date, end_date, get_native
                     )
                 else:
-                    # Use provider directly
-                    active_provider = self.registry.get_active()
-                    data = active_provider.fetch_data(
-                        ticker=ticker,
-                        timeframe=timeframe,
-                        start_date=start_date,
-                        end_date=end_date
-                    )
+                    data = get_native(timeframe)
                 
                 if data is not None and not data.empty:
                     results[timeframe] = data
@@ -138,6 +144,139 @@ class TimeframeManager:
         logger.info(f"Multi-timeframe fetch complete. Retrieved {len(results)}/{total_timeframes} timeframes")
         return results
     
+    def resolve_derivation(self, timeframe: str) -> Optional[str]:
+        """
+        Find the native timeframe a timeframe should be derived from
+        
+        Intraday targets (e.g. '2h', '4h', '45min') derive from intraday natives and
+        multi-day targets (e.g. '1w') from '1d'. Only natives the provider supports
+        are considered, and the coarsest one that evenly divides the target wins.
+        
+        Returns:
+            Native source timeframe, or None if the timeframe is fetched directly
+        """
+        if timeframe in NATIVE_TIMEFRAMES:
+            return None
+        
+        try:
+            target_width = timeframe_to_timedelta(timeframe)
+        except ValueError:
+            return None
+        
+        one_day = pd.Timedelta(days=1)
+        candidates = []
+        for native in NATIVE_TIMEFRAMES:
+            if native not in self.supported_timeframes:
+                continue
+            native_width = timeframe_to_timedelta(native)
+            if (native_width < target_width and target_width % native_width == pd.Timedelta(0)
+                    and (native_width < one_day) == (target_width < one_day)):
+                candidates.append((native_width, native))
+        
+        return max(candidates)[1] if candidates else None
+    
+    def _fetch_timeframe(self, ticker: str, timeframe: str,
+                         start_date: datetime, end_date: datetime) -> Optional[pd.DataFrame]:
+        """Fetch one timeframe through the data manager (cached) or the active provider"""
+        logger.info(f"Fetching {ticker} data for timeframe: {timeframe}")
+        if self.data_manager:
+            return self.data_manager.download_data(
+                ticker=ticker,
+                start_date=start_date, 
+                end_date=end_date,
+                interval=timeframe,
+                use_cache=True
+            )
+        
+        # Use provider directly
+        active_provider = self.registry.get_active()
+        return active_provider.fetch_data(
+            ticker=ticker,
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date
+        )
+    
+    def _get_derived_timeframe(
+        self,
+        ticker: str,
+        timeframe: str,
+        source_timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        get_native: Callable[[str], Optional[pd.DataFrame]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a derived timeframe from cache, or derive it from its native source
+        
+        Derived series are cached under their own timeframe with lineage metadata, so
+        later requests skip both the provider and the aggregation.
+        
+        Args:
+            ticker: Symbol being fetched
+            timeframe: Derived timeframe (e.g. '4h')
+            source_timeframe: Native timeframe it is derived from (e.g. '1h')
+            start_date: Start date for data
+            end_date: End date for data
+            get_native: Callable returning the native DataFrame for a timeframe
+            
+        Returns:
+            Derived DataFrame, or None if the native data is unavailable
+        """
+        if self.data_manager:
+            cached = self.data_manager._load_from_cache(ticker, start_date, end_date, timeframe)
+            if isinstance(cached, pd.DataFrame) and not cached.empty:
+                return cached
+        
+        source = get_native(source_timeframe)
+        if source is None or source.empty:
+            return None
+        
+        derived = self.derive_timeframe(source, ticker, timeframe, source_timeframe)
+        if self.data_manager and not derived.empty:
+            self.data_manager._save_to_cache(ticker, start_date, end_date, derived, timeframe)
+        return derived
+    
+    def derive_timeframe(self, source: pd.DataFrame, ticker: str, timeframe: str,
+                         source_timeframe: str) -> pd.DataFrame:
+        """
+        Aggregate native bars into a coarser timeframe and record its lineage
+        
+        Equities use bins anchored at the 09:30 session open; crypto uses 24/7 bins.
+        
+        Returns:
+            Derived DataFrame with 'derived_from' and 'lineage' attrs
+        """
+        asset_type = self._get_asset_type(ticker)
+        derived = resample_ohlcv(source, timeframe, asset_type)
+        
+        derived.attrs = dict(source.attrs)
+        derived.attrs.pop('cache_timestamp', None)
+        derived.attrs['timeframe'] = timeframe
+        derived.attrs['derived_from'] = source_timeframe
+        derived.attrs['lineage'] = {
+            'source_timeframe': source_timeframe,
+            'source_provider': source.attrs.get('provider_source', self.provider_name),
+            'source_cache_timestamp': source.attrs.get('cache_timestamp'),
+            'source_rows': len(source),
+            'source_start': source.index[0].isoformat(),
+            'source_end': source.index[-1].isoformat(),
+            'asset_type': asset_type,
+            'origin': 'epoch' if asset_type == 'crypto' else '09:30',
+            'derived_at': datetime.now().isoformat()
+        }
+        
+        logger.info(f"Derived {len(derived)} {ticker} {timeframe} records from {len(source)} {source_timeframe} records")
+        return derived
+    
+    def _get_asset_type(self, ticker: str) -> str:
+        """Classify a ticker as 'crypto' or 'stock' for session-aware aggregation"""
+        if ticker not in self._asset_types:
+            registry = getattr(self.data_manager, 'registry', None) if self.data_manager else self.registry
+            provider = registry.get_active() if registry is not None else None
+            self._asset_types[ticker] = get_asset_type(ticker, provider)
+        return self._asset_types[ticker]
+    
     def batch_download(
         self,
         tickers: List[str],
@@ -82,7 +82,12 @@ def run_regime_backtest(start_date, end_date, strategy_class=None, cash=100000,
     print(f'Starting Portfolio Value: {cerebro.broker.getvalue():.2f}')
     print(f'Asset Universe: {len(all_possible_assets)} assets from buckets: {bucket_names}')
     
-    results = cerebro.run()
+    # Backtest mode: regime and scanner lookups come from one bulk load of the window
+    regime_detector.preload_backtest_window(start_date, end_date, all_possible_assets)
+    try:
+        results = cerebro.run()
+    finally:
+        regime_detector.clear_backtest_window()
     
     print(f'Final Portfolio Value: {cerebro.broker.getvalue():.2f}')
     
@@ -138,7 +138,12 @@ def run_regime_backtest_optimized(
     # Run backtest
     import time
     start_time = time.time()
-    results = cerebro.run()
+    # Backtest mode: regime and scanner lookups come from one bulk load of the window
+    regime_detector.preload_backtest_window(start_date, end_date, all_possible_assets)
+    try:
+        results = cerebro.run()
+    finally:
+        regime_detector.clear_backtest_window()
     run_time = time.time() - start_time
     
     print(f'Final Portfolio Value: ${cerebro.broker.getvalue():,.2f}')
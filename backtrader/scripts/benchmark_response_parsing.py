@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark Alpha Vantage time-series response parsing
+
+Compares the legacy pandas path (DataFrame.from_dict + to_datetime + astype(float))
+with the array parser in data/providers/alpha_vantage/response_parser.py on recorded
+API responses, and the standard library JSON decoder with orjson when it is installed.
+Decoding and parsing are timed separately because they have different memory profiles.
+Both parsers must produce identical frames.
+
+Usage Examples:
+    # Benchmark recorded responses (raw JSON bodies saved from the API)
+    python scripts/benchmark_response_parsing.py responses/AAPL_1min_2024-03.json
+
+    # Benchmark a synthetic month of 1-minute bars
+    python scripts/benchmark_response_parsing.py --synthetic-bars 20000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.alpha_vantage.response_parser import find_time_series_key, orjson, time_series_to_frame
+
+
+def legacy_parse(time_series: Dict) -> pd.DataFrame:
+    """The parsing path the providers used before the array parser"""
+    df = pd.DataFrame.from_dict(time_series, orient='index')
+    df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+    df.index = pd.to_datetime(df.index)
+    return df.astype(float).sort_index()
+
+
+def synthetic_response(bars: int) -> bytes:
+    """A TIME_SERIES_INTRADAY 1min payload with the given number of bars, newest first"""
+    start = datetime(2024, 3, 1, 4, 0)
+    series = {}
+    for i in reversed(range(bars)):
+        price = 150.0 + (i % 500) * 0.01
+        series[(start + timedelta(minutes=i)).strftime('%Y-%m-%d %H:%M:%S')] = {
+            '1. open': f"{price:.4f}",
+            '2. high': f"{price + 0.05:.4f}",
+            '3. low': f"{price - 0.05:.4f}",
+            '4. close': f"{price + 0.01:.4f}",
+            '5. volume': str(1000 + i % 97)
+        }
+    return json.dumps({
+        'Meta Data': {'1. Information': 'Synthetic intraday (1min)'},
+        'Time Series (1min)': series
+    }).encode()
+
+
+def measure(func: Callable, arg, repeat: int) -> Tuple[float, float]:
+    """Return (median seconds, peak traced MiB) for one call of func(arg)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / (1024 * 1024)
+
+
+def benchmark(name: str, content: bytes, repeat: int) -> Dict:
+    """Benchmark decoding and parsing of one response and check both parsers agree"""
+    data = json.loads(content)
+    time_series = data[find_time_series_key(data)]
+    expected = legacy_parse(time_series)
+    pd.testing.assert_frame_equal(time_series_to_frame(time_series), expected, check_freq=False)
+
+    stages = {
+        'decode json': (json.loads, content),
+        'parse legacy': (legacy_parse, time_series),
+        'parse array': (time_series_to_frame, time_series)
+    }
+    if orjson is not None:
+        stages['decode orjson'] = (orjson.loads, content)
+
+    print(f"{name}: {len(expected)} bars, {len(content) / 1024:.0f} KiB")
+    results = {'name': name, 'rows': len(expected)}
+    for stage, (func, arg) in stages.items():
+        seconds, peak = measure(func, arg, repeat)
+        results[stage] = {'seconds': seconds, 'peak_mib': peak}
+        print(f"  {stage:<14} {seconds * 1000:8.1f} ms  peak {peak:6.1f} MiB")
+
+    legacy_total = results['decode json']['seconds'] + results['parse legacy']['seconds']
+    decoder = 'decode orjson' if orjson is not None else 'decode json'
+    array_total = results[decoder]['seconds'] + results['parse array']['seconds']
+    print(f"  end to end: {legacy_total * 1000:.1f} ms -> {array_total * 1000:.1f} ms "
+          f"({legacy_total / array_total:.1f}x faster)")
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('responses', nargs='*', help='Recorded Alpha Vantage JSON response files')
+    parser.add_argument('--synthetic-bars', type=int, default=0,
+                        help='Also benchmark a synthetic 1min response with this many bars')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per path (default: 5)')
+    args = parser.parse_args(argv)
+
+    if not args.responses and not args.synthetic_bars:
+        # A full month of 1-minute bars including extended hours
+        args.synthetic_bars = 21 * 16 * 60
+
+    if orjson is None:
+        print("orjson not installed: only the standard library decoder is benchmarked")
+
+    for path in args.responses:
+        benchmark(Path(path).name, Path(path).read_bytes(), args.repeat)
+    if args.synthetic_bars:
+        benchmark('synthetic', synthetic_response(args.synthetic_bars), args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
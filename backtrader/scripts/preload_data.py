@@ -16,6 +16,12 @@ Usage Examples:
     # Resume interrupted download
     python scripts/preload_data.py --resume PLAN_20240101_AAPL_multi
 
+    # Spread a large preload over several days within 500 API calls/day, next backtest's tickers first
+    python scripts/preload_data.py --bucket "Risk Assets" --timeframes 1h,4h,1d --period 2y --daily-quota 500 --priority AAPL,MSFT
+
+    # Continue a quota-limited preload (re-running the same command works too)
+    python scripts/preload_data.py --resume PRELOAD_20220101_20240101_3f2a9c1b7e --daily-quota 500
+
     # Download crypto data
     python scripts/preload_data.py --tickers BTC,ETH --timeframes 1d --period 6m --provider alpha_vantage
 
@@ -45,6 +51,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data.data_manager import DataManager
 from data.timeframe_manager import TimeframeManager
+from data.preload_planner import PreloadPlanner
 from data.asset_buckets import AssetBucketManager
 from data.providers.alpha_vantage.bulk_fetcher import BulkDataFetcher
 from data.providers.alpha_vantage.checkpoint_manager import CheckpointManager
@@ -104,7 +111,11 @@ class DataPreloader:
     def _signal_handler(self, signum, frame):
         """Handle interruption signals gracefully"""
         print(f"\n⚠️  Received signal {signum}. Saving checkpoint...")
-        if self.active_plan_id and self.supports_bulk:
+        if self.active_plan_id and self.active_plan_id.startswith('PRELOAD_'):
+            # Preload plans are saved after every unit
+            print(f"   💾 Preload plan saved: {self.active_plan_id}")
+            print(f"   🔄 Resume with: python scripts/preload_data.py --resume {self.active_plan_id} --daily-quota N")
+        elif self.active_plan_id and self.supports_bulk:
             print(f"   💾 Checkpoint saved for plan: {self.active_plan_id}")
             print(f"   🔄 Resume with: python scripts/preload_data.py --resume {self.active_plan_id}")
         sys.exit(0)
@@ -364,6 +375,94 @@ class DataPreloader:
         
         return success_count == len(plans)
     
+    def download_planned(self, tickers: List[str], timeframes: List[str],
+                         start_date: datetime, end_date: datetime, daily_quota: int,
+                         priority_tickers: Optional[List[str]] = None,
+                         plan_dir: str = 'data/preload_plans', force: bool = False,
+                         estimate_only: bool = False) -> bool:
+        """
+        Quota-limited preload that continues across runs
+        
+        Only fetches what the cache is missing, highest-priority tickers first, and
+        stops when today's API call budget is spent. Re-running the same command (or
+        --resume with the plan ID) continues the plan.
+        
+        Args:
+            tickers: List of ticker symbols
+            timeframes: List of timeframes
+            start_date: Start date
+            end_date: End date
+            daily_quota: API calls allowed per day
+            priority_tickers: Tickers to fetch first
+            plan_dir: Directory for persisted plans
+            force: Ignore existing cache coverage
+            estimate_only: Only print the schedule
+            
+        Returns:
+            True if the plan finished without failed units
+        """
+        planner = PreloadPlanner(self.data_manager, daily_quota, plan_dir=plan_dir)
+        plan = planner.load_or_create(tickers, timeframes, start_date, end_date,
+                                      priority_tickers=priority_tickers, force=force)
+        return self._run_plan(planner, plan, estimate_only)
+    
+    def resume_planned(self, plan_id: str, daily_quota: int, plan_dir: str = 'data/preload_plans') -> bool:
+        """
+        Continue a persisted quota-limited preload plan
+        
+        Args:
+            plan_id: PRELOAD_... plan ID
+            daily_quota: API calls allowed per day
+            plan_dir: Directory for persisted plans
+            
+        Returns:
+            True if the plan finished without failed units
+        """
+        planner = PreloadPlanner(self.data_manager, daily_quota, plan_dir=plan_dir)
+        plan = planner.load_plan(plan_id)
+        if not plan:
+            print(f"❌ Preload plan not found: {plan_id}")
+            return False
+        if plan.provider != self.provider_name:
+            print(f"❌ Plan {plan_id} was built for {plan.provider}; rerun with --provider {plan.provider}")
+            return False
+        
+        plan.daily_quota = daily_quota
+        return self._run_plan(planner, plan, estimate_only=False)
+    
+    def _run_plan(self, planner: PreloadPlanner, plan, estimate_only: bool) -> bool:
+        """Print the schedule of a preload plan and execute today's share"""
+        schedule = planner.schedule(plan)
+        pending_calls = sum(unit.calls for unit in plan.pending_units)
+        
+        print(f"\n🗓️  PRELOAD PLAN: {plan.plan_id}")
+        print(f"   📋 {len(plan.pending_units)}/{len(plan.units)} units pending, ~{pending_calls} API calls")
+        print(f"   📊 Daily quota: {plan.daily_quota} calls ({plan.usage.get(datetime.now().date().isoformat(), 0)} used today)")
+        for day in schedule:
+            tickers = ', '.join(day['tickers'][:5]) + (' ...' if len(day['tickers']) > 5 else '')
+            print(f"   📅 {day['date']}: {day['calls']} calls, {day['units']} units ({tickers})")
+        
+        if estimate_only:
+            print("\n✅ Estimation complete (--estimate-only specified)")
+            return True
+        
+        self.active_plan_id = plan.plan_id
+        result = planner.execute(plan)
+        self.active_plan_id = None
+        
+        print(f"\n📊 TODAY'S PRELOAD COMPLETE")
+        print(f"   ✅ Units fetched: {result['completed_units']}")
+        print(f"   📞 API calls today: {result['calls_today']}/{plan.daily_quota}")
+        if result['assembled_tickers']:
+            print(f"   🧩 Ready: {', '.join(result['assembled_tickers'])}")
+        if result['failed_units']:
+            print(f"   ❌ Failed units: {result['failed_units']}")
+        if not result['complete']:
+            print(f"   ⏳ {result['pending_units']} units left")
+            print(f"   🔄 Continue tomorrow with: python scripts/preload_data.py --resume {plan.plan_id} --daily-quota {plan.daily_quota}")
+        
+        return not any(unit.status == 'failed' for unit in plan.units)
+    
     def resume_download(self, plan_id: str) -> bool:
         """
         Resume interrupted download from checkpoint
@@ -482,7 +581,7 @@ def main():
     
     # Resume and management
     parser.add_argument('--resume', type=str,
-                       help='Resume download from checkpoint ID')
+                       help='Resume download from checkpoint ID (or PRELOAD_... plan ID)')
     parser.add_argument('--list-checkpoints', action='store_true',
                        help='List available checkpoints')
     parser.add_argument('--cache-stats', action='store_true',
@@ -494,6 +593,14 @@ def main():
     parser.add_argument('--estimate-only', action='store_true',
                        help='Only show download estimates, don\'t download')
     
+    # Quota-limited planning
+    parser.add_argument('--daily-quota', type=int,
+                       help='Spread the download over days, spending at most this many API calls per day')
+    parser.add_argument('--priority', type=str,
+                       help='Comma-separated tickers to fetch first with --daily-quota (e.g. the next backtest\'s)')
+    parser.add_argument('--plan-dir', type=str, default='data/preload_plans',
+                       help='Directory for quota-limited preload plans [default: data/preload_plans]')
+    
     args = parser.parse_args()
     
     try:
@@ -509,6 +616,13 @@ def main():
             preloader.show_cache_stats()
             return
         
+        if args.resume and args.resume.startswith('PRELOAD_'):
+            if not args.daily_quota:
+                print("❌ --daily-quota is required to resume a preload plan")
+                sys.exit(1)
+            success = preloader.resume_planned(args.resume, args.daily_quota, plan_dir=args.plan_dir)
+            sys.exit(0 if success else 1)
+        
         if args.resume:
             success = preloader.resume_download(args.resume)
             sys.exit(0 if success else 1)
@@ -539,6 +653,13 @@ def main():
         if len(tickers) > 5:
             print(f"          ... and {len(tickers) - 5} more")
         
+        if args.daily_quota:
+            priority = args.priority.split(',') if args.priority else None
+            success = preloader.download_planned(tickers, timeframes, start_date, end_date, args.daily_quota,
+                                                 priority_tickers=priority, plan_dir=args.plan_dir,
+                                                 force=args.force, estimate_only=args.estimate_only)
+            sys.exit(0 if success else 1)
+        
         # Estimate download
         estimates = preloader.estimate_download(tickers, timeframes)
         
@@ -0,0 +1,148 @@
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+import requests
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_manager import DataManager
+from data.providers.alpha_vantage.provider import AlphaVantageProvider
+from data.providers.yahoo_finance.provider import YahooFinanceProvider
+
+TODAY = pd.Timestamp.now().normalize()
+
+
+def _json_response(payload):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    response.encoding = 'utf-8'
+    return response
+
+
+class _FakeAlphaVantageSession:
+    """Answers Alpha Vantage queries from canned payloads and records them"""
+    
+    def __init__(self, bulk_symbols):
+        self.bulk_symbols = bulk_symbols
+        self.requests = []
+    
+    def get(self, url, params=None, timeout=None):
+        if url.endswith('digital_currency_list/'):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"currency code,currency name\nBTC,Bitcoin\nETH,Ethereum\n"
+            response.encoding = 'utf-8'
+            return response
+        
+        self.requests.append(params)
+        day = TODAY.strftime('%Y-%m-%d')
+        bar = {'1. open': '10', '2. high': '12', '3. low': '9', '4. close': '11', '5. volume': '100'}
+        if params['function'] == 'REALTIME_BULK_QUOTES':
+            return _json_response({'data': [
+                {'symbol': symbol, 'timestamp': f"{day} 16:00:00.000", 'open': '100', 'high': '102',
+                 'low': '99', 'close': '101', 'volume': '5000'}
+                for symbol in params['symbol'].split(',') if symbol in self.bulk_symbols
+            ]})
+        if params['function'] == 'TIME_SERIES_DAILY':
+            return _json_response({'Time Series (Daily)': {day: bar}})
+        if params['function'] == 'DIGITAL_CURRENCY_DAILY':
+            return _json_response({'Time Series (Digital Currency Daily)': {day: bar}})
+        raise AssertionError(f"Unexpected request: {params}")
+
+
+class TestBatchFetch:
+    """Universe-wide refreshes use bulk endpoints with a per-symbol fallback"""
+    
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_alpha_vantage_latest_bars_use_bulk_quotes(self):
+        session = _FakeAlphaVantageSession(bulk_symbols={'AAPL', 'MSFT'})
+        provider = AlphaVantageProvider(api_key='test_key', session=session)
+        provider.min_request_interval = 0
+        provider.get_crypto_provider().min_request_interval = 0
+        
+        bars = provider.fetch_latest_bars(['AAPL', 'MSFT', 'XYZ', 'BTC', 'BTCUSD'])
+        
+        functions = [params['function'] for params in session.requests]
+        # One bulk quote for the equities, one fallback for the symbol it missed,
+        # one daily request shared by both BTC aliases
+        assert functions == ['REALTIME_BULK_QUOTES', 'TIME_SERIES_DAILY', 'DIGITAL_CURRENCY_DAILY']
+        assert session.requests[0]['symbol'] == 'AAPL,MSFT,XYZ'
+        assert session.requests[1]['outputsize'] == 'compact'
+        
+        assert set(bars) == {'AAPL', 'MSFT', 'XYZ', 'BTC', 'BTCUSD'}
+        assert all(len(df) == 1 and df.index[0] == TODAY for df in bars.values())
+        assert bars['AAPL']['Close'].iloc[0] == 101.0
+        assert bars['XYZ']['Close'].iloc[0] == 11.0
+        assert bars['BTCUSD'].attrs['asset_type'] == 'crypto'
+    
+    def test_yahoo_multi_ticker_download_with_fallback(self):
+        index = pd.date_range('2024-01-02', periods=3, freq='D')
+        columns = pd.MultiIndex.from_product([['AAPL', 'MSFT'], ['Open', 'High', 'Low', 'Close', 'Volume']])
+        batch = pd.DataFrame(1.0, index=index, columns=columns)
+        batch.loc[:, 'MSFT'] = float('nan')  # MSFT failed inside the batch
+        single = pd.DataFrame({'open': [2.0], 'high': [2.0], 'low': [2.0], 'close': [2.0], 'volume': [2.0]},
+                              index=index[:1])
+        
+        with patch('data.providers.yahoo_finance.provider.yf.download', return_value=batch) as download, \
+             patch('data.providers.yahoo_finance.provider.yf.Ticker') as ticker_cls:
+            ticker_cls.return_value.history.return_value = single
+            frames = YahooFinanceProvider().fetch_multiple(['AAPL', 'MSFT'], '1d',
+                                                          datetime(2024, 1, 1), datetime(2024, 1, 5))
+        
+        assert download.call_count == 1
+        ticker_cls.assert_called_once_with('MSFT')
+        assert list(frames['AAPL']['Close']) == [1.0, 1.0, 1.0]
+        assert list(frames['MSFT']['Close']) == [2.0]
+    
+    def test_append_latest_bars_extends_cache(self):
+        data_manager = DataManager(cache_dir=self.temp_dir, provider_name='yahoo')
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 3)
+        history = pd.DataFrame({'Open': [1.0, 1.0], 'High': [1.0, 1.0], 'Low': [1.0, 1.0],
+                                'Close': [1.0, 1.0], 'Volume': [1.0, 1.0]},
+                               index=pd.DatetimeIndex(['2024-01-02', '2024-01-03']))
+        data_manager._save_to_cache('AAPL', start, end, history, '1d')
+        
+        latest = history.iloc[[-1]].copy()
+        latest.index = pd.DatetimeIndex(['2024-01-04'])
+        latest['Close'] = 5.0
+        provider = data_manager.registry.get_active()
+        with patch.object(provider, 'fetch_latest_bars', return_value={'AAPL': latest}) as fetch:
+            updated = data_manager.append_latest_bars(['AAPL', 'MSFT'])
+        
+        fetch.assert_called_once_with(['AAPL'])
+        assert list(updated['AAPL']['Close']) == [1.0, 1.0, 5.0]
+        cache_files = list((data_manager.cache_dir / 'yahoo' / 'AAPL' / '1d').glob('*.pkl'))
+        assert [path.name for path in cache_files] == ['AAPL_1d_20240101_20240104.pkl']
+        with open(cache_files[0], 'rb') as f:
+            assert len(pickle.load(f)) == 3
+    
+    def test_get_multiple_data_does_not_refetch_batch_misses(self):
+        data_manager = DataManager(cache_dir=self.temp_dir, provider_name='yahoo')
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 3)
+        history = pd.DataFrame({'Open': [1.0, 1.0], 'High': [1.0, 1.0], 'Low': [1.0, 1.0],
+                                'Close': [1.0, 1.0], 'Volume': [1.0, 1.0]},
+                               index=pd.DatetimeIndex(['2024-01-02', '2024-01-03']))
+        provider = data_manager.registry.get_active()
+        with patch.object(provider, 'fetch_multiple', return_value={'AAPL': history}) as fetch_multiple, \
+             patch.object(provider, 'fetch_data') as fetch_data:
+            feeds = data_manager.get_multiple_data(['AAPL', 'DELISTED'], start, end)
+        
+        # DELISTED came back empty from the batch, so it is not requested again one by one
+        fetch_multiple.assert_called_once()
+        assert fetch_multiple.call_args[0][0] == ['AAPL', 'DELISTED']
+        fetch_data.assert_not_called()
+        assert set(feeds) == {'AAPL'}
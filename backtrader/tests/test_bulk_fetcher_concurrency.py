@@ -0,0 +1,125 @@
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.alpha_vantage.bulk_fetcher import BulkDataFetcher
+from data.providers.alpha_vantage.client import AlphaVantageClient
+
+
+def _chunk_frame(start_date):
+    index = pd.date_range(start=start_date, periods=3, freq='D')
+    base = 100.0 + start_date.month
+    return pd.DataFrame({
+        'Open': [base, base + 1, base + 2],
+        'High': [base + 2, base + 3, base + 4],
+        'Low': [base - 1, base, base + 1],
+        'Close': [base + 1, base + 2, base + 3],
+        'Volume': [1000, 1100, 1200]
+    }, index=index)
+
+
+class TestBulkFetcherConcurrency:
+    """Tests for the concurrent chunk scheduler in BulkDataFetcher.execute_download_plan"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _fetcher(self, fetch):
+        client = Mock(spec=AlphaVantageClient)
+        client.fetch_data.side_effect = fetch
+        return BulkDataFetcher(client, os.path.join(self.temp_dir, "checkpoints"))
+
+    def _slow_fetch(self, ticker, timeframe, start_date, end_date):
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        # Earlier chunks take longer, so chunks complete out of order
+        time.sleep(0.3 if start_date.month < 4 else 0.1)
+        with self.lock:
+            self.in_flight -= 1
+        return _chunk_frame(start_date)
+
+    def test_chunks_download_in_parallel_and_assemble_in_order(self):
+        fetcher = self._fetcher(self._slow_fetch)
+        plan = fetcher.create_download_plan('AAPL', '1h', datetime(2023, 1, 1), datetime(2023, 12, 31))
+        assert plan.total_chunks == 6
+
+        updates = []
+        started = time.time()
+        result = fetcher.execute_download_plan(
+            plan, progress_callback=lambda status, percent, stats: updates.append(stats),
+            max_parallel=3, enable_checkpoints=False
+        )
+        elapsed = time.time() - started
+
+        assert self.peak_in_flight == 3
+        assert elapsed < 6 * 0.1 + 0.3
+        assert plan.completed_chunks == 6
+        assert result.index.is_monotonic_increasing
+        assert len(result) == 6 * 3
+
+        finished = [stats for stats in updates if 'current_chunk' in stats]
+        assert len(finished) == 6
+        assert finished[-1]['eta_seconds'] == 0
+        assert finished[-1]['chunks_per_minute'] > 0
+        assert finished[-1]['records_per_second'] > 0
+
+    def test_failed_chunk_is_retried_through_error_handler(self):
+        attempts = {}
+
+        def flaky_fetch(ticker, timeframe, start_date, end_date):
+            attempts[start_date] = attempts.get(start_date, 0) + 1
+            if start_date.month == 3 and attempts[start_date] == 1:
+                raise ConnectionError("connection error")
+            return _chunk_frame(start_date)
+
+        fetcher = self._fetcher(flaky_fetch)
+        fetcher.error_handler.base_delay = 0.01
+        plan = fetcher.create_download_plan('AAPL', '1h', datetime(2023, 1, 1), datetime(2023, 6, 30))
+
+        result = fetcher.execute_download_plan(plan, max_parallel=2, enable_checkpoints=False)
+
+        assert plan.failed_chunks == 0
+        assert len(result) == plan.total_chunks * 3
+        assert sorted(attempts.values()) == [1, 1, 2]
+        assert len(fetcher.error_handler.error_history) == 1
+
+    def test_interleaved_transient_failures_do_not_open_circuit(self):
+        attempts = {}
+
+        def flaky_fetch(ticker, timeframe, start_date, end_date):
+            # Every chunk fails once before succeeding
+            attempts[start_date] = attempts.get(start_date, 0) + 1
+            if attempts[start_date] == 1:
+                raise ConnectionError("connection error")
+            return _chunk_frame(start_date)
+
+        fetcher = self._fetcher(flaky_fetch)
+        fetcher.error_handler.base_delay = 0.01
+        plan = fetcher.create_download_plan('AAPL', '1h', datetime(2022, 1, 1), datetime(2023, 12, 31))
+        assert plan.total_chunks > 5
+
+        result = fetcher.execute_download_plan(plan, max_parallel=1, enable_checkpoints=False)
+
+        assert plan.failed_chunks == 0
+        assert plan.completed_chunks == plan.total_chunks
+        assert result is not None
+        assert len(fetcher.error_handler.error_history) == plan.total_chunks
+        assert not fetcher.error_handler.circuit_open
+        assert fetcher.error_handler.failure_count == 0
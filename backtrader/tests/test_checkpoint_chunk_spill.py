@@ -0,0 +1,121 @@
+import os
+import sys
+import shutil
+import tempfile
+from datetime import datetime
+from unittest.mock import Mock
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.alpha_vantage.bulk_fetcher import BulkDataFetcher, DownloadChunk
+from data.providers.alpha_vantage.checkpoint_manager import CheckpointManager
+from data.providers.alpha_vantage.client import AlphaVantageClient
+
+
+def _chunk_frame(start_date):
+    index = pd.date_range(start=start_date, periods=3, freq='D', name='Date')
+    base = 100.0 + start_date.month
+    return pd.DataFrame({
+        'Open': [base, base + 1, base + 2],
+        'High': [base + 2, base + 3, base + 4],
+        'Low': [base - 1, base, base + 1],
+        'Close': [base + 1, base + 2, base + 3],
+        'Volume': [1000, 1100, 1200]
+    }, index=index)
+
+
+class SimulatedCrash(Exception):
+    pass
+
+
+class TestCheckpointChunkSpill:
+    """Completed chunks are spilled with the checkpoint and reassembled on resume"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.checkpoint_dir = os.path.join(self.temp_dir, "checkpoints")
+        self.fetched = []
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _fetcher(self):
+        def fetch(ticker, timeframe, start_date, end_date):
+            self.fetched.append(start_date)
+            return _chunk_frame(start_date)
+
+        client = Mock(spec=AlphaVantageClient)
+        client.fetch_data.side_effect = fetch
+        return BulkDataFetcher(client, self.checkpoint_dir)
+
+    def _interrupted_download(self):
+        """Run a 3-chunk plan that crashes after its second chunk completes"""
+        fetcher = self._fetcher()
+        plan = fetcher.create_download_plan('AAPL', '1h', datetime(2023, 1, 1), datetime(2023, 6, 30))
+
+        def crash_after_two(status, percent, stats):
+            if stats['completed_chunks'] == 2:
+                raise SimulatedCrash()
+
+        try:
+            fetcher.execute_download_plan(plan, progress_callback=crash_after_two, max_parallel=1,
+                                          checkpoint_interval=1)
+        except SimulatedCrash:
+            pass
+        else:
+            raise AssertionError("download should have been interrupted")
+
+        plan_id = fetcher.list_resumable_downloads(ticker='AAPL')[0]['plan_id']
+        return fetcher, plan, plan_id
+
+    def test_resume_reassembles_spilled_chunks(self):
+        _, plan, plan_id = self._interrupted_download()
+        # The third chunk may already be in flight when the crash happens, but it was never spilled
+        assert len(self.fetched) >= 2
+
+        validation = self._fetcher().get_checkpoint_status(plan_id)
+        assert validation['corrupt_chunks'] == []
+        assert validation['can_resume']
+
+        self.fetched.clear()
+        result = self._fetcher().resume_download(plan_id)
+
+        assert self.fetched == [plan.chunks[2].start_date]
+        assert len(result) == 9
+        assert result.index.is_monotonic_increasing
+        expected = pd.concat([_chunk_frame(chunk.start_date) for chunk in plan.chunks])
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+        # Spilled chunks are removed once the download completes
+        assert not (CheckpointManager(self.checkpoint_dir).active_dir / plan_id).exists()
+
+    def test_corrupt_chunk_is_downloaded_again(self):
+        _, plan, plan_id = self._interrupted_download()
+        manager = CheckpointManager(self.checkpoint_dir)
+
+        chunk_file = manager.active_dir / plan_id / "chunk_0000.npz"
+        chunk_file.write_bytes(chunk_file.read_bytes()[:-10])
+
+        validation = manager.validate_checkpoint(plan_id)
+        assert validation['corrupt_chunks'] == [0]
+        assert not validation['valid']
+
+        self.fetched.clear()
+        result = self._fetcher().resume_download(plan_id)
+
+        assert sorted(self.fetched) == [plan.chunks[0].start_date, plan.chunks[2].start_date]
+        assert len(result) == 9
+
+    def test_chunk_round_trip_preserves_timezone_and_dtypes(self):
+        manager = CheckpointManager(self.checkpoint_dir)
+        data = _chunk_frame(datetime(2023, 1, 1)).tz_localize('America/New_York')
+        chunk = DownloadChunk(datetime(2023, 1, 1), datetime(2023, 1, 3), '1h', 'AAPL',
+                              status='completed', data=data)
+
+        assert manager.save_chunk_data("plan", 0, chunk)
+        restored = manager.load_chunk_data("plan", chunk)
+
+        pd.testing.assert_frame_equal(restored, data, check_freq=False)
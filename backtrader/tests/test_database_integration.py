@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Database Integration - Unit Tests
+
+Checks that range-preloaded macro, sentiment and trending lookups return the
+same answers as the per-date queries, without further database round trips.
+"""
+
+import unittest
+import sys
+import os
+from datetime import date, datetime
+from unittest.mock import Mock, patch
+
+# Add parent directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+
+from data.database_integration import DatabaseIntegration
+from data.regime_detector import RegimeDetector
+
+
+RESEARCH_ROWS = [
+    {'title': 'Week 1', 'regime': 'Deflation', 'buckets': ['Treasurys'], 'created_at': date(2024, 1, 1),
+     'plain_text': 'Weak demand and recession risk. Top considerations are: Treasurys > Risk Assets, and Gold > Energy.'},
+    {'title': 'Note', 'regime': None, 'buckets': None, 'created_at': date(2024, 1, 5),
+     'plain_text': 'Strong growth and expansion ahead.'},
+    {'title': 'Week 2', 'regime': 'Goldilocks', 'buckets': ['Growth'], 'created_at': date(2024, 1, 8),
+     'plain_text': 'Bullish but weak breadth. Top considerations are: Growth > Value.'},
+]
+
+TRENDING_ROWS = [
+    {'ticker': 'AAPL', 'market': 'trending', 'confidence': 0.9, 'date': date(2024, 1, 9)},
+    {'ticker': 'MSFT', 'market': 'trending', 'confidence': 0.8, 'date': date(2024, 1, 2)},
+    {'ticker': 'NVDA', 'market': 'trending', 'confidence': 0.6, 'date': date(2024, 1, 2)},
+]
+
+
+class TestDatabaseIntegrationPreload(unittest.TestCase):
+    """Test the bulk date-range preload path"""
+
+    def setUp(self):
+        """Create an integration instance that believes the database is connected"""
+        manager = Mock(is_connected=True)
+        with patch('data.database_integration.get_database_manager', return_value=manager):
+            self.integration = DatabaseIntegration()
+
+    @patch('data.database_integration.execute_query')
+    def test_preload_serves_per_date_lookups_from_memory(self, mock_execute_query):
+        """After preload, lookups inside the window issue no queries"""
+        mock_execute_query.side_effect = [list(map(dict, RESEARCH_ROWS)), list(map(dict, TRENDING_ROWS))]
+
+        loaded = self.integration.preload_range('2024-01-01', '2024-01-31', ['AAPL', 'MSFT', 'NVDA'])
+        self.assertEqual(loaded, {'research_rows': 3, 'trending_rows': 3})
+        self.assertEqual(mock_execute_query.call_count, 2)
+
+        macro = self.integration.get_macro_research_data('2024-01-06')
+        self.assertEqual(macro['regime'], 'Deflation')
+        self.assertEqual(set(macro['research_data'][0]), {'title', 'regime', 'buckets', 'created_at'})
+        self.assertEqual(self.integration.get_macro_research_data('2024-01-08')['regime'], 'Goldilocks')
+
+        sentiment = self.integration.get_market_sentiment_data('2024-01-06')
+        self.assertEqual(sentiment['research_count'], 2)
+        self.assertAlmostEqual(sentiment['sentiment_score'], 0.5)
+
+        self.assertEqual(self.integration.get_top_markets('2024-01-02'), ['Treasurys', 'Gold'])
+        self.assertEqual(self.integration.get_top_markets('2024-01-08'), ['Growth'])
+
+        trending = self.integration.get_trending_assets(['AAPL', 'MSFT', 'NVDA'], '2024-01-05', limit=5, min_confidence=0.7)
+        self.assertEqual(trending, ['MSFT'])
+        trending = self.integration.get_trending_assets(['AAPL', 'MSFT', 'NVDA'], '2024-01-10', limit=1, min_confidence=0.7)
+        self.assertEqual(trending, ['AAPL'])
+
+        self.assertEqual(mock_execute_query.call_count, 2)
+
+    @patch('data.database_integration.execute_query')
+    def test_sentiment_matches_per_date_query(self, mock_execute_query):
+        """Preloaded sentiment scores equal the scores computed from queried rows"""
+        latest_three = [{'plain_text': row['plain_text'], 'created_at': row['created_at']} for row in reversed(RESEARCH_ROWS)]
+        mock_execute_query.return_value = latest_three
+        queried = self.integration.get_market_sentiment_data('2024-01-10')
+
+        self.integration.cache.clear()
+        mock_execute_query.side_effect = [list(map(dict, RESEARCH_ROWS))]
+        self.integration.preload_range('2024-01-01', '2024-01-31')
+        preloaded = self.integration.get_market_sentiment_data('2024-01-10')
+
+        self.assertEqual(queried, preloaded)
+
+    @patch('data.database_integration.execute_query')
+    def test_dates_outside_window_query_database(self, mock_execute_query):
+        """Lookups outside the preloaded window or ticker set fall back to SQL"""
+        mock_execute_query.side_effect = [list(map(dict, RESEARCH_ROWS)), list(map(dict, TRENDING_ROWS))]
+        self.integration.preload_range('2024-01-01', '2024-01-31', ['AAPL'])
+
+        mock_execute_query.side_effect = None
+        mock_execute_query.return_value = []
+        self.integration.get_macro_research_data('2024-02-15')
+        self.integration.get_trending_assets(['AAPL', 'MSFT'], '2024-01-10')
+        self.assertEqual(mock_execute_query.call_count, 4)
+
+
+class TestRegimeDetectorBacktestWindow(unittest.TestCase):
+    """Test that the backtest window preload drives regime and scanner lookups"""
+
+    def setUp(self):
+        """Create a detector with a connected database and a mock scanner"""
+        manager = Mock(is_connected=True)
+        self.scanner = Mock()
+        self.scanner.preload_window.return_value = 7
+        with patch('data.regime_detector.get_database_manager', return_value=manager), \
+                patch('data.database_integration.get_database_manager', return_value=manager), \
+                patch('data.regime_detector.get_enhanced_asset_scanner', return_value=self.scanner):
+            self.detector = RegimeDetector()
+
+    @patch('data.regime_detector.execute_query')
+    @patch('data.database_integration.execute_query')
+    def test_window_preload_serves_regimes_without_queries(self, mock_integration_query, mock_detector_query):
+        """Regimes inside the preloaded window come from memory until the window is cleared"""
+        mock_integration_query.side_effect = [list(map(dict, RESEARCH_ROWS)), list(map(dict, TRENDING_ROWS))]
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+
+        loaded = self.detector.preload_backtest_window(start, end, ['AAPL', 'MSFT', 'NVDA'])
+        self.assertEqual(loaded, {'research_rows': 3, 'trending_rows': 3, 'scanner_rows': 7})
+        self.scanner.preload_window.assert_called_once_with(['AAPL', 'MSFT', 'NVDA'], start, end)
+
+        self.assertEqual(self.detector.get_market_regime(datetime(2024, 1, 6)), ('Deflation', 0.9))
+        self.assertEqual(self.detector.get_market_regime(datetime(2024, 1, 9)), ('Goldilocks', 0.9))
+        self.assertEqual(mock_integration_query.call_count, 2)
+        mock_detector_query.assert_not_called()
+
+        self.detector.clear_backtest_window()
+        self.scanner.clear_preload.assert_called_once_with()
+        self.assertIsNone(self.detector.research.preloaded)
+
+        mock_detector_query.return_value = [{'regime': 'Reflation'}]
+        self.assertEqual(self.detector.get_market_regime(datetime(2024, 1, 9)), ('Reflation', 0.9))
+        mock_detector_query.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Database Manager - Unit Tests
+
+Streaming queries and query instrumentation, exercised
+against a temporary SQLite database.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+
+from data.database_manager import DatabaseManager
+
+
+class TestDatabaseManagerStreaming(unittest.TestCase):
+    """Test streaming and instrumentation on DatabaseManager"""
+
+    def setUp(self):
+        """Create a small scanner table in a temporary SQLite database"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.manager = DatabaseManager(f"sqlite:///{os.path.join(self.tmpdir.name, 'test.db')}")
+        self.assertTrue(self.manager.is_connected)
+
+        with self.manager.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE scanner_historical (ticker TEXT, confidence REAL, date TEXT)")
+            conn.exec_driver_sql(
+                "INSERT INTO scanner_historical VALUES " +
+                ", ".join(f"('T{i}', {i / 10}, '2024-01-{i + 1:02d}')" for i in range(7))
+            )
+
+    def tearDown(self):
+        self.manager.close()
+        self.tmpdir.cleanup()
+
+    def test_stream_query_matches_execute_query(self):
+        """Streaming yields the same rows as the materializing path"""
+        query = "SELECT ticker, confidence FROM scanner_historical WHERE confidence >= :c ORDER BY ticker"
+
+        streamed = list(self.manager.stream_query(query, {"c": 0.2}, fetch_size=2))
+
+        self.assertEqual(streamed, self.manager.execute_query(query, {"c": 0.2}))
+        self.assertEqual(len(streamed), 5)
+
+    def test_stream_query_chunks(self):
+        """Chunks are column-oriented and bounded by chunk_size"""
+        query = "SELECT ticker, confidence FROM scanner_historical ORDER BY ticker"
+
+        frames = list(self.manager.stream_query_chunks(query, chunk_size=3))
+        self.assertEqual([len(frame) for frame in frames], [3, 3, 1])
+        combined = pd.concat(frames, ignore_index=True)
+        self.assertEqual(list(combined.columns), ['ticker', 'confidence'])
+        self.assertAlmostEqual(combined['confidence'].sum(), 2.1)
+
+        arrays = next(self.manager.stream_query_chunks(query, chunk_size=3, as_frame=False))
+        self.assertEqual(arrays['ticker'].tolist(), ['T0', 'T1', 'T2'])
+
+    def test_query_stats(self):
+        """Repeated queries accumulate stats across execute and stream paths"""
+        query = "SELECT * FROM scanner_historical"
+        self.manager.reset_query_stats()
+
+        self.manager.execute_query(query)
+        self.manager.execute_query(query)
+        list(self.manager.stream_query(query))
+
+        stats = self.manager.get_query_stats()[query]
+        self.assertEqual(stats['calls'], 3)
+        self.assertEqual(stats['rows'], 21)
+        self.assertGreaterEqual(stats['max_ms'], stats['avg_ms'])
+
+    def test_streaming_degrades_when_disconnected(self):
+        """No rows and no exception when the database is unavailable"""
+        self.manager.is_connected = False
+        self.assertEqual(list(self.manager.stream_query("SELECT 1")), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -367,6 +367,72 @@ class TestEnhancedAssetScanner(unittest.TestCase):
         self.assertFalse(scanner3.enable_database)
 
 
+class TestScannerWindowedQueries(unittest.TestCase):
+    """Test latest-per-timeframe queries and the backtest preload path"""
+    
+    def setUp(self):
+        """Set up a database-backed scanner with a few days of history"""
+        self.scanner = EnhancedAssetScanner(enable_database=True, lookback_days=10)
+        self.scanner.is_database_available = True
+        self.rows = [
+            {'ticker': 'AAPL', 'market': 'ranging', 'confidence': 0.95, 'timeframe': '1d', 'date': datetime(2024, 1, 2)},
+            {'ticker': 'AAPL', 'market': 'trending', 'confidence': 0.80, 'timeframe': '1d', 'date': datetime(2024, 1, 10)},
+            {'ticker': 'MSFT', 'market': 'breakout', 'confidence': 0.90, 'timeframe': '1d', 'date': datetime(2024, 1, 3)},
+            {'ticker': 'MSFT', 'market': 'ranging', 'confidence': 0.50, 'timeframe': '1d', 'date': datetime(2024, 1, 12)},
+        ]
+    
+    @patch('core.enhanced_asset_scanner.execute_query')
+    def test_query_is_window_bounded_and_latest_per_timeframe(self, mock_execute_query):
+        """Database path asks only for the latest row per (ticker, timeframe) in the window"""
+        mock_execute_query.return_value = [self.rows[1]]
+        
+        self.scanner._scan_from_database(['AAPL'], datetime(2024, 1, 15), 0.6)
+        
+        query, params = mock_execute_query.call_args[0]
+        self.assertIn('DISTINCT ON (ticker, timeframe)', query)
+        self.assertEqual(params['start_date'], '2024-01-05')
+        self.assertEqual(params['date'], '2024-01-15')
+    
+    @patch('core.enhanced_asset_scanner.execute_query')
+    def test_preloaded_window_answers_scans_from_memory(self, mock_execute_query):
+        """One bulk query serves every scan date inside the preloaded window"""
+        mock_execute_query.return_value = self.rows
+        
+        loaded = self.scanner.preload_window(['AAPL', 'MSFT'], datetime(2024, 1, 8), datetime(2024, 1, 20))
+        self.assertEqual(loaded, 4)
+        self.assertEqual(mock_execute_query.call_count, 1)
+        
+        # Latest row wins even when an older one is more confident
+        early = self.scanner._scan_from_database(['AAPL', 'MSFT'], datetime(2024, 1, 11), 0.6)
+        self.assertEqual(early['AAPL'].market, MarketCondition.TRENDING)
+        self.assertEqual(early['MSFT'].market, MarketCondition.BREAKOUT)
+        
+        # Latest MSFT row is below the threshold, so MSFT drops out
+        later = self.scanner._scan_from_database(['AAPL', 'MSFT'], datetime(2024, 1, 12), 0.6)
+        self.assertEqual(set(later), {'AAPL'})
+        
+        # Rows older than the lookback window are stale
+        stale = self.scanner._scan_from_database(['AAPL'], datetime(2024, 1, 20), 0.6)
+        self.assertEqual(stale, {})
+        
+        self.assertEqual(mock_execute_query.call_count, 1)
+    
+    @patch('core.enhanced_asset_scanner.execute_query')
+    def test_dates_outside_preload_fall_back_to_query(self, mock_execute_query):
+        """Scans outside the preloaded window or ticker set go to the database"""
+        mock_execute_query.return_value = self.rows
+        self.scanner.preload_window(['AAPL'], datetime(2024, 1, 8), datetime(2024, 1, 20))
+        
+        mock_execute_query.reset_mock()
+        mock_execute_query.return_value = []
+        self.scanner._scan_from_database(['AAPL'], datetime(2024, 2, 1), 0.6)
+        self.scanner._scan_from_database(['AAPL', 'MSFT'], datetime(2024, 1, 11), 0.6)
+        self.assertEqual(mock_execute_query.call_count, 2)
+        
+        self.scanner.clear_preload()
+        self.assertIsNone(self.scanner.get_scanner_status()['preloaded_window'])
+
+
 class TestScannerConfiguration(unittest.TestCase):
     """Test scanner configuration and parameter handling"""
     
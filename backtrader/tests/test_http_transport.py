@@ -0,0 +1,92 @@
+import gzip
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.http_transport import create_session, get_latency_stats
+
+BODY = b'{"Meta Data": {}, "Time Series (Daily)": {}}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves a gzip body with an ETag and answers revalidations with 304"""
+    
+    requests_seen = []
+    
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+            return
+        
+        payload = gzip.compress(BODY)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', '"v1"')
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.requests_seen = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHttpTransport:
+    """Pooled session with gzip, conditional GETs and latency histograms"""
+    
+    def test_conditional_get_replays_cached_body(self, server):
+        session = create_session(max_retries=0)
+        url = f"http://127.0.0.1:{server.server_port}/query?function=TIME_SERIES_DAILY"
+        
+        first = session.get(url, timeout=5)
+        second = session.get(url, timeout=5)
+        
+        assert first.status_code == 200 and not first.from_cache
+        assert first.content == BODY
+        assert 'gzip' in _Handler.requests_seen[0]['Accept-Encoding']
+        
+        # The revalidation carries the ETag and the 304 is answered from the cache
+        assert _Handler.requests_seen[1]['If-None-Match'] == '"v1"'
+        assert second.status_code == 200 and second.from_cache
+        assert second.json() == first.json()
+    
+    def test_latency_histogram_per_host(self, server):
+        session = create_session(max_retries=0)
+        url = f"http://127.0.0.1:{server.server_port}/query"
+        for _ in range(3):
+            session.get(url, timeout=5)
+        
+        stats = get_latency_stats(session)
+        host_stats = stats[f"127.0.0.1:{server.server_port}"]
+        assert host_stats['count'] == 3
+        assert sum(host_stats['buckets'].values()) == 3
+        assert host_stats['p50_ms'] is not None
+    
+    def test_connection_errors_are_retried_by_the_adapter(self):
+        session = create_session(max_retries=2)
+        adapter = session.get_adapter('https://www.alphavantage.co/query')
+        
+        assert adapter.max_retries.connect == 2
+        assert adapter.max_retries.read == 2
+        # Status codes such as 429 are left to the providers' error handling
+        assert adapter.max_retries.status == 0
@@ -0,0 +1,79 @@
+import os
+import sys
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.alpha_vantage.month_cache import IntradayMonthCache
+from data.providers.alpha_vantage.provider import AlphaVantageProvider
+
+
+def _month_response(month: str):
+    """TIME_SERIES_INTRADAY payload with two bars on the 2nd of the month"""
+    return {
+        'Time Series (60min)': {
+            f"{month}-02 11:00:00": {'1. open': '101', '2. high': '103', '3. low': '100', '4. close': '102', '5. volume': '2000'},
+            f"{month}-02 10:00:00": {'1. open': '100', '2. high': '102', '3. low': '99', '4. close': '101', '5. volume': '1000'},
+        }
+    }
+
+
+class TestIntradayMonthCache:
+    """Closed intraday months are served from the month cache instead of the API"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        with patch.dict(os.environ, {'ALPHA_VANTAGE_API_KEY': 'test_key'}):
+            self.provider = AlphaVantageProvider()
+        self.provider._month_cache = IntradayMonthCache(self.temp_dir)
+        self.requested = []
+
+        def make_request(params, ticker, timeframe):
+            self.requested.append(params['month'])
+            return _month_response(params['month'])
+
+        self.provider._make_request = make_request
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_only_open_month_is_requested_again(self):
+        now = datetime.now()
+        start = (now.replace(day=1) - timedelta(days=70)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        months = pd.period_range(start, now, freq='M').strftime('%Y-%m').tolist()
+
+        first = self.provider._fetch_intraday_monthly('AAPL', '60min', start, now)
+        assert self.requested == months
+
+        # A different range over the same months reuses every closed month
+        self.requested.clear()
+        second = self.provider._fetch_intraday_monthly('AAPL', '60min', start + timedelta(days=1), now)
+        closed = [m for m in months if IntradayMonthCache.is_month_closed(m)]
+        assert self.requested == [m for m in months if m not in closed]
+        assert self.provider.get_month_cache().hits == len(closed)
+
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+        assert second.index.is_monotonic_increasing
+
+    def test_month_closes_after_grace_period(self):
+        assert IntradayMonthCache.is_month_closed('2023-12', now=datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc))
+        assert not IntradayMonthCache.is_month_closed('2023-12', now=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc))
+
+    def test_corrupt_entry_is_refetched(self):
+        cache = self.provider.get_month_cache()
+        self.provider._fetch_intraday_monthly('AAPL', '60min', datetime(2023, 5, 1), datetime(2023, 5, 31))
+
+        entry = cache._path('AAPL', '60min', '2023-05', True, True)
+        entry.write_bytes(b'not an npz file')
+
+        self.requested.clear()
+        df = self.provider._fetch_intraday_monthly('AAPL', '60min', datetime(2023, 5, 1), datetime(2023, 5, 31))
+        assert self.requested == ['2023-05']
+        assert len(df) == 2
+        assert cache.get('AAPL', '60min', '2023-05') is not None
@@ -0,0 +1,122 @@
+import os
+import shutil
+import sys
+import tempfile
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_manager import DataManager
+from data.preload_planner import PreloadPlanner
+from data.providers.base import DataProvider
+
+
+class _CountingProvider(DataProvider):
+    """Daily bars for any ticker, counting fetches"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    @property
+    def name(self):
+        return 'yahoo'
+    
+    def get_supported_timeframes(self):
+        return ['1d']
+    
+    def get_rate_limit(self):
+        return {'requests_per_minute': 60}
+    
+    def validate_ticker(self, ticker):
+        return True
+    
+    def fetch_data(self, ticker, timeframe, start_date, end_date):
+        self.calls.append((ticker, timeframe, start_date.date(), end_date.date()))
+        index = pd.date_range(start_date, end_date, freq='D', inclusive='left')
+        close = np.linspace(100, 110, len(index))
+        return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1,
+                             'Close': close, 'Volume': 1000.0}, index=index)
+
+
+class TestPreloadPlanner:
+    """Quota-limited preload plans fetch only missing data and continue across runs"""
+    
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.plan_dir = os.path.join(self.temp_dir, 'plans')
+        self.data_manager = DataManager(cache_dir=self.cache_dir, provider_name='yahoo')
+        self.provider = _CountingProvider()
+        self.data_manager.registry.register('yahoo', self.provider)
+        self.data_manager.registry.set_active('yahoo')
+        self.start = datetime(2024, 1, 1)
+        self.end = datetime(2024, 3, 31)
+    
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _planner(self, quota):
+        return PreloadPlanner(self.data_manager, quota, plan_dir=self.plan_dir)
+    
+    def test_cached_ranges_are_not_requested(self):
+        self.data_manager.download_data('AAPL', self.start, self.end)
+        self.data_manager.download_data('MSFT', self.start, datetime(2024, 2, 15))
+        self.provider.calls.clear()
+        
+        plan = self._planner(10).load_or_create(['AAPL', 'MSFT'], ['1d', '1w'], self.start, self.end)
+        
+        # Weekly bars derive from daily, AAPL is fully cached, MSFT only misses its tail
+        assert [(u.ticker, u.timeframe, u.start_date, u.end_date) for u in plan.units] == [
+            ('MSFT', '1d', '2024-02-16', '2024-03-31')
+        ]
+    
+    def test_quota_spreads_plan_over_days(self):
+        tickers = ['AAPL', 'MSFT', 'GOOGL']
+        planner = self._planner(2)
+        plan = planner.load_or_create(tickers, ['1d', '1w'], self.start, self.end, priority_tickers=['MSFT'])
+        
+        assert [u.ticker for u in plan.units] == ['MSFT', 'AAPL', 'GOOGL']
+        assert [(d['date'], d['calls']) for d in planner.schedule(plan, date(2024, 4, 1))] == [
+            ('2024-04-01', 2), ('2024-04-02', 1)
+        ]
+        
+        first = planner.execute(plan, today=date(2024, 4, 1))
+        assert first['completed_units'] == 2 and first['calls_today'] == 2
+        assert not first['complete']
+        assert [call[0] for call in self.provider.calls] == ['MSFT', 'AAPL']
+        
+        # A later run of the same request picks up the persisted plan
+        resumed = self._planner(2).load_or_create(tickers, ['1d', '1w'], self.start, self.end)
+        assert resumed.plan_id == plan.plan_id
+        assert resumed.usage == {'2024-04-01': 2}
+        assert [u.ticker for u in resumed.pending_units] == ['GOOGL']
+        
+        # Today's budget is spent
+        assert self._planner(2).execute(resumed, today=date(2024, 4, 1))['completed_units'] == 0
+        
+        second = self._planner(2).execute(resumed, today=date(2024, 4, 2))
+        assert second['complete']
+        assert len(self.provider.calls) == 3
+        assert sorted(resumed.assembled) == sorted(tickers)
+        
+        # Assembled tickers are served from the cache, derived timeframes included
+        self.provider.calls.clear()
+        data = self.data_manager.timeframe_manager.get_multi_timeframe_data('GOOGL', ['1d', '1w'], self.start, self.end)
+        assert set(data) == {'1d', '1w'}
+        assert self.provider.calls == []
+    
+    def test_priority_change_reorders_pending_units(self):
+        planner = self._planner(1)
+        plan = planner.load_or_create(['AAPL', 'MSFT', 'TSLA'], ['1d'], self.start, self.end)
+        assert [u.ticker for u in plan.units] == ['AAPL', 'MSFT', 'TSLA']
+        
+        plan = planner.load_or_create(['AAPL', 'MSFT', 'TSLA'], ['1d'], self.start, self.end,
+                                      priority_tickers=['TSLA'])
+        assert [u.ticker for u in plan.units] == ['TSLA', 'AAPL', 'MSFT']
+        
+        planner.execute(plan, today=date(2024, 4, 1))
+        assert self.provider.calls[0][0] == 'TSLA'
@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.registry import ProviderRegistry
+from data.providers.replay.provider import ReplayProvider
+from data.providers.replay.transport import ResponseArchive, SimulatedConditions, create_replay_session
+
+DAILY_RESPONSE = {
+    'Meta Data': {'2. Symbol': 'IBM'},
+    'Time Series (Daily)': {
+        '2024-01-04': {'1. open': '161.0', '2. high': '163.0', '3. low': '160.5', '4. close': '162.0', '5. volume': '5000'},
+        '2024-01-03': {'1. open': '160.0', '2. high': '161.5', '3. low': '159.0', '4. close': '161.0', '5. volume': '4000'},
+        '2024-01-02': {'1. open': '158.0', '2. high': '160.5', '3. low': '157.5', '4. close': '160.0', '5. volume': '3000'}
+    }
+}
+
+
+class _DailyHandler(BaseHTTPRequestHandler):
+    """Stands in for the Alpha Vantage query endpoint"""
+
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        body = json.dumps(DAILY_RESPONSE).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestReplayProvider:
+    """Recorded responses drive the real provider pipeline without network access"""
+
+    def setup_method(self):
+        self.archive_dir = tempfile.mkdtemp()
+        _DailyHandler.calls = 0
+
+    def teardown_method(self):
+        shutil.rmtree(self.archive_dir)
+
+    def _daily_url(self, base_url, api_key):
+        params = {'function': 'TIME_SERIES_DAILY', 'symbol': 'IBM', 'apikey': api_key, 'outputsize': 'full'}
+        return requests.Request('GET', base_url, params=params).prepare().url
+
+    def test_record_then_replay_offline(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _DailyHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}/query"
+        try:
+            archive = ResponseArchive(self.archive_dir)
+            recorder = create_replay_session(archive, mode='record')
+            assert recorder.get(self._daily_url(base_url, 'real-key'), timeout=5).json() == DAILY_RESPONSE
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Replays match regardless of the API key and never reach the (now closed) server
+        replayer = create_replay_session(archive, mode='replay')
+        replayed = replayer.get(self._daily_url(base_url, 'other-key'), timeout=5)
+        assert replayed.status_code == 200
+        assert replayed.json() == DAILY_RESPONSE
+        assert _DailyHandler.calls == 1
+
+        archived = json.dumps([json.load(open(path)) for path in archive.root.glob('*/*.json')])
+        assert 'real-key' not in archived
+
+        missing = replayer.get(f"{base_url}?function=TIME_SERIES_DAILY&symbol=MSFT", timeout=5)
+        assert missing.status_code == 404
+
+    def test_replay_provider_runs_alpha_vantage_pipeline(self):
+        with patch.dict(os.environ, {'ALPHA_VANTAGE_API_KEY': 'test_key'}):
+            provider = ReplayProvider(self.archive_dir, mode='replay')
+
+        # Seed the archive as a recording of the real endpoint would
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = json.dumps(DAILY_RESPONSE).encode()
+        response.encoding = 'utf-8'
+        provider.archive.save('GET', self._daily_url(provider.upstream.base_url, 'recorded-key'), None, response)
+
+        registry = ProviderRegistry()
+        registry.register('replay', provider)
+        registry.set_active('replay')
+
+        df = registry.get_active().fetch_data('IBM', '1d', datetime(2024, 1, 1), datetime(2024, 1, 5))
+        assert list(df['Close']) == [160.0, 161.0, 162.0]
+        assert df.index.is_monotonic_increasing
+        assert provider.get_replay_stats()['hits'] == 1
+
+    def test_simulated_rate_limit_uses_upstream_response(self):
+        archive = ResponseArchive(self.archive_dir)
+        session = create_replay_session(archive, conditions=SimulatedConditions(requests_per_minute=2))
+
+        av_responses = [session.get('https://www.alphavantage.co/query?function=X', timeout=5) for _ in range(3)]
+        assert [r.status_code for r in av_responses] == [404, 404, 200]
+        assert 'call frequency' in av_responses[2].json()['Note']
+
+        other_responses = [session.get('https://api.financialdatasets.ai/prices/', timeout=5) for _ in range(3)]
+        assert [r.status_code for r in other_responses] == [404, 404, 429]
+        assert int(other_responses[2].headers['Retry-After']) > 0
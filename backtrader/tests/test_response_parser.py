@@ -0,0 +1,79 @@
+import json
+import os
+import sys
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.alpha_vantage.response_parser import (
+    decode_response, parse_time_series, time_series_to_frame
+)
+
+
+def _legacy_parse(time_series):
+    df = pd.DataFrame.from_dict(time_series, orient='index')
+    df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+    df.index = pd.to_datetime(df.index)
+    return df.astype(float).sort_index()
+
+
+def _bar(price, volume):
+    return {'1. open': str(price), '2. high': str(price + 1), '3. low': str(price - 1),
+            '4. close': str(price + 0.5), '5. volume': str(volume)}
+
+
+class TestResponseParser:
+    """The array parser matches the legacy from_dict path"""
+
+    def test_intraday_matches_legacy_path(self):
+        # Alpha Vantage returns newest bars first
+        time_series = {
+            f"2024-03-01 {hour:02d}:00:00": _bar(100 + hour, 1000 * hour)
+            for hour in reversed(range(4, 20))
+        }
+        pd.testing.assert_frame_equal(time_series_to_frame(time_series), _legacy_parse(time_series))
+
+    def test_unordered_daily_keys_are_sorted(self):
+        time_series = {'2024-01-03': _bar(3, 30), '2024-01-01': _bar(1, 10), '2024-01-02': _bar(2, 20)}
+        arrays = parse_time_series(time_series)
+
+        assert arrays['timestamps'].dtype == np.dtype('datetime64[ns]')
+        assert list(arrays['Open']) == [1.0, 2.0, 3.0]
+        assert arrays['Volume'].dtype == np.float64
+        pd.testing.assert_frame_equal(time_series_to_frame(time_series), _legacy_parse(time_series))
+
+    def test_crypto_fields_are_located_by_name(self):
+        time_series = {
+            '2024-01-02': {'1a. open (USD)': '42000.5', '1b. open (USD)': '42000.5',
+                           '2a. high (USD)': '43000', '3a. low (USD)': '41000',
+                           '4a. close (USD)': '42500', '5. volume': '1234.56'},
+            '2024-01-01': {'1a. open (USD)': '41000', '1b. open (USD)': '41000',
+                           '2a. high (USD)': '42100', '3a. low (USD)': '40500',
+                           '4a. close (USD)': '42000.5'}
+        }
+        df = time_series_to_frame(time_series)
+
+        assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+        assert df.loc['2024-01-02', 'Open'] == 42000.5
+        assert df.loc['2024-01-02', 'Volume'] == 1234.56
+        assert np.isnan(df.loc['2024-01-01', 'Volume'])
+
+    def test_empty_series_gives_empty_ohlcv_frame(self):
+        df = time_series_to_frame({})
+        assert df.empty
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+
+    def test_decode_response_falls_back_to_json_method(self):
+        payload = {'Time Series (Daily)': {'2024-01-01': _bar(1, 10)}}
+
+        raw = Mock(content=json.dumps(payload).encode())
+        assert decode_response(raw) == payload
+
+        mocked = Mock(spec=['json'])
+        mocked.json.return_value = payload
+        assert decode_response(mocked) == payload
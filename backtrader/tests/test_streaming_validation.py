@@ -0,0 +1,126 @@
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.providers.alpha_vantage.data_validator import DataValidator, RowIssue
+
+
+def _hourly_bars(rows, start='2024-03-04 00:00'):
+    """Regular hourly OHLCV bars with a few seeded defects"""
+    index = pd.date_range(start, periods=rows, freq='h')
+    close = 100.0 + np.sin(np.arange(rows) / 10.0)
+    df = pd.DataFrame({
+        'Open': close - 0.1,
+        'High': close + 0.2,
+        'Low': close - 0.2,
+        'Close': close,
+        'Volume': np.full(rows, 1000.0)
+    }, index=index)
+    df.iloc[5, df.columns.get_loc('High')] = 50.0        # high below open/close
+    df.iloc[12, df.columns.get_loc('Volume')] = 50000.0  # volume spike
+    df.iloc[20, df.columns.get_loc('Close')] = np.nan    # null value
+    df.iloc[33, df.columns.get_loc('Volume')] = -5.0     # negative volume
+    return df
+
+
+class TestStreamingValidation:
+    """Chunked validation matches validating the whole frame at once"""
+    
+    def setup_method(self):
+        self.validator = DataValidator()
+    
+    def test_chunks_match_one_shot_validation(self):
+        df = _hourly_bars(60)
+        # Gap and duplicate straddling a chunk boundary
+        df = pd.concat([df.iloc[:30], df.iloc[29:30], df.iloc[30:].shift(12, freq='h')])
+        
+        expected = self.validator.validate_dataframe(df, 'AAPL', '1h')
+        
+        stream = self.validator.start_stream('AAPL', '1h')
+        for start in range(0, len(df), 16):
+            stream.add_chunk(df.iloc[start:start + 16])
+        result = stream.finish()
+        
+        assert result.errors == expected.errors
+        assert result.warnings == expected.warnings
+        np.testing.assert_array_equal(result.issue_mask, expected.issue_mask)
+        assert result.metadata['issue_counts'] == expected.metadata['issue_counts']
+        
+        mask = result.issue_mask
+        assert mask[5] & RowIssue.HIGH_VIOLATION
+        assert mask[12] & RowIssue.VOLUME_SPIKE
+        assert mask[20] & RowIssue.NULL_VALUE
+        assert mask[29] & RowIssue.DUPLICATE_TIMESTAMP
+        assert mask[31] & RowIssue.GAP_BEFORE
+        assert mask[31] & RowIssue.IRREGULAR_INTERVAL
+    
+    def test_messages_match_pandas_semantics(self):
+        df = _hourly_bars(40)[['Volume', 'Close', 'Open', 'High', 'Low']]
+        # A jump across a missing close counts, as with pct_change's forward fill
+        df.iloc[10, df.columns.get_loc('Close')] = np.nan
+        df.iloc[11:, df.columns.get_loc('Close')] *= 3
+        df.iloc[3, df.columns.get_loc('Volume')] = np.nan
+        expected_changes = int((df['Close'].ffill().pct_change().abs() > 0.5).sum())
+        
+        stream = self.validator.start_stream('AAPL', '1h')
+        for start in range(0, len(df), 11):
+            stream.add_chunk(df.iloc[start:start + 11])
+        result = stream.finish()
+        
+        assert expected_changes == 1
+        assert any(message.startswith(f"{expected_changes} periods have >50% price changes")
+                   for message in result.errors + result.warnings)
+        # Null counts are listed in the frame's column order
+        assert "3 null values found: {'Volume': 1, 'Close': 2}" in result.warnings
+    
+    def test_repair_uses_issue_mask(self):
+        df = _hourly_bars(40)
+        result = self.validator.validate_dataframe(df, 'AAPL', '1h')
+        
+        repaired = self.validator.repair_data(df, result)
+        
+        # Rows with nulls or negative volume are dropped; other issues are only reported
+        assert result.issue_mask[5] & RowIssue.HIGH_VIOLATION
+        assert len(repaired) == 38
+        assert not repaired.index.isin(df.index[[20, 33]]).any()
+        assert (repaired['Volume'] >= 0).all()
+    
+    def test_bulk_fetcher_streams_chunks_without_a_provider(self):
+        from data.providers.alpha_vantage.bulk_fetcher import BulkDataFetcher
+        from data.providers.alpha_vantage.client import AlphaVantageClient
+        
+        fetcher = BulkDataFetcher(Mock(spec=AlphaVantageClient))
+        with patch('data.providers.alpha_vantage.provider.AlphaVantageProvider') as provider_class:
+            assert fetcher._get_asset_type('AAPL') == 'stock'
+            assert fetcher._get_asset_type('BTC') == 'crypto'
+            provider_class.assert_not_called()
+        
+        assert fetcher.get_validator() is fetcher.get_validator()
+    
+    def test_bulk_fetcher_and_timeframe_manager_share_asset_classification(self):
+        from data.asset_buckets import get_asset_type
+        from data.providers.alpha_vantage.bulk_fetcher import BulkDataFetcher
+        from data.providers.alpha_vantage.client import AlphaVantageClient
+        from data.timeframe_manager import TimeframeManager
+        
+        fetcher = BulkDataFetcher(Mock(spec=AlphaVantageClient))
+        timeframe_manager = TimeframeManager.__new__(TimeframeManager)
+        timeframe_manager.data_manager = None
+        timeframe_manager.registry = None
+        timeframe_manager._asset_types = {}
+        
+        for ticker in ['AAPL', 'BTC', 'eth', 'SPY']:
+            expected = get_asset_type(ticker)
+            assert fetcher._get_asset_type(ticker) == expected
+            assert timeframe_manager._get_asset_type(ticker) == expected
+        
+        # A provider's own crypto check takes precedence over the bucket lists
+        provider = Mock(_is_crypto_symbol=lambda ticker: ticker.endswith('USD'))
+        assert get_asset_type('BTCUSD', provider) == 'crypto'
+        assert get_asset_type('BTC', provider) == 'stock'
@@ -0,0 +1,102 @@
+import os
+import sys
+import shutil
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_manager import DataManager
+from data.ohlcv_resampler import resample_ohlcv
+
+
+def _hourly_session(start, days):
+    """Hourly bars from 04:00 to 19:00 (extended hours) on consecutive days"""
+    index = pd.DatetimeIndex([
+        pd.Timestamp(start) + pd.Timedelta(days=day, hours=hour)
+        for day in range(days) for hour in range(4, 20)
+    ])
+    close = 100.0 + np.arange(len(index))
+    return pd.DataFrame({
+        'Open': close - 0.5,
+        'High': close + 1.0,
+        'Low': close - 1.0,
+        'Close': close,
+        'Volume': np.full(len(index), 1000)
+    }, index=index)
+
+
+class TestTimeframeDerivation:
+    """Coarser timeframes are derived locally from a single native fetch"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.fetched = []
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _data_manager(self):
+        with patch.dict(os.environ, {'ALPHA_VANTAGE_API_KEY': 'test_key'}):
+            data_manager = DataManager(cache_dir=self.temp_dir, provider_name='alpha_vantage')
+
+        def fetch_data(ticker, timeframe, start_date, end_date, validate_data=True):
+            self.fetched.append((ticker, timeframe))
+            return _hourly_session(datetime(2023, 1, 3), 3)
+
+        data_manager.registry.get_active().fetch_data = fetch_data
+        return data_manager
+
+    def test_native_is_fetched_once_and_derived_series_cached(self):
+        start, end = datetime(2023, 1, 3), datetime(2023, 1, 5)
+        manager = self._data_manager().timeframe_manager
+
+        results = manager.get_multi_timeframe_data('AAPL', ['4h', '1h'], start, end)
+        assert self.fetched == [('AAPL', '1h')]
+        assert set(results) == {'1h', '4h'}
+
+        four_hour = results['4h']
+        first_day = four_hour[four_hour.index.normalize() == pd.Timestamp('2023-01-03')]
+        # Pre-market bins count back from the 09:30 open
+        assert [ts.strftime('%H:%M') for ts in first_day.index] == ['01:30', '05:30', '09:30', '13:30', '17:30']
+        assert four_hour.attrs['derived_from'] == '1h'
+        assert four_hour.attrs['lineage']['source_rows'] == len(results['1h'])
+        assert four_hour.attrs['lineage']['origin'] == '09:30'
+
+        # A new session serves both timeframes from cache without touching the provider
+        self.fetched.clear()
+        cached = self._data_manager().timeframe_manager.get_multi_timeframe_data('AAPL', ['1h', '4h'], start, end)
+        assert self.fetched == []
+        pd.testing.assert_frame_equal(cached['4h'], four_hour)
+        assert cached['4h'].attrs['derived_from'] == '1h'
+
+    def test_aggregates_match_ohlcv_semantics(self):
+        hourly = _hourly_session(datetime(2023, 1, 3), 1)
+        four_hour = resample_ohlcv(hourly, '4h')
+
+        bar = four_hour.loc[pd.Timestamp('2023-01-03 09:30')]
+        window = hourly.between_time('10:00', '13:00')
+        assert bar['Open'] == window['Open'].iloc[0]
+        assert bar['High'] == window['High'].max()
+        assert bar['Low'] == window['Low'].min()
+        assert bar['Close'] == window['Close'].iloc[-1]
+        assert bar['Volume'] == window['Volume'].sum()
+        assert four_hour['Volume'].sum() == hourly['Volume'].sum()
+
+    def test_crypto_bins_are_continuous_around_the_clock(self):
+        index = pd.date_range('2023-01-01 22:00', periods=8, freq='h', tz='UTC')
+        hourly = pd.DataFrame({
+            'Open': 1.0, 'High': 2.0, 'Low': 0.5, 'Close': 1.5, 'Volume': 10.0
+        }, index=index)
+
+        four_hour = resample_ohlcv(hourly, '4h', asset_type='crypto')
+
+        assert list(four_hour.index) == [pd.Timestamp('2023-01-01 20:00', tz='UTC'),
+                                         pd.Timestamp('2023-01-02 00:00', tz='UTC'),
+                                         pd.Timestamp('2023-01-02 04:00', tz='UTC')]
+        assert list(four_hour['Volume']) == [20.0, 40.0, 20.0]
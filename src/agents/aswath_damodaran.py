@@ -13,6 +13,7 @@ from src.tools.api import (
     get_market_cap,
     search_line_items,
 )
+from src.data.signal_cache import lookup_signal_as_of, lookup_signal_by_data, store_signal
 from src.utils.llm import call_llm
 from src.utils.progress import progress
 
@@ -40,6 +41,11 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
     damodaran_signals: dict[str, dict] = {}
 
     for ticker in tickers:
+        # ─── Reuse the signal from an identical earlier run ─────────────────────
+        if (cached_signal := lookup_signal_as_of(state, agent_id, ticker)) is not None:
+            damodaran_signals[ticker] = cached_signal
+            continue
+
         # ─── Fetch core data ────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5)
@@ -63,6 +69,12 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
         progress.update_status(agent_id, ticker, "Getting market cap")
         market_cap = get_market_cap(ticker, end_date)
 
+        # ─── Skip analysis + LLM when the fundamentals are unchanged ────────────
+        cached_signal, fingerprint = lookup_signal_by_data(state, agent_id, ticker, metrics, line_items, market_cap)
+        if cached_signal is not None:
+            damodaran_signals[ticker] = cached_signal
+            continue
+
         # ─── Analyses ───────────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Analyzing growth and reinvestment")
         growth_analysis = analyze_growth_and_reinvestment(metrics, line_items)
@@ -121,6 +133,7 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
         )
 
         damodaran_signals[ticker] = damodaran_output.model_dump()
+        store_signal(state, agent_id, ticker, fingerprint, damodaran_signals[ticker])
 
         progress.update_status(agent_id, ticker, "Done", analysis=damodaran_output.reasoning)
 
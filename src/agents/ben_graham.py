@@ -7,6 +7,7 @@ import json
 from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
+from src.data.signal_cache import lookup_signal_as_of, lookup_signal_by_data, store_signal
 import math
 
 
@@ -32,6 +33,11 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
     graham_analysis = {}
 
     for ticker in tickers:
+        # Reuse the signal from an identical earlier run without fetching anything
+        if (cached_signal := lookup_signal_as_of(state, agent_id, ticker)) is not None:
+            graham_analysis[ticker] = cached_signal
+            continue
+
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10)
 
@@ -41,6 +47,12 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
         progress.update_status(agent_id, ticker, "Getting market cap")
         market_cap = get_market_cap(ticker, end_date)
 
+        # Annual fundamentals rarely change between dates; skip the analysis and LLM call if they didn't
+        cached_signal, fingerprint = lookup_signal_by_data(state, agent_id, ticker, metrics, financial_line_items, market_cap)
+        if cached_signal is not None:
+            graham_analysis[ticker] = cached_signal
+            continue
+
         # Perform sub-analyses
         progress.update_status(agent_id, ticker, "Analyzing earnings stability")
         earnings_analysis = analyze_earnings_stability(metrics, financial_line_items)
@@ -74,6 +86,7 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
         )
 
         graham_analysis[ticker] = {"signal": graham_output.signal, "confidence": graham_output.confidence, "reasoning": graham_output.reasoning}
+        store_signal(state, agent_id, ticker, fingerprint, graham_analysis[ticker])
 
         progress.update_status(agent_id, ticker, "Done", analysis=graham_output.reasoning)
 
@@ -9,7 +9,10 @@ import pandas as pd
 from colorama import Fore, Style, init
 import numpy as np
 import itertools
+from collections import deque
 
+from src.data.signal_cache import get_signal_cache
+from src.llm.cache import LLMCacheMode, get_llm_cache
 from src.llm.models import LLM_ORDER, OLLAMA_LLM_ORDER, get_model_info, ModelProvider
 from src.utils.analysts import ANALYST_ORDER
 from src.main import run_hedge_fund
@@ -20,12 +23,17 @@ from src.tools.api import (
     get_financial_metrics,
     get_insider_trades,
 )
-from src.utils.display import print_backtest_results, format_backtest_row
+from src.utils.display import BACKTEST_OUTPUT_MODES, print_backtest_day, print_backtest_results, format_backtest_row
+from src.utils.ledger import PortfolioLedger
+from src.utils.performance import RunningPerformanceStats
 from typing_extensions import Callable
 from src.utils.ollama import ensure_ollama_and_model
+from src.utils.progress import progress
 
 init(autoreset=True)
 
+HISTORY_COLUMNS = ["Portfolio Value", "Long Exposure", "Short Exposure", "Gross Exposure", "Net Exposure", "Long/Short Ratio"]
+
 
 class Backtester:
     def __init__(
@@ -39,6 +47,8 @@ class Backtester:
         model_provider: str = "OpenAI",
         selected_analysts: list[str] = [],
         initial_margin_requirement: float = 0.0,
+        output_mode: str = "full",
+        display_window: int = 0,
     ):
         """
         :param agent: The trading agent (Callable).
@@ -50,7 +60,14 @@ class Backtester:
         :param model_provider: Which LLM provider (OpenAI, etc).
         :param selected_analysts: List of analyst names or IDs to incorporate.
         :param initial_margin_requirement: The margin ratio (e.g. 0.5 = 50%).
+        :param output_mode: "full" re-renders the whole table every day, "stream" prints only each
+            new day (or the last `display_window` days) and the full table once at the end,
+            "quiet" skips table formatting entirely for headless/batch runs.
+        :param display_window: Number of most recent days to re-render in "stream" mode (0 = only the new day).
         """
+        if output_mode not in BACKTEST_OUTPUT_MODES:
+            raise ValueError(f"output_mode must be one of {BACKTEST_OUTPUT_MODES}, got {output_mode!r}")
+
         self.agent = agent
         self.tickers = tickers
         self.start_date = start_date
@@ -59,22 +76,26 @@ class Backtester:
         self.model_name = model_name
         self.model_provider = model_provider
         self.selected_analysts = selected_analysts
+        self.output_mode = output_mode
+        self.display_window = display_window
+
+        # Initialize the array-backed ledger with support for long/short positions
+        self.ledger = PortfolioLedger(tickers, initial_capital, initial_margin_requirement)
+
+        # Daily history, preallocated in run_backtest once the number of dates is known
+        self._history_dates = []
+        self._history = np.empty((0, len(HISTORY_COLUMNS)), dtype=np.float64)
+        self._num_values = 0
 
-        # Initialize portfolio with support for long/short positions
-        self.portfolio_values = []
-        self.portfolio = {
-            "cash": initial_capital,
-            "margin_used": 0.0,  # total margin usage across all short positions
-            "margin_requirement": initial_margin_requirement,  # The margin ratio required for shorts
-            "positions": {ticker: {"long": 0, "short": 0, "long_cost_basis": 0.0, "short_cost_basis": 0.0, "short_margin_used": 0.0} for ticker in tickers},  # Number of shares held long  # Number of shares held short  # Average cost basis per share (long)  # Average cost basis per share (short)  # Dollars of margin used for this ticker's short
-            "realized_gains": {
-                ticker: {
-                    "long": 0.0,  # Realized gains from long positions
-                    "short": 0.0,  # Realized gains from short positions
-                }
-                for ticker in tickers
-            },
-        }
+    @property
+    def portfolio(self) -> dict:
+        """Snapshot of the ledger in the nested dict format consumed by the agents."""
+        return self.ledger.to_dict()
+
+    @property
+    def portfolio_values(self) -> list[dict]:
+        """Recorded daily portfolio values and exposures as a list of row dicts."""
+        return self.history_frame().reset_index().to_dict("records")
 
     def execute_trade(self, ticker: str, action: str, quantity: float, current_price: float):
         """
@@ -82,163 +103,7 @@ class Backtester:
         `quantity` is the number of shares the agent wants to buy/sell/short/cover.
         We will only trade integer shares to keep it simple.
         """
-        if quantity <= 0:
-            return 0
-
-        quantity = int(quantity)  # force integer shares
-        position = self.portfolio["positions"][ticker]
-
-        if action == "buy":
-            cost = quantity * current_price
-            if cost <= self.portfolio["cash"]:
-                # Weighted average cost basis for the new total
-                old_shares = position["long"]
-                old_cost_basis = position["long_cost_basis"]
-                new_shares = quantity
-                total_shares = old_shares + new_shares
-
-                if total_shares > 0:
-                    total_old_cost = old_cost_basis * old_shares
-                    total_new_cost = cost
-                    position["long_cost_basis"] = (total_old_cost + total_new_cost) / total_shares
-
-                position["long"] += quantity
-                self.portfolio["cash"] -= cost
-                return quantity
-            else:
-                # Calculate maximum affordable quantity
-                max_quantity = int(self.portfolio["cash"] / current_price)
-                if max_quantity > 0:
-                    cost = max_quantity * current_price
-                    old_shares = position["long"]
-                    old_cost_basis = position["long_cost_basis"]
-                    total_shares = old_shares + max_quantity
-
-                    if total_shares > 0:
-                        total_old_cost = old_cost_basis * old_shares
-                        total_new_cost = cost
-                        position["long_cost_basis"] = (total_old_cost + total_new_cost) / total_shares
-
-                    position["long"] += max_quantity
-                    self.portfolio["cash"] -= cost
-                    return max_quantity
-                return 0
-
-        elif action == "sell":
-            # You can only sell as many as you own
-            quantity = min(quantity, position["long"])
-            if quantity > 0:
-                # Realized gain/loss using average cost basis
-                avg_cost_per_share = position["long_cost_basis"] if position["long"] > 0 else 0
-                realized_gain = (current_price - avg_cost_per_share) * quantity
-                self.portfolio["realized_gains"][ticker]["long"] += realized_gain
-
-                position["long"] -= quantity
-                self.portfolio["cash"] += quantity * current_price
-
-                if position["long"] == 0:
-                    position["long_cost_basis"] = 0.0
-
-                return quantity
-
-        elif action == "short":
-            """
-            Typical short sale flow:
-              1) Receive proceeds = current_price * quantity
-              2) Post margin_required = proceeds * margin_ratio
-              3) Net effect on cash = +proceeds - margin_required
-            """
-            proceeds = current_price * quantity
-            margin_required = proceeds * self.portfolio["margin_requirement"]
-            if margin_required <= self.portfolio["cash"]:
-                # Weighted average short cost basis
-                old_short_shares = position["short"]
-                old_cost_basis = position["short_cost_basis"]
-                new_shares = quantity
-                total_shares = old_short_shares + new_shares
-
-                if total_shares > 0:
-                    total_old_cost = old_cost_basis * old_short_shares
-                    total_new_cost = current_price * new_shares
-                    position["short_cost_basis"] = (total_old_cost + total_new_cost) / total_shares
-
-                position["short"] += quantity
-
-                # Update margin usage
-                position["short_margin_used"] += margin_required
-                self.portfolio["margin_used"] += margin_required
-
-                # Increase cash by proceeds, then subtract the required margin
-                self.portfolio["cash"] += proceeds
-                self.portfolio["cash"] -= margin_required
-                return quantity
-            else:
-                # Calculate maximum shortable quantity
-                margin_ratio = self.portfolio["margin_requirement"]
-                if margin_ratio > 0:
-                    max_quantity = int(self.portfolio["cash"] / (current_price * margin_ratio))
-                else:
-                    max_quantity = 0
-
-                if max_quantity > 0:
-                    proceeds = current_price * max_quantity
-                    margin_required = proceeds * margin_ratio
-
-                    old_short_shares = position["short"]
-                    old_cost_basis = position["short_cost_basis"]
-                    total_shares = old_short_shares + max_quantity
-
-                    if total_shares > 0:
-                        total_old_cost = old_cost_basis * old_short_shares
-                        total_new_cost = current_price * max_quantity
-                        position["short_cost_basis"] = (total_old_cost + total_new_cost) / total_shares
-
-                    position["short"] += max_quantity
-                    position["short_margin_used"] += margin_required
-                    self.portfolio["margin_used"] += margin_required
-
-                    self.portfolio["cash"] += proceeds
-                    self.portfolio["cash"] -= margin_required
-                    return max_quantity
-                return 0
-
-        elif action == "cover":
-            """
-            When covering shares:
-              1) Pay cover cost = current_price * quantity
-              2) Release a proportional share of the margin
-              3) Net effect on cash = -cover_cost + released_margin
-            """
-            quantity = min(quantity, position["short"])
-            if quantity > 0:
-                cover_cost = quantity * current_price
-                avg_short_price = position["short_cost_basis"] if position["short"] > 0 else 0
-                realized_gain = (avg_short_price - current_price) * quantity
-
-                if position["short"] > 0:
-                    portion = quantity / position["short"]
-                else:
-                    portion = 1.0
-
-                margin_to_release = portion * position["short_margin_used"]
-
-                position["short"] -= quantity
-                position["short_margin_used"] -= margin_to_release
-                self.portfolio["margin_used"] -= margin_to_release
-
-                # Pay the cost to cover, but get back the released margin
-                self.portfolio["cash"] += margin_to_release
-                self.portfolio["cash"] -= cover_cost
-
-                self.portfolio["realized_gains"][ticker]["short"] += realized_gain
-
-                if position["short"] == 0:
-                    position["short_cost_basis"] = 0.0
-                    position["short_margin_used"] = 0.0
-
-                return quantity
-
-        return 0
+        return self.ledger.execute_trade(ticker, action, quantity, current_price)
 
     def calculate_portfolio_value(self, current_prices):
         """
@@ -247,21 +112,22 @@ class Backtester:
           - market value of long positions
           - unrealized gains/losses for short positions
         """
-        total_value = self.portfolio["cash"]
-
-        for ticker in self.tickers:
-            position = self.portfolio["positions"][ticker]
-            price = current_prices[ticker]
-
-            # Long position value
-            long_value = position["long"] * price
-            total_value += long_value
-
-            # Short position unrealized PnL = short_shares * (short_cost_basis - current_price)
-            if position["short"] > 0:
-                total_value -= position["short"] * price
-
-        return total_value
+        return self.ledger.portfolio_value(self.ledger.prices_array(current_prices))
+
+    def _record_value(self, date, values: tuple):
+        """Append one row to the preallocated history, growing it if needed."""
+        if self._num_values >= len(self._history):
+            grown = np.full((max(2 * len(self._history), 16), len(HISTORY_COLUMNS)), np.nan)
+            grown[: self._num_values] = self._history[: self._num_values]
+            self._history = grown
+        self._history[self._num_values, : len(values)] = values
+        self._history_dates.append(date)
+        self._num_values += 1
+
+    def history_frame(self) -> pd.DataFrame:
+        """Build the daily history DataFrame from the recorded arrays."""
+        index = pd.Index(self._history_dates, name="Date")
+        return pd.DataFrame(self._history[: self._num_values], index=index, columns=HISTORY_COLUMNS)
 
     def prefetch_data(self):
         """Pre-fetch all data needed for the backtest period."""
@@ -293,15 +159,20 @@ class Backtester:
 
         dates = pd.date_range(self.start_date, self.end_date, freq="B")
         table_rows = []
+        # Rolling window of the most recent days' rows for streaming output
+        recent_rows = deque(maxlen=self.display_window * (len(self.tickers) + 1)) if self.output_mode == "stream" and self.display_window > 0 else None
         performance_metrics = {"sharpe_ratio": None, "sortino_ratio": None, "max_drawdown": None, "long_short_ratio": None, "gross_exposure": None, "net_exposure": None}
 
         print("\nStarting backtest...")
 
-        # Initialize portfolio values list with initial capital
+        # Preallocate the daily history and seed it with the initial capital
+        self._history = np.full((len(dates) + 1, len(HISTORY_COLUMNS)), np.nan)
+        self._history_dates = []
+        self._num_values = 0
+        self.stats = RunningPerformanceStats()
         if len(dates) > 0:
-            self.portfolio_values = [{"Date": dates[0], "Portfolio Value": self.initial_capital}]
-        else:
-            self.portfolio_values = []
+            self._record_value(dates[0], (self.initial_capital,))
+            self.stats.update(self.initial_capital, dates[0])
 
         for current_date in dates:
             lookback_start = (current_date - timedelta(days=30)).strftime("%Y-%m-%d")
@@ -367,160 +238,122 @@ class Backtester:
             # 2) Now that trades have executed trades, recalculate the final
             #    portfolio value for this day.
             # ---------------------------------------------------------------
-            total_value = self.calculate_portfolio_value(current_prices)
+            prices = self.ledger.prices_array(current_prices)
 
             # Also compute long/short exposures for final post‐trade state
-            long_exposure = sum(self.portfolio["positions"][t]["long"] * current_prices[t] for t in self.tickers)
-            short_exposure = sum(self.portfolio["positions"][t]["short"] * current_prices[t] for t in self.tickers)
+            long_exposure, short_exposure = self.ledger.exposures(prices)
+            total_value = self.ledger.cash + long_exposure - short_exposure
 
             # Calculate gross and net exposures
             gross_exposure = long_exposure + short_exposure
             net_exposure = long_exposure - short_exposure
             long_short_ratio = long_exposure / short_exposure if short_exposure > 1e-9 else float("inf")
 
-            # Track each day's portfolio value in self.portfolio_values
-            self.portfolio_values.append({"Date": current_date, "Portfolio Value": total_value, "Long Exposure": long_exposure, "Short Exposure": short_exposure, "Gross Exposure": gross_exposure, "Net Exposure": net_exposure, "Long/Short Ratio": long_short_ratio})
+            # Track each day's portfolio value and update the running statistics
+            self._record_value(current_date, (total_value, long_exposure, short_exposure, gross_exposure, net_exposure, long_short_ratio))
+            self.stats.update(total_value, current_date)
 
             # ---------------------------------------------------------------
-            # 3) Build the table rows to display
-            # ---------------------------------------------------------------
-            date_rows = []
-
-            # For each ticker, record signals/trades
-            for ticker in self.tickers:
-                ticker_signals = {}
-                for agent_name, signals in analyst_signals.items():
-                    if ticker in signals:
-                        ticker_signals[agent_name] = signals[ticker]
-
-                bullish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bullish"])
-                bearish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bearish"])
-                neutral_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "neutral"])
-
-                # Calculate net position value
-                pos = self.portfolio["positions"][ticker]
-                long_val = pos["long"] * current_prices[ticker]
-                short_val = pos["short"] * current_prices[ticker]
-                net_position_value = long_val - short_val
-
-                # Get the action and quantity from the decisions
-                action = decisions.get(ticker, {}).get("action", "hold")
-                quantity = executed_trades.get(ticker, 0)
-
-                # Append the agent action to the table rows
-                date_rows.append(
-                    format_backtest_row(
-                        date=current_date_str,
-                        ticker=ticker,
-                        action=action,
-                        quantity=quantity,
-                        price=current_prices[ticker],
-                        shares_owned=pos["long"] - pos["short"],  # net shares
-                        position_value=net_position_value,
-                        bullish_count=bullish_count,
-                        bearish_count=bearish_count,
-                        neutral_count=neutral_count,
-                    )
-                )
-            # ---------------------------------------------------------------
-            # 4) Calculate performance summary metrics
+            # 3) Build and render the table rows (skipped entirely in quiet mode)
             # ---------------------------------------------------------------
-            # Calculate portfolio return vs. initial capital
-            # The realized gains are already reflected in cash balance, so we don't add them separately
-            portfolio_return = (total_value / self.initial_capital - 1) * 100
-
-            # Add summary row for this day
-            date_rows.append(
-                format_backtest_row(
-                    date=current_date_str,
-                    ticker="",
-                    action="",
-                    quantity=0,
-                    price=0,
-                    shares_owned=0,
-                    position_value=0,
-                    bullish_count=0,
-                    bearish_count=0,
-                    neutral_count=0,
-                    is_summary=True,
-                    total_value=total_value,
-                    return_pct=portfolio_return,
-                    cash_balance=self.portfolio["cash"],
-                    total_position_value=total_value - self.portfolio["cash"],
-                    sharpe_ratio=performance_metrics["sharpe_ratio"],
-                    sortino_ratio=performance_metrics["sortino_ratio"],
-                    max_drawdown=performance_metrics["max_drawdown"],
-                ),
-            )
-
-            table_rows.extend(date_rows)
-            print_backtest_results(table_rows)
+            if self.output_mode != "quiet":
+                date_rows = self._build_date_rows(current_date_str, decisions, analyst_signals, executed_trades, current_prices, prices, total_value, performance_metrics)
+                table_rows.extend(date_rows)
+
+                if self.output_mode == "full":
+                    print_backtest_results(table_rows)
+                elif recent_rows is not None:
+                    recent_rows.extend(date_rows)
+                    print_backtest_results(list(recent_rows))
+                else:
+                    print_backtest_day(date_rows)
 
             # Update performance metrics if we have enough data
-            if len(self.portfolio_values) > 3:
-                self._update_performance_metrics(performance_metrics)
+            if self._num_values > 3:
+                self.stats.update_metrics(performance_metrics)
+
+        # Streaming output only showed each day once, so write the full table at the end,
+        # below the streamed days unless a rolling window was redrawing the screen anyway
+        if self.output_mode == "stream" and table_rows:
+            print_backtest_results(table_rows, clear_screen=recent_rows is not None)
 
         # Store the final performance metrics for reference in analyze_performance
         self.performance_metrics = performance_metrics
         return performance_metrics
 
-    def _update_performance_metrics(self, performance_metrics):
-        """Helper method to update performance metrics using daily returns."""
-        values_df = pd.DataFrame(self.portfolio_values).set_index("Date")
-        values_df["Daily Return"] = values_df["Portfolio Value"].pct_change()
-        clean_returns = values_df["Daily Return"].dropna()
+    def _build_date_rows(self, current_date_str, decisions, analyst_signals, executed_trades, current_prices, prices, total_value, performance_metrics) -> list:
+        """Format the per-ticker rows and the portfolio summary row for one trading day."""
+        date_rows = []
 
-        if len(clean_returns) < 2:
-            return  # not enough data points
+        # For each ticker, record signals/trades
+        net_position_values = self.ledger.net_position_values(prices)
+        for i, ticker in enumerate(self.tickers):
+            ticker_signals = {}
+            for agent_name, signals in analyst_signals.items():
+                if ticker in signals:
+                    ticker_signals[agent_name] = signals[ticker]
 
-        # Assumes 252 trading days/year
-        daily_risk_free_rate = 0.0434 / 252
-        excess_returns = clean_returns - daily_risk_free_rate
-        mean_excess_return = excess_returns.mean()
-        std_excess_return = excess_returns.std()
+            bullish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bullish"])
+            bearish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bearish"])
+            neutral_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "neutral"])
 
-        # Sharpe ratio
-        if std_excess_return > 1e-12:
-            performance_metrics["sharpe_ratio"] = np.sqrt(252) * (mean_excess_return / std_excess_return)
-        else:
-            performance_metrics["sharpe_ratio"] = 0.0
-
-        # Sortino ratio
-        negative_returns = excess_returns[excess_returns < 0]
-        if len(negative_returns) > 0:
-            downside_std = negative_returns.std()
-            if downside_std > 1e-12:
-                performance_metrics["sortino_ratio"] = np.sqrt(252) * (mean_excess_return / downside_std)
-            else:
-                performance_metrics["sortino_ratio"] = float("inf") if mean_excess_return > 0 else 0
-        else:
-            performance_metrics["sortino_ratio"] = float("inf") if mean_excess_return > 0 else 0
-
-        # Maximum drawdown (ensure it's stored as a negative percentage)
-        rolling_max = values_df["Portfolio Value"].cummax()
-        drawdown = (values_df["Portfolio Value"] - rolling_max) / rolling_max
-
-        if len(drawdown) > 0:
-            min_drawdown = drawdown.min()
-            # Store as a negative percentage
-            performance_metrics["max_drawdown"] = min_drawdown * 100
-
-            # Store the date of max drawdown for reference
-            if min_drawdown < 0:
-                performance_metrics["max_drawdown_date"] = drawdown.idxmin().strftime("%Y-%m-%d")
-            else:
-                performance_metrics["max_drawdown_date"] = None
-        else:
-            performance_metrics["max_drawdown"] = 0.0
-            performance_metrics["max_drawdown_date"] = None
+            # Get the action and quantity from the decisions
+            action = decisions.get(ticker, {}).get("action", "hold")
+            quantity = executed_trades.get(ticker, 0)
+
+            # Append the agent action to the table rows
+            date_rows.append(
+                format_backtest_row(
+                    date=current_date_str,
+                    ticker=ticker,
+                    action=action,
+                    quantity=quantity,
+                    price=current_prices[ticker],
+                    shares_owned=int(self.ledger.long[i] - self.ledger.short[i]),  # net shares
+                    position_value=float(net_position_values[i]),
+                    bullish_count=bullish_count,
+                    bearish_count=bearish_count,
+                    neutral_count=neutral_count,
+                )
+            )
+
+        # Calculate portfolio return vs. initial capital
+        # The realized gains are already reflected in cash balance, so we don't add them separately
+        portfolio_return = (total_value / self.initial_capital - 1) * 100
+
+        # Add summary row for this day
+        date_rows.append(
+            format_backtest_row(
+                date=current_date_str,
+                ticker="",
+                action="",
+                quantity=0,
+                price=0,
+                shares_owned=0,
+                position_value=0,
+                bullish_count=0,
+                bearish_count=0,
+                neutral_count=0,
+                is_summary=True,
+                total_value=total_value,
+                return_pct=portfolio_return,
+                cash_balance=self.ledger.cash,
+                total_position_value=total_value - self.ledger.cash,
+                sharpe_ratio=performance_metrics["sharpe_ratio"],
+                sortino_ratio=performance_metrics["sortino_ratio"],
+                max_drawdown=performance_metrics["max_drawdown"],
+            ),
+        )
+
+        return date_rows
 
     def analyze_performance(self):
         """Creates a performance DataFrame, prints summary stats, and plots equity curve."""
-        if not self.portfolio_values:
+        if self._num_values == 0:
             print("No portfolio data found. Please run the backtest first.")
             return pd.DataFrame()
 
-        performance_df = pd.DataFrame(self.portfolio_values).set_index("Date")
+        performance_df = self.history_frame()
         if performance_df.empty:
             print("No valid performance data to analyze.")
             return performance_df
@@ -532,7 +365,7 @@ class Backtester:
         print(f"Total Return: {Fore.GREEN if total_return >= 0 else Fore.RED}{total_return:.2f}%{Style.RESET_ALL}")
 
         # Print realized P&L for informational purposes only
-        total_realized_gains = sum(self.portfolio["realized_gains"][ticker]["long"] + self.portfolio["realized_gains"][ticker]["short"] for ticker in self.tickers)
+        total_realized_gains = self.ledger.total_realized_gains()
         print(f"Total Realized Gains/Losses: {Fore.GREEN if total_realized_gains >= 0 else Fore.RED}${total_realized_gains:,.2f}{Style.RESET_ALL}")
 
         # Plot the portfolio value over time
@@ -652,9 +485,48 @@ if __name__ == "__main__":
         help="Use all available analysts (overrides --analysts)",
     )
     parser.add_argument("--ollama", action="store_true", help="Use Ollama for local LLM inference")
+    parser.add_argument(
+        "--output",
+        type=str,
+        choices=BACKTEST_OUTPUT_MODES,
+        default="full",
+        help="Table output: 'full' re-renders every day, 'stream' prints each new day and the full table at the end, 'quiet' skips the table (default: full)",
+    )
+    parser.add_argument(
+        "--display-window",
+        type=int,
+        default=0,
+        help="With --output stream, re-render the last N days instead of appending only the new day (default: 0)",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        type=str,
+        choices=[mode.value for mode in LLMCacheMode],
+        default=None,
+        help="LLM response cache mode: 'record' stores responses on disk, 'replay' runs offline from recorded responses (default: LLM_CACHE_MODE or off)",
+    )
+    parser.add_argument(
+        "--signal-cache",
+        action="store_true",
+        help="Reuse analyst signals when an analyst's input data is unchanged between dates (also SIGNAL_CACHE=1)",
+    )
+    parser.add_argument(
+        "--llm-cache-dir",
+        type=str,
+        default=None,
+        help="Directory for recorded LLM responses (default: LLM_CACHE_DIR or .cache/llm)",
+    )
 
     args = parser.parse_args()
 
+    if args.signal_cache:
+        get_signal_cache().enabled = True
+
+    llm_cache = get_llm_cache()
+    llm_cache.configure(mode=args.llm_cache, cache_dir=args.llm_cache_dir)
+    if llm_cache.enabled:
+        print(f"{Fore.CYAN}LLM response cache: {llm_cache.mode.value} ({llm_cache.cache_dir}){Style.RESET_ALL}")
+
     # Parse tickers from comma-separated string
     tickers = [ticker.strip() for ticker in args.tickers.split(",")] if args.tickers else []
 
@@ -770,7 +642,17 @@ if __name__ == "__main__":
         model_provider=model_provider,
         selected_analysts=selected_analysts,
         initial_margin_requirement=args.margin_requirement,
+        output_mode=args.output,
+        display_window=args.display_window,
     )
 
     performance_metrics = backtester.run_backtest()
     performance_df = backtester.analyze_performance()
+
+    if get_signal_cache().enabled:
+        for agent_name, stats in progress.get_cache_stats().items():
+            print(f"Signal cache {agent_name}: {stats['hits']} hits, {stats['misses']} misses")
+
+    if llm_cache.enabled:
+        cache_stats = llm_cache.get_stats()
+        print(f"\nLLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['writes']} recorded")
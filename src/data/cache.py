@@ -1,5 +1,19 @@
+import os
+import pickle
+from pathlib import Path
+
+
 class Cache:
-    """In-memory cache for API responses."""
+    """In-memory cache for API responses, optionally persisted to disk between runs."""
+
+    # Cache attribute -> field used to de-duplicate merged entries
+    _KEY_FIELDS = {
+        "_prices_cache": "time",
+        "_financial_metrics_cache": "report_period",
+        "_line_items_cache": "report_period",
+        "_insider_trades_cache": "filing_date",
+        "_company_news_cache": "date",
+    }
 
     def __init__(self):
         self._prices_cache: dict[str, list[dict[str, any]]] = {}
@@ -61,6 +75,50 @@ class Cache:
         """Append new company news to cache."""
         self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
 
+    def snapshot(self) -> dict[str, dict[str, list[dict[str, any]]]]:
+        """Return a picklable copy of all cached entries."""
+        return {name: dict(getattr(self, name)) for name in self._KEY_FIELDS}
+
+    def mark(self) -> dict[str, dict[str, int]]:
+        """Record the current number of entries per cache key, for use with snapshot_since()."""
+        return {name: {cache_key: len(data) for cache_key, data in getattr(self, name).items()} for name in self._KEY_FIELDS}
+
+    def snapshot_since(self, marker: dict[str, dict[str, int]]) -> dict[str, dict[str, list[dict[str, any]]]]:
+        """Return only the entries added after `marker` was taken (merges append, so earlier entries keep their positions)."""
+        delta = {}
+        for name in self._KEY_FIELDS:
+            counts = marker.get(name, {})
+            added = {cache_key: data[counts.get(cache_key, 0) :] for cache_key, data in getattr(self, name).items() if len(data) > counts.get(cache_key, 0)}
+            if added:
+                delta[name] = added
+        return delta
+
+    def merge_snapshot(self, snapshot: dict[str, dict[str, list[dict[str, any]]]]):
+        """Merge entries from a snapshot (e.g. produced by another process) into this cache."""
+        for name, key_field in self._KEY_FIELDS.items():
+            target = getattr(self, name)
+            for cache_key, data in snapshot.get(name, {}).items():
+                target[cache_key] = self._merge_data(target.get(cache_key), data, key_field=key_field)
+
+    def save(self, path: str | Path):
+        """Persist the cache to disk so later runs (or worker processes) start warm."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self.snapshot(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str | Path) -> bool:
+        """Merge a cache previously written with save(). Returns False if there is nothing to load."""
+        try:
+            with open(path, "rb") as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False
+        self.merge_snapshot(snapshot)
+        return True
+
 
 # Global cache instance
 _cache = Cache()
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import threading
+
+from src.utils.llm import get_agent_model_config
+from src.utils.progress import progress
+
+
+class SignalCache:
+    """In-memory cache of analyst signals.
+
+    Signals are looked up in two steps:
+      1. by (analyst, ticker, as-of date, model) - an exact repeat of a run,
+         which skips both the data fetch and the LLM call;
+      2. by (analyst, ticker, data fingerprint, model) - a different date whose
+         input data is unchanged (e.g. quarterly fundamentals), which skips the
+         analysis and the LLM call.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._by_as_of: dict[tuple, tuple[str, dict]] = {}
+        self._by_fingerprint: dict[tuple, dict] = {}
+
+    def get_as_of(self, agent_id: str, ticker: str, as_of: str, model_key: str) -> dict | None:
+        """Get the signal produced for exactly this as-of date, if any."""
+        with self._lock:
+            entry = self._by_as_of.get((agent_id, ticker, as_of, model_key))
+        return dict(entry[1]) if entry else None
+
+    def get_by_fingerprint(self, agent_id: str, ticker: str, fingerprint: str, model_key: str) -> dict | None:
+        """Get a signal previously produced from identical input data, if any."""
+        with self._lock:
+            signal = self._by_fingerprint.get((agent_id, ticker, fingerprint, model_key))
+        return dict(signal) if signal else None
+
+    def put(self, agent_id: str, ticker: str, as_of: str, fingerprint: str, model_key: str, signal: dict):
+        """Store a signal under both its as-of date and its data fingerprint."""
+        signal = dict(signal)
+        with self._lock:
+            self._by_as_of[(agent_id, ticker, as_of, model_key)] = (fingerprint, signal)
+            self._by_fingerprint[(agent_id, ticker, fingerprint, model_key)] = signal
+
+    def clear(self):
+        """Drop all cached signals."""
+        with self._lock:
+            self._by_as_of.clear()
+            self._by_fingerprint.clear()
+
+
+def fingerprint_data(*data: any) -> str:
+    """Hash the data an analyst consumed (Pydantic models, dicts, lists, scalars) into a stable fingerprint."""
+
+    def to_serializable(obj):
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump()
+        if isinstance(obj, (list, tuple)):
+            return [to_serializable(item) for item in obj]
+        if isinstance(obj, dict):
+            return {str(key): to_serializable(value) for key, value in obj.items()}
+        return obj
+
+    encoded = json.dumps(to_serializable(list(data)), sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _model_key(state, agent_id: str) -> str:
+    model_name, model_provider = get_agent_model_config(state, agent_id)
+    return f"{model_provider}:{model_name}"
+
+
+def lookup_signal_as_of(state, agent_id: str, ticker: str) -> dict | None:
+    """Return the cached signal for this analyst/ticker/as-of date, before fetching any data."""
+    cache = get_signal_cache()
+    if not cache.enabled:
+        return None
+
+    signal = cache.get_as_of(agent_id, ticker, state["data"]["end_date"], _model_key(state, agent_id))
+    if signal is not None:
+        progress.record_cache_result(agent_id, hit=True)
+        progress.update_status(agent_id, ticker, "Done (cached)", analysis=signal.get("reasoning"))
+    return signal
+
+
+def lookup_signal_by_data(state, agent_id: str, ticker: str, *data: any) -> tuple[dict | None, str | None]:
+    """
+    Fingerprint the fetched input data and return (cached_signal, fingerprint).
+    A hit is also recorded under the current as-of date so a repeat run skips the fetch.
+    """
+    cache = get_signal_cache()
+    if not cache.enabled:
+        return None, None
+
+    fingerprint = fingerprint_data(*data)
+    model_key = _model_key(state, agent_id)
+    signal = cache.get_by_fingerprint(agent_id, ticker, fingerprint, model_key)
+    progress.record_cache_result(agent_id, hit=signal is not None)
+    if signal is not None:
+        cache.put(agent_id, ticker, state["data"]["end_date"], fingerprint, model_key, signal)
+        progress.update_status(agent_id, ticker, "Done (unchanged data)", analysis=signal.get("reasoning"))
+    return signal, fingerprint
+
+
+def store_signal(state, agent_id: str, ticker: str, fingerprint: str | None, signal: dict):
+    """Record a freshly computed signal for later runs."""
+    cache = get_signal_cache()
+    if not cache.enabled or fingerprint is None:
+        return
+    cache.put(agent_id, ticker, state["data"]["end_date"], fingerprint, _model_key(state, agent_id), signal)
+
+
+# Global signal cache instance, created lazily so .env values loaded at startup are honoured
+_signal_cache: SignalCache | None = None
+
+
+def get_signal_cache() -> SignalCache:
+    """Get the global signal cache instance (enabled via SIGNAL_CACHE=1 or by setting `enabled`)."""
+    global _signal_cache
+    if _signal_cache is None:
+        _signal_cache = SignalCache(enabled=os.getenv("SIGNAL_CACHE", "0").lower() in ("1", "true", "yes"))
+    return _signal_cache
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import threading
+from enum import Enum
+from pathlib import Path
+
+from pydantic import BaseModel
+
+
+class LLMCacheMode(str, Enum):
+    """Enum for LLM response cache modes"""
+
+    OFF = "off"
+    RECORD = "record"  # Serve hits from disk, call the LLM on misses and store the response
+    REPLAY = "replay"  # Serve hits from disk only, never call the LLM
+
+
+DEFAULT_LLM_CACHE_DIR = Path(".cache") / "llm"
+
+
+class LLMResponseCache:
+    """Content-addressed on-disk cache for structured LLM responses.
+
+    Entries are keyed on (model, provider, prompt, output schema) so that
+    re-running the same backtest window with the same analysts produces
+    byte-identical prompts and is served from disk instead of the API.
+    """
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_LLM_CACHE_DIR, mode: LLMCacheMode | str = LLMCacheMode.OFF):
+        self.cache_dir = Path(cache_dir)
+        self.mode = LLMCacheMode(mode)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the cache is consulted at all"""
+        return self.mode != LLMCacheMode.OFF
+
+    @property
+    def replay_only(self) -> bool:
+        """Check if misses must be answered without calling the LLM"""
+        return self.mode == LLMCacheMode.REPLAY
+
+    def configure(self, mode: LLMCacheMode | str | None = None, cache_dir: str | Path | None = None):
+        """Change the cache mode and/or directory and reset the statistics."""
+        if mode is not None:
+            self.mode = LLMCacheMode(mode)
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir)
+        with self._lock:
+            self.hits = self.misses = self.writes = 0
+
+    def make_key(self, model_name: str, model_provider: str, prompt: any, pydantic_model: type[BaseModel]) -> str:
+        """Build the content hash identifying a single LLM request."""
+        if hasattr(model_provider, "value"):
+            model_provider = model_provider.value
+        payload = {
+            "model_name": model_name,
+            "model_provider": str(model_provider),
+            "prompt": _serialize_prompt(prompt),
+            "schema": pydantic_model.model_json_schema(),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str, pydantic_model: type[BaseModel]) -> BaseModel | None:
+        """Return the cached response for a key, or None on a miss."""
+        path = self._path_for(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            result = pydantic_model.model_validate(entry["response"])
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, response: BaseModel, model_name: str | None = None, model_provider: str | None = None, agent_name: str | None = None):
+        """Store a response under a key, replacing any existing entry atomically."""
+        if hasattr(model_provider, "value"):
+            model_provider = model_provider.value
+        entry = {
+            "model_name": model_name,
+            "model_provider": model_provider,
+            "agent_name": agent_name,
+            "response": response.model_dump(mode="json"),
+        }
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, sort_keys=True)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.writes += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get hit/miss/write counters since the last configure()."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+    def _path_for(self, key: str) -> Path:
+        # Shard by the first two hex characters to keep directories small
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+
+def _serialize_prompt(prompt: any) -> any:
+    """Convert a prompt (string, PromptValue or message list) into a stable JSON-able form."""
+    if hasattr(prompt, "to_messages"):
+        prompt = prompt.to_messages()
+    if isinstance(prompt, (list, tuple)):
+        return [_serialize_prompt(item) for item in prompt]
+    if hasattr(prompt, "type") and hasattr(prompt, "content"):
+        return {"type": prompt.type, "content": prompt.content}
+    return prompt if isinstance(prompt, (str, int, float, bool, dict)) or prompt is None else str(prompt)
+
+
+# Global LLM cache instance, created lazily so .env values loaded at startup are honoured
+_llm_cache: LLMResponseCache | None = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the global LLM response cache instance."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache(
+            cache_dir=os.getenv("LLM_CACHE_DIR", str(DEFAULT_LLM_CACHE_DIR)),
+            mode=os.getenv("LLM_CACHE_MODE", LLMCacheMode.OFF.value),
+        )
+    return _llm_cache
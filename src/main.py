@@ -16,6 +16,7 @@ from src.utils.ollama import ensure_ollama_and_model
 
 import argparse
 from datetime import datetime
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from src.utils.visualize import save_graph_as_png
 import json
@@ -56,10 +57,9 @@ def run_hedge_fund(
     progress.start()
 
     try:
-        # Create a new workflow if analysts are customized
+        # Reuse the compiled workflow for this analyst selection across calls
         if selected_analysts:
-            workflow = create_workflow(selected_analysts)
-            agent = workflow.compile()
+            agent = compile_workflow(tuple(selected_analysts))
         else:
             agent = app
 
@@ -132,6 +132,12 @@ def create_workflow(selected_analysts=None):
     return workflow
 
 
+@lru_cache(maxsize=16)
+def compile_workflow(selected_analysts: tuple[str, ...]):
+    """Compile (once) the workflow for a given analyst selection."""
+    return create_workflow(list(selected_analysts)).compile()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the hedge fund trading system")
     parser.add_argument("--initial-cash", type=float, default=100000.0, help="Initial cash position. Defaults to 100000.0)")
@@ -0,0 +1,303 @@
+import sys
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+
+import numpy as np
+import pandas as pd
+from colorama import Fore, Style, init
+from tabulate import tabulate
+from typing_extensions import Callable
+
+from src.backtester import Backtester
+from src.data.cache import get_cache
+from src.llm.cache import LLMCacheMode, get_llm_cache
+from src.main import run_hedge_fund
+from src.utils.analysts import ANALYST_ORDER
+
+init(autoreset=True)
+
+DEFAULT_DATA_CACHE_PATH = ".cache/data/api_cache.pkl"
+
+
+def split_date_range(start_date: str, end_date: str, num_windows: int | None = None, window_months: int | None = None) -> list[tuple[str, str]]:
+    """
+    Shard [start_date, end_date] into disjoint, contiguous windows.
+
+    Exactly one of `num_windows` (equal-length windows) or `window_months`
+    (calendar windows of that many months, the last one truncated) must be given.
+    """
+    if (num_windows is None) == (window_months is None):
+        raise ValueError("Specify exactly one of num_windows or window_months")
+
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+    if end_dt < start_dt:
+        raise ValueError("end_date must not be before start_date")
+
+    windows = []
+    if num_windows is not None:
+        if num_windows < 1:
+            raise ValueError("num_windows must be at least 1")
+        total_days = (end_dt - start_dt).days + 1
+        num_windows = min(num_windows, total_days)
+        boundaries = np.linspace(0, total_days, num_windows + 1).round().astype(int)
+        for lo, hi in zip(boundaries[:-1], boundaries[1:]):
+            window_start = start_dt + timedelta(days=int(lo))
+            window_end = start_dt + timedelta(days=int(hi) - 1)
+            windows.append((window_start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")))
+    else:
+        if window_months < 1:
+            raise ValueError("window_months must be at least 1")
+        window_start = start_dt
+        while window_start <= end_dt:
+            window_end = min(window_start + relativedelta(months=window_months) - timedelta(days=1), end_dt)
+            windows.append((window_start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")))
+            window_start = window_end + timedelta(days=1)
+
+    return windows
+
+
+def _init_worker(data_cache_path: str | None, llm_cache_mode: str, llm_cache_dir: str):
+    """Warm each worker process from the persistent data cache and silence the live progress display."""
+    from src.utils.progress import console
+
+    console.quiet = True
+    if data_cache_path:
+        get_cache().load(data_cache_path)
+    get_llm_cache().configure(mode=llm_cache_mode, cache_dir=llm_cache_dir)
+
+
+def _run_window(job: dict) -> dict:
+    """Run one independent backtest window in a worker process."""
+    # Workers run several windows and start warm, so only ship back what this window fetched
+    cache_marker = get_cache().mark()
+    backtester = Backtester(
+        agent=job["agent"],
+        tickers=job["tickers"],
+        start_date=job["start_date"],
+        end_date=job["end_date"],
+        initial_capital=job["initial_capital"],
+        model_name=job["model_name"],
+        model_provider=job["model_provider"],
+        selected_analysts=job["selected_analysts"],
+        initial_margin_requirement=job["margin_requirement"],
+        output_mode="quiet",
+    )
+    metrics = backtester.run_backtest()
+    history = backtester.history_frame()
+
+    final_value = float(history["Portfolio Value"].iloc[-1]) if not history.empty else job["initial_capital"]
+    return {
+        "window_id": job["window_id"],
+        "tickers": job["tickers"],
+        "start_date": job["start_date"],
+        "end_date": job["end_date"],
+        "trading_days": max(len(history) - 1, 0),
+        "final_value": final_value,
+        "total_return": (final_value / job["initial_capital"] - 1) * 100,
+        "sharpe_ratio": metrics.get("sharpe_ratio"),
+        "sortino_ratio": metrics.get("sortino_ratio"),
+        "max_drawdown": metrics.get("max_drawdown"),
+        "realized_gains": backtester.ledger.total_realized_gains(),
+        # Ship newly fetched data back so the parent can persist it for the next run
+        "cache_snapshot": get_cache().snapshot_since(cache_marker),
+    }
+
+
+def merge_window_results(results: list[dict]) -> pd.DataFrame:
+    """Combine per-window results into one report with an aggregate row at the bottom."""
+    columns = ["window_id", "tickers", "start_date", "end_date", "trading_days", "final_value", "total_return", "sharpe_ratio", "sortino_ratio", "max_drawdown", "realized_gains"]
+    report = pd.DataFrame([{column: result.get(column) for column in columns} for result in results], columns=columns)
+    if report.empty:
+        return report
+
+    report = report.sort_values("window_id").reset_index(drop=True)
+    report["tickers"] = report["tickers"].apply(lambda tickers: ",".join(tickers))
+
+    numeric = report[["total_return", "sharpe_ratio", "sortino_ratio", "max_drawdown"]].apply(pd.to_numeric, errors="coerce").replace([np.inf, -np.inf], np.nan)
+    aggregate = {
+        "window_id": "ALL",
+        "tickers": "",
+        "start_date": report["start_date"].min(),
+        "end_date": report["end_date"].max(),
+        "trading_days": int(report["trading_days"].sum()),
+        # Windows are independent books, so there is no combined final value (left empty)
+        "total_return": numeric["total_return"].mean(),
+        "sharpe_ratio": numeric["sharpe_ratio"].mean(),
+        "sortino_ratio": numeric["sortino_ratio"].mean(),
+        # The worst (most negative) drawdown across windows
+        "max_drawdown": numeric["max_drawdown"].min(),
+        "realized_gains": report["realized_gains"].sum(),
+    }
+    return pd.concat([report, pd.DataFrame([aggregate])], ignore_index=True)
+
+
+def run_parallel_backtests(
+    ticker_sets: list[list[str]],
+    windows: list[tuple[str, str]],
+    initial_capital: float,
+    model_name: str = "gpt-4.1",
+    model_provider: str = "OpenAI",
+    selected_analysts: list[str] = [],
+    margin_requirement: float = 0.0,
+    max_workers: int | None = None,
+    data_cache_path: str | None = DEFAULT_DATA_CACHE_PATH,
+    agent: Callable = run_hedge_fund,
+) -> pd.DataFrame:
+    """
+    Run every (ticker set, window) combination as an independent backtest across a process pool.
+
+    Each window starts from `initial_capital` with an empty book, so windows do not share
+    portfolio state. Workers start from the persistent data cache at `data_cache_path`; the data
+    they fetch is merged back and saved so subsequent runs start warm.
+    """
+    jobs = []
+    for tickers in ticker_sets:
+        for start_date, end_date in windows:
+            jobs.append(
+                {
+                    "window_id": len(jobs),
+                    "agent": agent,
+                    "tickers": tickers,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "initial_capital": initial_capital,
+                    "model_name": model_name,
+                    "model_provider": model_provider,
+                    "selected_analysts": selected_analysts,
+                    "margin_requirement": margin_requirement,
+                }
+            )
+
+    # Start from the persisted cache so saving at the end keeps entries no window refetched
+    if data_cache_path:
+        get_cache().load(data_cache_path)
+
+    llm_cache = get_llm_cache()
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(data_cache_path, llm_cache.mode.value, str(llm_cache.cache_dir)),
+    ) as executor:
+        futures = {executor.submit(_run_window, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"{Fore.RED}Window {job['window_id']} ({','.join(job['tickers'])} {job['start_date']} to {job['end_date']}) failed: {e}{Style.RESET_ALL}")
+                continue
+
+            get_cache().merge_snapshot(result.pop("cache_snapshot"))
+            results.append(result)
+            print(f"Finished window {result['window_id']}: {','.join(result['tickers'])} {result['start_date']} to {result['end_date']} " f"({result['total_return']:+.2f}%)")
+
+    if data_cache_path:
+        get_cache().save(data_cache_path)
+
+    return merge_window_results(results)
+
+
+def print_parallel_report(report: pd.DataFrame) -> None:
+    """Print the merged multi-window report"""
+    if report.empty:
+        print("No completed windows to report.")
+        return
+
+    def fmt(value, pattern):
+        return pattern.format(value) if value is not None and pd.notnull(value) else ""
+
+    rows = [
+        [
+            row["window_id"],
+            row["tickers"],
+            row["start_date"],
+            row["end_date"],
+            row["trading_days"],
+            fmt(row["final_value"], "${:,.2f}"),
+            fmt(row["total_return"], "{:+.2f}%"),
+            fmt(row["sharpe_ratio"], "{:.2f}"),
+            fmt(row["sortino_ratio"], "{:.2f}"),
+            fmt(row["max_drawdown"], "{:.2f}%"),
+        ]
+        for _, row in report.iterrows()
+    ]
+
+    print(f"\n{Fore.WHITE}{Style.BRIGHT}MULTI-WINDOW BACKTEST REPORT:{Style.RESET_ALL}")
+    print(
+        tabulate(
+            rows,
+            headers=["Window", "Tickers", "Start", "End", "Days", "Final Value", "Return", "Sharpe", "Sortino", "Max Drawdown"],
+            tablefmt="grid",
+        )
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run independent backtest windows in parallel")
+    parser.add_argument("--tickers", type=str, help="Comma-separated list of stock ticker symbols (e.g., AAPL,MSFT,GOOGL)")
+    parser.add_argument("--ticker-sets", type=str, help="Semicolon-separated independent ticker sets (e.g., AAPL,MSFT;NVDA,AMD)")
+    parser.add_argument("--start-date", type=str, required=True, help="Start date in YYYY-MM-DD format")
+    parser.add_argument("--end-date", type=str, required=True, help="End date in YYYY-MM-DD format")
+    parser.add_argument("--windows", type=int, default=None, help="Split the date range into this many equal windows")
+    parser.add_argument("--window-months", type=int, default=None, help="Split the date range into windows of this many months")
+    parser.add_argument("--initial-capital", type=float, default=100000, help="Initial capital per window (default: 100000)")
+    parser.add_argument("--margin-requirement", type=float, default=0.0, help="Margin ratio for short positions (default: 0.0)")
+    parser.add_argument("--analysts", type=str, help="Comma-separated list of analysts to use")
+    parser.add_argument("--analysts-all", action="store_true", help="Use all available analysts (overrides --analysts)")
+    parser.add_argument("--model-name", type=str, default="gpt-4.1", help="LLM model name (default: gpt-4.1)")
+    parser.add_argument("--model-provider", type=str, default="OpenAI", help="LLM provider (default: OpenAI)")
+    parser.add_argument("--max-workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--data-cache", type=str, default=DEFAULT_DATA_CACHE_PATH, help=f"Persistent API data cache shared by all workers (default: {DEFAULT_DATA_CACHE_PATH})")
+    parser.add_argument(
+        "--llm-cache",
+        type=str,
+        choices=[mode.value for mode in LLMCacheMode],
+        default=None,
+        help="LLM response cache mode shared by all workers (default: LLM_CACHE_MODE or off)",
+    )
+    parser.add_argument("--llm-cache-dir", type=str, default=None, help="Directory for recorded LLM responses")
+
+    args = parser.parse_args()
+
+    if args.ticker_sets:
+        ticker_sets = [[ticker.strip() for ticker in ticker_set.split(",") if ticker.strip()] for ticker_set in args.ticker_sets.split(";") if ticker_set.strip()]
+    elif args.tickers:
+        ticker_sets = [[ticker.strip() for ticker in args.tickers.split(",") if ticker.strip()]]
+    else:
+        print("Provide --tickers or --ticker-sets.")
+        sys.exit(1)
+
+    if args.analysts_all:
+        selected_analysts = [a[1] for a in ANALYST_ORDER]
+    elif args.analysts:
+        selected_analysts = [a.strip() for a in args.analysts.split(",") if a.strip()]
+    else:
+        print("Provide --analysts or --analysts-all.")
+        sys.exit(1)
+
+    if args.windows is None and args.window_months is None:
+        windows = [(args.start_date, args.end_date)]
+    else:
+        windows = split_date_range(args.start_date, args.end_date, num_windows=args.windows, window_months=args.window_months)
+
+    get_llm_cache().configure(mode=args.llm_cache, cache_dir=args.llm_cache_dir)
+
+    print(f"Running {len(windows) * len(ticker_sets)} backtests ({len(ticker_sets)} ticker set(s) x {len(windows)} window(s))...")
+    report = run_parallel_backtests(
+        ticker_sets=ticker_sets,
+        windows=windows,
+        initial_capital=args.initial_capital,
+        model_name=args.model_name,
+        model_provider=args.model_provider,
+        selected_analysts=selected_analysts,
+        margin_requirement=args.margin_requirement,
+        max_workers=args.max_workers,
+        data_cache_path=args.data_cache,
+    )
+    print_parallel_report(report)
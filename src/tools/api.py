@@ -5,6 +5,8 @@ import requests
 import time
 
 from src.data.cache import get_cache
+from src.utils.cancellation import cancellable_sleep, raise_if_cancelled
+from src.utils.http import get_session
 from src.data.models import (
     CompanyNews,
     CompanyNewsResponse,
@@ -41,16 +43,17 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
         Exception: If the request fails with a non-429 error
     """
     for attempt in range(max_retries + 1):  # +1 for initial attempt
+        raise_if_cancelled()
         if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
+            response = get_session().post(url, headers=headers, json=json_data)
         else:
-            response = requests.get(url, headers=headers)
+            response = get_session().get(url, headers=headers)
         
         if response.status_code == 429 and attempt < max_retries:
             # Linear backoff: 60s, 90s, 120s, 150s...
             delay = 60 + (30 * attempt)
             print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
-            time.sleep(delay)
+            cancellable_sleep(delay)
             continue
         
         # Return the response (whether success, other errors, or final 429)
@@ -0,0 +1,53 @@
+"""Cooperative cancellation for hedge fund runs.
+
+A run binds a threading.Event with `cancellation_scope`; the event is stored in a
+context variable, so it follows the run into LangGraph's worker threads. Long
+running helpers (LLM calls, data API requests, retry backoffs) call
+`raise_if_cancelled` / `cancellable_sleep` so a cancelled run stops at its next
+checkpoint instead of finishing every remaining call.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class RunCancelledError(Exception):
+    """Raised inside a run whose cancellation event has been set."""
+
+
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar("run_cancel_event", default=None)
+
+
+@contextmanager
+def cancellation_scope(event: threading.Event) -> Iterator[threading.Event]:
+    """Make `event` the cancellation signal for work done in this context."""
+    token = _cancel_event.set(event)
+    try:
+        yield event
+    finally:
+        _cancel_event.reset(token)
+
+
+def is_cancelled() -> bool:
+    """Whether the current run has been cancelled."""
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+def raise_if_cancelled():
+    """Raise RunCancelledError if the current run has been cancelled."""
+    if is_cancelled():
+        raise RunCancelledError("Run was cancelled")
+
+
+def cancellable_sleep(seconds: float):
+    """Sleep for `seconds`, waking up early (and raising) if the current run is cancelled."""
+    event = _cancel_event.get()
+    if event is None:
+        time.sleep(seconds)
+        return
+    if event.wait(seconds):
+        raise RunCancelledError("Run was cancelled")
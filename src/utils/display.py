@@ -226,12 +226,37 @@ def print_trading_output(result: dict) -> None:
         print(f"{Fore.CYAN}{wrapped_reasoning}{Style.RESET_ALL}")
 
 
-def print_backtest_results(table_rows: list) -> None:
-    """Print the backtest results in a nicely formatted table"""
-    # Clear the screen
-    os.system("cls" if os.name == "nt" else "clear")
+BACKTEST_OUTPUT_MODES = ("full", "stream", "quiet")
 
-    # Split rows into ticker rows and summary rows
+BACKTEST_TABLE_HEADERS = [
+    "Date",
+    "Ticker",
+    "Action",
+    "Quantity",
+    "Price",
+    "Shares",
+    "Position Value",
+    "Bullish",
+    "Bearish",
+    "Neutral",
+]
+
+BACKTEST_TABLE_COLALIGN = (
+    "left",  # Date
+    "left",  # Ticker
+    "center",  # Action
+    "right",  # Quantity
+    "right",  # Price
+    "right",  # Shares
+    "right",  # Position Value
+    "right",  # Bullish
+    "right",  # Bearish
+    "right",  # Neutral
+)
+
+
+def _split_backtest_rows(table_rows: list) -> tuple[list, list]:
+    """Split rows into ticker rows and summary rows"""
     ticker_rows = []
     summary_rows = []
 
@@ -241,69 +266,79 @@ def print_backtest_results(table_rows: list) -> None:
         else:
             ticker_rows.append(row)
 
-    
-    # Display latest portfolio summary
-    if summary_rows:
-        latest_summary = summary_rows[-1]
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}PORTFOLIO SUMMARY:{Style.RESET_ALL}")
+    return ticker_rows, summary_rows
 
-        # Extract values and remove commas before converting to float
-        cash_str = latest_summary[7].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
-        position_str = latest_summary[6].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
-        total_str = latest_summary[8].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
 
-        print(f"Cash Balance: {Fore.CYAN}${float(cash_str):,.2f}{Style.RESET_ALL}")
-        print(f"Total Position Value: {Fore.YELLOW}${float(position_str):,.2f}{Style.RESET_ALL}")
-        print(f"Total Value: {Fore.WHITE}${float(total_str):,.2f}{Style.RESET_ALL}")
-        print(f"Return: {latest_summary[9]}")
-        
-        # Display performance metrics if available
-        if latest_summary[10]:  # Sharpe ratio
-            print(f"Sharpe Ratio: {latest_summary[10]}")
-        if latest_summary[11]:  # Sortino ratio
-            print(f"Sortino Ratio: {latest_summary[11]}")
-        if latest_summary[12]:  # Max drawdown
-            print(f"Max Drawdown: {latest_summary[12]}")
+def _print_portfolio_summary(latest_summary: list) -> None:
+    """Print the portfolio summary block for a summary row"""
+    print(f"\n{Fore.WHITE}{Style.BRIGHT}PORTFOLIO SUMMARY:{Style.RESET_ALL}")
+
+    # Extract values and remove commas before converting to float
+    cash_str = latest_summary[7].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
+    position_str = latest_summary[6].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
+    total_str = latest_summary[8].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
+
+    print(f"Cash Balance: {Fore.CYAN}${float(cash_str):,.2f}{Style.RESET_ALL}")
+    print(f"Total Position Value: {Fore.YELLOW}${float(position_str):,.2f}{Style.RESET_ALL}")
+    print(f"Total Value: {Fore.WHITE}${float(total_str):,.2f}{Style.RESET_ALL}")
+    print(f"Return: {latest_summary[9]}")
+
+    # Display performance metrics if available
+    if latest_summary[10]:  # Sharpe ratio
+        print(f"Sharpe Ratio: {latest_summary[10]}")
+    if latest_summary[11]:  # Sortino ratio
+        print(f"Sortino Ratio: {latest_summary[11]}")
+    if latest_summary[12]:  # Max drawdown
+        print(f"Max Drawdown: {latest_summary[12]}")
+
+
+def print_backtest_results(table_rows: list, clear_screen: bool = True) -> None:
+    """Print the backtest results in a nicely formatted table.
+
+    Pass clear_screen=False to print below earlier output instead of redrawing the
+    screen, e.g. for the closing table after streamed days.
+    """
+    if clear_screen:
+        os.system("cls" if os.name == "nt" else "clear")
+
+    ticker_rows, summary_rows = _split_backtest_rows(table_rows)
+
+    # Display latest portfolio summary
+    if summary_rows:
+        _print_portfolio_summary(summary_rows[-1])
 
     # Add vertical spacing
     print("\n" * 2)
 
     # Print the table with just ticker rows
-    print(
-        tabulate(
-            ticker_rows,
-            headers=[
-                "Date",
-                "Ticker",
-                "Action",
-                "Quantity",
-                "Price",
-                "Shares",
-                "Position Value",
-                "Bullish",
-                "Bearish",
-                "Neutral",
-            ],
-            tablefmt="grid",
-            colalign=(
-                "left",  # Date
-                "left",  # Ticker
-                "center",  # Action
-                "right",  # Quantity
-                "right",  # Price
-                "right",  # Shares
-                "right",  # Position Value
-                "right",  # Bullish
-                "right",  # Bearish
-                "right",  # Neutral
-            ),
-        )
-    )
+    print(tabulate(ticker_rows, headers=BACKTEST_TABLE_HEADERS, tablefmt="grid", colalign=BACKTEST_TABLE_COLALIGN))
 
     # Add vertical spacing
     print("\n" * 4)
 
 
+def print_backtest_day(date_rows: list) -> None:
+    """Print only one trading day's rows, appended below the previous output.
+
+    Unlike print_backtest_results this neither clears the screen nor re-renders
+    earlier days, so the cost per day is constant for long backtests.
+    """
+    ticker_rows, summary_rows = _split_backtest_rows(date_rows)
+
+    print(tabulate(ticker_rows, headers=BACKTEST_TABLE_HEADERS, tablefmt="simple", colalign=BACKTEST_TABLE_COLALIGN))
+    if summary_rows:
+        latest_summary = summary_rows[-1]
+        metrics = [f"Total Value: {latest_summary[8]}", f"Return: {latest_summary[9]}"]
+        if latest_summary[10]:
+            metrics.append(f"Sharpe: {latest_summary[10]}")
+        if latest_summary[11]:
+            metrics.append(f"Sortino: {latest_summary[11]}")
+        if latest_summary[12]:
+            metrics.append(f"Max DD: {latest_summary[12]}")
+        print(" | ".join(metrics))
+    print()
+
+
 def format_backtest_row(
     date: str,
     ticker: str,
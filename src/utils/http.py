@@ -0,0 +1,129 @@
+"""Shared HTTP session for the external data APIs.
+
+Every request made through `get_session()` reuses one pooled, keep-alive
+`requests.Session` instead of opening a new TCP+TLS connection per call. The
+mounted adapter retries transient socket errors (connect/read failures only;
+429s are handled by the callers' backoff), sends `If-None-Match` /
+`If-Modified-Since` for URLs whose last 200 carried an ETag or Last-Modified and
+answers a 304 from memory, and records per-host latency histograms.
+
+Pool and retry sizes come from HTTP_POOL_MAXSIZE (default 16) and
+HTTP_MAX_RETRIES (default 3). Setting HTTP_REPLAY_DIR records or replays responses
+instead (see `src.utils.http_replay`).
+"""
+
+import bisect
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from src.utils.http_replay import replay_adapter_from_env
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# Revalidatable responses kept in memory
+CONDITIONAL_CACHE_ENTRIES = 256
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter with socket-level retries, conditional GETs and latency histograms."""
+
+    def __init__(self, pool_maxsize: int, max_retries: int):
+        retries = Retry(total=max_retries, connect=max_retries, read=max_retries, status=0,
+                        backoff_factor=0.5, allowed_methods=frozenset({"GET", "HEAD"}), raise_on_status=False)
+        super().__init__(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retries)
+        self._validated: OrderedDict[str, tuple[str | None, str | None, requests.Response]] = OrderedDict()
+        self._latency: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, stream=False, **kwargs):
+        cached = None
+        if request.method == "GET" and not stream:
+            with self._lock:
+                cached = self._validated.get(request.url)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    request.headers["If-None-Match"] = etag
+                if last_modified:
+                    request.headers["If-Modified-Since"] = last_modified
+
+        started = time.perf_counter()
+        response = super().send(request, stream=stream, **kwargs)
+        self._observe(request.url, time.perf_counter() - started)
+
+        if cached and response.status_code == 304:
+            return _replay(response, cached[2])
+        if request.method == "GET" and not stream and response.status_code == 200:
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if etag or last_modified:
+                response.content  # read the body so it can be replayed
+                with self._lock:
+                    self._validated[request.url] = (etag, last_modified, response)
+                    self._validated.move_to_end(request.url)
+                    if len(self._validated) > CONDITIONAL_CACHE_ENTRIES:
+                        self._validated.popitem(last=False)
+        return response
+
+    def _observe(self, url: str, seconds: float):
+        host = urlsplit(url).netloc
+        with self._lock:
+            counts = self._latency.setdefault(host, [0] * (len(LATENCY_BUCKETS_MS) + 1))
+            counts[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    def latency_histograms(self) -> dict[str, dict[str, int]]:
+        """Request counts per latency bucket, keyed by host."""
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        with self._lock:
+            return {host: dict(zip(labels, counts)) for host, counts in self._latency.items()}
+
+
+def _replay(not_modified: requests.Response, cached: requests.Response) -> requests.Response:
+    """Answer a 304 with the cached body, keeping the fresh headers."""
+    headers = CaseInsensitiveDict(cached.headers)
+    headers.update(not_modified.headers)
+    headers.pop("Content-Encoding", None)  # the cached body is already decoded
+    not_modified.headers = headers
+    not_modified.status_code = 200
+    not_modified.reason = "OK"
+    not_modified._content = cached.content
+    not_modified.encoding = cached.encoding
+    return not_modified
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """The process-wide pooled session, created on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                adapter = PooledAdapter(
+                    pool_maxsize=int(os.environ.get("HTTP_POOL_MAXSIZE", "16")),
+                    max_retries=int(os.environ.get("HTTP_MAX_RETRIES", "3")),
+                )
+                # HTTP_REPLAY_DIR swaps the network for a recorded-response archive
+                adapter = replay_adapter_from_env(adapter) or adapter
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+                _session = session
+    return _session
+
+
+def get_latency_histograms() -> dict[str, dict[str, int]]:
+    """Per-host latency histograms of the shared session."""
+    adapter = get_session().get_adapter("https://")
+    adapter = getattr(adapter, "upstream", adapter)
+    return adapter.latency_histograms()
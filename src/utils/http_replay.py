@@ -0,0 +1,120 @@
+"""Record/replay of HTTP responses for offline, deterministic runs.
+
+When HTTP_REPLAY_DIR is set, `src.utils.http.get_session()` routes requests through
+`ReplayAdapter`. With HTTP_REPLAY_MODE=record (the default is replay), responses from
+the real pooled adapter are written to the archive; in replay mode they are served from
+it and the network is never touched. Unrecorded requests get a 404 "Not Recorded".
+
+The archive layout matches the backtrader replay provider (one JSON file per request at
+<dir>/http/<host>/<key>.json, keyed on the method and the URL with sorted query
+parameters and without credentials), so one archive can serve both.
+HTTP_REPLAY_LATENCY_MS adds simulated latency to replayed responses.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+CREDENTIAL_PARAMS = {"apikey", "api_key", "token", "access_token", "key"}
+TRANSPORT_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive", "set-cookie"}
+
+
+def normalize_url(url: str) -> str:
+    """Sort query parameters and drop credentials so equivalent requests share a key."""
+    parts = urlsplit(url)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name.lower() not in CREDENTIAL_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that archives (record) or serves (replay) HTTP responses."""
+
+    def __init__(self, archive_dir: str, mode: str = "replay", upstream: BaseAdapter | None = None, latency_ms: float = 0.0):
+        super().__init__()
+        if mode not in ("replay", "record"):
+            raise ValueError(f"Unknown HTTP_REPLAY_MODE: {mode}")
+        self.root = Path(archive_dir) / "http"
+        self.mode = mode
+        self.upstream = upstream
+        self.latency_ms = latency_ms
+
+    def _path(self, request) -> Path:
+        digest = hashlib.sha256(f"{request.method.upper()} {normalize_url(request.url)}".encode())
+        if request.body and request.method.upper() != "GET":
+            digest.update(request.body if isinstance(request.body, bytes) else str(request.body).encode())
+        host = urlsplit(request.url).netloc.lower().replace(":", "_") or "local"
+        return self.root / host / f"{digest.hexdigest()[:24]}.json"
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        path = self._path(request)
+        if self.mode == "record":
+            response = self.upstream.send(request, stream=False, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+            if response.status_code < 500:
+                self._save(path, request, response)
+            return response
+
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+        if not path.exists():
+            return self._build(request, 404, "Not Recorded", {"Content-Type": "text/plain"}, b"No recorded response for this request", "utf-8")
+        record = json.loads(path.read_text(encoding="utf-8"))
+        content = base64.b64decode(record["body"]) if record.get("body_base64") else record["body"].encode("utf-8")
+        return self._build(request, record["status"], record.get("reason") or "", record.get("headers", {}), content, record.get("encoding"))
+
+    def close(self):
+        if self.upstream is not None:
+            self.upstream.close()
+
+    def _save(self, path: Path, request, response: requests.Response):
+        content = response.content or b""
+        try:
+            body, is_base64 = content.decode("utf-8"), False
+        except UnicodeDecodeError:
+            body, is_base64 = base64.b64encode(content).decode("ascii"), True
+        record = {
+            "request": {"method": request.method.upper(), "url": normalize_url(request.url)},
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {name: value for name, value in response.headers.items() if name.lower() not in TRANSPORT_HEADERS},
+            "encoding": response.encoding,
+            "body": body,
+            "body_base64": is_base64,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(record, indent=1), encoding="utf-8")
+        temp_path.replace(path)
+
+    def _build(self, request, status: int, reason: str, headers: dict, content: bytes, encoding: str | None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        response.encoding = encoding
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def replay_adapter_from_env(upstream: BaseAdapter) -> ReplayAdapter | None:
+    """A ReplayAdapter configured from HTTP_REPLAY_* variables, or None when replay is off."""
+    archive_dir = os.environ.get("HTTP_REPLAY_DIR")
+    if not archive_dir:
+        return None
+    return ReplayAdapter(
+        archive_dir,
+        mode=os.environ.get("HTTP_REPLAY_MODE", "replay"),
+        upstream=upstream,
+        latency_ms=float(os.environ.get("HTTP_REPLAY_LATENCY_MS", "0")),
+    )
@@ -0,0 +1,193 @@
+import numpy as np
+
+
+class PortfolioLedger:
+    """Array-backed long/short portfolio ledger.
+
+    Positions, cost bases, margin and realized gains are stored as NumPy arrays
+    indexed by ticker so that valuing the whole book is a couple of vector
+    operations instead of a Python loop over dictionaries. `to_dict()` returns
+    the nested dict layout the agents expect.
+    """
+
+    def __init__(self, tickers: list[str], initial_cash: float, margin_requirement: float = 0.0):
+        self.tickers = list(tickers)
+        self.ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        n = len(self.tickers)
+
+        self.cash = float(initial_cash)
+        self.margin_used = 0.0  # total margin usage across all short positions
+        self.margin_requirement = float(margin_requirement)
+
+        self.long = np.zeros(n, dtype=np.int64)  # Number of shares held long
+        self.short = np.zeros(n, dtype=np.int64)  # Number of shares held short
+        self.long_cost_basis = np.zeros(n, dtype=np.float64)  # Average cost basis per share (long)
+        self.short_cost_basis = np.zeros(n, dtype=np.float64)  # Average cost basis per share (short)
+        self.short_margin_used = np.zeros(n, dtype=np.float64)  # Dollars of margin used for each ticker's short
+        self.realized_long = np.zeros(n, dtype=np.float64)  # Realized gains from long positions
+        self.realized_short = np.zeros(n, dtype=np.float64)  # Realized gains from short positions
+
+    def prices_array(self, current_prices: dict[str, float]) -> np.ndarray:
+        """Convert a ticker -> price mapping into an array aligned with the ledger."""
+        return np.fromiter((current_prices[ticker] for ticker in self.tickers), dtype=np.float64, count=len(self.tickers))
+
+    def execute_trade(self, ticker: str, action: str, quantity: float, current_price: float) -> int:
+        """
+        Execute trades with support for both long and short positions.
+        `quantity` is the number of shares the agent wants to buy/sell/short/cover.
+        Only integer shares are traded. Returns the number of shares executed.
+        """
+        if quantity <= 0:
+            return 0
+
+        quantity = int(quantity)  # force integer shares
+        i = self.ticker_index[ticker]
+
+        if action == "buy":
+            cost = quantity * current_price
+            if cost > self.cash:
+                # Fall back to the maximum affordable quantity
+                quantity = int(self.cash / current_price)
+                if quantity <= 0:
+                    return 0
+                cost = quantity * current_price
+
+            # Weighted average cost basis for the new total
+            old_shares = int(self.long[i])
+            total_shares = old_shares + quantity
+            if total_shares > 0:
+                self.long_cost_basis[i] = (self.long_cost_basis[i] * old_shares + cost) / total_shares
+
+            self.long[i] += quantity
+            self.cash -= cost
+            return quantity
+
+        elif action == "sell":
+            # You can only sell as many as you own
+            quantity = min(quantity, int(self.long[i]))
+            if quantity > 0:
+                # Realized gain/loss using average cost basis
+                avg_cost_per_share = self.long_cost_basis[i] if self.long[i] > 0 else 0
+                self.realized_long[i] += (current_price - avg_cost_per_share) * quantity
+
+                self.long[i] -= quantity
+                self.cash += quantity * current_price
+
+                if self.long[i] == 0:
+                    self.long_cost_basis[i] = 0.0
+
+                return quantity
+
+        elif action == "short":
+            """
+            Typical short sale flow:
+              1) Receive proceeds = current_price * quantity
+              2) Post margin_required = proceeds * margin_ratio
+              3) Net effect on cash = +proceeds - margin_required
+            """
+            margin_ratio = self.margin_requirement
+            margin_required = current_price * quantity * margin_ratio
+            if margin_required > self.cash:
+                # Fall back to the maximum shortable quantity
+                quantity = int(self.cash / (current_price * margin_ratio)) if margin_ratio > 0 else 0
+                if quantity <= 0:
+                    return 0
+
+            proceeds = current_price * quantity
+            margin_required = proceeds * margin_ratio
+
+            # Weighted average short cost basis
+            old_short_shares = int(self.short[i])
+            total_shares = old_short_shares + quantity
+            if total_shares > 0:
+                self.short_cost_basis[i] = (self.short_cost_basis[i] * old_short_shares + proceeds) / total_shares
+
+            self.short[i] += quantity
+
+            # Update margin usage
+            self.short_margin_used[i] += margin_required
+            self.margin_used += margin_required
+
+            # Increase cash by proceeds, then subtract the required margin
+            self.cash += proceeds
+            self.cash -= margin_required
+            return quantity
+
+        elif action == "cover":
+            """
+            When covering shares:
+              1) Pay cover cost = current_price * quantity
+              2) Release a proportional share of the margin
+              3) Net effect on cash = -cover_cost + released_margin
+            """
+            quantity = min(quantity, int(self.short[i]))
+            if quantity > 0:
+                cover_cost = quantity * current_price
+                avg_short_price = self.short_cost_basis[i] if self.short[i] > 0 else 0
+                realized_gain = (avg_short_price - current_price) * quantity
+
+                portion = quantity / self.short[i] if self.short[i] > 0 else 1.0
+                margin_to_release = portion * self.short_margin_used[i]
+
+                self.short[i] -= quantity
+                self.short_margin_used[i] -= margin_to_release
+                self.margin_used -= margin_to_release
+
+                # Pay the cost to cover, but get back the released margin
+                self.cash += margin_to_release
+                self.cash -= cover_cost
+
+                self.realized_short[i] += realized_gain
+
+                if self.short[i] == 0:
+                    self.short_cost_basis[i] = 0.0
+                    self.short_margin_used[i] = 0.0
+
+                return quantity
+
+        return 0
+
+    def exposures(self, prices: np.ndarray) -> tuple[float, float]:
+        """Return (long_exposure, short_exposure) in dollars for a price array."""
+        return float(self.long @ prices), float(self.short @ prices)
+
+    def net_position_values(self, prices: np.ndarray) -> np.ndarray:
+        """Per-ticker long minus short market value."""
+        return (self.long - self.short) * prices
+
+    def portfolio_value(self, prices: np.ndarray) -> float:
+        """
+        Total portfolio value: cash plus the market value of long positions
+        minus the market value of short positions.
+        """
+        long_exposure, short_exposure = self.exposures(prices)
+        return self.cash + long_exposure - short_exposure
+
+    def total_realized_gains(self) -> float:
+        """Sum of realized gains across all tickers and both sides."""
+        return float(self.realized_long.sum() + self.realized_short.sum())
+
+    def to_dict(self) -> dict:
+        """Snapshot the ledger in the nested dict format consumed by the agents."""
+        return {
+            "cash": self.cash,
+            "margin_used": self.margin_used,
+            "margin_requirement": self.margin_requirement,
+            "positions": {
+                ticker: {
+                    "long": int(self.long[i]),
+                    "short": int(self.short[i]),
+                    "long_cost_basis": float(self.long_cost_basis[i]),
+                    "short_cost_basis": float(self.short_cost_basis[i]),
+                    "short_margin_used": float(self.short_margin_used[i]),
+                }
+                for i, ticker in enumerate(self.tickers)
+            },
+            "realized_gains": {
+                ticker: {
+                    "long": float(self.realized_long[i]),
+                    "short": float(self.realized_short[i]),
+                }
+                for i, ticker in enumerate(self.tickers)
+            },
+        }
@@ -2,7 +2,9 @@
 
 import json
 from pydantic import BaseModel
+from src.llm.cache import get_llm_cache
 from src.llm.models import get_model, get_model_info
+from src.utils.cancellation import raise_if_cancelled
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
@@ -29,7 +31,8 @@ def call_llm(
     Returns:
         An instance of the specified Pydantic model
     """
-    
+    model_name, model_provider = None, None
+
     # Extract model configuration if state is provided and agent_name is available
     if state and agent_name:
         model_name, model_provider = get_agent_model_config(state, agent_name)
@@ -40,6 +43,22 @@ def call_llm(
     if not model_provider:
         model_provider = "OPENAI"
 
+    # Serve byte-identical requests from the on-disk response cache when enabled
+    llm_cache = get_llm_cache()
+    cache_key = None
+    if llm_cache.enabled:
+        cache_key = llm_cache.make_key(model_name, model_provider, prompt, pydantic_model)
+        cached_result = llm_cache.get(cache_key, pydantic_model)
+        if cached_result is not None:
+            return cached_result
+        if llm_cache.replay_only:
+            # Replay runs are offline: never reach for the network on a miss
+            if agent_name:
+                progress.update_status(agent_name, None, "Replay cache miss - using default")
+            if default_factory:
+                return default_factory()
+            return create_default_response(pydantic_model)
+
     model_info = get_model_info(model_name, model_provider)
     llm = get_model(model_name, model_provider)
 
@@ -52,6 +71,8 @@ def call_llm(
 
     # Call the LLM with retries
     for attempt in range(max_retries):
+        # Stop before spending another LLM call on a cancelled run
+        raise_if_cancelled()
         try:
             # Call the LLM
             result = llm.invoke(prompt)
@@ -60,9 +81,13 @@ def call_llm(
             if model_info and not model_info.has_json_mode():
                 parsed_result = extract_json_from_response(result.content)
                 if parsed_result:
-                    return pydantic_model(**parsed_result)
-            else:
-                return result
+                    result = pydantic_model(**parsed_result)
+                else:
+                    continue
+
+            if cache_key:
+                llm_cache.put(cache_key, result, model_name=model_name, model_provider=model_provider, agent_name=agent_name)
+            return result
 
         except Exception as e:
             if agent_name:
@@ -37,10 +37,14 @@ def is_ollama_installed() -> bool:
         return False  # Unsupported OS
 
 
+# Keep-alive session reused by every probe of the local Ollama server
+_session = requests.Session()
+
+
 def is_ollama_server_running() -> bool:
     """Check if the Ollama server is running."""
     try:
-        response = requests.get(OLLAMA_API_MODELS_ENDPOINT, timeout=2)
+        response = _session.get(OLLAMA_API_MODELS_ENDPOINT, timeout=2)
         return response.status_code == 200
     except requests.RequestException:
         return False
@@ -48,11 +52,8 @@ def is_ollama_server_running() -> bool:
 
 def get_locally_available_models() -> List[str]:
     """Get a list of models that are already downloaded locally."""
-    if not is_ollama_server_running():
-        return []
-
     try:
-        response = requests.get(OLLAMA_API_MODELS_ENDPOINT, timeout=5)
+        response = _session.get(OLLAMA_API_MODELS_ENDPOINT, timeout=5)
         if response.status_code == 200:
             data = response.json()
             return [model["name"] for model in data["models"]] if "models" in data else []
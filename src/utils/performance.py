@@ -0,0 +1,97 @@
+import math
+
+
+class RunningPerformanceStats:
+    """Incrementally maintained Sharpe, Sortino and max drawdown.
+
+    Each `update()` is O(1): excess-return mean/variance use Welford's
+    algorithm (sample variance, matching pandas' `std()`), downside deviation
+    tracks a second Welford accumulator over negative excess returns only,
+    and drawdown is measured against a running peak.
+    """
+
+    def __init__(self, risk_free_rate: float = 0.0434, periods_per_year: int = 252):
+        self.daily_risk_free_rate = risk_free_rate / periods_per_year
+        self.annualization = math.sqrt(periods_per_year)
+
+        self.last_value: float | None = None
+        self.num_values = 0
+
+        # Welford accumulators for all excess returns
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+        # Welford accumulators for negative excess returns
+        self.downside_count = 0
+        self._downside_mean = 0.0
+        self._downside_m2 = 0.0
+
+        # Running peak for drawdown
+        self.peak: float | None = None
+        self.max_drawdown = 0.0
+        self.max_drawdown_date = None
+
+    def update(self, value: float, date=None):
+        """Add the next portfolio value (and its date) to the running statistics."""
+        value = float(value)
+        self.num_values += 1
+
+        if self.last_value is not None and self.last_value != 0:
+            excess_return = value / self.last_value - 1 - self.daily_risk_free_rate
+            self.count += 1
+            delta = excess_return - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (excess_return - self.mean)
+
+            if excess_return < 0:
+                self.downside_count += 1
+                downside_delta = excess_return - self._downside_mean
+                self._downside_mean += downside_delta / self.downside_count
+                self._downside_m2 += downside_delta * (excess_return - self._downside_mean)
+        self.last_value = value
+
+        if self.peak is None or value > self.peak:
+            self.peak = value
+        if self.peak:
+            drawdown = (value - self.peak) / self.peak
+            if drawdown < self.max_drawdown:
+                self.max_drawdown = drawdown
+                self.max_drawdown_date = date
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of excess returns (NaN with fewer than 2 returns)."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else float("nan")
+
+    @property
+    def downside_std(self) -> float:
+        """Sample standard deviation of negative excess returns (NaN with fewer than 2)."""
+        return math.sqrt(self._downside_m2 / (self.downside_count - 1)) if self.downside_count > 1 else float("nan")
+
+    def sharpe_ratio(self) -> float:
+        std = self.std
+        if std > 1e-12:
+            return self.annualization * (self.mean / std)
+        return 0.0
+
+    def sortino_ratio(self) -> float:
+        downside_std = self.downside_std
+        if self.downside_count > 0 and downside_std > 1e-12:
+            return self.annualization * (self.mean / downside_std)
+        return float("inf") if self.mean > 0 else 0
+
+    def update_metrics(self, performance_metrics: dict):
+        """Write the current Sharpe/Sortino/drawdown into a performance metrics dict."""
+        if self.count < 2:
+            return  # not enough data points
+
+        performance_metrics["sharpe_ratio"] = self.sharpe_ratio()
+        performance_metrics["sortino_ratio"] = self.sortino_ratio()
+
+        # Maximum drawdown stored as a negative percentage
+        performance_metrics["max_drawdown"] = self.max_drawdown * 100
+        if self.max_drawdown < 0 and self.max_drawdown_date is not None:
+            performance_metrics["max_drawdown_date"] = self.max_drawdown_date.strftime("%Y-%m-%d")
+        else:
+            performance_metrics["max_drawdown_date"] = None
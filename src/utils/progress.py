@@ -1,33 +1,155 @@
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
 from rich.style import Style
 from rich.text import Text
-from typing import Dict, Optional, Callable, List
+from typing import Dict, Iterator, Optional, Callable, List
 
 console = Console()
 
 
-class AgentProgress:
-    """Manages progress tracking for multiple agents."""
+def _get_display_name(agent_name: str) -> str:
+    """Convert agent_name to a display-friendly format."""
+    return agent_name.replace("_agent", "").replace("_", " ").title()
 
-    def __init__(self):
+
+class ProgressChannel:
+    """Progress state and update handlers for a single run."""
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id or uuid.uuid4().hex
         self.agent_status: Dict[str, Dict[str, str]] = {}
-        self.table = Table(show_header=False, box=None, padding=(0, 1))
-        self.live = Live(self.table, console=console, refresh_per_second=4)
-        self.started = False
         self.update_handlers: List[Callable[[str, Optional[str], str], None]] = []
+        self.cache_stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
 
     def register_handler(self, handler: Callable[[str, Optional[str], str], None]):
-        """Register a handler to be called when agent status updates."""
-        self.update_handlers.append(handler)
+        """Register a handler to be called when an agent in this run updates."""
+        with self._lock:
+            self.update_handlers.append(handler)
         return handler  # Return handler to support use as decorator
 
     def unregister_handler(self, handler: Callable[[str, Optional[str], str], None]):
         """Unregister a previously registered handler."""
-        if handler in self.update_handlers:
-            self.update_handlers.remove(handler)
+        with self._lock:
+            if handler in self.update_handlers:
+                self.update_handlers.remove(handler)
+
+    def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = "", analysis: Optional[str] = None):
+        """Update the status of an agent and notify this run's handlers."""
+        # Set the timestamp as UTC datetime
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        with self._lock:
+            info = self.agent_status.setdefault(agent_name, {"status": "", "ticker": None})
+            if ticker:
+                info["ticker"] = ticker
+            if status:
+                info["status"] = status
+            if analysis:
+                info["analysis"] = analysis
+            info["timestamp"] = timestamp
+            handlers = list(self.update_handlers)
+
+        # Handlers run outside the lock so they may call back into the channel
+        for handler in handlers:
+            handler(agent_name, ticker, status, analysis, timestamp)
+
+    def record_cache_result(self, agent_name: str, hit: bool):
+        """Count a signal cache hit or miss for an agent."""
+        with self._lock:
+            stats = self.cache_stats.setdefault(agent_name, {"hits": 0, "misses": 0})
+            stats["hits" if hit else "misses"] += 1
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-agent signal cache hit/miss counts."""
+        with self._lock:
+            return {agent_name: dict(stats) for agent_name, stats in self.cache_stats.items()}
+
+    def get_all_status(self):
+        """Get the current status of all agents as a dictionary."""
+        with self._lock:
+            return {
+                agent_name: {
+                    "ticker": info["ticker"],
+                    "status": info["status"],
+                    "display_name": _get_display_name(agent_name),
+                    "cache_hits": self.cache_stats.get(agent_name, {}).get("hits", 0),
+                    "cache_misses": self.cache_stats.get(agent_name, {}).get("misses", 0),
+                }
+                for agent_name, info in self.agent_status.items()
+            }
+
+    def snapshot(self) -> tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, int]]]:
+        """Copy of (agent_status, cache_stats) for rendering."""
+        with self._lock:
+            return (
+                {agent_name: dict(info) for agent_name, info in self.agent_status.items()},
+                {agent_name: dict(stats) for agent_name, stats in self.cache_stats.items()},
+            )
+
+
+# The run's channel follows the run through threads and tasks that copy the context
+# (asyncio.to_thread, LangGraph's node executor); code outside any run uses the default channel.
+_current_channel: ContextVar[Optional[ProgressChannel]] = ContextVar("progress_channel", default=None)
+
+
+class AgentProgress:
+    """Manages progress tracking for multiple agents.
+
+    Updates go to the progress channel of the current run (see `use_channel`), so
+    concurrent runs never see each other's updates. Status updates never render:
+    the terminal display pulls the default channel's state on its own refresh
+    tick while started, and nothing is rendered when it is not (e.g. in the API server).
+    """
+
+    def __init__(self):
+        self.default_channel = ProgressChannel(run_id="default")
+        self.live = Live(console=console, refresh_per_second=4, get_renderable=self._build_table)
+        self.started = False
+
+    @property
+    def channel(self) -> ProgressChannel:
+        """The progress channel of the current run."""
+        return _current_channel.get() or self.default_channel
+
+    @property
+    def agent_status(self) -> Dict[str, Dict[str, str]]:
+        return self.channel.agent_status
+
+    @property
+    def update_handlers(self) -> List[Callable[[str, Optional[str], str], None]]:
+        return self.channel.update_handlers
+
+    @property
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        return self.channel.cache_stats
+
+    def create_channel(self, run_id: Optional[str] = None) -> ProgressChannel:
+        """Create an isolated progress channel for a run."""
+        return ProgressChannel(run_id)
+
+    @contextmanager
+    def use_channel(self, channel: ProgressChannel) -> Iterator[ProgressChannel]:
+        """Route progress updates made in this context to `channel`."""
+        token = _current_channel.set(channel)
+        try:
+            yield channel
+        finally:
+            _current_channel.reset(token)
+
+    def register_handler(self, handler: Callable[[str, Optional[str], str], None]):
+        """Register a handler to be called when agent status updates in the current run."""
+        return self.channel.register_handler(handler)
+
+    def unregister_handler(self, handler: Callable[[str, Optional[str], str], None]):
+        """Unregister a previously registered handler."""
+        self.channel.unregister_handler(handler)
 
     def start(self):
         """Start the progress display."""
@@ -43,38 +165,29 @@ class AgentProgress:
 
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = "", analysis: Optional[str] = None):
         """Update the status of an agent."""
-        if agent_name not in self.agent_status:
-            self.agent_status[agent_name] = {"status": "", "ticker": None}
-
-        if ticker:
-            self.agent_status[agent_name]["ticker"] = ticker
-        if status:
-            self.agent_status[agent_name]["status"] = status
-        if analysis:
-            self.agent_status[agent_name]["analysis"] = analysis
-        
-        # Set the timestamp as UTC datetime
-        timestamp = datetime.now(timezone.utc).isoformat()
-        self.agent_status[agent_name]["timestamp"] = timestamp
+        self.channel.update_status(agent_name, ticker, status, analysis)
 
-        # Notify all registered handlers
-        for handler in self.update_handlers:
-            handler(agent_name, ticker, status, analysis, timestamp)
+    def record_cache_result(self, agent_name: str, hit: bool):
+        """Count a signal cache hit or miss for an agent."""
+        self.channel.record_cache_result(agent_name, hit)
 
-        self._refresh_display()
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-agent signal cache hit/miss counts."""
+        return self.channel.get_cache_stats()
 
     def get_all_status(self):
         """Get the current status of all agents as a dictionary."""
-        return {agent_name: {"ticker": info["ticker"], "status": info["status"], "display_name": self._get_display_name(agent_name)} for agent_name, info in self.agent_status.items()}
+        return self.channel.get_all_status()
 
     def _get_display_name(self, agent_name: str) -> str:
         """Convert agent_name to a display-friendly format."""
-        return agent_name.replace("_agent", "").replace("_", " ").title()
+        return _get_display_name(agent_name)
 
-    def _refresh_display(self):
-        """Refresh the progress display."""
-        self.table.columns.clear()
-        self.table.add_column(width=100)
+    def _build_table(self) -> Table:
+        """Build the progress table (called by the live display on each refresh)."""
+        agent_status, cache_stats = self.default_channel.snapshot()
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column(width=100)
 
         # Sort agents with Risk Management and Portfolio Management at the bottom
         def sort_key(item):
@@ -86,7 +199,7 @@ class AgentProgress:
             else:
                 return (1, agent_name)
 
-        for agent_name, info in sorted(self.agent_status.items(), key=sort_key):
+        for agent_name, info in sorted(agent_status.items(), key=sort_key):
             status = info["status"]
             ticker = info["ticker"]
             # Create the status text with appropriate styling
@@ -109,7 +222,13 @@ class AgentProgress:
                 status_text.append(f"[{ticker}] ", style=Style(color="cyan"))
             status_text.append(status, style=style)
 
-            self.table.add_row(status_text)
+            if agent_name in cache_stats:
+                stats = cache_stats[agent_name]
+                status_text.append(f" (cache {stats['hits']}/{stats['hits'] + stats['misses']})", style=Style(color="bright_black"))
+
+            table.add_row(status_text)
+
+        return table
 
 
 # Create a global instance
@@ -0,0 +1,82 @@
+import asyncio
+import os
+import statistics
+import tempfile
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.backend.database import get_async_db
+from app.backend.database.models import Base
+from app.backend.routes import flow_runs, flows
+
+SSE_TICKS = 50
+SSE_INTERVAL = 0.02
+CRUD_CLIENTS = 20
+CRUD_ROUNDS = 5
+
+
+def _build_app(session_factory):
+    app = FastAPI()
+    app.include_router(flows.router)
+    app.include_router(flow_runs.router)
+
+    async def override_get_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_db
+
+    @app.get("/ticks")
+    async def ticks():
+        # Stand-in for a hedge fund run stream: reports how late each tick was delivered
+        async def generator():
+            loop = asyncio.get_running_loop()
+            for _ in range(SSE_TICKS):
+                scheduled = loop.time() + SSE_INTERVAL
+                await asyncio.sleep(SSE_INTERVAL)
+                yield f"event: tick\ndata: {loop.time() - scheduled}\n\n"
+
+        return StreamingResponse(generator(), media_type="text/event-stream")
+
+    return app
+
+
+async def _crud_client(client: httpx.AsyncClient, worker: int):
+    for i in range(CRUD_ROUNDS):
+        flow = (await client.post("/flows/", json={"name": f"Flow {worker}-{i}", "nodes": [], "edges": []})).json()
+        await client.get("/flows/")
+        await client.put(f"/flows/{flow['id']}", json={"description": "updated"})
+        await client.post(f"/flows/{flow['id']}/runs/", json={})
+        await client.get(f"/flows/{flow['id']}/runs/")
+
+
+class TestAsyncDatabaseLoad:
+    def test_sse_latency_under_concurrent_crud(self):
+        """SSE ticks stay on schedule while concurrent clients run CRUD queries against the database."""
+
+        async def main():
+            with tempfile.TemporaryDirectory() as tmp:
+                engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'load.db')}")
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
+                app = _build_app(async_sessionmaker(engine, autoflush=False, expire_on_commit=False))
+
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    sse, *_ = await asyncio.gather(
+                        client.get("/ticks"),
+                        *(_crud_client(client, worker) for worker in range(CRUD_CLIENTS)),
+                    )
+                    assert len((await client.get("/flows/")).json()) == CRUD_CLIENTS * CRUD_ROUNDS
+                await engine.dispose()
+            return [float(line[len("data: "):]) for line in sse.text.splitlines() if line.startswith("data: ")]
+
+        lateness = sorted(asyncio.run(main()))
+        p50 = statistics.median(lateness)
+        p99 = lateness[int(len(lateness) * 0.99) - 1]
+
+        assert len(lateness) == SSE_TICKS
+        assert p99 < 0.25, f"SSE tick lateness under {CRUD_CLIENTS} CRUD clients: p50={p50 * 1000:.1f}ms p99={p99 * 1000:.1f}ms"
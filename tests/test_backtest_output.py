@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from src.backtester import Backtester
+from src.utils import display
+
+DATES = ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]
+
+
+def _fake_price_data(ticker, start_date, end_date):
+    return pd.DataFrame({"close": [100.0 + int(end_date[-2:])]})
+
+
+def _hold_agent(tickers, **kwargs):
+    return {
+        "decisions": {ticker: {"action": "hold", "quantity": 0} for ticker in tickers},
+        "analyst_signals": {"technical_analyst_agent": {ticker: {"signal": "bullish"} for ticker in tickers}},
+    }
+
+
+def _run(output_mode: str, display_window: int = 0, tickers=("AAPL", "MSFT")):
+    """Run a short backtest with recording wrappers around the display functions."""
+    calls = []
+
+    def record(name, original):
+        def wrapper(rows, **kwargs):
+            calls.append((name, [row[0] for row in display._split_backtest_rows(rows)[0]]))
+            return original(rows, **kwargs)
+
+        return wrapper
+
+    backtester = Backtester(
+        agent=_hold_agent,
+        tickers=list(tickers),
+        start_date=DATES[0],
+        end_date=DATES[-1],
+        initial_capital=100_000,
+        output_mode=output_mode,
+        display_window=display_window,
+    )
+    with patch.object(Backtester, "prefetch_data"), \
+         patch("src.backtester.get_price_data", side_effect=_fake_price_data), \
+         patch("src.utils.display.os.system", side_effect=lambda command: calls.append(("clear", []))), \
+         patch("src.backtester.print_backtest_day", side_effect=record("day", display.print_backtest_day)), \
+         patch("src.backtester.print_backtest_results", side_effect=record("full", display.print_backtest_results)):
+        backtester.run_backtest()
+    return calls
+
+
+class TestBacktestOutputModes:
+    """Test suite for the full/stream/quiet backtest output modes."""
+
+    def test_stream_prints_each_new_day_then_one_full_table(self, capsys):
+        calls = _run("stream")
+        output = capsys.readouterr().out
+
+        # One call per day with only that day's ticker rows, then a single full table
+        # printed below them without clearing the screen
+        assert [name for name, _ in calls] == ["day"] * len(DATES) + ["full"]
+        for (_, rows), date in zip(calls, DATES):
+            assert rows == [date, date]
+        assert calls[-1][1] == [date for date in DATES for _ in range(2)]
+
+        # Each ticker row is printed twice: in its own day table and in the final table
+        for date in DATES:
+            assert output.count(date) == 4
+
+    def test_stream_rolling_window_shows_only_recent_days(self, capsys):
+        calls = _run("stream", display_window=2)
+        capsys.readouterr()
+
+        # Every rolling redraw, including the closing table, clears the screen
+        assert [name for name, _ in calls] == ["full", "clear"] * (len(DATES) + 1)
+        calls = [call for call in calls if call[0] != "clear"]
+        for i, (_, rows) in enumerate(calls[:-1]):
+            assert sorted(set(rows)) == DATES[max(0, i - 1): i + 1]
+        # The closing table still covers the whole backtest
+        assert sorted(set(calls[-1][1])) == DATES
+
+    def test_quiet_mode_skips_table_formatting(self, capsys):
+        with patch("src.backtester.format_backtest_row", side_effect=AssertionError("formatted a row")) as format_row, \
+             patch("src.utils.display.tabulate", side_effect=AssertionError("rendered a table")) as tabulate:
+            calls = _run("quiet")
+        output = capsys.readouterr().out
+
+        assert calls == []
+        format_row.assert_not_called()
+        tabulate.assert_not_called()
+        assert not any(date in output for date in DATES)
+
+    def test_unknown_output_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            Backtester(agent=_hold_agent, tickers=["AAPL"], start_date=DATES[0], end_date=DATES[-1], initial_capital=1_000, output_mode="verbose")
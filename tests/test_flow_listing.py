@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.backend.database import get_async_db
+from app.backend.database.models import Base
+from app.backend.repositories.flow_repository import FlowRepository
+from app.backend.repositories.flow_run_repository import FlowRunRepository
+from app.backend.routes import flow_runs, flows
+
+FLOW_COUNT = 7
+RUN_COUNT = 5
+
+
+async def _seed():
+    """Flows whose last-modified times include ties, so pagination must break them by id."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    async with session_factory() as db:
+        repo = FlowRepository(db)
+        for i in range(FLOW_COUNT):
+            flow = await repo.create_flow(
+                name=f"Momentum {i}" if i % 2 else f"Value {i}",
+                nodes=[{"id": f"node_{i}"}],
+                edges=[],
+                is_template=(i == 0),
+            )
+            flow.created_at = base + timedelta(minutes=i // 2)
+        await db.commit()
+
+        run_repo = FlowRunRepository(db)
+        for _ in range(RUN_COUNT):
+            await run_repo.create_flow_run(flow.id, request_data={"tickers": ["AAPL"]})
+    return session_factory, flow.id
+
+
+def _client(session_factory):
+    app = FastAPI()
+    app.include_router(flows.router)
+    app.include_router(flow_runs.router)
+
+    async def override_get_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_db
+    return TestClient(app)
+
+
+class TestFlowSummaries:
+    def test_keyset_pages_cover_all_flows_once(self):
+        session_factory, _ = asyncio.run(_seed())
+        client = _client(session_factory)
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            page = client.get("/flows/summaries", params=params).json()
+            seen.extend(item["id"] for item in page["items"])
+            assert all("nodes" not in item for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [item["id"] for item in client.get("/flows/").json()]
+        assert sorted(seen) == list(range(1, FLOW_COUNT + 1))
+
+    def test_name_search_and_template_filter(self):
+        session_factory, _ = asyncio.run(_seed())
+        client = _client(session_factory)
+
+        page = client.get("/flows/summaries", params={"name": "momentum"}).json()
+        assert {item["name"] for item in page["items"]} == {"Momentum 1", "Momentum 3", "Momentum 5"}
+
+        page = client.get("/flows/summaries", params={"include_templates": False}).json()
+        assert all(not item["is_template"] for item in page["items"])
+
+        assert client.get("/flows/summaries", params={"cursor": "not-a-cursor"}).status_code == 400
+
+    def test_run_summaries_page_by_run_number(self):
+        session_factory, flow_id = asyncio.run(_seed())
+        client = _client(session_factory)
+
+        first = client.get(f"/flows/{flow_id}/runs/summaries", params={"limit": 3}).json()
+        assert [run["run_number"] for run in first["items"]] == [5, 4, 3]
+
+        second = client.get(f"/flows/{flow_id}/runs/summaries", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+        assert [run["run_number"] for run in second["items"]] == [2, 1]
+        assert second["next_cursor"] is None
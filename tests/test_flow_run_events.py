@@ -0,0 +1,168 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.backend.database import get_async_db
+from app.backend.database.models import Base
+from app.backend.models.events import CompleteEvent, ProgressUpdateEvent
+from app.backend.models.schemas import FlowRunStatus
+from app.backend.repositories.flow_repository import FlowRepository
+from app.backend.repositories.flow_run_event_repository import FlowRunEventRepository
+from app.backend.repositories.flow_run_repository import FlowRunRepository
+from app.backend.routes import flow_runs
+from app.backend.services.run_events import RunEventRecorder
+
+
+async def _session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def _create_run(session_factory):
+    async with session_factory() as db:
+        flow = await FlowRepository(db).create_flow(name="Value", nodes=[], edges=[])
+        run = await FlowRunRepository(db).create_flow_run(flow.id)
+        return flow.id, run.id
+
+
+def _progress(agent, ticker, status):
+    return ProgressUpdateEvent(agent=agent, ticker=ticker, status=status)
+
+
+class TestRunEventRecorder:
+    def test_records_events_and_final_result(self):
+        async def main():
+            session_factory = await _session_factory()
+            _, run_id = await _create_run(session_factory)
+
+            recorder = await RunEventRecorder.open(run_id, session_factory=session_factory, batch_size=2, flush_interval=60)
+            assert recorder.record(_progress("ben_graham", "AAPL", "Analyzing"), agent="ben_graham", ticker="AAPL") == 1
+            assert recorder.record(_progress("ben_graham", "MSFT", "Analyzing"), agent="ben_graham", ticker="MSFT") == 2
+
+            signals = {"ben_graham": {"AAPL": {"signal": "bullish"}, "MSFT": {"signal": "bearish"}}}
+            final_id = await recorder.finish(CompleteEvent(data={"decisions": {}, "analyst_signals": signals}), signals)
+            assert final_id == 5
+
+            async with session_factory() as db:
+                repo = FlowRunEventRepository(db)
+                assert [e.event_type for e in await repo.get_events(run_id)] == ["progress", "progress", "signal", "signal", "complete"]
+                assert [e.sequence for e in await repo.get_events(run_id, after_sequence=2, limit=2)] == [3, 4]
+                assert (await repo.get_signals(run_id, ticker="MSFT"))[0].payload["signal"] == {"signal": "bearish"}
+
+                flow_run = await FlowRunRepository(db).get_flow_run_by_id(run_id)
+                assert flow_run.status == FlowRunStatus.COMPLETE.value
+                # Signals live in the events table; the run row keeps decisions and a count
+                assert flow_run.results == {"decisions": {}, "signal_count": 2}
+
+        asyncio.run(main())
+
+    def test_failed_flush_keeps_batch_for_retry(self):
+        async def main():
+            session_factory = await _session_factory()
+            _, run_id = await _create_run(session_factory)
+            failing = {"remaining": 1}
+
+            def flaky_session_factory():
+                if failing["remaining"]:
+                    failing["remaining"] -= 1
+                    raise ConnectionError("database unavailable")
+                return session_factory()
+
+            recorder = await RunEventRecorder.open(run_id, session_factory=session_factory, flush_interval=60)
+            recorder._session_factory = flaky_session_factory
+            recorder.record(_progress("ben_graham", "AAPL", "Fetching"))
+            await recorder.flush()
+            recorder.record(_progress("ben_graham", "AAPL", "Analyzing"))
+            await recorder.close()
+
+            async with session_factory() as db:
+                events = await FlowRunEventRepository(db).get_events(run_id)
+                assert [e.sequence for e in events] == [1, 2]
+                assert [e.payload["status"] for e in events] == ["Fetching", "Analyzing"]
+
+        asyncio.run(main())
+
+    def test_sequences_continue_and_delete_removes_events(self):
+        async def main():
+            session_factory = await _session_factory()
+            _, run_id = await _create_run(session_factory)
+
+            recorder = await RunEventRecorder.open(run_id, session_factory=session_factory)
+            recorder.record(_progress("system", None, "Starting"))
+            await recorder.close()
+
+            recorder = await RunEventRecorder.open(run_id, session_factory=session_factory)
+            assert recorder.record(_progress("system", None, "Resumed")) == 2
+            await recorder.close()
+
+            async with session_factory() as db:
+                assert await FlowRunRepository(db).delete_flow_run(run_id)
+                assert await FlowRunEventRepository(db).get_last_sequence(run_id) == 0
+
+        asyncio.run(main())
+
+
+class TestFlowRunEventRoutes:
+    def _client(self, session_factory, monkeypatch):
+        monkeypatch.setattr(flow_runs, "AsyncSessionLocal", session_factory)
+        app = FastAPI()
+        app.include_router(flow_runs.router)
+
+        async def override_get_db():
+            async with session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_db
+        return TestClient(app)
+
+    def test_stream_resumes_after_last_event_id(self, monkeypatch):
+        async def record_run():
+            session_factory = await _session_factory()
+            flow_id, run_id = await _create_run(session_factory)
+
+            recorder = await RunEventRecorder.open(run_id, session_factory=session_factory)
+            for status in ("Fetching", "Analyzing", "Done"):
+                recorder.record(_progress("ben_graham", "AAPL", status), agent="ben_graham", ticker="AAPL")
+            await recorder.finish(CompleteEvent(data={"decisions": {}}), {"ben_graham": {"AAPL": {"signal": "bullish"}}})
+            return session_factory, flow_id, run_id
+
+        session_factory, flow_id, run_id = asyncio.run(record_run())
+
+        client = self._client(session_factory, monkeypatch)
+        response = client.get(f"/flows/{flow_id}/runs/{run_id}/events/stream", headers={"Last-Event-ID": "2"})
+        assert response.status_code == 200
+        ids = [line[len("id: "):] for line in response.text.splitlines() if line.startswith("id: ")]
+        # Signals are served by the signals endpoint, not replayed on the stream
+        assert ids == ["3", "5"]
+        assert "event: complete" in response.text
+
+        page = client.get(f"/flows/{flow_id}/runs/{run_id}/events", params={"after": 1, "limit": 2}).json()
+        assert [event["sequence"] for event in page] == [2, 3]
+
+        signals = client.get(f"/flows/{flow_id}/runs/{run_id}/signals", params={"ticker": "AAPL"}).json()
+        assert signals[0]["agent"] == "ben_graham"
+
+    def test_stream_of_stale_run_closes_after_idle_timeout(self, monkeypatch):
+        async def record_run():
+            session_factory = await _session_factory()
+            flow_id, run_id = await _create_run(session_factory)
+
+            # The recorder goes away without finishing, as after a server restart
+            recorder = await RunEventRecorder.open(run_id, session_factory=session_factory)
+            recorder.record(_progress("ben_graham", "AAPL", "Fetching"), agent="ben_graham", ticker="AAPL")
+            await recorder.close()
+            return session_factory, flow_id, run_id
+
+        session_factory, flow_id, run_id = asyncio.run(record_run())
+        monkeypatch.setattr(flow_runs, "EVENT_STREAM_POLL_INTERVAL", 0.01)
+        monkeypatch.setattr(flow_runs, "EVENT_STREAM_IDLE_TIMEOUT", 0.1)
+
+        client = self._client(session_factory, monkeypatch)
+        response = client.get(f"/flows/{flow_id}/runs/{run_id}/events/stream")
+        assert response.status_code == 200
+        assert [line for line in response.text.splitlines() if line.startswith("id: ")] == ["id: 1"]
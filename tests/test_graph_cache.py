@@ -0,0 +1,81 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.backend.database.models import Base
+from app.backend.models.schemas import GraphEdge, GraphNode
+from app.backend.repositories.flow_repository import FlowRepository
+from app.backend.services.graph import get_compiled_graph
+from app.backend.services.graph_cache import CompiledGraphCache, get_compiled_graph_cache, graph_structure_key
+
+
+def _compile(nodes, edges):
+    return get_compiled_graph([GraphNode(**node) for node in nodes], [GraphEdge(**edge) for edge in edges])
+
+
+NODES = [
+    {"id": "ben_graham_abc123", "position": {"x": 0, "y": 0}},
+    {"id": "portfolio_manager_xyz789", "position": {"x": 100, "y": 0}},
+]
+EDGES = [
+    {"id": "e1", "source": "ben_graham_abc123", "target": "portfolio_manager_xyz789"},
+    {"id": "e2", "source": "ticker_input", "target": "ben_graham_abc123"},
+]
+
+
+class TestGraphStructureKey:
+    """Test suite for structural hashing of React Flow graphs."""
+
+    def test_ignores_layout_and_order_but_not_structure(self):
+        moved = [dict(node, position={"x": 50, "y": 50}) for node in reversed(NODES)]
+        assert graph_structure_key(NODES, EDGES) == graph_structure_key(moved, EDGES)
+
+        # Pydantic request models and stored JSON hash the same way
+        models = [GraphNode(**node) for node in NODES]
+        edge_models = [GraphEdge(**edge) for edge in EDGES]
+        assert graph_structure_key(models, edge_models) == graph_structure_key(NODES, EDGES)
+
+        extra = NODES + [{"id": "warren_buffett_def456"}]
+        assert graph_structure_key(extra, EDGES) != graph_structure_key(NODES, EDGES)
+
+    def test_lru_bound(self):
+        cache = CompiledGraphCache(max_size=1)
+        cache.get_or_compile(NODES, EDGES, lambda: "first")
+        cache.get_or_compile(NODES[:1], [], lambda: "second")
+
+        assert cache.get_or_compile(NODES, EDGES, lambda: "recompiled") == "recompiled"
+        assert cache.get_stats()["size"] == 1
+
+
+class TestCompiledGraphReuse:
+    def test_same_structure_reuses_compiled_graph(self):
+        get_compiled_graph_cache().clear()
+        first = _compile(NODES, EDGES)
+        second = _compile(NODES, EDGES)
+
+        assert first is second
+        assert "risk_management_agent_xyz789" in first.get_graph().nodes
+
+    def test_update_flow_invalidates_old_structure(self):
+        async def main():
+            engine = create_async_engine("sqlite+aiosqlite://")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                repo = FlowRepository(db)
+                cache = get_compiled_graph_cache()
+                cache.clear()
+
+                flow = await repo.create_flow(name="Value", nodes=NODES, edges=EDGES)
+                compiled = _compile(flow.nodes, flow.edges)
+                assert _compile(NODES, EDGES) is compiled
+
+                # Metadata-only updates keep the compiled graph
+                await repo.update_flow(flow.id, name="Renamed")
+                assert _compile(NODES, EDGES) is compiled
+
+                await repo.update_flow(flow.id, nodes=NODES + [{"id": "warren_buffett_def456"}])
+                assert _compile(NODES, EDGES) is not compiled
+            await engine.dispose()
+
+        asyncio.run(main())
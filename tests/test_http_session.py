@@ -0,0 +1,74 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.http import get_latency_histograms, get_session
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a JSON body with an ETag and answers matching revalidations with 304."""
+
+    protocol_version = "HTTP/1.1"
+    seen = []
+
+    def do_GET(self):
+        self.seen.append((self.headers.get("If-None-Match"), self.client_address[1]))
+        if self.headers.get("If-None-Match") == '"prices-v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"prices-v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"prices": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"prices-v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_shared_session_revalidates_and_reuses_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/prices/?ticker=AAPL"
+        first = get_session().get(url, timeout=5)
+        second = get_session().get(url, timeout=5)
+
+        assert first.json() == second.json() == {"prices": []}
+        assert second.status_code == 200
+        assert [etag for etag, _ in ETagHandler.seen] == [None, '"prices-v1"']
+        # Keep-alive: both requests arrived over the same client connection
+        assert ETagHandler.seen[0][1] == ETagHandler.seen[1][1]
+        assert sum(get_latency_histograms()[f"127.0.0.1:{server.server_port}"].values()) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_replay_adapter_serves_recordings_without_network(tmp_path):
+    from src.utils.http_replay import ReplayAdapter
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/prices/?ticker=AAPL&interval=day"
+    try:
+        recorder = requests.Session()
+        recorder.mount("http://", ReplayAdapter(str(tmp_path), mode="record", upstream=HTTPAdapter()))
+        assert recorder.get(url, timeout=5).json() == {"prices": []}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    replayer = requests.Session()
+    replayer.mount("http://", ReplayAdapter(str(tmp_path)))
+    # Query parameter order does not matter and the closed server is never contacted
+    reordered = f"http://127.0.0.1:{server.server_port}/prices/?interval=day&ticker=AAPL"
+    assert replayer.get(reordered, timeout=5).json() == {"prices": []}
+    assert replayer.get(url.replace("AAPL", "MSFT"), timeout=5).status_code == 404
@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import Mock, patch
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
+from typing_extensions import Literal
+
+from src.llm.cache import LLMCacheMode, LLMResponseCache
+from src.utils.llm import call_llm
+
+
+class Signal(BaseModel):
+    signal: Literal["bullish", "bearish", "neutral"]
+    confidence: float
+    reasoning: str
+
+
+def _make_prompt(ticker: str):
+    template = ChatPromptTemplate.from_messages([("system", "You are an analyst."), ("human", "Analyze {ticker}")])
+    return template.invoke({"ticker": ticker})
+
+
+def _stand_in_model(response: BaseModel) -> Mock:
+    """A local stand-in for a chat model that returns a fixed structured response."""
+    llm = Mock()
+    llm.with_structured_output.return_value = llm
+    llm.invoke.return_value = response
+    return llm
+
+
+class TestLLMResponseCache:
+    """Test suite for the on-disk LLM response cache."""
+
+    def test_key_is_deterministic_and_content_addressed(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, LLMCacheMode.RECORD)
+
+        key = cache.make_key("gpt-4.1", "OpenAI", _make_prompt("AAPL"), Signal)
+
+        assert key == cache.make_key("gpt-4.1", "OpenAI", _make_prompt("AAPL"), Signal)
+        assert key != cache.make_key("gpt-4.1", "OpenAI", _make_prompt("MSFT"), Signal)
+        assert key != cache.make_key("gpt-4o", "OpenAI", _make_prompt("AAPL"), Signal)
+        assert key != cache.make_key("gpt-4.1", "Anthropic", _make_prompt("AAPL"), Signal)
+
+    def test_put_and_get_round_trip(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, LLMCacheMode.RECORD)
+        response = Signal(signal="bullish", confidence=80.0, reasoning="Strong moat")
+        key = cache.make_key("gpt-4.1", "OpenAI", "prompt", Signal)
+
+        assert cache.get(key, Signal) is None
+        cache.put(key, response, model_name="gpt-4.1", model_provider="OpenAI")
+
+        assert cache.get(key, Signal) == response
+        assert cache.get_stats() == {"hits": 1, "misses": 1, "writes": 1}
+
+    @patch("src.utils.llm.get_model")
+    def test_record_then_replay_offline(self, mock_get_model, tmp_path):
+        response = Signal(signal="bearish", confidence=65.0, reasoning="Overvalued")
+        mock_get_model.return_value = _stand_in_model(response)
+
+        with patch("src.utils.llm.get_llm_cache", return_value=LLMResponseCache(tmp_path, LLMCacheMode.RECORD)):
+            first = call_llm(_make_prompt("AAPL"), Signal)
+            second = call_llm(_make_prompt("AAPL"), Signal)
+
+        assert first == response
+        assert second == response
+        # The second call was served from disk
+        assert mock_get_model.call_count == 1
+
+        mock_get_model.reset_mock()
+        replay_cache = LLMResponseCache(tmp_path, LLMCacheMode.REPLAY)
+        with patch("src.utils.llm.get_llm_cache", return_value=replay_cache):
+            replayed = call_llm(_make_prompt("AAPL"), Signal)
+            missed = call_llm(_make_prompt("MSFT"), Signal, default_factory=lambda: Signal(signal="neutral", confidence=0.0, reasoning="default"))
+
+        assert replayed == response
+        assert missed.signal == "neutral"
+        mock_get_model.assert_not_called()
+        assert replay_cache.get_stats() == {"hits": 1, "misses": 1, "writes": 0}
+
+    @patch("src.utils.llm.get_model")
+    def test_off_mode_does_not_touch_disk(self, mock_get_model, tmp_path):
+        response = Signal(signal="neutral", confidence=50.0, reasoning="Mixed")
+        mock_get_model.return_value = _stand_in_model(response)
+
+        with patch("src.utils.llm.get_llm_cache", return_value=LLMResponseCache(tmp_path, LLMCacheMode.OFF)):
+            call_llm(_make_prompt("AAPL"), Signal)
+            call_llm(_make_prompt("AAPL"), Signal)
+
+        assert mock_get_model.call_count == 2
+        assert not any(tmp_path.iterdir())
@@ -0,0 +1,95 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app.backend.services.ollama_service import OllamaService
+
+
+class FakeOllamaClient:
+    """Stands in for ollama.AsyncClient, counting list() probes and pull() streams."""
+
+    host = "http://localhost:11434"
+
+    def __init__(self, pull_steps=3):
+        self.list_calls = 0
+        self.pull_calls = 0
+        self.pull_steps = pull_steps
+        self.release = asyncio.Event()
+
+    async def list(self):
+        self.list_calls += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(models=[SimpleNamespace(model="llama3:8b")])
+
+    async def pull(self, model_name, stream=False):
+        self.pull_calls += 1
+        await self.release.wait()
+        for step in range(1, self.pull_steps + 1):
+            yield SimpleNamespace(status="pulling layer", digest="sha256:abc", completed=step, total=self.pull_steps)
+            await asyncio.sleep(0)
+        yield SimpleNamespace(status="success", digest=None, completed=None, total=None)
+
+
+def _service(client):
+    service = OllamaService()
+    service._async_client = client
+    service._installed = True
+    return service
+
+
+async def _collect(stream):
+    return [json.loads(message[len("data: "):]) async for message in stream]
+
+
+class TestOllamaService:
+    def test_concurrent_status_checks_share_one_probe(self):
+        async def main():
+            client = FakeOllamaClient()
+            service = _service(client)
+
+            statuses = await asyncio.gather(*(service.check_ollama_status() for _ in range(10)))
+            assert client.list_calls == 1
+            assert all(status["running"] and status["available_models"] == ["llama3:8b"] for status in statuses)
+
+            service._clear_status_cache()
+            await service.check_ollama_status()
+            assert client.list_calls == 2
+
+        asyncio.run(main())
+
+    def test_download_watcher_fans_out_to_subscribers(self):
+        async def main():
+            client = FakeOllamaClient(pull_steps=3)
+            service = _service(client)
+
+            first = asyncio.create_task(_collect(service.download_model_with_progress("llama3:8b")))
+            await asyncio.sleep(0.05)
+            assert service.is_download_active("llama3:8b")
+            second = asyncio.create_task(_collect(service.download_model_with_progress("llama3:8b")))
+            follower = asyncio.create_task(_collect(service.stream_download_progress("llama3:8b")))
+            await asyncio.sleep(0.05)
+            client.release.set()
+
+            streams = await asyncio.gather(first, second, follower)
+            assert client.pull_calls == 1
+            for events in streams:
+                assert events[0]["status"] == "starting"
+                assert [event["bytes_downloaded"] for event in events[1:-1]] == [1, 2, 3]
+                assert events[-1]["status"] == "completed"
+            assert not service.is_download_active("llama3:8b")
+
+        asyncio.run(main())
+
+    def test_cancel_stops_the_pull(self):
+        async def main():
+            service = _service(FakeOllamaClient())
+
+            stream = asyncio.create_task(_collect(service.download_model_with_progress("llama3:8b")))
+            await asyncio.sleep(0.05)
+            assert service.cancel_download("llama3:8b")
+
+            events = await stream
+            assert events[-1]["status"] == "cancelled"
+            assert not service.is_download_active("llama3:8b")
+
+        asyncio.run(main())
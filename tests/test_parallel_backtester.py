@@ -0,0 +1,140 @@
+import multiprocessing
+import warnings
+
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from src.data.cache import Cache
+from src.parallel_backtester import merge_window_results, run_parallel_backtests, split_date_range
+
+
+def _fake_price_data(ticker, start_date, end_date):
+    return pd.DataFrame({"close": [100.0 + len(ticker) + int(end_date[-2:]) % 5]})
+
+
+def _buy_and_hold_agent(tickers, **kwargs):
+    return {
+        "decisions": {ticker: {"action": "buy", "quantity": 1} for ticker in tickers},
+        "analyst_signals": {},
+    }
+
+
+class TestSplitDateRange:
+    """Test suite for sharding a date range into independent windows."""
+
+    def test_equal_windows_are_disjoint_and_cover_range(self):
+        windows = split_date_range("2024-01-01", "2024-12-31", num_windows=4)
+
+        assert len(windows) == 4
+        assert windows[0][0] == "2024-01-01"
+        assert windows[-1][1] == "2024-12-31"
+        for (_, previous_end), (next_start, _) in zip(windows, windows[1:]):
+            assert pd.Timestamp(next_start) - pd.Timestamp(previous_end) == pd.Timedelta(days=1)
+
+    def test_month_windows_truncate_last_window(self):
+        windows = split_date_range("2024-01-15", "2024-04-10", window_months=1)
+
+        assert windows == [
+            ("2024-01-15", "2024-02-14"),
+            ("2024-02-15", "2024-03-14"),
+            ("2024-03-15", "2024-04-10"),
+        ]
+
+    def test_requires_exactly_one_strategy(self):
+        with pytest.raises(ValueError):
+            split_date_range("2024-01-01", "2024-02-01")
+        with pytest.raises(ValueError):
+            split_date_range("2024-01-01", "2024-02-01", num_windows=2, window_months=1)
+
+
+class TestMergeWindowResults:
+    def test_aggregate_row(self):
+        results = [
+            {"window_id": 1, "tickers": ["AAPL"], "start_date": "2024-02-01", "end_date": "2024-02-29", "trading_days": 20, "final_value": 110.0, "total_return": 10.0, "sharpe_ratio": 1.0, "sortino_ratio": float("inf"), "max_drawdown": -5.0, "realized_gains": 1.0},
+            {"window_id": 0, "tickers": ["AAPL"], "start_date": "2024-01-01", "end_date": "2024-01-31", "trading_days": 22, "final_value": 95.0, "total_return": -5.0, "sharpe_ratio": -1.0, "sortino_ratio": -2.0, "max_drawdown": -12.0, "realized_gains": 2.0},
+        ]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            report = merge_window_results(results)
+
+        assert list(report["window_id"]) == [0, 1, "ALL"]
+        aggregate = report.iloc[-1]
+        assert aggregate["trading_days"] == 42
+        assert aggregate["total_return"] == pytest.approx(2.5)
+        assert aggregate["sortino_ratio"] == pytest.approx(-2.0)
+        assert aggregate["max_drawdown"] == pytest.approx(-12.0)
+        assert aggregate["start_date"] == "2024-01-01"
+        assert pd.isna(aggregate["final_value"])
+
+
+class TestPersistentDataCache:
+    def test_save_and_load_round_trip(self, tmp_path):
+        cache = Cache()
+        cache.set_prices("AAPL_2024-01-01_2024-01-31", [{"time": "2024-01-02", "close": 1.0}])
+
+        cache.save(tmp_path / "cache.pkl")
+        restored = Cache()
+        assert restored.load(tmp_path / "cache.pkl")
+
+        assert restored.get_prices("AAPL_2024-01-01_2024-01-31") == [{"time": "2024-01-02", "close": 1.0}]
+        assert not Cache().load(tmp_path / "missing.pkl")
+
+    def test_snapshot_since_returns_only_new_entries(self):
+        cache = Cache()
+        cache.set_prices("AAPL", [{"time": "2024-01-02", "close": 1.0}])
+        cache.set_company_news("AAPL", [{"date": "2024-01-02", "title": "old"}])
+        marker = cache.mark()
+
+        cache.set_prices("AAPL", [{"time": "2024-01-02", "close": 1.0}, {"time": "2024-01-03", "close": 2.0}])
+        cache.set_prices("MSFT", [{"time": "2024-01-02", "close": 3.0}])
+
+        delta = cache.snapshot_since(marker)
+        assert delta == {"_prices_cache": {"AAPL": [{"time": "2024-01-03", "close": 2.0}], "MSFT": [{"time": "2024-01-02", "close": 3.0}]}}
+
+        restored = Cache()
+        restored.set_prices("AAPL", [{"time": "2024-01-02", "close": 1.0}])
+        restored.merge_snapshot(delta)
+        assert [row["time"] for row in restored.get_prices("AAPL")] == ["2024-01-02", "2024-01-03"]
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="patched data functions only reach forked workers")
+class TestRunParallelBacktests:
+    def test_runs_windows_across_processes(self, tmp_path):
+        windows = split_date_range("2024-01-01", "2024-02-29", num_windows=2)
+
+        with patch("src.backtester.get_price_data", side_effect=_fake_price_data), patch("src.backtester.Backtester.prefetch_data"):
+            report = run_parallel_backtests(
+                ticker_sets=[["AAPL"], ["MSFT", "NVDA"]],
+                windows=windows,
+                initial_capital=10_000,
+                max_workers=2,
+                data_cache_path=str(tmp_path / "cache.pkl"),
+                agent=_buy_and_hold_agent,
+            )
+
+        assert len(report) == 5
+        assert list(report["tickers"][:4]) == ["AAPL", "AAPL", "MSFT,NVDA", "MSFT,NVDA"]
+        assert (report["trading_days"][:4] > 0).all()
+        assert (tmp_path / "cache.pkl").exists()
+
+    def test_existing_cache_entries_survive_the_run(self, tmp_path):
+        cache_path = tmp_path / "cache.pkl"
+        seeded = Cache()
+        seeded.set_prices("SEEDED_2020-01-01_2020-01-31", [{"time": "2020-01-02", "close": 7.0}])
+        seeded.save(cache_path)
+
+        with patch("src.backtester.get_price_data", side_effect=_fake_price_data), patch("src.backtester.Backtester.prefetch_data"):
+            run_parallel_backtests(
+                ticker_sets=[["AAPL"]],
+                windows=[("2024-01-01", "2024-01-10")],
+                initial_capital=10_000,
+                max_workers=1,
+                data_cache_path=str(cache_path),
+                agent=_buy_and_hold_agent,
+            )
+
+        restored = Cache()
+        assert restored.load(cache_path)
+        assert restored.get_prices("SEEDED_2020-01-01_2020-01-31") == [{"time": "2020-01-02", "close": 7.0}]
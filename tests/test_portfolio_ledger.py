@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.ledger import PortfolioLedger
+from src.utils.performance import RunningPerformanceStats
+
+
+class TestPortfolioLedger:
+    """Test suite for the array-backed portfolio ledger."""
+
+    def test_buy_sell_updates_cost_basis_and_realized_gains(self):
+        ledger = PortfolioLedger(["AAPL", "MSFT"], initial_cash=10_000)
+
+        assert ledger.execute_trade("AAPL", "buy", 10, 100.0) == 10
+        assert ledger.execute_trade("AAPL", "buy", 10, 200.0) == 10
+        assert ledger.long_cost_basis[0] == pytest.approx(150.0)
+        assert ledger.cash == pytest.approx(7_000)
+
+        assert ledger.execute_trade("AAPL", "sell", 50, 180.0) == 20
+        assert ledger.realized_long[0] == pytest.approx(600.0)
+        assert ledger.long_cost_basis[0] == 0.0
+        assert ledger.cash == pytest.approx(10_600)
+
+    def test_buy_is_capped_by_available_cash(self):
+        ledger = PortfolioLedger(["AAPL"], initial_cash=1_000)
+
+        assert ledger.execute_trade("AAPL", "buy", 100, 300.0) == 3
+        assert ledger.cash == pytest.approx(100)
+
+    def test_short_and_cover_track_margin(self):
+        ledger = PortfolioLedger(["AAPL", "MSFT"], initial_cash=10_000, margin_requirement=0.5)
+
+        assert ledger.execute_trade("MSFT", "short", 10, 100.0) == 10
+        assert ledger.margin_used == pytest.approx(500)
+        assert ledger.cash == pytest.approx(10_500)
+
+        assert ledger.execute_trade("MSFT", "cover", 5, 80.0) == 5
+        assert ledger.margin_used == pytest.approx(250)
+        assert ledger.realized_short[1] == pytest.approx(100)
+        assert ledger.cash == pytest.approx(10_350)
+
+    def test_vectorized_valuation_and_dict_snapshot(self):
+        ledger = PortfolioLedger(["AAPL", "MSFT"], initial_cash=10_000, margin_requirement=0.5)
+        ledger.execute_trade("AAPL", "buy", 10, 100.0)
+        ledger.execute_trade("MSFT", "short", 5, 200.0)
+
+        prices = ledger.prices_array({"AAPL": 110.0, "MSFT": 190.0})
+        assert ledger.exposures(prices) == (1_100.0, 950.0)
+        assert ledger.portfolio_value(prices) == pytest.approx(ledger.cash + 1_100 - 950)
+
+        snapshot = ledger.to_dict()
+        assert snapshot["positions"]["AAPL"]["long"] == 10
+        assert snapshot["positions"]["MSFT"]["short"] == 5
+        assert snapshot["positions"]["MSFT"]["short_margin_used"] == pytest.approx(500)
+        assert isinstance(snapshot["positions"]["AAPL"]["long"], int)
+
+
+class TestRunningPerformanceStats:
+    """Running statistics must match the full-history pandas computation."""
+
+    def test_matches_pandas_reference(self):
+        rng = np.random.default_rng(42)
+        values = 100_000 * np.cumprod(1 + rng.normal(0.0005, 0.01, size=250))
+        dates = pd.bdate_range("2024-01-01", periods=len(values))
+
+        stats = RunningPerformanceStats()
+        for date, value in zip(dates, values):
+            stats.update(value, date)
+        metrics = {}
+        stats.update_metrics(metrics)
+
+        series = pd.Series(values, index=dates)
+        excess = series.pct_change().dropna() - 0.0434 / 252
+        drawdown = (series - series.cummax()) / series.cummax()
+
+        assert metrics["sharpe_ratio"] == pytest.approx(np.sqrt(252) * excess.mean() / excess.std())
+        assert metrics["sortino_ratio"] == pytest.approx(np.sqrt(252) * excess.mean() / excess[excess < 0].std())
+        assert metrics["max_drawdown"] == pytest.approx(drawdown.min() * 100)
+        assert metrics["max_drawdown_date"] == drawdown.idxmin().strftime("%Y-%m-%d")
+
+    def test_needs_two_returns(self):
+        stats = RunningPerformanceStats()
+        stats.update(100.0)
+        stats.update(101.0)
+        metrics = {"sharpe_ratio": None}
+        stats.update_metrics(metrics)
+        assert metrics == {"sharpe_ratio": None}
@@ -0,0 +1,88 @@
+import asyncio
+import operator
+import threading
+from typing import Annotated
+from typing_extensions import TypedDict
+
+from langgraph.graph import END, StateGraph
+
+from app.backend.services.graph import run_graph_async
+from src.utils.progress import AgentProgress, progress
+
+
+class _State(TypedDict):
+    messages: Annotated[list, operator.add]
+    data: dict
+    metadata: dict
+
+
+def _make_agent(agent_name: str, barrier: threading.Barrier):
+    def agent(state: _State):
+        ticker = state["data"]["tickers"][0]
+        progress.update_status(agent_name, ticker, "Analyzing")
+        # Both runs are mid-flight at the same time before either finishes
+        barrier.wait(timeout=5)
+        progress.update_status(agent_name, ticker, "Done")
+        return {"messages": []}
+
+    return agent
+
+
+def _build_graph(barrier: threading.Barrier):
+    graph = StateGraph(_State)
+    graph.add_node("start_node", lambda state: state)
+    for agent_name in ("warren_buffett_agent", "ben_graham_agent"):
+        graph.add_node(agent_name, _make_agent(agent_name, barrier))
+        graph.add_edge("start_node", agent_name)
+        graph.add_edge(agent_name, END)
+    graph.set_entry_point("start_node")
+    return graph.compile()
+
+
+class TestProgressChannels:
+    """Test suite for per-run progress isolation."""
+
+    def test_concurrent_runs_only_see_their_own_updates(self):
+        barrier = threading.Barrier(4)
+        graph = _build_graph(barrier)
+        events = {"AAPL": [], "MSFT": []}
+        default_updates = []
+        progress.default_channel.register_handler(lambda *args: default_updates.append(args))
+
+        async def run(ticker: str):
+            channel = progress.create_channel()
+            channel.register_handler(lambda agent_name, t, status, analysis, timestamp: events[ticker].append((agent_name, t, status)))
+            await run_graph_async(graph, {}, [ticker], "2024-01-01", "2024-01-31", "gpt-4.1", "OpenAI", progress_channel=channel)
+            return channel
+
+        async def main():
+            return await asyncio.gather(run("AAPL"), run("MSFT"))
+
+        try:
+            channels = asyncio.run(main())
+        finally:
+            progress.default_channel.update_handlers.clear()
+
+        for ticker, channel in zip(("AAPL", "MSFT"), channels):
+            assert len(events[ticker]) == 4
+            assert {event[1] for event in events[ticker]} == {ticker}
+            assert {info["status"] for info in channel.get_all_status().values()} == {"Done"}
+        assert default_updates == []
+
+    def test_updates_outside_a_run_use_default_channel(self):
+        tracker = AgentProgress()
+        tracker.update_status("ben_graham_agent", "AAPL", "Done")
+
+        assert tracker.get_all_status()["ben_graham_agent"]["status"] == "Done"
+        with tracker.use_channel(tracker.create_channel()):
+            assert tracker.get_all_status() == {}
+
+    def test_display_renders_default_channel_on_demand(self):
+        tracker = AgentProgress()
+        tracker.update_status("ben_graham_agent", "AAPL", "Done")
+        tracker.record_cache_result("ben_graham_agent", hit=True)
+
+        table = tracker._build_table()
+
+        assert table.row_count == 1
+        assert not tracker.started
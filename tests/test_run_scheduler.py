@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.backend.services.run_scheduler import RunQueueFullError, RunScheduler
+from src.utils.cancellation import RunCancelledError, cancellable_sleep, raise_if_cancelled
+
+
+def _blocking_run(release: threading.Event, value):
+    release.wait(timeout=5)
+    return value
+
+
+def _cancellable_run(started: threading.Event):
+    started.set()
+    for _ in range(100):
+        cancellable_sleep(0.05)
+    return "finished"
+
+
+class TestRunScheduler:
+    """Test suite for the bounded hedge fund run scheduler."""
+
+    def test_runs_are_queued_beyond_pool_size(self):
+        async def main():
+            scheduler = RunScheduler(max_workers=1, max_queue_size=5, max_runs_per_user=5)
+            release = threading.Event()
+            positions = []
+
+            first = scheduler.submit("alice", _blocking_run, release, 1)
+            second = scheduler.submit("bob", _blocking_run, release, 2, on_position=positions.append)
+
+            assert first.position == 0
+            assert second.position == 1
+            assert scheduler.get_status()["queued"] == 1
+
+            release.set()
+            assert await first.result == 1
+            assert await second.result == 2
+            assert positions == [1, 0]
+
+        asyncio.run(main())
+
+    def test_admission_limits(self):
+        async def main():
+            scheduler = RunScheduler(max_workers=1, max_queue_size=1, max_runs_per_user=2)
+            release = threading.Event()
+
+            scheduler.submit("alice", _blocking_run, release, 1)
+            scheduler.submit("alice", _blocking_run, release, 2)
+            with pytest.raises(RunQueueFullError):
+                scheduler.submit("alice", _blocking_run, release, 3)  # per-user limit
+            with pytest.raises(RunQueueFullError):
+                scheduler.submit("bob", _blocking_run, release, 4)  # queue full
+            release.set()
+
+        asyncio.run(main())
+
+    def test_cancel_queued_and_running_runs(self):
+        async def main():
+            scheduler = RunScheduler(max_workers=1, max_queue_size=5, max_runs_per_user=5)
+            started = threading.Event()
+            release = threading.Event()
+
+            running = scheduler.submit("alice", _cancellable_run, started)
+            queued = scheduler.submit("alice", _blocking_run, release, 2)
+            await asyncio.to_thread(started.wait, 5)
+
+            scheduler.cancel(queued)
+            assert queued.done()
+            scheduler.cancel(running)
+
+            with pytest.raises(RunCancelledError):
+                await asyncio.wait_for(running.result, timeout=2)
+            assert scheduler.get_status()["running"] == 0
+
+        asyncio.run(main())
+
+
+class TestCancellationCheckpoints:
+    def test_checkpoints_are_no_ops_outside_a_run(self):
+        raise_if_cancelled()
+        cancellable_sleep(0)
@@ -0,0 +1,73 @@
+import pytest
+from unittest.mock import patch
+
+from src.agents.ben_graham import BenGrahamSignal, ben_graham_agent
+from src.data.signal_cache import SignalCache, fingerprint_data
+from src.utils.progress import progress
+
+
+def _make_state(end_date: str) -> dict:
+    return {
+        "messages": [],
+        "data": {"tickers": ["AAPL"], "end_date": end_date, "analyst_signals": {}},
+        "metadata": {"show_reasoning": False, "model_name": "gpt-4.1", "model_provider": "OpenAI"},
+    }
+
+
+class TestSignalCache:
+    """Test suite for the analyst signal cache."""
+
+    def test_fingerprint_is_order_and_content_sensitive(self):
+        assert fingerprint_data([{"a": 1}], 10.0) == fingerprint_data([{"a": 1}], 10.0)
+        assert fingerprint_data([{"a": 1}], 10.0) != fingerprint_data([{"a": 2}], 10.0)
+        assert fingerprint_data({"b": 1, "a": 2}) == fingerprint_data({"a": 2, "b": 1})
+
+    @patch("src.agents.ben_graham.call_llm")
+    @patch("src.agents.ben_graham.get_market_cap", return_value=1_000_000.0)
+    @patch("src.agents.ben_graham.search_line_items", return_value=[])
+    @patch("src.agents.ben_graham.get_financial_metrics", return_value=[])
+    def test_agent_skips_llm_when_data_unchanged(self, mock_metrics, mock_line_items, mock_market_cap, mock_call_llm):
+        mock_call_llm.return_value = BenGrahamSignal(signal="neutral", confidence=50.0, reasoning="No data")
+        progress.cache_stats.clear()
+
+        with patch("src.data.signal_cache.get_signal_cache", return_value=SignalCache(enabled=True)):
+            first = ben_graham_agent(_make_state("2024-01-02"))
+            # Next day, identical fundamentals: data is fetched but the LLM is not called
+            second = ben_graham_agent(_make_state("2024-01-03"))
+            # Repeat of the first day: nothing is fetched at all
+            mock_metrics.reset_mock()
+            third = ben_graham_agent(_make_state("2024-01-02"))
+
+        assert mock_call_llm.call_count == 1
+        mock_metrics.assert_not_called()
+        expected = {"AAPL": {"signal": "neutral", "confidence": 50.0, "reasoning": "No data"}}
+        for result in (first, second, third):
+            assert result["data"]["analyst_signals"]["ben_graham_agent"] == expected
+        assert progress.get_cache_stats()["ben_graham_agent"] == {"hits": 2, "misses": 1}
+
+    @patch("src.agents.ben_graham.call_llm")
+    @patch("src.agents.ben_graham.get_market_cap")
+    @patch("src.agents.ben_graham.search_line_items", return_value=[])
+    @patch("src.agents.ben_graham.get_financial_metrics", return_value=[])
+    def test_changed_data_calls_llm_again(self, mock_metrics, mock_line_items, mock_market_cap, mock_call_llm):
+        mock_call_llm.return_value = BenGrahamSignal(signal="neutral", confidence=50.0, reasoning="No data")
+        mock_market_cap.side_effect = [1_000_000.0, 2_000_000.0]
+
+        with patch("src.data.signal_cache.get_signal_cache", return_value=SignalCache(enabled=True)):
+            ben_graham_agent(_make_state("2024-01-02"))
+            ben_graham_agent(_make_state("2024-01-03"))
+
+        assert mock_call_llm.call_count == 2
+
+    @patch("src.agents.ben_graham.call_llm")
+    @patch("src.agents.ben_graham.get_market_cap", return_value=1_000_000.0)
+    @patch("src.agents.ben_graham.search_line_items", return_value=[])
+    @patch("src.agents.ben_graham.get_financial_metrics", return_value=[])
+    def test_disabled_cache_is_a_no_op(self, mock_metrics, mock_line_items, mock_market_cap, mock_call_llm):
+        mock_call_llm.return_value = BenGrahamSignal(signal="neutral", confidence=50.0, reasoning="No data")
+
+        with patch("src.data.signal_cache.get_signal_cache", return_value=SignalCache(enabled=False)):
+            ben_graham_agent(_make_state("2024-01-02"))
+            ben_graham_agent(_make_state("2024-01-02"))
+
+        assert mock_call_llm.call_count == 2